@@ -283,6 +283,131 @@ def ws_test(
     asyncio.run(_test())
 
 
+# =============================================================================
+# Load Testing Commands
+# =============================================================================
+
+@app.command()
+def load_test(
+    base_url: str = typer.Option("http://localhost:8000", help="REST API base URL"),
+    branch_slug: str = typer.Option(..., help="Branch slug for the public menu"),
+    token: str = typer.Option(None, help="Staff JWT (waiter tables, kitchen rounds)"),
+    table_token: str = typer.Option(None, help="Table token (diner cart)"),
+    concurrency: int = typer.Option(50, help="Concurrent clients"),
+    duration: float = typer.Option(30.0, help="Seconds per endpoint"),
+    label: str = typer.Option("run", help="Name of this run (e.g. sync, async)"),
+    output: Path = typer.Option(None, help="Write results as JSON"),
+    compare: Path = typer.Option(None, help="JSON results of a previous run to compare with"),
+):
+    """
+    Measure requests per second and latency of the hot read endpoints.
+
+    PERF-ASYNCDB-01: Compares the sync and async database modes on the same
+    hardware. Start the API with DB_ASYNC_ENGINE=false, run with
+    --label sync --output sync.json, restart it with DB_ASYNC_ENGINE=true and
+    run with --label async --compare sync.json. Disable per-IP limits on the
+    target (IP_RATE_LIMIT_ENABLED=false, never in production) or 429s
+    dominate the measurement.
+    """
+    import asyncio
+    import json
+    import time
+    import httpx
+
+    endpoints = [("menu", f"/api/public/menu/{branch_slug}", {})]
+    if token:
+        staff = {"Authorization": f"Bearer {token}"}
+        endpoints.append(("waiter_tables", "/api/waiter/tables", staff))
+        endpoints.append(("kitchen_rounds", "/api/kitchen/rounds", staff))
+    if table_token:
+        endpoints.append(("cart", "/api/diner/cart", {"X-Table-Token": table_token}))
+
+    def percentile(values: list[float], pct: float) -> float:
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+    async def _run(client: "httpx.AsyncClient", path: str, headers: dict) -> dict:
+        latencies: list[float] = []
+        errors = 0
+        limited = 0
+        deadline = time.perf_counter() + duration
+
+        async def worker():
+            nonlocal errors, limited
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    response = await client.get(path, headers=headers)
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                if response.status_code == 429:
+                    limited += 1
+                elif response.status_code >= 400:
+                    errors += 1
+                else:
+                    latencies.append((time.perf_counter() - start) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        latencies.sort()
+        return {
+            "requests": len(latencies),
+            "rps": round(len(latencies) / elapsed, 1),
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+            "errors": errors,
+            "rate_limited": limited,
+        }
+
+    async def _load_test() -> dict:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        results = {}
+        async with httpx.AsyncClient(base_url=base_url, timeout=30.0, limits=limits) as client:
+            for name, path, headers in endpoints:
+                console.print(f"[blue]{name}: {concurrency} clients for {duration:.0f}s[/blue]")
+                results[name] = await _run(client, path, headers)
+        return results
+
+    results = asyncio.run(_load_test())
+
+    table = Table(title=f"Load test: {label}")
+    for column in ("Endpoint", "RPS", "p50 (ms)", "p99 (ms)", "Errors", "429"):
+        table.add_column(column, style="cyan" if column == "Endpoint" else "green")
+    for name, r in results.items():
+        table.add_row(
+            name, str(r["rps"]), str(r["p50_ms"]), str(r["p99_ms"]),
+            str(r["errors"]), str(r["rate_limited"]),
+        )
+    console.print(table)
+
+    if output:
+        output.write_text(json.dumps({"label": label, "concurrency": concurrency, "results": results}, indent=2))
+        console.print(f"[green]✓ Results written to {output}[/green]")
+
+    if compare:
+        baseline = json.loads(compare.read_text())
+        table = Table(title=f"{label} vs {baseline['label']}")
+        for column in ("Endpoint", "RPS", "RPS change", "p99 (ms)", "p99 change"):
+            table.add_column(column, style="cyan" if column == "Endpoint" else "yellow")
+        for name, r in results.items():
+            before = baseline["results"].get(name)
+            if not before:
+                continue
+            rps_change = (r["rps"] / before["rps"] - 1) * 100 if before["rps"] else 0.0
+            p99_change = (r["p99_ms"] / before["p99_ms"] - 1) * 100 if before["p99_ms"] else 0.0
+            table.add_row(
+                name,
+                f"{before['rps']} → {r['rps']}",
+                f"{rps_change:+.0f}%",
+                f"{before['p99_ms']} → {r['p99_ms']}",
+                f"{p99_change:+.0f}%",
+            )
+        console.print(table)
+
+
 # =============================================================================
 # Health Commands
 # =============================================================================
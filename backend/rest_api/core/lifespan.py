@@ -91,6 +91,11 @@ async def lifespan(app: FastAPI):
         from shared.infrastructure.metrics import init_metrics
         await init_metrics(redis)
         logger.info("Prometheus metrics initialized")
+
+        # PERF-CACHE-01: Drop local cache tiers when other workers invalidate
+        from shared.infrastructure.cache import start_cache_invalidation_listener
+        await start_cache_invalidation_listener()
+        logger.info("Cache invalidation listener started")
     except Exception as e:
         # Cache warming failure is non-fatal - app can still start
         logger.warning("Cache/metrics initialization failed (non-fatal)", error=str(e))
@@ -108,6 +113,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("Failed to stop refresh-ahead scheduler", error=str(e))
 
+    # PERF-CACHE-01: Stop cache invalidation listener
+    try:
+        from shared.infrastructure.cache import stop_cache_invalidation_listener
+        await stop_cache_invalidation_listener()
+    except Exception as e:
+        logger.warning("Failed to stop cache invalidation listener", error=str(e))
+
     # OUTBOX-PATTERN: Stop outbox processor gracefully
     from rest_api.services.events.outbox_processor import stop_outbox_processor
     await stop_outbox_processor()
@@ -122,6 +134,11 @@ async def lifespan(app: FastAPI):
     from shared.security.rate_limit import close_rate_limit_executor
     close_rate_limit_executor()
 
+    # PERF-ASYNCDB-01: Close async engine connections
+    from shared.infrastructure.db import async_engine
+    await async_engine.dispose()
+    logger.info("Async database engine disposed")
+
     # Close Redis connection pool on shutdown
     await close_redis_pool()
     logger.info("Redis connection pool closed")
@@ -1,12 +1,16 @@
 """
 Security middlewares for the FastAPI application.
-Implements security headers and content-type validation.
+Implements security headers, content-type validation and response compression.
 """
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from shared.infrastructure.metrics.compression import get_compression_stats
+from shared.utils.compression import IDENTITY, compress, is_compressible, negotiate_encoding
+
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     """
@@ -96,12 +100,91 @@ class ContentTypeValidationMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
 
+class CompressionMiddleware(BaseHTTPMiddleware):
+    """
+    Negotiate gzip/brotli for large compressible responses.
+
+    PERF-COMPRESS-01: Catalog payloads (menus, complete product views) are
+    large JSON documents sent to phones on weak Wi-Fi.
+
+    - Responses already encoded by the endpoint (precompressed cache
+      entries) pass through untouched
+    - Streaming responses (no Content-Length) and bodies smaller than
+      settings.response_compression_min_bytes are sent as is
+    - Bodies of at least settings.response_compression_thread_min_bytes
+      are compressed in the threadpool, so a large menu does not stall
+      the event loop for every other request
+    - Bytes on the wire and compression CPU are recorded per route
+    """
+
+    SKIP_STATUS = {204, 304}
+
+    async def dispatch(self, request: Request, call_next):
+        from shared.config.settings import settings
+
+        response = await call_next(request)
+
+        content_length = response.headers.get("content-length")
+        if (
+            request.method == "HEAD"
+            or response.status_code < 200
+            or response.status_code in self.SKIP_STATUS
+            or content_length is None
+            or not is_compressible(response.headers.get("content-type"))
+        ):
+            return response
+
+        route = request.scope.get("route")
+        endpoint = getattr(route, "path", None) or "unmatched"
+        stats = get_compression_stats()
+        stats.maybe_flush()
+        response.headers.add_vary_header("Accept-Encoding")
+
+        wire_bytes = int(content_length)
+        content_encoding = response.headers.get("content-encoding")
+        if content_encoding:
+            # Endpoint sent a precompressed variant
+            raw_bytes = getattr(request.state, "uncompressed_size", wire_bytes)
+            stats.record_response(endpoint, content_encoding, raw_bytes, wire_bytes)
+            return response
+
+        encoding = None
+        if wire_bytes >= settings.response_compression_min_bytes:
+            encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        if encoding is None:
+            stats.record_response(endpoint, IDENTITY, wire_bytes, wire_bytes)
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        if len(body) >= settings.response_compression_thread_min_bytes:
+            compressed = await run_in_threadpool(compress, body, encoding, endpoint)
+        else:
+            compressed = compress(body, encoding, endpoint)
+        stats.record_response(endpoint, encoding, len(body), len(compressed))
+
+        encoded = Response(
+            content=compressed,
+            status_code=response.status_code,
+            background=response.background,
+        )
+        encoded.raw_headers = [
+            (name, value) for name, value in response.raw_headers
+            if name != b"content-length"
+        ] + [
+            (b"content-length", str(len(compressed)).encode("latin-1")),
+            (b"content-encoding", encoding.encode("latin-1")),
+        ]
+        return encoded
+
+
 def register_middlewares(app: FastAPI) -> None:
     """
     Register all security middlewares on the FastAPI application.
 
     Order matters: middlewares are executed in reverse order of registration.
-    ContentTypeValidation runs first, then SecurityHeaders.
+    ContentTypeValidation runs first, then SecurityHeaders, and
+    Compression (PERF-COMPRESS-01) sees the endpoint's response first.
     """
+    app.add_middleware(CompressionMiddleware)
     app.add_middleware(SecurityHeadersMiddleware)
     app.add_middleware(ContentTypeValidationMiddleware)
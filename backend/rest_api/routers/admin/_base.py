@@ -55,6 +55,7 @@ from shared.security.auth import current_user_context as current_user
 from shared.security.password import hash_password
 from rest_api.services.crud.audit import log_create, log_update, log_delete, serialize_model
 from rest_api.services.events.admin_events import publish_entity_deleted
+from rest_api.services.catalog.menu_cache import bump_menu_version
 from rest_api.services.crud.soft_delete import (
     soft_delete,
     restore_entity,
@@ -273,6 +274,8 @@ __all__ = [
     "serialize_model",
     # Events
     "publish_entity_deleted",
+    # Public menu cache
+    "bump_menu_version",
     # Soft delete
     "soft_delete",
     "restore_entity",
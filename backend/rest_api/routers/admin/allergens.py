@@ -9,10 +9,10 @@ from fastapi import APIRouter, BackgroundTasks
 from rest_api.routers.admin._base import (
     Depends, HTTPException, status, Session, select,
     selectinload, joinedload,
-    get_db, current_user, Allergen, AllergenCrossReaction,
+    get_db, current_user, Allergen, AllergenCrossReaction, Branch,
     soft_delete, set_created_by, set_updated_by,
     get_user_id, get_user_email, publish_entity_deleted,
-    require_admin, require_admin_or_manager,
+    bump_menu_version, require_admin, require_admin_or_manager,
 )
 from shared.utils.admin_schemas import (
     AllergenOutput, AllergenCreate, AllergenUpdate,
@@ -24,6 +24,19 @@ router = APIRouter(tags=["admin-allergens"])
 
 
 
+def _bump_tenant_menus(db: Session, tenant_id: int) -> None:
+    """
+    PERF-MENU-01: Allergens are tenant-wide; every branch menu embeds them.
+
+    PERF-WARM-01: Also invalidates the cached public allergen list with
+    cross-reactions of every branch.
+    """
+    branch_ids = db.execute(
+        select(Branch.id).where(Branch.tenant_id == tenant_id)
+    ).scalars().all()
+    bump_menu_version(*branch_ids)
+
+
 def _build_allergen_output(allergen: Allergen) -> AllergenOutput:
     """
     Build AllergenOutput from allergen model.
@@ -133,6 +146,7 @@ def create_allergen(
     set_created_by(allergen, get_user_id(user), get_user_email(user))
     db.add(allergen)
     db.commit()
+    _bump_tenant_menus(db, user["tenant_id"])
     # Refresh with eager loading
     allergen = db.scalar(
         select(Allergen)
@@ -173,6 +187,7 @@ def update_allergen(
     set_updated_by(allergen, get_user_id(user), get_user_email(user))
 
     db.commit()
+    _bump_tenant_menus(db, user["tenant_id"])
     # Refresh with eager loading
     allergen = db.scalar(
         select(Allergen)
@@ -213,6 +228,7 @@ def delete_allergen(
     tenant_id = allergen.tenant_id
 
     soft_delete(db, allergen, get_user_id(user), get_user_email(user))
+    _bump_tenant_menus(db, tenant_id)
 
     publish_entity_deleted(
         tenant_id=tenant_id,
@@ -329,6 +345,7 @@ def create_cross_reaction(
         existing.notes = body.notes
         db.commit()
         db.refresh(existing)
+        _bump_tenant_menus(db, tenant_id)
         return CrossReactionOutput(
             id=existing.id,
             tenant_id=existing.tenant_id,
@@ -352,6 +369,7 @@ def create_cross_reaction(
     db.add(cross_reaction)
     db.commit()
     db.refresh(cross_reaction)
+    _bump_tenant_menus(db, tenant_id)
 
     return CrossReactionOutput(
         id=cross_reaction.id,
@@ -394,6 +412,7 @@ def update_cross_reaction(
     set_updated_by(cross_reaction, get_user_id(user), get_user_email(user))
     db.commit()
     db.refresh(cross_reaction)
+    _bump_tenant_menus(db, user["tenant_id"])
 
     allergen = db.scalar(select(Allergen).where(Allergen.id == cross_reaction.allergen_id))
     cross_allergen = db.scalar(select(Allergen).where(Allergen.id == cross_reaction.cross_reacts_with_id))
@@ -432,3 +451,4 @@ def delete_cross_reaction(
         )
 
     soft_delete(db, cross_reaction, get_user_id(user), get_user_email(user))
+    _bump_tenant_menus(db, user["tenant_id"])
@@ -1,9 +1,13 @@
 """
 Waiter-sector assignment endpoints for daily shift management.
+
+PERF-SECTORS-01: Changes to today's assignments publish
+SECTOR_ASSIGNMENTS_CHANGED (via BackgroundTasks) so WebSocket gateways
+refresh waiter sectors immediately instead of waiting for the cache TTL.
 """
 
 from datetime import date
-from fastapi import APIRouter
+from fastapi import APIRouter, BackgroundTasks
 
 from rest_api.routers.admin._base import (
     Depends, HTTPException, Session, select, or_,
@@ -20,6 +24,7 @@ from shared.utils.admin_schemas import (
     WaiterSectorBulkAssignment, WaiterSectorBulkResult,
     WaiterSectorAssignmentOutput,
 )
+from rest_api.services.events.admin_events import publish_sector_assignments_changed
 
 
 router = APIRouter(tags=["admin-assignments"])
@@ -142,6 +147,7 @@ async def get_branch_assignments(
 @router.post("/assignments/bulk", response_model=WaiterSectorBulkResult)
 async def create_bulk_assignments(
     data: WaiterSectorBulkAssignment,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user: dict = Depends(require_admin_or_manager),
 ) -> WaiterSectorBulkResult:
@@ -253,6 +259,15 @@ async def create_bulk_assignments(
 
     db.commit()
 
+    publish_sector_assignments_changed(
+        tenant_id=tenant_id,
+        branch_id=data.branch_id,
+        waiter_ids=[a.waiter_id for a in created],
+        assignment_date=data.assignment_date,
+        actor_user_id=user_id,
+        background_tasks=background_tasks,
+    )
+
     # Refresh to get IDs
     for a in created:
         db.refresh(a)
@@ -289,6 +304,7 @@ async def create_bulk_assignments(
 async def delete_bulk_assignments(
     branch_id: int,
     assignment_date: date,
+    background_tasks: BackgroundTasks,
     shift: str | None = None,
     db: Session = Depends(get_db),
     user: dict = Depends(require_admin_or_manager),
@@ -323,12 +339,22 @@ async def delete_bulk_assignments(
 
     db.commit()
 
+    publish_sector_assignments_changed(
+        tenant_id=tenant_id,
+        branch_id=branch_id,
+        waiter_ids=[a.waiter_id for a in assignments],
+        assignment_date=assignment_date,
+        actor_user_id=user_id,
+        background_tasks=background_tasks,
+    )
+
     return {"message": f"Deleted {len(assignments)} assignments", "deleted_count": len(assignments)}
 
 
 @router.delete("/assignments/{assignment_id}")
 async def delete_assignment(
     assignment_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user: dict = Depends(require_admin_or_manager),
 ) -> dict:
@@ -352,9 +378,22 @@ async def delete_assignment(
     if not is_admin(user):
         validate_branch_access(user, assignment.branch_id)
 
+    branch_id = assignment.branch_id
+    waiter_id = assignment.waiter_id
+    assignment_date = assignment.assignment_date
+
     soft_delete(db, assignment, int(user["sub"]), get_user_email(user))
     db.commit()
 
+    publish_sector_assignments_changed(
+        tenant_id=tenant_id,
+        branch_id=branch_id,
+        waiter_ids=[waiter_id],
+        assignment_date=assignment_date,
+        actor_user_id=int(user["sub"]),
+        background_tasks=background_tasks,
+    )
+
     return {"message": "Assignment deleted", "id": assignment_id}
 
 
@@ -363,6 +402,7 @@ async def copy_assignments(
     branch_id: int,
     from_date: date,
     to_date: date,
+    background_tasks: BackgroundTasks,
     shift: str | None = None,
     db: Session = Depends(get_db),
     user: dict = Depends(require_admin_or_manager),
@@ -443,6 +483,15 @@ async def copy_assignments(
 
     db.commit()
 
+    publish_sector_assignments_changed(
+        tenant_id=tenant_id,
+        branch_id=branch_id,
+        waiter_ids=[a.waiter_id for a in created],
+        assignment_date=to_date,
+        actor_user_id=user_id,
+        background_tasks=background_tasks,
+    )
+
     for a in created:
         db.refresh(a)
 
@@ -11,7 +11,7 @@ from rest_api.routers.admin._base import (
     get_db, current_user, Branch,
     soft_delete, set_created_by, set_updated_by,
     get_user_id, get_user_email, publish_entity_deleted,
-    require_admin, require_admin_or_manager,
+    bump_menu_version, require_admin, require_admin_or_manager,
     is_admin, validate_branch_access,
 )
 from shared.utils.admin_schemas import BranchOutput, BranchCreate, BranchUpdate
@@ -133,6 +133,8 @@ def update_branch(
             detail="Branch not found",
         )
 
+    previous_slug = branch.slug
+
     update_data = body.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(branch, key, value)
@@ -150,6 +152,9 @@ def update_branch(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update branch - please try again",
         )
+
+    # PERF-MENU-01: Menu embeds branch name/slug; a renamed slug stops resolving
+    bump_menu_version(branch.id, forget_slugs=(previous_slug, branch.slug))
     return BranchOutput.model_validate(branch)
 
 
@@ -178,10 +183,14 @@ def delete_branch(
         )
 
     branch_name = branch.name
+    branch_slug = branch.slug
     tenant_id = branch.tenant_id
 
     soft_delete(db, branch, get_user_id(user), get_user_email(user))
 
+    # PERF-MENU-01: Deleted branch must stop serving its cached menu
+    bump_menu_version(branch_id, forget_slugs=(branch_slug,))
+
     # PERF-BGTASK-01: Pass BackgroundTasks for proper lifecycle management
     publish_entity_deleted(
         tenant_id=tenant_id,
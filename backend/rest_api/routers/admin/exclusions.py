@@ -11,7 +11,7 @@ from rest_api.routers.admin._base import (
     BranchCategoryExclusion, BranchSubcategoryExclusion,
     soft_delete, set_created_by,
     get_user_id, get_user_email,
-    require_admin,
+    bump_menu_version, require_admin,
 )
 from shared.utils.admin_schemas import (
     ExclusionOverview, CategoryExclusionSummary, SubcategoryExclusionSummary,
@@ -179,6 +179,9 @@ def update_category_exclusions(
         )
     ).scalars().all()
 
+    # PERF-MENU-01: Branches that were or become excluded change their menu
+    affected_branch_ids = {exc.branch_id for exc in existing} | set(body.excluded_branch_ids)
+
     for exc in existing:
         soft_delete(db, exc, get_user_id(user), get_user_email(user))
 
@@ -192,6 +195,7 @@ def update_category_exclusions(
         db.add(exclusion)
 
     db.commit()
+    bump_menu_version(*affected_branch_ids)
 
     return CategoryExclusionSummary(
         category_id=category.id,
@@ -287,6 +291,9 @@ def update_subcategory_exclusions(
         )
     ).scalars().all()
 
+    # PERF-MENU-01: Branches that were or become excluded change their menu
+    affected_branch_ids = {exc.branch_id for exc in existing} | set(body.excluded_branch_ids)
+
     for exc in existing:
         soft_delete(db, exc, get_user_id(user), get_user_email(user))
 
@@ -300,6 +307,7 @@ def update_subcategory_exclusions(
         db.add(exclusion)
 
     db.commit()
+    bump_menu_version(*affected_branch_ids)
 
     return SubcategoryExclusionSummary(
         subcategory_id=subcategory.id,
@@ -11,7 +11,7 @@ from rest_api.routers.admin._base import (
     get_db, current_user, Subcategory, Category,
     soft_delete, set_created_by, set_updated_by,
     get_user_id, get_user_email, publish_entity_deleted,
-    require_admin,
+    bump_menu_version, require_admin,
 )
 from shared.utils.validators import validate_image_url
 from shared.utils.admin_schemas import SubcategoryOutput, SubcategoryCreate, SubcategoryUpdate
@@ -125,6 +125,9 @@ def create_subcategory(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create subcategory - please try again",
         )
+
+    # PERF-MENU-01
+    bump_menu_version(category.branch_id)
     return SubcategoryOutput.model_validate(subcategory)
 
 
@@ -161,6 +164,9 @@ def update_subcategory(
                 detail=str(e),
             )
 
+    # PERF-MENU-01: Menus of the old and new category's branch change
+    previous_branch_id = subcategory.category.branch_id
+
     for key, value in update_data.items():
         setattr(subcategory, key, value)
 
@@ -177,6 +183,8 @@ def update_subcategory(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update subcategory - please try again",
         )
+
+    bump_menu_version(previous_branch_id, subcategory.category.branch_id)
     return SubcategoryOutput.model_validate(subcategory)
 
 
@@ -215,6 +223,9 @@ def delete_subcategory(
 
     soft_delete(db, subcategory, get_user_id(user), get_user_email(user))
 
+    # PERF-MENU-01
+    bump_menu_version(branch_id)
+
     publish_entity_deleted(
         tenant_id=tenant_id,
         entity_type="subcategory",
@@ -1,15 +1,15 @@
 """
 Catalogs router for cooking methods, flavors, and textures (Phase 3 - Canonical Product Model).
 Read-only endpoints for global catalogs used in product configuration.
+
+PERF-WARM-01: Served from the reference catalog cache (see
+rest_api/services/catalog/reference_catalogs.py) and paginated in memory.
 """
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from sqlalchemy import select
 
-from shared.infrastructure.db import get_db
-from rest_api.models import CookingMethod, FlavorProfile, TextureProfile, CuisineType
+from rest_api.services.catalog.reference_catalogs import get_reference_catalog
 from shared.security.auth import current_user_context as current_user
 
 
@@ -71,8 +71,7 @@ class CuisineTypeOutput(BaseModel):
 
 
 @router.get("/cooking-methods", response_model=list[CookingMethodOutput])
-def list_cooking_methods(
-    db: Session = Depends(get_db),
+async def list_cooking_methods(
     user: dict = Depends(current_user),
     limit: int = 100,
     offset: int = 0,
@@ -87,14 +86,8 @@ def list_cooking_methods(
     limit = min(max(1, limit), 200)  # 1-200
     offset = max(0, offset)
 
-    methods = db.execute(
-        select(CookingMethod)
-        .where(CookingMethod.is_active.is_(True))
-        .order_by(CookingMethod.name)
-        .limit(limit)
-        .offset(offset)
-    ).scalars().all()
-    return [CookingMethodOutput.model_validate(m) for m in methods]
+    rows = await get_reference_catalog("cooking_methods")
+    return [CookingMethodOutput.model_validate(row) for row in rows[offset:offset + limit]]
 
 
 # =============================================================================
@@ -103,8 +96,7 @@ def list_cooking_methods(
 
 
 @router.get("/flavor-profiles", response_model=list[FlavorProfileOutput])
-def list_flavor_profiles(
-    db: Session = Depends(get_db),
+async def list_flavor_profiles(
     user: dict = Depends(current_user),
     limit: int = 100,
     offset: int = 0,
@@ -119,14 +111,8 @@ def list_flavor_profiles(
     limit = min(max(1, limit), 200)
     offset = max(0, offset)
 
-    profiles = db.execute(
-        select(FlavorProfile)
-        .where(FlavorProfile.is_active.is_(True))
-        .order_by(FlavorProfile.name)
-        .limit(limit)
-        .offset(offset)
-    ).scalars().all()
-    return [FlavorProfileOutput.model_validate(p) for p in profiles]
+    rows = await get_reference_catalog("flavor_profiles")
+    return [FlavorProfileOutput.model_validate(row) for row in rows[offset:offset + limit]]
 
 
 # =============================================================================
@@ -135,8 +121,7 @@ def list_flavor_profiles(
 
 
 @router.get("/texture-profiles", response_model=list[TextureProfileOutput])
-def list_texture_profiles(
-    db: Session = Depends(get_db),
+async def list_texture_profiles(
     user: dict = Depends(current_user),
     limit: int = 100,
     offset: int = 0,
@@ -151,14 +136,8 @@ def list_texture_profiles(
     limit = min(max(1, limit), 200)
     offset = max(0, offset)
 
-    profiles = db.execute(
-        select(TextureProfile)
-        .where(TextureProfile.is_active.is_(True))
-        .order_by(TextureProfile.name)
-        .limit(limit)
-        .offset(offset)
-    ).scalars().all()
-    return [TextureProfileOutput.model_validate(p) for p in profiles]
+    rows = await get_reference_catalog("texture_profiles")
+    return [TextureProfileOutput.model_validate(row) for row in rows[offset:offset + limit]]
 
 
 # =============================================================================
@@ -167,8 +146,7 @@ def list_texture_profiles(
 
 
 @router.get("/cuisine-types", response_model=list[CuisineTypeOutput])
-def list_cuisine_types(
-    db: Session = Depends(get_db),
+async def list_cuisine_types(
     user: dict = Depends(current_user),
     limit: int = 100,
     offset: int = 0,
@@ -183,11 +161,5 @@ def list_cuisine_types(
     limit = min(max(1, limit), 200)
     offset = max(0, offset)
 
-    types = db.execute(
-        select(CuisineType)
-        .where(CuisineType.is_active.is_(True))
-        .order_by(CuisineType.name)
-        .limit(limit)
-        .offset(offset)
-    ).scalars().all()
-    return [CuisineTypeOutput.model_validate(t) for t in types]
+    rows = await get_reference_catalog("cuisine_types")
+    return [CuisineTypeOutput.model_validate(row) for row in rows[offset:offset + limit]]
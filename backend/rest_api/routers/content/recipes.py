@@ -1307,6 +1307,7 @@ def derive_product_from_recipe(
     )
 
     # Create branch prices if provided
+    priced_branch_ids = []
     if body.branch_prices:
         from rest_api.models import BranchProduct, Branch
         for bp in body.branch_prices:
@@ -1328,6 +1329,7 @@ def derive_product_from_recipe(
                 is_available=bp.get("is_available", True),
             )
             db.add(branch_product)
+            priced_branch_ids.append(branch.id)
 
     # AUDIT-FIX: Wrap commit in try-except for consistent error handling
     try:
@@ -1341,6 +1343,10 @@ def derive_product_from_recipe(
             detail="Failed to create derived product - please try again",
         )
 
+    # PERF-MENU-01: Derived product shows up in the menus of its branches
+    from rest_api.services.catalog.menu_cache import bump_menu_version
+    bump_menu_version(*priced_branch_ids)
+
     return DeriveProductOutput(
         id=product.id,
         name=product.name,
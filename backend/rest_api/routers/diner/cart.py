@@ -9,8 +9,9 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.infrastructure.db import get_db
+from shared.infrastructure.db import get_async_db, get_db
 from shared.security.rate_limit import limiter
 from shared.security.auth import current_table_context
 from shared.config.logging import diner_logger as logger
@@ -234,6 +235,7 @@ def add_to_cart(
 
     # Increment cart version
     session.cart_version += 1
+    cart_version = session.cart_version
 
     # AUDIT-FIX: Wrap commit in try-except for consistent error handling
     try:
@@ -268,7 +270,7 @@ def add_to_cart(
         tenant_id=tenant_id,
         branch_id=branch_id,
         session_id=session_id,
-        entity=output.model_dump(),
+        entity={**output.model_dump(), "cart_version": cart_version},
         actor_diner_id=diner.id,
     )
 
@@ -325,6 +327,7 @@ def update_cart_item(
     session = db.get(TableSession, session_id)
     if session:
         session.cart_version += 1
+    cart_version = session.cart_version if session else None
 
     # AUDIT-FIX: Wrap commit in try-except for consistent error handling
     try:
@@ -366,7 +369,7 @@ def update_cart_item(
         tenant_id=tenant_id,
         branch_id=branch_id,
         session_id=session_id,
-        entity=output.model_dump(),
+        entity={**output.model_dump(), "cart_version": cart_version},
         actor_diner_id=cart_item.diner.id,
     )
 
@@ -420,6 +423,7 @@ def remove_cart_item(
     session = db.get(TableSession, session_id)
     if session:
         session.cart_version += 1
+    cart_version = session.cart_version if session else None
 
     # AUDIT-FIX: Wrap commit in try-except for consistent error handling
     try:
@@ -443,6 +447,7 @@ def remove_cart_item(
             "item_id": item_id,
             "product_id": product_id,
             "diner_id": diner_id,
+            "cart_version": cart_version,
         },
         actor_diner_id=diner_id,
     )
@@ -450,9 +455,9 @@ def remove_cart_item(
 
 @router.get("", response_model=CartOutput)
 @limiter.limit("60/minute")
-def get_cart(
+async def get_cart(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     table_ctx: dict[str, int] = Depends(current_table_context),
 ) -> CartOutput:
     """
@@ -461,12 +466,14 @@ def get_cart(
     Returns all active cart items for the session with current version.
 
     Requires X-Table-Token header.
+
+    PERF-ASYNCDB-01: Called on every diner reconnect; runs on the async session.
     """
     session_id = table_ctx["session_id"]
     branch_id = table_ctx["branch_id"]
 
     # Get session with cart version
-    session = db.get(TableSession, session_id)
+    session = await db.get(TableSession, session_id)
     if not session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -474,7 +481,7 @@ def get_cart(
         )
 
     # Get all active cart items
-    cart_items = db.scalars(
+    cart_items = (await db.scalars(
         select(CartItem)
         .options(
             selectinload(CartItem.product).selectinload(Product.branch_products),
@@ -485,7 +492,7 @@ def get_cart(
             CartItem.is_active.is_(True),
         )
         .order_by(CartItem.created_at)
-    ).all()
+    )).all()
 
     # Build output
     items = []
@@ -549,6 +556,7 @@ def clear_cart(
     session = db.get(TableSession, session_id)
     if session:
         session.cart_version += 1
+    cart_version = session.cart_version if session else None
 
     # AUDIT-FIX: Wrap commit in try-except for consistent error handling
     try:
@@ -568,6 +576,6 @@ def clear_cart(
         tenant_id=tenant_id,
         branch_id=branch_id,
         session_id=session_id,
-        entity={"cleared": True},
+        entity={"cleared": True, "cart_version": cart_version},
         actor_diner_id=None,
     )
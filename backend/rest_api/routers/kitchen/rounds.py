@@ -9,8 +9,9 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, selectinload, joinedload
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.infrastructure.db import get_db
+from shared.infrastructure.db import get_async_db, get_db
 from rest_api.models import (
     Round,
     RoundItem,
@@ -41,8 +42,8 @@ router = APIRouter(prefix="/api/kitchen", tags=["kitchen"])
 
 
 @router.get("/rounds", response_model=list[RoundOutput])
-def get_pending_rounds(
-    db: Session = Depends(get_db),
+async def get_pending_rounds(
+    db: AsyncSession = Depends(get_async_db),
     ctx: dict[str, Any] = Depends(current_user_context),
 ) -> list[RoundOutput]:
     """
@@ -59,6 +60,8 @@ def get_pending_rounds(
     - READY/SERVED: Handled by Dashboard, not kitchen view
 
     Requires KITCHEN, MANAGER, or ADMIN role.
+
+    PERF-ASYNCDB-01: Polled by every kitchen screen; runs on the async session.
     """
     require_roles(ctx, ["KITCHEN", "MANAGER", "ADMIN"])
 
@@ -71,7 +74,7 @@ def get_pending_rounds(
     # - joinedload for session->table chain (many-to-one)
     # Kitchen only sees SUBMITTED and IN_KITCHEN (2 columns: Nuevos, En Cocina)
     # PENDING and CONFIRMED are handled by waiter/admin, not kitchen
-    rounds = db.execute(
+    rounds = (await db.execute(
         select(Round)
         .options(
             selectinload(Round.items).joinedload(RoundItem.product),
@@ -82,7 +85,7 @@ def get_pending_rounds(
             Round.status.in_(["SUBMITTED", "IN_KITCHEN"]),
         )
         .order_by(Round.submitted_at.asc())
-    ).scalars().unique().all()
+    )).scalars().unique().all()
 
     result = []
     for round_obj in rounds:
@@ -4,11 +4,12 @@ Exposes menu data for the pwaMenu application.
 No authentication required for public endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.infrastructure.db import get_db
+from shared.infrastructure.db import get_async_db, get_db
 from shared.security.rate_limit import limiter
 from rest_api.models import (
     Branch,
@@ -48,6 +49,13 @@ from shared.utils.schemas import (
     ProductCookingOutput,
 )
 from rest_api.services.catalog.product_view import get_product_complete
+from rest_api.services.catalog.menu_cache import (
+    MENU_ALLERGENS,
+    PUBLIC_MENU,
+    cached_menu_response,
+    get_menu_cache,
+)
+from shared.infrastructure.cache.access import get_access_tracker
 
 
 router = APIRouter(prefix="/api/public", tags=["catalog"])
@@ -96,7 +104,11 @@ def get_public_branches(db: Session = Depends(get_db)) -> list[BranchPublicOutpu
 
 @router.get("/menu/{branch_slug}", response_model=MenuOutput)
 @limiter.limit("100/minute")
-def get_menu(request: Request, branch_slug: str, db: Session = Depends(get_db)) -> MenuOutput:
+async def get_menu(
+    request: Request,
+    branch_slug: str,
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
     """
     Get the complete menu for a branch.
 
@@ -104,11 +116,92 @@ def get_menu(request: Request, branch_slug: str, db: Session = Depends(get_db))
     with their prices for the specified branch.
 
     This endpoint is public and does not require authentication.
+
+    PERF-MENU-01: Served from the versioned pre-serialized menu cache; only
+    a miss (first request after an admin change) touches the database.
+    Responses carry an ETag and a matching If-None-Match gets a 304.
+
+    PERF-COMPRESS-01: gzip/brotli variants are built once with the cache
+    entry and picked by Accept-Encoding.
+
+    PERF-ASYNCDB-01: Runs on the event loop with the async Redis pool and
+    session; the menu render of a miss runs through run_sync.
     """
-    # Find branch by slug
+    menu_cache = get_menu_cache()
+    branch_id, branch = await _resolve_branch_async(db, branch_slug)
+
+    # PERF-WARM-01: Hot menus are re-rendered ahead of requests
+    get_access_tracker().record(PUBLIC_MENU, branch_id)
+
+    version, cached = await menu_cache.aget(branch_id, PUBLIC_MENU)
+    if cached is None:
+        if branch is None:
+            branch = await _get_active_branch_async(db, Branch.id == branch_id, branch_slug)
+        body = await db.run_sync(render_public_menu, branch)
+        cached = await menu_cache.astore(
+            branch_id, version, body, endpoint=request.scope["route"].path
+        )
+
+    return cached_menu_response(request, cached)
+
+
+def render_public_menu(db: Session, branch: Branch) -> str:
+    """Serialize the public menu of a branch (PERF-WARM-01: also used by the cache warmer)."""
+    return _build_menu(db, branch).model_dump_json(by_alias=True)
+
+
+def _resolve_branch(db: Session, branch_slug: str) -> tuple[int, Branch | None]:
+    """
+    Get the branch ID of an active branch slug, cached (PERF-MENU-01).
+
+    Returns:
+        (branch_id, branch). branch is only loaded when the slug was not
+        cached; load it with _get_active_branch() if a render needs it.
+    """
+    menu_cache = get_menu_cache()
+    branch_id = menu_cache.resolve_branch(branch_slug)
+    if branch_id is not None:
+        return branch_id, None
+
+    branch = _get_active_branch(db, Branch.slug == branch_slug, branch_slug)
+    menu_cache.remember_branch(branch_slug, branch.id)
+    return branch.id, branch
+
+
+async def _resolve_branch_async(db: AsyncSession, branch_slug: str) -> tuple[int, Branch | None]:
+    """Async _resolve_branch() (PERF-ASYNCDB-01)."""
+    menu_cache = get_menu_cache()
+    branch_id = await menu_cache.aresolve_branch(branch_slug)
+    if branch_id is not None:
+        return branch_id, None
+
+    branch = await _get_active_branch_async(db, Branch.slug == branch_slug, branch_slug)
+    await menu_cache.aremember_branch(branch_slug, branch.id)
+    return branch.id, branch
+
+
+async def _get_active_branch_async(db: AsyncSession, condition, branch_slug: str) -> Branch:
+    """Async _get_active_branch() (PERF-ASYNCDB-01)."""
+    branch = await db.scalar(
+        select(Branch).where(
+            condition,
+            Branch.is_active.is_(True),
+        )
+    )
+
+    if not branch:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Branch '{branch_slug}' not found",
+        )
+    return branch
+
+
+def _get_active_branch(db: Session, condition, branch_slug: str) -> Branch:
+    """Load an active branch or raise 404."""
     branch = db.scalar(
         select(Branch).where(
-            Branch.slug == branch_slug,
+            condition,
             Branch.is_active.is_(True),
         )
     )
@@ -118,7 +211,11 @@ def get_menu(request: Request, branch_slug: str, db: Session = Depends(get_db))
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Branch '{branch_slug}' not found",
         )
+    return branch
+
 
+def _build_menu(db: Session, branch: Branch) -> MenuOutput:
+    """Render the complete menu of a branch from the database."""
     import json
 
     # ROUTER-HIGH-05 FIX: Get excluded category IDs for this branch
@@ -525,9 +622,10 @@ def get_product_complete_endpoint(
 
 @router.get("/menu/{branch_slug}/allergens", response_model=list[AllergenPublicOutput])
 def get_allergens_with_cross_reactions(
+    request: Request,
     branch_slug: str,
     db: Session = Depends(get_db),
-) -> list[AllergenPublicOutput]:
+) -> Response:
     """
     Get all allergens with cross-reaction information for pwaMenu filters.
 
@@ -536,25 +634,43 @@ def get_allergens_with_cross_reactions(
     (e.g., latex-fruit syndrome).
 
     This endpoint is public and does not require authentication.
+
+    PERF-WARM-01: Cached per branch under the menu version like the menu
+    itself; allergen and cross-reaction writes bump it.
     """
-    # Find branch to get tenant_id
-    branch = db.scalar(
-        select(Branch).where(
-            Branch.slug == branch_slug,
-            Branch.is_active.is_(True),
+    menu_cache = get_menu_cache()
+    branch_id, branch = _resolve_branch(db, branch_slug)
+    get_access_tracker().record(MENU_ALLERGENS, branch_id)
+
+    version, cached = menu_cache.get(branch_id, MENU_ALLERGENS)
+    if cached is None:
+        if branch is None:
+            branch = _get_active_branch(db, Branch.id == branch_id, branch_slug)
+        cached = menu_cache.store(
+            branch_id,
+            version,
+            render_allergens(db, branch),
+            endpoint=request.scope["route"].path,
+            kind=MENU_ALLERGENS,
         )
-    )
 
-    if not branch:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Branch '{branch_slug}' not found",
-        )
+    return cached_menu_response(request, cached)
+
+
+def render_allergens(db: Session, branch: Branch) -> str:
+    """Serialize the allergens with cross-reactions of a branch's tenant."""
+    import json
+
+    allergens = _build_allergens(db, branch.tenant_id)
+    return json.dumps([allergen.model_dump(mode="json", by_alias=True) for allergen in allergens])
+
 
+def _build_allergens(db: Session, tenant_id: int) -> list[AllergenPublicOutput]:
+    """Load the active allergens of a tenant with their cross-reactions."""
     # Get all active allergens for this tenant
     allergens = db.execute(
         select(Allergen).where(
-            Allergen.tenant_id == branch.tenant_id,
+            Allergen.tenant_id == tenant_id,
             Allergen.is_active.is_(True),
         ).order_by(Allergen.is_mandatory.desc(), Allergen.name)
     ).scalars().all()
@@ -12,8 +12,9 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.infrastructure.db import get_db
+from shared.infrastructure.db import get_async_db, get_db
 from shared.security.rate_limit import limiter
 from rest_api.models import (
     Branch,
@@ -55,9 +56,9 @@ router = APIRouter(tags=["tables"])
 
 
 @router.get("/api/waiter/tables", response_model=list[TableCard])
-def get_waiter_tables(
+async def get_waiter_tables(
     branch_id: int = Query(None, description="Filter by specific branch ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     ctx: dict[str, Any] = Depends(current_user_context),
 ) -> list[TableCard]:
     """
@@ -78,6 +79,8 @@ def get_waiter_tables(
     - Check status (if any)
 
     Requires WAITER, MANAGER, or ADMIN role.
+
+    PERF-ASYNCDB-01: Polled by every waiter device; runs on the async session.
     """
     require_roles(ctx, ["WAITER", "MANAGER", "ADMIN"])
 
@@ -114,7 +117,7 @@ def get_waiter_tables(
     if not is_admin_or_manager:
         today = date.today()
         # Get waiter's sector assignments for today
-        assignments = db.execute(
+        assignments = (await db.execute(
             select(WaiterSectorAssignment.sector_id)
             .where(
                 WaiterSectorAssignment.waiter_id == user_id,
@@ -122,7 +125,7 @@ def get_waiter_tables(
                 WaiterSectorAssignment.assignment_date == today,
                 WaiterSectorAssignment.is_active.is_(True),
             )
-        ).scalars().all()
+        )).scalars().all()
         assigned_sector_ids = list(assignments) if assignments else []
 
         logger.info(
@@ -155,7 +158,9 @@ def get_waiter_tables(
     if assigned_sector_ids is not None:
         query = query.where(Table.sector_id.in_(assigned_sector_ids))
 
-    tables = db.execute(query.order_by(Table.branch_id, Table.code)).scalars().unique().all()
+    tables = (
+        await db.execute(query.order_by(Table.branch_id, Table.code))
+    ).scalars().unique().all()
 
     logger.info("SECTOR-FILTER: Tables found", count=len(tables), is_admin_or_manager=is_admin_or_manager)
 
@@ -168,13 +173,13 @@ def get_waiter_tables(
     table_ids = [t.id for t in tables]
 
     # 1. Batch fetch all active sessions for these tables
-    sessions_query = db.execute(
+    sessions_query = (await db.execute(
         select(TableSession)
         .where(
             TableSession.table_id.in_(table_ids),
             TableSession.status.in_(["OPEN", "PAYING"]),
         )
-    ).scalars().all()
+    )).scalars().all()
 
     # Build lookup: table_id -> session (most recent if multiple)
     session_by_table: dict[int, TableSession] = {}
@@ -190,7 +195,7 @@ def get_waiter_tables(
     # FIX: Include CONFIRMED status - rounds verified by waiter but not yet sent to kitchen
     rounds_count_by_session: dict[int, int] = {}
     if active_session_ids:
-        rounds_query = db.execute(
+        rounds_query = (await db.execute(
             select(Round.table_session_id, func.count().label("cnt"))
             .where(
                 Round.table_session_id.in_(active_session_ids),
@@ -198,7 +203,7 @@ def get_waiter_tables(
                 Round.is_active.is_(True),
             )
             .group_by(Round.table_session_id)
-        ).all()
+        )).all()
         for row in rounds_query:
             rounds_count_by_session[row[0]] = row[1]
 
@@ -206,14 +211,14 @@ def get_waiter_tables(
     # This allows the frontend to call resolve on specific call IDs
     calls_by_session: dict[int, list[int]] = {}
     if active_session_ids:
-        calls_query = db.execute(
+        calls_query = (await db.execute(
             select(ServiceCall.id, ServiceCall.table_session_id)
             .where(
                 ServiceCall.table_session_id.in_(active_session_ids),
                 ServiceCall.status == "OPEN",
                 ServiceCall.is_active.is_(True),
             )
-        ).all()
+        )).all()
         for call_id, session_id in calls_query:
             if session_id not in calls_by_session:
                 calls_by_session[session_id] = []
@@ -227,11 +232,11 @@ def get_waiter_tables(
         # then iterate and keep only the first (most recent) check per session.
         # This is more efficient than a subquery for small result sets and avoids
         # complex window functions that may not be optimized in all databases.
-        checks_query = db.execute(
+        checks_query = (await db.execute(
             select(Check)
             .where(Check.table_session_id.in_(active_session_ids))
             .order_by(Check.table_session_id, Check.created_at.desc())
-        ).scalars().all()
+        )).scalars().all()
         # Keep only the most recent check per session (first seen due to DESC ordering)
         for check in checks_query:
             if check.table_session_id not in check_status_by_session:
@@ -242,7 +247,7 @@ def get_waiter_tables(
     confirmed_by_name_by_session: dict[int, str] = {}
     if active_session_ids:
         # Query rounds with confirmed_by_user_id, joined with User to get last_name
-        confirmed_rounds_query = db.execute(
+        confirmed_rounds_query = (await db.execute(
             select(Round.table_session_id, User.last_name)
             .join(User, Round.confirmed_by_user_id == User.id)
             .where(
@@ -251,7 +256,7 @@ def get_waiter_tables(
                 Round.is_active.is_(True),
             )
             .order_by(Round.table_session_id, Round.created_at.desc())
-        ).all()
+        )).all()
         # Keep only the most recent confirmed_by per session
         for session_id, last_name in confirmed_rounds_query:
             if session_id not in confirmed_by_name_by_session:
@@ -9,7 +9,7 @@ from datetime import date, datetime, timezone
 from enum import Enum
 from typing import Any, Optional, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import select, or_, func
@@ -73,6 +73,8 @@ from shared.infrastructure.events import (
     TABLE_CLEARED,
 )
 from rest_api.services.payments.allocation import allocate_payment_fifo
+from rest_api.services.catalog.menu_cache import WAITER_MENU, cached_menu_response, get_menu_cache
+from shared.infrastructure.cache.access import get_access_tracker
 from rest_api.services.domain import RoundService, ServiceCallService, BillingService
 from rest_api.services.domain.service_call_service import (
     ServiceCallNotFoundError,
@@ -1414,15 +1416,19 @@ class MenuCompactOutput(BaseModel):
 
 @router.get("/branches/{branch_id}/menu", response_model=MenuCompactOutput)
 def get_branch_menu_compact(
+    request: Request,
     branch_id: int,
     db: Session = Depends(get_db),
     ctx: dict[str, Any] = Depends(current_user_context),
-) -> MenuCompactOutput:
+) -> Response:
     """
     COMANDA RÁPIDA: Get compact menu for a branch.
 
     Returns products organized by category, without images, optimized for
     quick waiter order entry. Includes allergen icons for quick reference.
+
+    PERF-WARM-01: Cached per branch under the menu version, so the admin
+    writes that bump the public menu invalidate it too.
     """
     require_roles(ctx, ["WAITER", "MANAGER", "ADMIN"])
 
@@ -1436,21 +1442,47 @@ def get_branch_menu_compact(
             detail="No access to this branch",
         )
 
-    # Get branch info
-    branch = db.scalar(
-        select(Branch).where(
-            Branch.id == branch_id,
-            Branch.tenant_id == tenant_id,
-            Branch.is_active.is_(True),
+    menu_cache = get_menu_cache()
+    get_access_tracker().record(WAITER_MENU, branch_id)
+
+    version, cached = menu_cache.get(branch_id, WAITER_MENU)
+    if cached is None:
+        # Get branch info
+        branch = db.scalar(
+            select(Branch).where(
+                Branch.id == branch_id,
+                Branch.tenant_id == tenant_id,
+                Branch.is_active.is_(True),
+            )
         )
-    )
 
-    if not branch:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Branch {branch_id} not found",
+        if not branch:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Branch {branch_id} not found",
+            )
+
+        cached = menu_cache.store(
+            branch_id,
+            version,
+            render_compact_menu(db, branch),
+            endpoint=request.scope["route"].path,
+            kind=WAITER_MENU,
         )
 
+    return cached_menu_response(request, cached)
+
+
+def render_compact_menu(db: Session, branch: Branch) -> str:
+    """Serialize the compact waiter menu of a branch (also used by the cache warmer)."""
+    return _build_compact_menu(db, branch).model_dump_json()
+
+
+def _build_compact_menu(db: Session, branch: Branch) -> MenuCompactOutput:
+    """Render the compact waiter menu of a branch from the database."""
+    tenant_id = branch.tenant_id
+    branch_id = branch.id
+
     # Get all categories for this branch's tenant
     # RTR-LOW-05 FIX: Removed inline import - moved to top of file
     categories = db.execute(
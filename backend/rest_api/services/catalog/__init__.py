@@ -3,6 +3,8 @@ Catalog Services - Product catalog and content management.
 
 Provides:
 - Product view service with Redis caching
+- Versioned pre-serialized public menu cache
+- Menu cache warming and reference catalog cache
 - RAG text generation for products and recipes
 - Recipe-to-product synchronization
 """
@@ -30,6 +32,29 @@ from .product_view import (
     generate_product_text_for_rag,
     generate_recipe_text_for_rag,
 )
+from .menu_cache import (
+    MENU_ALLERGENS,
+    MENU_KINDS,
+    PUBLIC_MENU,
+    WAITER_MENU,
+    CachedMenu,
+    MenuCache,
+    get_menu_cache,
+    bump_menu_version,
+    cached_menu_response,
+    compute_etag,
+    etag_matches,
+)
+from .menu_warming import (
+    list_active_branches,
+    warm_branch_menus,
+)
+from .reference_catalogs import (
+    REFERENCE_CATALOG,
+    REFERENCE_CATALOGS,
+    get_reference_catalog,
+    refresh_reference_catalog,
+)
 from .recipe_sync import (
     sync_product_from_recipe,
     derive_product_from_recipe,
@@ -56,6 +81,25 @@ __all__ = [
     "get_products_complete_for_branch_cached",
     "invalidate_branch_products_cache",
     "invalidate_all_branch_caches_for_tenant",
+    # Public menu cache
+    "MENU_ALLERGENS",
+    "MENU_KINDS",
+    "PUBLIC_MENU",
+    "WAITER_MENU",
+    "CachedMenu",
+    "MenuCache",
+    "get_menu_cache",
+    "bump_menu_version",
+    "cached_menu_response",
+    "compute_etag",
+    "etag_matches",
+    # Cache warming
+    "list_active_branches",
+    "warm_branch_menus",
+    "REFERENCE_CATALOG",
+    "REFERENCE_CATALOGS",
+    "get_reference_catalog",
+    "refresh_reference_catalog",
     # RAG text generation
     "generate_product_text_for_rag",
     "generate_recipe_text_for_rag",
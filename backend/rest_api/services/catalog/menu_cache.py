@@ -0,0 +1,460 @@
+"""
+Pre-serialized public menu cache.
+
+PERF-MENU-01: GET /api/public/menu/{branch_slug} runs about ten queries and
+serializes the whole menu on every call, so a QR-scan rush at opening time
+hits Postgres once per diner. The rendered JSON is stored in Redis as
+ready-to-send text, keyed by a per-branch menu version:
+
+- cache:menu:slug:{slug}        -> branch_id
+- cache:menu:version:{branch_id} -> menu version (never expires)
+- cache:menu:{branch_id}        -> hash {version, etag, size, body, gzip, br}
+- cache:menu:{kind}:{branch_id} -> same hash for the other menu views (kind)
+
+An entry is only served while its version equals the current menu version.
+Admin writes that change what the menu shows (products, prices, categories,
+subcategories, exclusions, branch data) call bump_menu_version() after
+their commit; nothing has to be deleted.
+
+The ETag is a hash of the body, so an unchanged menu keeps its ETag across
+bumps and returning diners get a 304.
+
+PERF-COMPRESS-01: The gzip/brotli variants are produced once when the entry
+is built and stored next to the raw body (base64, the pooled client decodes
+responses), so cached menus are never recompressed per request.
+
+PERF-WARM-01: The compact waiter menu and the allergen list with
+cross-reactions are stored the same way, as other kinds of entry under the
+same menu version, so every bump invalidates them too. version_to_refresh()
+lets the cache warmer render entries that are missing, stale or about to
+expire before a request needs them.
+
+PERF-ASYNCDB-01: aresolve_branch/aget/astore are the same operations over
+the async Redis pool, for async endpoints.
+
+Redis failures are never fatal: reads fall back to rendering from the
+database, writes are skipped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from fastapi import Request, Response, status
+
+from shared.config.logging import get_logger
+from shared.utils.compression import PREFERRED_ENCODINGS, negotiate_encoding, precompress
+from shared.infrastructure.redis.constants import (
+    MENU_CACHE_TTL,
+    PREFIX_CACHE_MENU,
+    PREFIX_CACHE_MENU_SLUG,
+    PREFIX_CACHE_MENU_VERSION,
+)
+
+logger = get_logger(__name__)
+
+# PERF-WARM-01: Kinds of entry rendered per branch and menu version
+PUBLIC_MENU = "public"
+WAITER_MENU = "waiter"
+MENU_ALLERGENS = "allergens"
+MENU_KINDS = (PUBLIC_MENU, WAITER_MENU, MENU_ALLERGENS)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedMenu:
+    """A rendered menu ready to be sent."""
+
+    version: int
+    etag: str
+    body: str
+    size: int
+    # Precompressed bodies by content encoding (PERF-COMPRESS-01)
+    variants: dict[str, bytes] = field(default_factory=dict)
+
+
+def compute_etag(body: str) -> str:
+    """
+    ETag of a serialized menu.
+
+    Weak, because the same menu is sent as identity, gzip or brotli
+    (PERF-COMPRESS-01) and a strong ETag must differ per encoding.
+    """
+    return 'W/"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+
+    Handles lists, weak validators (W/) and the "*" wildcard.
+    """
+    if not if_none_match:
+        return False
+    tag = _opaque_tag(etag)
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or _opaque_tag(candidate) == tag:
+            return True
+    return False
+
+
+def _version_key(branch_id: int) -> str:
+    return f"{PREFIX_CACHE_MENU_VERSION}{branch_id}"
+
+
+def _entry_key(branch_id: int, kind: str = PUBLIC_MENU) -> str:
+    if kind == PUBLIC_MENU:
+        return f"{PREFIX_CACHE_MENU}{branch_id}"
+    return f"{PREFIX_CACHE_MENU}{kind}:{branch_id}"
+
+
+def _slug_key(branch_slug: str) -> str:
+    return f"{PREFIX_CACHE_MENU_SLUG}{branch_slug}"
+
+
+def _initial_version() -> int:
+    # Seeding from the clock means a version key lost with a Redis flush
+    # never restarts at a value an older entry was stored under.
+    return time.time_ns()
+
+
+def _default_client() -> Any:
+    from shared.infrastructure.events import get_redis_sync_client
+
+    return get_redis_sync_client()
+
+
+async def _default_async_client() -> Any:
+    from shared.infrastructure.events import get_redis_pool
+
+    return await get_redis_pool()
+
+
+def _queue_get(pipe: Any, branch_id: int, kind: str) -> None:
+    pipe.set(_version_key(branch_id), _initial_version(), nx=True)
+    pipe.get(_version_key(branch_id))
+    pipe.hgetall(_entry_key(branch_id, kind))
+
+
+def _parse_get(results: list[Any]) -> tuple[int, CachedMenu | None]:
+    _, version, entry = results
+    version = int(version)
+    if entry and "size" in entry and int(entry.get("version", -1)) == version:
+        return version, CachedMenu(
+            version=version,
+            etag=entry["etag"],
+            body=entry["body"],
+            size=int(entry["size"]),
+            variants={
+                encoding: base64.b64decode(entry[encoding])
+                for encoding in PREFERRED_ENCODINGS
+                if entry.get(encoding)
+            },
+        )
+    return version, None
+
+
+def _build_entry(version: int | None, body: str, endpoint: str | None) -> CachedMenu:
+    raw = body.encode("utf-8")
+    if version is None:
+        # Not cacheable: leave compression to the response middleware
+        return CachedMenu(version=0, etag=compute_etag(body), body=body, size=len(raw))
+    return CachedMenu(
+        version=version,
+        etag=compute_etag(body),
+        body=body,
+        size=len(raw),
+        variants=precompress(raw, endpoint),
+    )
+
+
+class MenuCache:
+    """
+    Versioned cache of rendered menus.
+
+    Usage:
+        cache = get_menu_cache()
+        version, cached = cache.get(branch_id)
+        if cached is None:
+            cached = cache.store(branch_id, version, render())
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Any] | None = None,
+        ttl_seconds: int = MENU_CACHE_TTL,
+        async_client_factory: Callable[[], Awaitable[Any]] | None = None,
+    ) -> None:
+        """
+        Initialize menu cache.
+
+        Args:
+            client_factory: Returns a sync Redis client with decoded responses
+                (defaults to get_redis_sync_client).
+            ttl_seconds: Lifetime of slug mappings and rendered entries.
+            async_client_factory: Returns an async Redis client with decoded
+                responses (defaults to the shared pool).
+        """
+        self._client_factory = client_factory or _default_client
+        self._async_client_factory = async_client_factory or _default_async_client
+        self._ttl = ttl_seconds
+
+    def resolve_branch(self, branch_slug: str) -> int | None:
+        """Get the branch ID cached for a slug, if any."""
+        try:
+            branch_id = self._client_factory().get(_slug_key(branch_slug))
+        except Exception as e:
+            logger.warning("Menu cache slug lookup failed", branch_slug=branch_slug, error=str(e))
+            return None
+        return int(branch_id) if branch_id else None
+
+    def remember_branch(self, branch_slug: str, branch_id: int) -> None:
+        """Cache the branch ID of an active branch slug."""
+        try:
+            self._client_factory().set(_slug_key(branch_slug), branch_id, ex=self._ttl)
+        except Exception as e:
+            logger.warning("Menu cache slug store failed", branch_slug=branch_slug, error=str(e))
+
+    def get(self, branch_id: int, kind: str = PUBLIC_MENU) -> tuple[int | None, CachedMenu | None]:
+        """
+        Get the current menu version and the entry rendered for it.
+
+        The version must be read before rendering on a miss and passed to
+        store(), so a bump that lands during the render is never hidden.
+
+        Args:
+            branch_id: Branch the entry belongs to.
+            kind: Menu view (PUBLIC_MENU, WAITER_MENU or MENU_ALLERGENS).
+
+        Returns:
+            (version, entry). entry is None on a miss; version is None if
+            Redis is unavailable (do not store).
+        """
+        try:
+            pipe = self._client_factory().pipeline(transaction=False)
+            _queue_get(pipe, branch_id, kind)
+            return _parse_get(pipe.execute())
+        except Exception as e:
+            logger.warning("Menu cache read failed", branch_id=branch_id, kind=kind, error=str(e))
+            return None, None
+
+    def store(
+        self,
+        branch_id: int,
+        version: int | None,
+        body: str,
+        endpoint: str | None = None,
+        kind: str = PUBLIC_MENU,
+    ) -> CachedMenu:
+        """
+        Store a menu rendered at the given version, with its compressed variants.
+
+        Args:
+            branch_id: Branch the menu belongs to.
+            version: Version returned by get() before rendering.
+            body: Serialized menu.
+            endpoint: Route label to account compression CPU to.
+            kind: Menu view the body renders.
+
+        Returns:
+            The entry to send (also when it could not be stored).
+        """
+        cached = _build_entry(version, body, endpoint)
+        if version is None:
+            return cached
+
+        try:
+            pipe = self._client_factory().pipeline(transaction=True)
+            self._queue_store(pipe, branch_id, kind, cached)
+            pipe.execute()
+        except Exception as e:
+            logger.warning("Menu cache store failed", branch_id=branch_id, kind=kind, error=str(e))
+        return cached
+
+    def _queue_store(self, pipe: Any, branch_id: int, kind: str, cached: CachedMenu) -> None:
+        mapping = {"version": cached.version, "etag": cached.etag, "size": cached.size, "body": cached.body}
+        for encoding, data in cached.variants.items():
+            mapping[encoding] = base64.b64encode(data).decode("ascii")
+        pipe.hset(_entry_key(branch_id, kind), mapping=mapping)
+        pipe.expire(_entry_key(branch_id, kind), self._ttl)
+
+    # =========================================================================
+    # Async variants (PERF-ASYNCDB-01)
+    # =========================================================================
+
+    async def aresolve_branch(self, branch_slug: str) -> int | None:
+        """Async resolve_branch()."""
+        try:
+            redis = await self._async_client_factory()
+            branch_id = await redis.get(_slug_key(branch_slug))
+        except Exception as e:
+            logger.warning("Menu cache slug lookup failed", branch_slug=branch_slug, error=str(e))
+            return None
+        return int(branch_id) if branch_id else None
+
+    async def aremember_branch(self, branch_slug: str, branch_id: int) -> None:
+        """Async remember_branch()."""
+        try:
+            redis = await self._async_client_factory()
+            await redis.set(_slug_key(branch_slug), branch_id, ex=self._ttl)
+        except Exception as e:
+            logger.warning("Menu cache slug store failed", branch_slug=branch_slug, error=str(e))
+
+    async def aget(self, branch_id: int, kind: str = PUBLIC_MENU) -> tuple[int | None, CachedMenu | None]:
+        """Async get()."""
+        try:
+            redis = await self._async_client_factory()
+            pipe = redis.pipeline(transaction=False)
+            _queue_get(pipe, branch_id, kind)
+            return _parse_get(await pipe.execute())
+        except Exception as e:
+            logger.warning("Menu cache read failed", branch_id=branch_id, kind=kind, error=str(e))
+            return None, None
+
+    async def astore(
+        self,
+        branch_id: int,
+        version: int | None,
+        body: str,
+        endpoint: str | None = None,
+        kind: str = PUBLIC_MENU,
+    ) -> CachedMenu:
+        """Async store(); compression runs in a worker thread."""
+        cached = await asyncio.to_thread(_build_entry, version, body, endpoint)
+        if version is None:
+            return cached
+
+        try:
+            redis = await self._async_client_factory()
+            pipe = redis.pipeline(transaction=True)
+            self._queue_store(pipe, branch_id, kind, cached)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Menu cache store failed", branch_id=branch_id, kind=kind, error=str(e))
+        return cached
+
+    def version_to_refresh(
+        self,
+        branch_id: int,
+        kind: str = PUBLIC_MENU,
+        min_ttl: int = 0,
+    ) -> int | None:
+        """
+        Check whether an entry should be rendered ahead of requests.
+
+        PERF-WARM-01: Used by the cache warmer; does not transfer the body.
+
+        Args:
+            branch_id: Branch the entry belongs to.
+            kind: Menu view to check.
+            min_ttl: Also refresh entries expiring within this many seconds.
+
+        Returns:
+            The version to render and store() under if the entry is missing,
+            stale or expiring; None if it is fresh or Redis is unavailable.
+        """
+        try:
+            pipe = self._client_factory().pipeline(transaction=False)
+            pipe.set(_version_key(branch_id), _initial_version(), nx=True)
+            pipe.get(_version_key(branch_id))
+            pipe.hget(_entry_key(branch_id, kind), "version")
+            pipe.ttl(_entry_key(branch_id, kind))
+            _, version, entry_version, ttl = pipe.execute()
+        except Exception as e:
+            logger.warning("Menu cache check failed", branch_id=branch_id, kind=kind, error=str(e))
+            return None
+
+        version = int(version)
+        if entry_version is None or int(entry_version) != version or 0 <= ttl < min_ttl:
+            return version
+        return None
+
+    def bump(self, *branch_ids: int | None, forget_slugs: tuple[str, ...] = ()) -> None:
+        """
+        Invalidate the cached menus of branches.
+
+        Args:
+            branch_ids: Branches whose menu changed (None entries are ignored).
+            forget_slugs: Slugs whose branch mapping is no longer valid
+                (renamed or deactivated branches).
+        """
+        ids = sorted({branch_id for branch_id in branch_ids if branch_id is not None})
+        if not ids and not forget_slugs:
+            return
+
+        try:
+            pipe = self._client_factory().pipeline(transaction=False)
+            for branch_id in ids:
+                pipe.set(_version_key(branch_id), _initial_version(), nx=True)
+                pipe.incr(_version_key(branch_id))
+            if forget_slugs:
+                pipe.delete(*(_slug_key(slug) for slug in forget_slugs))
+            pipe.execute()
+            logger.debug("Menu version bumped", branch_ids=ids)
+        except Exception as e:
+            # Entries still expire after the TTL
+            logger.error("Menu version bump failed", branch_ids=ids, error=str(e))
+
+
+def cached_menu_response(request: Request, cached: CachedMenu) -> Response:
+    """
+    Send a cached menu entry.
+
+    Answers 304 to a matching If-None-Match and sends a precompressed
+    variant when the client accepts one (PERF-COMPRESS-01).
+    """
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"), tuple(cached.variants))
+    if encoding:
+        request.state.uncompressed_size = cached.size
+        headers["Content-Encoding"] = encoding
+        return Response(content=cached.variants[encoding], media_type="application/json", headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+_menu_cache: MenuCache | None = None
+
+
+def get_menu_cache() -> MenuCache:
+    """Get singleton menu cache."""
+    global _menu_cache
+    if _menu_cache is None:
+        _menu_cache = MenuCache()
+    return _menu_cache
+
+
+def bump_menu_version(*branch_ids: int | None, forget_slugs: tuple[str, ...] = ()) -> None:
+    """
+    Invalidate the cached public menu of branches.
+
+    Call after committing any write that changes what GET /menu/{slug}
+    returns for those branches.
+    """
+    get_menu_cache().bump(*branch_ids, forget_slugs=forget_slugs)
+
+
+__all__ = [
+    "MENU_ALLERGENS",
+    "MENU_KINDS",
+    "PUBLIC_MENU",
+    "WAITER_MENU",
+    "CachedMenu",
+    "MenuCache",
+    "bump_menu_version",
+    "cached_menu_response",
+    "compute_etag",
+    "etag_matches",
+    "get_menu_cache",
+]
@@ -0,0 +1,108 @@
+"""
+Menu cache warming.
+
+PERF-WARM-01: Renders the versioned menu entries of a branch (public menu,
+compact waiter menu, allergens with cross-reactions) before a request needs
+them. Only entries that are missing, rendered for an older menu version or
+about to expire are rendered.
+
+These functions are synchronous and open their own session; the cache
+warmer runs them in worker threads.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from shared.config.logging import get_logger
+from rest_api.models import Branch
+from rest_api.services.catalog.menu_cache import (
+    MENU_ALLERGENS,
+    MENU_KINDS,
+    PUBLIC_MENU,
+    WAITER_MENU,
+    get_menu_cache,
+)
+
+logger = get_logger(__name__)
+
+# Route labels the precompression CPU is accounted to (PERF-COMPRESS-01)
+_ENDPOINTS = {
+    PUBLIC_MENU: "/api/public/menu/{branch_slug}",
+    WAITER_MENU: "/api/waiter/branches/{branch_id}/menu",
+    MENU_ALLERGENS: "/api/public/menu/{branch_slug}/allergens",
+}
+
+
+def _renderers() -> dict[str, Callable[[Session, Branch], str]]:
+    # Imported lazily: the routers import the menu cache
+    from rest_api.routers.public.catalog import render_allergens, render_public_menu
+    from rest_api.routers.waiter.routes import render_compact_menu
+
+    return {
+        PUBLIC_MENU: render_public_menu,
+        WAITER_MENU: render_compact_menu,
+        MENU_ALLERGENS: render_allergens,
+    }
+
+
+def list_active_branches(session_factory: Callable[[], Session]) -> list[tuple[int, int]]:
+    """Get (branch_id, tenant_id) of every active branch."""
+    with session_factory() as db:
+        rows = db.execute(
+            select(Branch.id, Branch.tenant_id).where(Branch.is_active.is_(True))
+        ).all()
+    return [(branch_id, tenant_id) for branch_id, tenant_id in rows]
+
+
+def warm_branch_menus(
+    session_factory: Callable[[], Session],
+    branch_id: int,
+    kinds: tuple[str, ...] = MENU_KINDS,
+    min_ttl: int = 0,
+) -> int:
+    """
+    Render the menu entries of a branch that are not fresh.
+
+    Args:
+        session_factory: Creates the database session used for rendering.
+        branch_id: Branch to warm.
+        kinds: Menu views to warm.
+        min_ttl: Also re-render entries expiring within this many seconds.
+
+    Returns:
+        Number of entries rendered.
+    """
+    menu_cache = get_menu_cache()
+    renderers = _renderers()
+    rendered = 0
+
+    with session_factory() as db:
+        branch = db.scalar(
+            select(Branch).where(Branch.id == branch_id, Branch.is_active.is_(True))
+        )
+        if branch is None:
+            return 0
+        if PUBLIC_MENU in kinds or MENU_ALLERGENS in kinds:
+            menu_cache.remember_branch(branch.slug, branch.id)
+
+        for kind in kinds:
+            version = menu_cache.version_to_refresh(branch_id, kind, min_ttl=min_ttl)
+            if version is None:
+                continue
+            body = renderers[kind](db, branch)
+            menu_cache.store(branch_id, version, body, endpoint=_ENDPOINTS[kind], kind=kind)
+            rendered += 1
+
+    if rendered:
+        logger.debug("Warmed menu cache", branch_id=branch_id, rendered=rendered)
+    return rendered
+
+
+__all__ = [
+    "list_active_branches",
+    "warm_branch_menus",
+]
@@ -19,10 +19,13 @@ This consolidated view is used by:
 Enhanced with Redis caching (producto3.md improvement):
 - get_products_complete_for_branch has 5-minute cache
 - Cache invalidated on product update via invalidate_branch_products_cache()
+- PERF-CACHE-01: Two-tier cache (in-process LRU in front of Redis) with
+  single-flight loading and early refresh
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import TYPE_CHECKING, Optional, TypedDict
 
@@ -91,6 +94,8 @@ def _safe_json_parse(value: Optional[str], default: list | dict | None = None) -
 # Redis Cache Configuration
 # =============================================================================
 
+from shared.infrastructure.cache.access import get_access_tracker
+from shared.infrastructure.cache.two_tier import TwoTierCache
 from shared.infrastructure.redis.constants import (
     BRANCH_PRODUCTS_CACHE_TTL,
     get_branch_products_cache_key,
@@ -98,8 +103,13 @@ from shared.infrastructure.redis.constants import (
 
 # Cache TTL: 5 minutes for branch product views
 CACHE_TTL_SECONDS = BRANCH_PRODUCTS_CACHE_TTL
-# FAIL-LOW-04 FIX: Max jitter for cache TTL (prevents stampede)
-CACHE_TTL_JITTER_SECONDS = 30
+
+# PERF-CACHE-01: Replaces the FAIL-LOW-04 TTL jitter; early refresh and
+# single-flight loading keep expiries from stampeding the database
+_branch_products_cache = TwoTierCache("branch_products", ttl=CACHE_TTL_SECONDS)
+
+# PERF-WARM-01: Access-tracking kind of branch product view reads
+BRANCH_PRODUCTS = "products"
 
 
 def _get_branch_products_cache_key(branch_id: int, tenant_id: int) -> str:
@@ -547,48 +557,33 @@ async def get_products_complete_for_branch_cached(
     producto3.md improvement: Cache branch product views for 5 minutes.
     Falls back to database query if Redis is unavailable.
 
+    PERF-CACHE-01: Served from the two-tier cache; the returned list is
+    shared with other callers and must not be mutated. Loads run in a worker
+    thread with their own session, since an early refresh may outlive the
+    caller's request.
+
     Args:
-        db: Database session
+        db: Database session (kept for compatibility; loads do not use it)
         branch_id: Branch ID to filter by
         tenant_id: Tenant ID for security
 
     Returns:
         List of complete product views (from cache or database)
     """
-    from shared.infrastructure.events import get_redis_pool
-
     cache_key = _get_branch_products_cache_key(branch_id, tenant_id)
+    # PERF-WARM-01: Hot branches are refreshed ahead of expiry
+    get_access_tracker().record(BRANCH_PRODUCTS, (branch_id, tenant_id))
+    return await _branch_products_cache.get_or_load(
+        cache_key,
+        lambda: asyncio.to_thread(_load_products_complete_for_branch, branch_id, tenant_id),
+    )
 
-    # LOG-01 FIX: Use structured logging instead of f-strings
-    try:
-        redis = await get_redis_pool()
-        cached = await redis.get(cache_key)
-
-        if cached:
-            logger.debug("Cache HIT for branch products", branch_id=branch_id)
-            return json.loads(cached)
-
-        logger.debug("Cache MISS for branch products", branch_id=branch_id)
-    except Exception as e:
-        logger.warning("Redis cache error, falling back to DB", error=str(e), branch_id=branch_id)
-        # Fall through to database query
-
-    # Query from database
-    results = get_products_complete_for_branch(db, branch_id, tenant_id)
 
-    # Cache the results with jitter to prevent stampede
-    try:
-        import random
-        redis = await get_redis_pool()
-        # FAIL-LOW-04 FIX: Add jitter to prevent cache stampede
-        jitter = random.randint(-CACHE_TTL_JITTER_SECONDS, CACHE_TTL_JITTER_SECONDS)
-        ttl_with_jitter = CACHE_TTL_SECONDS + jitter
-        await redis.setex(cache_key, ttl_with_jitter, json.dumps(results))
-        logger.debug("Cached products for branch", count=len(results), branch_id=branch_id, ttl=ttl_with_jitter)
-    except Exception as e:
-        logger.warning("Failed to cache branch products", error=str(e), branch_id=branch_id)
+def _load_products_complete_for_branch(branch_id: int, tenant_id: int) -> list[ProductCompleteView]:
+    from shared.infrastructure.db import SessionLocal
 
-    return results
+    with SessionLocal() as db:
+        return get_products_complete_for_branch(db, branch_id, tenant_id)
 
 
 async def invalidate_branch_products_cache(branch_id: int, tenant_id: int) -> bool:
@@ -607,19 +602,13 @@ async def invalidate_branch_products_cache(branch_id: int, tenant_id: int) -> bo
     Returns:
         True if cache was invalidated, False on error
     """
-    from shared.infrastructure.events import get_redis_pool
-
     cache_key = _get_branch_products_cache_key(branch_id, tenant_id)
 
-    # LOG-01 FIX: Use structured logging instead of f-strings
-    try:
-        redis = await get_redis_pool()
-        result = await redis.delete(cache_key)
-        logger.info("Invalidated cache for branch", branch_id=branch_id, deleted=result)
-        return True
-    except Exception as e:
-        logger.warning("Failed to invalidate branch cache", error=str(e), branch_id=branch_id)
-        return False
+    # PERF-CACHE-01: Also drops the local tier of every worker
+    invalidated = await _branch_products_cache.invalidate(cache_key)
+    if invalidated:
+        logger.info("Invalidated cache for branch", branch_id=branch_id)
+    return invalidated
 
 
 async def invalidate_all_branch_caches_for_tenant(tenant_id: int) -> int:
@@ -659,9 +648,10 @@ async def invalidate_all_branch_caches_for_tenant(tenant_id: int) -> int:
                 break
 
         if keys:
-            deleted = await redis.delete(*keys)
-            logger.info("Invalidated branch caches for tenant", deleted=deleted, tenant_id=tenant_id)
-            return deleted
+            # PERF-CACHE-01: Also drops the local tier of every worker
+            await _branch_products_cache.invalidate(*keys)
+            logger.info("Invalidated branch caches for tenant", deleted=len(keys), tenant_id=tenant_id)
+            return len(keys)
         return 0
     except Exception as e:
         logger.warning("Failed to invalidate tenant caches", error=str(e), tenant_id=tenant_id)
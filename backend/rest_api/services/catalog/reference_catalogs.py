@@ -0,0 +1,97 @@
+"""
+Reference catalog cache.
+
+PERF-WARM-01: Cooking methods, flavor and texture profiles and cuisine
+types are read on every product form of the Dashboard and only written by
+the seed. The active rows of each catalog are kept in the two-tier cache
+and paginated in memory; the cache warmer loads them on startup and keeps
+them refreshed while they are being read.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from sqlalchemy import select
+
+from shared.config.logging import get_logger
+from shared.infrastructure.cache.access import get_access_tracker
+from shared.infrastructure.cache.two_tier import TwoTierCache
+from shared.infrastructure.redis.constants import (
+    REFERENCE_CATALOG_CACHE_TTL,
+    get_reference_catalog_cache_key,
+)
+from rest_api.models import CookingMethod, CuisineType, FlavorProfile, TextureProfile
+
+logger = get_logger(__name__)
+
+# Access-tracking kind of reference catalog reads
+REFERENCE_CATALOG = "catalog"
+
+REFERENCE_CATALOGS = {
+    "cooking_methods": CookingMethod,
+    "flavor_profiles": FlavorProfile,
+    "texture_profiles": TextureProfile,
+    "cuisine_types": CuisineType,
+}
+
+_reference_catalog_cache = TwoTierCache("reference_catalogs", ttl=REFERENCE_CATALOG_CACHE_TTL)
+
+
+def _load_reference_catalog(name: str) -> list[dict[str, Any]]:
+    from shared.infrastructure.db import SessionLocal
+
+    model = REFERENCE_CATALOGS[name]
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(model).where(model.is_active.is_(True)).order_by(model.name)
+        ).scalars().all()
+        return [
+            {
+                "id": row.id,
+                "name": row.name,
+                "description": row.description,
+                "icon": row.icon,
+                "is_active": row.is_active,
+            }
+            for row in rows
+        ]
+
+
+async def get_reference_catalog(name: str) -> list[dict[str, Any]]:
+    """
+    Get the active rows of a reference catalog, ordered by name.
+
+    The returned list is shared with other callers and must not be mutated.
+
+    Args:
+        name: Catalog name (key of REFERENCE_CATALOGS).
+    """
+    get_access_tracker().record(REFERENCE_CATALOG, name)
+    return await _reference_catalog_cache.get_or_load(
+        get_reference_catalog_cache_key(name),
+        lambda: asyncio.to_thread(_load_reference_catalog, name),
+    )
+
+
+async def refresh_reference_catalog(name: str) -> int:
+    """
+    Reload a reference catalog into the cache (cache warmer).
+
+    Returns:
+        Number of rows cached.
+    """
+    rows = await _reference_catalog_cache.refresh(
+        get_reference_catalog_cache_key(name),
+        lambda: asyncio.to_thread(_load_reference_catalog, name),
+    )
+    return len(rows)
+
+
+__all__ = [
+    "REFERENCE_CATALOG",
+    "REFERENCE_CATALOGS",
+    "get_reference_catalog",
+    "refresh_reference_catalog",
+]
@@ -23,6 +23,7 @@ from rest_api.models import Category, Branch
 from shared.utils.admin_schemas import CategoryOutput
 from rest_api.services.base_service import BranchScopedService
 from rest_api.services.events import publish_entity_deleted
+from rest_api.services.catalog.menu_cache import bump_menu_version
 from shared.utils.exceptions import ValidationError
 
 
@@ -150,6 +151,20 @@ class CategoryService(BranchScopedService[Category, CategoryOutput]):
     # Lifecycle Hooks
     # =========================================================================
 
+    def _after_create(self, entity: Category, user_id: int, user_email: str) -> None:
+        """PERF-MENU-01: Invalidate the branch menu."""
+        bump_menu_version(entity.branch_id)
+
+    def _after_update(
+        self,
+        entity: Category,
+        old_values: dict[str, Any],
+        user_id: int,
+        user_email: str,
+    ) -> None:
+        """PERF-MENU-01: Invalidate the branch menu (old and new branch if moved)."""
+        bump_menu_version(entity.branch_id, old_values.get("branch_id"))
+
     def _after_delete(
         self,
         entity_info: dict[str, Any],
@@ -157,6 +172,7 @@ class CategoryService(BranchScopedService[Category, CategoryOutput]):
         user_email: str,
     ) -> None:
         """Publish deletion event."""
+        bump_menu_version(entity_info.get("branch_id"))
         publish_entity_deleted(
             tenant_id=entity_info["tenant_id"],
             entity_type="category",
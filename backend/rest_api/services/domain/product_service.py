@@ -39,6 +39,7 @@ from shared.utils.admin_schemas import (
 from rest_api.services.base_service import BaseCRUDService
 from rest_api.services.crud.soft_delete import soft_delete, set_created_by, set_updated_by
 from rest_api.services.events import publish_entity_deleted
+from rest_api.services.catalog.menu_cache import bump_menu_version
 from shared.utils.exceptions import ValidationError, NotFoundError
 from shared.utils.validators import validate_image_url
 from shared.config.constants import (
@@ -237,6 +238,9 @@ class ProductService(BaseCRUDService[Product, ProductOutput]):
         self._db.commit()
         self._db.refresh(product)
 
+        # PERF-MENU-01: New product shows up in the menus of its branches
+        bump_menu_version(*self.get_product_branch_ids(product))
+
         return self.to_output(product)
 
     # =========================================================================
@@ -253,6 +257,7 @@ class ProductService(BaseCRUDService[Product, ProductOutput]):
     ) -> ProductOutput:
         """Update product with all related entities."""
         product = self._get_product_for_update(product_id, tenant_id)
+        previous_branch_ids = self.get_product_branch_ids(product)
 
         # Extract related data
         branch_prices = data.pop("branch_prices", None)
@@ -321,6 +326,9 @@ class ProductService(BaseCRUDService[Product, ProductOutput]):
         self._db.commit()
         self._db.refresh(product)
 
+        # PERF-MENU-01: Branches the product left or joined change too
+        bump_menu_version(*previous_branch_ids, *self.get_product_branch_ids(product))
+
         return self.to_output(product)
 
     # =========================================================================
@@ -343,9 +351,13 @@ class ProductService(BaseCRUDService[Product, ProductOutput]):
         branch_id = category.branch_id if category else None
 
         product_name = product.name
+        product_branch_ids = self.get_product_branch_ids(product)
 
         soft_delete(self._db, product, user_id, user_email)
 
+        # PERF-MENU-01
+        bump_menu_version(*product_branch_ids)
+
         publish_entity_deleted(
             tenant_id=tenant_id,
             entity_type="product",
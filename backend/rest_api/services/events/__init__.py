@@ -13,6 +13,7 @@ from .admin_events import (
     publish_entity_updated,
     publish_entity_deleted,
     publish_cascade_delete,
+    publish_sector_assignments_changed,
 )
 
 from .domain_event import (
@@ -48,6 +49,7 @@ __all__ = [
     "publish_entity_updated",
     "publish_entity_deleted",
     "publish_cascade_delete",
+    "publish_sector_assignments_changed",
     # Typed event API (preferred for new code)
     "DomainEvent",
     "EventType",
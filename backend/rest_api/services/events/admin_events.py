@@ -12,11 +12,13 @@ The _run_async fallback is preserved for code running outside request context
 """
 
 import asyncio
+from datetime import date
 from typing import Optional, TYPE_CHECKING
 
 from shared.infrastructure.events import (
     get_redis_client,
     publish_admin_crud_event,
+    publish_sector_assignment_event,
     ENTITY_CREATED,
     ENTITY_UPDATED,
     ENTITY_DELETED,
@@ -323,3 +325,85 @@ def publish_cascade_delete(
             ),
             task_name=task_name,
         )
+
+
+async def _publish_sector_assignments_changed(
+    tenant_id: int,
+    branch_id: int,
+    waiter_ids: list[int],
+    assignment_date: date,
+    actor_user_id: Optional[int] = None,
+) -> None:
+    """
+    PERF-SECTORS-01: Internal async function to publish SECTOR_ASSIGNMENTS_CHANGED.
+
+    Args:
+        tenant_id: Tenant ID for multi-tenant isolation
+        branch_id: Branch ID of the changed assignments
+        waiter_ids: Waiters whose assignments changed
+        assignment_date: Date of the changed assignments
+        actor_user_id: Optional ID of the user who triggered the action
+    """
+    try:
+        redis_client = await get_redis_client()
+        await publish_sector_assignment_event(
+            redis_client=redis_client,
+            tenant_id=tenant_id,
+            branch_id=branch_id,
+            waiter_ids=waiter_ids,
+            assignment_date=assignment_date.isoformat(),
+            actor_user_id=actor_user_id,
+        )
+        logger.info(
+            "Sector assignment event published",
+            branch_id=branch_id,
+            waiter_count=len(waiter_ids),
+        )
+    except Exception as e:
+        logger.error("Failed to publish sector assignment event", error=str(e))
+
+
+def publish_sector_assignments_changed(
+    tenant_id: int,
+    branch_id: int,
+    waiter_ids: list[int],
+    assignment_date: date,
+    actor_user_id: Optional[int] = None,
+    background_tasks: Optional["BackgroundTasks"] = None,
+) -> None:
+    """
+    Publish SECTOR_ASSIGNMENTS_CHANGED so WebSocket gateways refresh waiter sectors.
+
+    PERF-SECTORS-01: Gateways only track today's assignments, so changes for
+    other dates (or with no affected waiters) publish nothing.
+
+    Args:
+        waiter_ids: Waiters whose assignments changed
+        assignment_date: Date of the changed assignments
+        background_tasks: FastAPI BackgroundTasks dependency (recommended in routes)
+    """
+    if not waiter_ids or assignment_date != date.today():
+        return
+
+    waiter_ids = sorted(set(waiter_ids))
+    if background_tasks is not None:
+        background_tasks.add_task(
+            _publish_sector_assignments_changed,
+            tenant_id=tenant_id,
+            branch_id=branch_id,
+            waiter_ids=waiter_ids,
+            assignment_date=assignment_date,
+            actor_user_id=actor_user_id,
+        )
+    else:
+        task_name = f"admin_event:SECTOR_ASSIGNMENTS_CHANGED:{branch_id}"
+        _run_async(
+            _publish_sector_assignments_changed(
+                tenant_id=tenant_id,
+                branch_id=branch_id,
+                waiter_ids=waiter_ids,
+                assignment_date=assignment_date,
+                actor_user_id=actor_user_id,
+            ),
+            task_name=task_name,
+        )
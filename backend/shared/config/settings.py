@@ -67,6 +67,8 @@ class Settings(BaseSettings):
     # Rate limiting - SHARED-LOW-01 FIX: Moved from hardcoded values
     login_rate_limit: int = 5  # Max login attempts per window
     login_rate_window: int = 60  # Window in seconds
+    # PERF-ASYNCDB-01: Per-IP endpoint limits (slowapi); off only to load-test a staging server
+    ip_rate_limit_enabled: bool = True
 
     # WebSocket - WS-MED-02 FIX: Moved from hardcoded values
     # LOAD-LEVEL1: Reduced per-user limit to control total connections
@@ -83,6 +85,12 @@ class Settings(BaseSettings):
     ws_broadcast_batch_size: int = 50  # Connections to send to in parallel
     # HIGH-WS-01 FIX: Configurable callback timeout for event processing
     ws_event_callback_timeout: int = 5  # Timeout in seconds for event callbacks
+    # PERF-OUTBOX-01: Per-connection outbound queues (slow-consumer isolation)
+    ws_outbound_queue_size: int = 64  # Pending frames per connection before dropping oldest
+    ws_outbound_max_lag_seconds: float = 10.0  # Close client if oldest pending frame is older
+    # SCALE-MULTI-01: Multi-instance gateway (one stream consumer group per replica)
+    ws_gateway_multi_instance: bool = False  # Every replica receives every critical event
+    ws_gateway_instance_id: str = ""  # Stable replica identity; required in multi-instance mode
 
     # Redis - REDIS-MED-03 FIX: Moved from hardcoded values
     # LOAD-LEVEL1: Increased pool sizes for 400+ users
@@ -103,6 +111,31 @@ class Settings(BaseSettings):
     # MED-01 FIX: Event processing order configuration
     redis_event_strict_ordering: bool = False  # If True, retried events go to front of queue (strict FIFO)
     redis_event_staleness_threshold: float = 5.0  # Warn if event waited > N seconds in queue
+    # PERF-SUBS-01: Subscribe only to channels of locally connected branches/sessions/sectors
+    redis_interest_subscriptions: bool = True  # False = legacy wildcard psubscribe
+    # PERF-DISPATCH-01: Concurrent dispatch across sessions/branches (ordered within each)
+    redis_dispatch_concurrency: int = 8  # Max events delivered at once; 1 = sequential dispatch
+    # PERF-CART-01: Merge CART_* events of a session into one CART_SYNC delta per window
+    ws_cart_coalesce_window_ms: int = 0  # 0 = off; e.g. 50 for tables with many diners
+    # PERF-PROM-01: Reuse the /ws/metrics exposition across scrapes
+    ws_metrics_cache_seconds: float = 5.0  # 0 = rebuild on every scrape
+    # PERF-ADMISSION-01: Cap concurrent WebSocket handshakes during reconnect storms
+    ws_handshake_max_concurrent: int = 50  # Auth + registration running at once
+    ws_handshake_max_queued: int = 500  # Waiting for a slot; beyond this close with TRY_AGAIN_LATER
+    ws_handshake_queue_timeout: float = 5.0  # Max wait for a slot before TRY_AGAIN_LATER
+    # PERF-COMPRESS-01: gzip/brotli for REST responses (catalog payloads on weak Wi-Fi)
+    response_compression_min_bytes: int = 1024  # Smaller bodies are sent uncompressed
+    response_compression_thread_min_bytes: int = 64 * 1024  # Larger bodies are compressed off the event loop
+    # PERF-WARM-01: Startup warming and access-driven refresh-ahead of REST caches
+    cache_warm_concurrency: int = 4  # Branches warmed at once (each holds a DB connection)
+    cache_refresh_interval_seconds: int = 60  # How often hot entries are checked
+    cache_refresh_ahead_seconds: int = 120  # Refresh entries expiring within this window
+    cache_refresh_min_hits_per_minute: float = 1.0  # Reads/min for an entry to count as hot
+    cache_access_half_life_seconds: float = 600.0  # Decay of observed read counts
+    # PERF-ASYNCDB-01: AsyncSession engine for the hot read endpoints
+    db_async_engine: bool = True  # False = serve them from the sync pool via the threadpool
+    db_async_pool_size: int = 10  # Connections held only while a query runs
+    db_async_max_overflow: int = 10
 
     class Config:
         env_file = ".env"
@@ -149,6 +182,10 @@ class Settings(BaseSettings):
                     "MERCADOPAGO_WEBHOOK_SECRET must be set when using Mercado Pago"
                 )
 
+            # PERF-ASYNCDB-01: The load-test switch must never reach production
+            if not self.ip_rate_limit_enabled:
+                errors.append("IP_RATE_LIMIT_ENABLED must be True in production")
+
             # CRIT-03 FIX: Check CORS is configured for production
             if not self.allowed_origins:
                 errors.append(
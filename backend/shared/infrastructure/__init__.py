@@ -12,6 +12,10 @@ from shared.infrastructure.db import (
     get_db,
     get_db_context,
     safe_commit,
+    async_engine,
+    AsyncSessionLocal,
+    SyncSessionAdapter,
+    get_async_db,
 )
 from shared.infrastructure.events import (
     get_redis_pool,
@@ -27,6 +31,10 @@ __all__ = [
     "get_db",
     "get_db_context",
     "safe_commit",
+    "async_engine",
+    "AsyncSessionLocal",
+    "SyncSessionAdapter",
+    "get_async_db",
     # events (Redis)
     "get_redis_pool",
     "get_redis_sync_client",
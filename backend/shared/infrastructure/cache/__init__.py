@@ -2,14 +2,38 @@
 Cache package initialization.
 
 REDIS-02: Cache utilities and warming.
+PERF-CACHE-01: Two-tier (in-process LRU + Redis) cache.
+PERF-WARM-01: Access tracking and refresh-ahead of hot entries.
 """
 
 from shared.infrastructure.cache.warmer import (
     CacheWarmer,
+    RefreshAheadScheduler,
     warm_caches_on_startup,
 )
+from shared.infrastructure.cache.access import (
+    AccessTracker,
+    get_access_tracker,
+)
+from shared.infrastructure.cache.two_tier import (
+    TwoTierCache,
+    CacheInvalidationListener,
+    get_registered_caches,
+    start_cache_invalidation_listener,
+    stop_cache_invalidation_listener,
+)
 
 __all__ = [
     "CacheWarmer",
     "warm_caches_on_startup",
+    # PERF-WARM-01
+    "RefreshAheadScheduler",
+    "AccessTracker",
+    "get_access_tracker",
+    # PERF-CACHE-01
+    "TwoTierCache",
+    "CacheInvalidationListener",
+    "get_registered_caches",
+    "start_cache_invalidation_listener",
+    "stop_cache_invalidation_listener",
 ]
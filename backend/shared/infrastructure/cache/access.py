@@ -0,0 +1,98 @@
+"""
+Cache Access Tracking.
+
+PERF-WARM-01: Counts reads of cacheable resources (menus, product views,
+reference catalogs) so the refresh-ahead scheduler only keeps the entries
+that are actually being read warm.
+
+Counts decay exponentially with a configurable half-life, so a branch that
+was busy at lunch stops being refreshed during the afternoon lull and a
+branch that is opening climbs above the threshold within minutes.
+
+Recording is in process and lock-protected (sync endpoints record from the
+threadpool); there is no Redis round-trip per request.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Hashable
+
+from shared.config.settings import settings
+
+# Below this decayed count an entry is forgotten
+_FORGET_BELOW = 0.05
+
+
+class AccessTracker:
+    """
+    Exponentially decayed read counts per (kind, key).
+
+    Usage:
+        tracker = get_access_tracker()
+        tracker.record("public", branch_id)
+        for kind, key, per_minute in tracker.hot(min_per_minute=1.0):
+            ...
+    """
+
+    def __init__(self, half_life_seconds: float = 600.0) -> None:
+        """
+        Initialize tracker.
+
+        Args:
+            half_life_seconds: Time for an idle entry's count to halve.
+        """
+        self._lock = threading.Lock()
+        self._decay = math.log(2) / half_life_seconds
+        # (kind, key) -> [decayed count, monotonic time of last update]
+        self._counts: dict[tuple[str, Hashable], list[float]] = {}
+
+    def record(self, kind: str, key: Hashable) -> None:
+        """Count one read of a cached resource."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._counts.get((kind, key))
+            if entry is None:
+                self._counts[(kind, key)] = [1.0, now]
+            else:
+                entry[0] = entry[0] * math.exp(-self._decay * (now - entry[1])) + 1.0
+                entry[1] = now
+
+    def hot(self, min_per_minute: float) -> list[tuple[str, Hashable, float]]:
+        """
+        Get the resources read at least min_per_minute times per minute.
+
+        The rate is the decayed count scaled by the decay constant, i.e. a
+        steady rate r converges to r. Idle entries are dropped.
+
+        Returns:
+            (kind, key, reads per minute), hottest first.
+        """
+        now = time.monotonic()
+        result = []
+        with self._lock:
+            for (kind, key), (count, updated) in list(self._counts.items()):
+                count *= math.exp(-self._decay * (now - updated))
+                if count < _FORGET_BELOW:
+                    del self._counts[(kind, key)]
+                    continue
+                per_minute = count * self._decay * 60.0
+                if per_minute >= min_per_minute:
+                    result.append((kind, key, per_minute))
+        result.sort(key=lambda item: item[2], reverse=True)
+        return result
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._counts)
+
+
+# Created at import: recording happens from threadpool threads as well
+_tracker = AccessTracker(half_life_seconds=settings.cache_access_half_life_seconds)
+
+
+def get_access_tracker() -> AccessTracker:
+    """Get singleton access tracker."""
+    return _tracker
@@ -0,0 +1,568 @@
+"""
+Two-Tier Cache.
+
+PERF-CACHE-01: Every cached read used to be a Redis GET plus json.loads per
+request. TwoTierCache keeps a bounded in-process LRU/TTL tier in front of
+Redis:
+
+- Local tier: deserialized values, LRU-bounded, short TTL (never longer
+  than the Redis entry)
+- Redis tier: JSON envelope {"v": value, "e": expires_at, "d": load_seconds}
+  shared by all workers
+- Invalidation: DEL in Redis plus a message on CHANNEL_CACHE_INVALIDATION
+  so every worker drops its local copy. Each invalidation also bumps the
+  key's generation in Redis; a load writes its result back only if the
+  generation is unchanged since it started, so a load that raced an
+  invalidation on another worker cannot put the old value back
+- Single-flight: concurrent misses of a key share one load per process and
+  a short Redis lock lets one worker rebuild while the others wait for
+  its result
+- Probabilistic early refresh (XFetch): a hit refreshes in the background
+  with a probability that grows as expiry approaches, weighted by how long
+  the last load took, so entries do not expire under a crowd
+
+Values handed out from the local tier are shared; callers must not mutate
+them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import math
+import random
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from shared.config.logging import get_logger
+from shared.infrastructure.redis.constants import (
+    CHANNEL_CACHE_INVALIDATION,
+    PREFIX_CACHE_GENERATION,
+    PREFIX_CACHE_LOCK,
+)
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = get_logger(__name__)
+
+Loader = Callable[[], Any | Awaitable[Any]]
+
+# Identifies this process in invalidation messages (it already dropped its copy)
+_INSTANCE_ID = uuid.uuid4().hex
+
+METRICS_FLUSH_INTERVAL_SECONDS = 10.0
+LOCK_POLL_INTERVAL_SECONDS = 0.05
+# Generations must outlive any load that read them (far longer than a load)
+GENERATION_TTL_SECONDS = 24 * 3600
+
+# Stores an entry only if the key's generation is still the one read before
+# loading (KEYS: entry, generation; ARGV: envelope, ttl, generation or "")
+_SET_IF_GENERATION_LUA = """
+local current = redis.call('GET', KEYS[2]) or ''
+if current ~= ARGV[3] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+
+
+async def _default_redis() -> "Redis":
+    from shared.infrastructure.events import get_redis_pool
+
+    return await get_redis_pool()
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: Any
+    expires_at: float  # wall clock, shared with other workers through Redis
+    load_seconds: float  # duration of the load that produced the value
+    local_deadline: float = 0.0  # monotonic
+
+
+class TwoTierCache:
+    """
+    In-process LRU/TTL cache in front of Redis.
+
+    Usage:
+        products = TwoTierCache("branch_products", ttl=300)
+
+        views = await products.get_or_load(
+            key, lambda: get_products_complete_for_branch(db, branch_id, tenant_id)
+        )
+        await products.invalidate(key)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float = 300.0,
+        local_ttl: float = 30.0,
+        local_max_entries: int = 1024,
+        early_refresh_beta: float = 1.0,
+        lock_timeout: float = 10.0,
+        lock_wait: float = 2.0,
+        redis_factory: Callable[[], Awaitable["Redis"]] | None = None,
+    ) -> None:
+        """
+        Initialize cache and register it for cross-worker invalidation.
+
+        Args:
+            name: Cache name (metrics label and invalidation routing).
+            ttl: Lifetime of Redis entries in seconds.
+            local_ttl: Max lifetime of local entries; bounds staleness if an
+                invalidation message is lost.
+            local_max_entries: LRU bound of the local tier.
+            early_refresh_beta: XFetch aggressiveness (0 disables, >1 earlier).
+            lock_timeout: Expiry of the cross-worker rebuild lock.
+            lock_wait: Max seconds a worker waits for another one's rebuild
+                before loading itself.
+            redis_factory: Returns the async Redis client (defaults to the
+                shared pool).
+        """
+        self.name = name
+        self._ttl = ttl
+        self._local_ttl = local_ttl
+        self._local_max_entries = local_max_entries
+        self._beta = early_refresh_beta
+        self._lock_timeout = lock_timeout
+        self._lock_wait = lock_wait
+        self._redis_factory = redis_factory or _default_redis
+
+        self._local: OrderedDict[str, _Entry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._invalidated_inflight: set[str] = set()
+
+        self._stats = {
+            "hits_local": 0,
+            "hits_redis": 0,
+            "misses": 0,
+            "early_refreshes": 0,
+            "load_errors": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+        # Deltas not yet flushed to AppMetrics: tier -> [count, seconds]
+        self._pending_metrics: dict[str, list[float]] = {}
+        self._next_flush = time.monotonic() + METRICS_FLUSH_INTERVAL_SECONDS
+        self._flush_task: asyncio.Task | None = None
+
+        _caches[name] = self
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    async def get_or_load(self, key: str, loader: Loader) -> Any:
+        """
+        Get a value, loading and caching it on a miss.
+
+        Args:
+            key: Redis key of the entry.
+            loader: Builds the value (sync or async); must be JSON-serializable.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        start = time.perf_counter()
+        self._maybe_flush_metrics()
+
+        entry = self._local_get(key)
+        tier = "local"
+        if entry is None:
+            entry = await self._redis_get(key)
+            tier = "redis"
+            if entry is not None:
+                self._local_set(key, entry)
+
+        if entry is not None:
+            self._stats[f"hits_{tier}"] += 1
+            self._record(tier, time.perf_counter() - start)
+            if self._should_refresh_early(entry):
+                self._stats["early_refreshes"] += 1
+                self._start_load(key, loader)
+            return entry.value
+
+        self._stats["misses"] += 1
+        value = await asyncio.shield(self._start_load(key, loader))
+        self._record("miss", time.perf_counter() - start)
+        return value
+
+    async def refresh(self, key: str, loader: Loader) -> Any:
+        """Reload a key now (single-flight), e.g. from a warmer."""
+        return await asyncio.shield(self._start_load(key, loader))
+
+    def _should_refresh_early(self, entry: _Entry) -> bool:
+        # XFetch: refresh when now - delta * beta * ln(U) >= expiry, U in (0, 1]
+        if self._beta <= 0:
+            return False
+        gap = -entry.load_seconds * self._beta * math.log(1.0 - random.random())
+        return time.time() + gap >= entry.expires_at
+
+    # =========================================================================
+    # Single-flight loading
+    # =========================================================================
+
+    def _start_load(self, key: str, loader: Loader) -> asyncio.Task:
+        """Get the in-flight load of a key or start one."""
+        task = self._inflight.get(key)
+        if task is None:
+            # A task rather than the caller's coroutine: a cancelled caller
+            # must not cancel the load the other callers are waiting for
+            task = asyncio.get_running_loop().create_task(self._load(key, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._load_done(key, t))
+        return task
+
+    def _load_done(self, key: str, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        self._invalidated_inflight.discard(key)
+        if not task.cancelled() and task.exception() is not None:
+            # Retrieved here so background refresh failures are logged once
+            self._stats["load_errors"] += 1
+            logger.warning("Cache load failed", cache=self.name, key=key, error=str(task.exception()))
+
+    async def _load(self, key: str, loader: Loader) -> Any:
+        lock_token = await self._acquire_lock(key)
+        if lock_token is None:
+            # Another worker is rebuilding: wait for its result
+            entry = await self._wait_for_entry(key)
+            if entry is not None:
+                self._local_set(key, entry)
+                return entry.value
+
+        try:
+            generation = await self._read_generation(key)
+            start = time.perf_counter()
+            value = loader()
+            if inspect.isawaitable(value):
+                value = await value
+            entry = _Entry(
+                value=value,
+                expires_at=time.time() + self._ttl,
+                load_seconds=time.perf_counter() - start,
+            )
+
+            if key in self._invalidated_inflight:
+                # Invalidated while loading: the value may predate the change
+                return value
+            if await self._redis_set(key, entry, generation):
+                self._local_set(key, entry)
+            return value
+        finally:
+            if lock_token:
+                await self._release_lock(key, lock_token)
+
+    async def _acquire_lock(self, key: str) -> str | None:
+        """Take the rebuild lock. Returns a token, "" if Redis is down, None if taken."""
+        token = uuid.uuid4().hex
+        try:
+            redis = await self._redis_factory()
+            acquired = await redis.set(
+                PREFIX_CACHE_LOCK + key, token, nx=True, px=int(self._lock_timeout * 1000)
+            )
+        except Exception as e:
+            logger.warning("Cache lock unavailable", cache=self.name, key=key, error=str(e))
+            return ""
+        return token if acquired else None
+
+    async def _release_lock(self, key: str, token: str) -> None:
+        try:
+            redis = await self._redis_factory()
+            lock_key = PREFIX_CACHE_LOCK + key
+            # Only release our own lock (it may have expired and been retaken)
+            if await redis.get(lock_key) == token:
+                await redis.delete(lock_key)
+        except Exception as e:
+            logger.debug("Cache lock release failed", cache=self.name, key=key, error=str(e))
+
+    async def _wait_for_entry(self, key: str) -> _Entry | None:
+        deadline = time.monotonic() + self._lock_wait
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL_SECONDS)
+            entry = await self._redis_get(key)
+            if entry is not None:
+                return entry
+        return None
+
+    # =========================================================================
+    # Tiers
+    # =========================================================================
+
+    def _local_get(self, key: str) -> _Entry | None:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        if entry.local_deadline <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return entry
+
+    def _local_set(self, key: str, entry: _Entry) -> None:
+        remaining = entry.expires_at - time.time()
+        if remaining <= 0:
+            return
+        entry.local_deadline = time.monotonic() + min(self._local_ttl, remaining)
+        self._local[key] = entry
+        self._local.move_to_end(key)
+        while len(self._local) > self._local_max_entries:
+            self._local.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    async def _redis_get(self, key: str) -> _Entry | None:
+        try:
+            redis = await self._redis_factory()
+            raw = await redis.get(key)
+        except Exception as e:
+            logger.warning("Redis cache error, falling back to loader", cache=self.name, key=key, error=str(e))
+            return None
+        if not raw:
+            return None
+        try:
+            envelope = json.loads(raw)
+            return _Entry(
+                value=envelope["v"],
+                expires_at=float(envelope["e"]),
+                load_seconds=float(envelope["d"]),
+            )
+        except (ValueError, TypeError, KeyError):
+            # Entry written by an older format: treat as a miss
+            return None
+
+    async def _read_generation(self, key: str) -> str | None:
+        """Invalidation generation of a key ("" if never invalidated, None if Redis is down)."""
+        try:
+            redis = await self._redis_factory()
+            generation = await redis.get(PREFIX_CACHE_GENERATION + key)
+        except Exception as e:
+            logger.warning("Cache generation unavailable", cache=self.name, key=key, error=str(e))
+            return None
+        if isinstance(generation, bytes):
+            generation = generation.decode()
+        return generation or ""
+
+    async def _redis_set(self, key: str, entry: _Entry, generation: str | None) -> bool:
+        """
+        Store an entry unless the key was invalidated since `generation` was read.
+
+        Returns:
+            False if the entry is stale (invalidated meanwhile), True otherwise,
+            including when Redis is unavailable (the local tier still caches).
+        """
+        if generation is None:
+            return True
+        envelope = json.dumps({"v": entry.value, "e": entry.expires_at, "d": entry.load_seconds})
+        try:
+            redis = await self._redis_factory()
+            stored = await redis.eval(
+                _SET_IF_GENERATION_LUA,
+                2,
+                key,
+                PREFIX_CACHE_GENERATION + key,
+                envelope,
+                max(1, int(self._ttl)),
+                generation,
+            )
+        except Exception as e:
+            logger.warning("Failed to store cache entry", cache=self.name, key=key, error=str(e))
+            return True
+        if not stored:
+            logger.debug("Discarded cache entry invalidated during load", cache=self.name, key=key)
+        return bool(stored)
+
+    # =========================================================================
+    # Invalidation
+    # =========================================================================
+
+    async def invalidate(self, *keys: str) -> bool:
+        """
+        Invalidate keys in Redis and in the local tier of every worker.
+
+        Returns:
+            True if Redis was updated, False on error (local copies of this
+            process are dropped regardless).
+        """
+        if not keys:
+            return True
+        self.drop_local(*keys)
+        message = json.dumps({"cache": self.name, "keys": list(keys), "origin": _INSTANCE_ID})
+        try:
+            redis = await self._redis_factory()
+            pipe = redis.pipeline(transaction=False)
+            # Bump generations before DEL: a write-back checked after the
+            # bump fails, one checked before it is deleted right after
+            for key in keys:
+                pipe.incr(PREFIX_CACHE_GENERATION + key)
+                pipe.expire(PREFIX_CACHE_GENERATION + key, GENERATION_TTL_SECONDS)
+            pipe.delete(*keys)
+            pipe.publish(CHANNEL_CACHE_INVALIDATION, message)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to invalidate cache keys", cache=self.name, keys=list(keys), error=str(e))
+            return False
+        return True
+
+    def drop_local(self, *keys: str) -> None:
+        """Drop keys from the local tier only (invalidation messages)."""
+        for key in keys:
+            self._local.pop(key, None)
+            if key in self._inflight:
+                self._invalidated_inflight.add(key)
+        self._stats["invalidations"] += len(keys)
+
+    def clear_local(self) -> None:
+        """Drop the whole local tier (e.g. invalidation messages may have been missed)."""
+        self._local.clear()
+        self._invalidated_inflight.update(self._inflight)
+
+    # =========================================================================
+    # Metrics
+    # =========================================================================
+
+    def _record(self, tier: str, seconds: float) -> None:
+        row = self._pending_metrics.get(tier)
+        if row is None:
+            row = self._pending_metrics[tier] = [0, 0.0]
+        row[0] += 1
+        row[1] += seconds
+
+    def _maybe_flush_metrics(self) -> None:
+        now = time.monotonic()
+        if now < self._next_flush or (self._flush_task and not self._flush_task.done()):
+            return
+        self._next_flush = now + METRICS_FLUSH_INTERVAL_SECONDS
+        self._flush_task = asyncio.get_running_loop().create_task(self.flush_metrics())
+
+    async def flush_metrics(self) -> None:
+        """Add hit/miss counts and latency accumulated since the last flush to AppMetrics."""
+        from shared.infrastructure.metrics import get_app_metrics
+
+        metrics = await get_app_metrics()
+        if metrics is None:
+            return
+
+        pending, self._pending_metrics = self._pending_metrics, {}
+        try:
+            for tier, (count, seconds) in pending.items():
+                if tier == "miss":
+                    await metrics.cache_miss(self.name, count=int(count), seconds=seconds)
+                else:
+                    await metrics.cache_hit(self.name, count=int(count), seconds=seconds, tier=tier)
+        except Exception as e:
+            logger.warning("Failed to flush cache metrics", cache=self.name, error=str(e))
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache statistics for monitoring."""
+        return {
+            **self._stats,
+            "local_entries": len(self._local),
+            "inflight_loads": len(self._inflight),
+        }
+
+
+# =============================================================================
+# Registry and cross-worker invalidation
+# =============================================================================
+
+_caches: dict[str, TwoTierCache] = {}
+
+
+def get_registered_caches() -> dict[str, TwoTierCache]:
+    """Caches of this process by name."""
+    return dict(_caches)
+
+
+def handle_invalidation_message(data: str) -> None:
+    """Apply an invalidation published by a TwoTierCache of another worker."""
+    try:
+        message = json.loads(data)
+    except (ValueError, TypeError):
+        logger.warning("Invalid cache invalidation message", data=str(data)[:200])
+        return
+    if message.get("origin") == _INSTANCE_ID:
+        return
+    cache = _caches.get(message.get("cache"))
+    if cache is not None:
+        cache.drop_local(*message.get("keys", []))
+
+
+class CacheInvalidationListener:
+    """
+    Subscribes to CHANNEL_CACHE_INVALIDATION and drops local entries.
+
+    On connection loss every local tier is cleared, since messages sent
+    meanwhile are lost, and the subscription is retried with backoff.
+    """
+
+    def __init__(self, redis_factory: Callable[[], Awaitable["Redis"]] | None = None) -> None:
+        self._redis_factory = redis_factory or _default_redis
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start listening in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        backoff = 1.0
+        while True:
+            pubsub = None
+            try:
+                redis = await self._redis_factory()
+                pubsub = redis.pubsub()
+                await pubsub.subscribe(CHANNEL_CACHE_INVALIDATION)
+                backoff = 1.0
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message.get("type") == "message":
+                        handle_invalidation_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Cache invalidation listener disconnected", error=str(e), retry_in=backoff)
+                for cache in _caches.values():
+                    cache.clear_local()
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+
+_listener: CacheInvalidationListener | None = None
+
+
+async def start_cache_invalidation_listener() -> None:
+    """Start the invalidation listener. Call from the FastAPI lifespan."""
+    global _listener
+    if _listener is None:
+        _listener = CacheInvalidationListener()
+    await _listener.start()
+
+
+async def stop_cache_invalidation_listener() -> None:
+    """Stop the invalidation listener."""
+    global _listener
+    if _listener:
+        await _listener.stop()
+        _listener = None
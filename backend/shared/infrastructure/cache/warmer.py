@@ -2,15 +2,31 @@
 Cache Warming Service.
 
 REDIS-02: Pre-warm caches on application startup.
+
+PERF-WARM-01: Startup warming covers every REST cache that opening time
+reads (public menu, compact waiter menu, allergens with cross-reactions,
+branch product views and reference catalogs). Branches are warmed in
+parallel by a bounded pool of workers; database work runs in worker
+threads with its own session, never on the event loop. After startup the
+refresh-ahead scheduler keeps the entries that are actually being read
+(see shared/infrastructure/cache/access.py) fresh before they expire.
+
+With several workers, a short Redis claim per entry makes sure only one of
+them renders it in a given cycle.
 """
 
 import asyncio
-from typing import TYPE_CHECKING
+import time
+from collections import defaultdict
+from functools import partial
+from typing import TYPE_CHECKING, Awaitable, Callable
 
 from shared.config.logging import get_logger
+from shared.config.settings import settings
 from shared.infrastructure.redis.constants import (
-    PRODUCT_CACHE_TTL,
+    PREFIX_CACHE_REFRESH_CLAIM,
     get_branch_products_cache_key,
+    get_reference_catalog_cache_key,
 )
 
 if TYPE_CHECKING:
@@ -18,146 +34,214 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Warming job: (result category, claim label, coroutine factory -> entries warmed)
+WarmJob = tuple[str, str, Callable[[], Awaitable[int]]]
+
+# Long enough to dedupe workers starting together, short enough that a quick
+# restart still warms
+STARTUP_CLAIM_SECONDS = 15
+
 
 class CacheWarmer:
     """
     Pre-warms caches on application startup.
-    
+
     REDIS-02: Prevents cold-start latency by loading frequently
     accessed data into Redis cache before traffic arrives.
     """
-    
-    def __init__(self, redis: "Redis", db_session_factory):
+
+    def __init__(self, redis: "Redis", db_session_factory, concurrency: int | None = None):
+        """
+        Initialize warmer.
+
+        Args:
+            redis: Async Redis client (refresh claims and TTL checks).
+            db_session_factory: Creates sync database sessions.
+            concurrency: Jobs run at once (PERF-WARM-01); each holds a
+                database connection. Defaults to settings.cache_warm_concurrency.
+        """
         self._redis = redis
         self._db_session_factory = db_session_factory
-    
+        self._concurrency = max(1, concurrency or settings.cache_warm_concurrency)
+
     async def warm_on_startup(self) -> dict[str, int]:
         """
         Warm all caches during application startup.
-        
+
         Returns dict with counts of warmed items per category.
         """
-        logger.info("Starting cache warming...")
-        
-        results = {}
-        
+        from rest_api.services.catalog.menu_warming import list_active_branches
+        from rest_api.services.catalog.reference_catalogs import REFERENCE_CATALOGS
+
+        logger.info("Starting cache warming...", concurrency=self._concurrency)
+        start = time.perf_counter()
+
         try:
-            async with asyncio.TaskGroup() as tg:
-                # Warm product caches
-                products_task = tg.create_task(self._warm_products())
-                
-                # Warm other caches as needed
-                # tg.create_task(self._warm_allergens())
-                # tg.create_task(self._warm_categories())
-            
-            results["products"] = products_task.result()
-            
-        except* Exception as eg:
-            for exc in eg.exceptions:
-                logger.error("Cache warming task failed", error=str(exc))
-        
+            branches = await asyncio.to_thread(list_active_branches, self._db_session_factory)
+        except Exception as e:
+            logger.error("Failed to list branches for cache warming", error=str(e))
+            branches = []
+
+        jobs: list[WarmJob] = [
+            ("catalogs", f"catalog:{name}", partial(self._warm_reference_catalog, name))
+            for name in REFERENCE_CATALOGS
+        ]
+        for branch_id, tenant_id in branches:
+            jobs.append(("menus", f"menus:{branch_id}", partial(self._warm_branch_menus, branch_id)))
+            jobs.append((
+                "products",
+                f"products:{branch_id}",
+                partial(self._warm_branch_products, branch_id, tenant_id),
+            ))
+
+        results = await self.run_jobs(jobs, claim_seconds=STARTUP_CLAIM_SECONDS)
+
         total_warmed = sum(results.values())
         logger.info(
             "Cache warming completed",
             total_items=total_warmed,
             breakdown=results,
+            branches=len(branches),
+            duration_ms=round((time.perf_counter() - start) * 1000),
         )
-        
+
         return results
-    
-    async def _warm_products(self) -> int:
+
+    async def run_jobs(self, jobs: list[WarmJob], claim_seconds: int = 0) -> dict[str, int]:
         """
-        Warm product caches for all active branches.
-        
-        Returns number of branches warmed.
+        Run warming jobs on a bounded pool of workers.
+
+        Args:
+            jobs: Jobs to run; a failing job is logged and skipped.
+            claim_seconds: If > 0, skip jobs another worker process claimed
+                within this many seconds.
+
+        Returns:
+            Entries warmed per category.
         """
-        from sqlalchemy import select
-        from rest_api.models import Branch
-        
-        warmed_count = 0
-        
+        results: dict[str, int] = defaultdict(int)
+        if claim_seconds > 0 and jobs:
+            claimed = await self._claim([label for _, label, _ in jobs], claim_seconds)
+            jobs = [job for job, ok in zip(jobs, claimed) if ok]
+
+        queue: asyncio.Queue[WarmJob] = asyncio.Queue()
+        for job in jobs:
+            queue.put_nowait(job)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    category, label, run = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    warmed = await run()
+                except Exception as e:
+                    logger.warning("Cache warming job failed", job=label, error=str(e))
+                    continue
+                results[category] += warmed
+
+        await asyncio.gather(*(worker() for _ in range(min(self._concurrency, len(jobs)))))
+        return dict(results)
+
+    async def _claim(self, labels: list[str], seconds: int) -> list[bool]:
+        """Claim entries for this process. Returns one flag per label (all True without Redis)."""
         try:
-            with self._db_session_factory() as db:
-                # Get active branches
-                branches = db.execute(
-                    select(Branch).where(Branch.is_active.is_(True))
-                ).scalars().all()
-                
-                for branch in branches:
-                    try:
-                        await self._warm_branch_products(branch.id, branch.tenant_id)
-                        warmed_count += 1
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to warm cache for branch",
-                            branch_id=branch.id,
-                            error=str(e),
-                        )
-        
+            pipe = self._redis.pipeline(transaction=False)
+            for label in labels:
+                pipe.set(f"{PREFIX_CACHE_REFRESH_CLAIM}{label}", "1", nx=True, ex=seconds)
+            return [bool(ok) for ok in await pipe.execute()]
         except Exception as e:
-            logger.error("Failed to warm products cache", error=str(e))
-        
-        return warmed_count
-    
-    async def _warm_branch_products(self, branch_id: int, tenant_id: int) -> None:
-        """Warm products cache for a single branch."""
-        from sqlalchemy import select
-        from sqlalchemy.orm import selectinload
-        from rest_api.models import Product, BranchProduct, Category
-        
+            logger.warning("Cache warming claims unavailable", error=str(e))
+            return [True] * len(labels)
+
+    async def _expires_within(self, cache_key: str, seconds: int) -> bool:
+        """Check whether a two-tier cache entry is missing or expires soon."""
+        ttl = await self._redis.ttl(cache_key)
+        # -2: missing, -1: no expiry
+        return ttl == -2 or 0 <= ttl < seconds
+
+    async def _warm_branch_menus(
+        self,
+        branch_id: int,
+        kinds: tuple[str, ...] | None = None,
+        min_ttl: int = 0,
+    ) -> int:
+        """Render the menu entries of a branch that are not fresh (PERF-WARM-01)."""
+        from rest_api.services.catalog.menu_cache import MENU_KINDS
+        from rest_api.services.catalog.menu_warming import warm_branch_menus
+
+        return await asyncio.to_thread(
+            warm_branch_menus, self._db_session_factory, branch_id, kinds or MENU_KINDS, min_ttl
+        )
+
+    async def _warm_reference_catalog(self, name: str, min_ttl: int | None = None) -> int:
+        """Load a reference catalog; with min_ttl, only if it expires within it."""
+        from rest_api.services.catalog.reference_catalogs import refresh_reference_catalog
+
+        if min_ttl is not None and not await self._expires_within(
+            get_reference_catalog_cache_key(name), min_ttl
+        ):
+            return 0
+        await refresh_reference_catalog(name)
+        return 1
+
+    async def _warm_branch_products(
+        self,
+        branch_id: int,
+        tenant_id: int,
+        force: bool = False,
+        min_ttl: int | None = None,
+    ) -> int:
+        """
+        Warm products cache for a single branch.
+
+        PERF-CACHE-01: Goes through the two-tier branch products cache, so
+        the entry has the shape and envelope its readers expect.
+
+        Args:
+            branch_id: Branch to warm.
+            tenant_id: Tenant of the branch.
+            force: Reload even if the entry is cached (refresh-ahead).
+            min_ttl: Only reload if the entry expires within this many
+                seconds (PERF-WARM-01).
+
+        Returns:
+            Number of entries warmed (0 or 1).
+        """
+        from rest_api.services.catalog.product_view import (
+            _branch_products_cache,
+            _load_products_complete_for_branch,
+        )
+
         cache_key = get_branch_products_cache_key(branch_id, tenant_id)
-        
-        # Check if already cached
-        if await self._redis.exists(cache_key):
-            return
-        
-        with self._db_session_factory() as db:
-            # Fetch products with relations
-            products = db.execute(
-                select(Product)
-                .join(BranchProduct)
-                .where(
-                    BranchProduct.branch_id == branch_id,
-                    BranchProduct.is_available == True,
-                    Product.is_active.is_(True),
-                )
-                .options(selectinload(Product.allergens))
-            ).scalars().all()
-            
-            # Serialize to JSON
-            import json
-            products_data = [
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "description": p.description,
-                    "category_id": p.category_id,
-                    "is_active": p.is_active,
-                    "allergen_ids": [a.id for a in p.allergens],
-                }
-                for p in products
-            ]
-            
-            # Store in cache
-            await self._redis.setex(
-                cache_key,
-                PRODUCT_CACHE_TTL,
-                json.dumps(products_data),
-            )
-        
+        if min_ttl is not None:
+            if not await self._expires_within(cache_key, min_ttl):
+                return 0
+            force = True
+
+        def load():
+            return asyncio.to_thread(_load_products_complete_for_branch, branch_id, tenant_id)
+
+        if force:
+            products_data = await _branch_products_cache.refresh(cache_key, load)
+        else:
+            products_data = await _branch_products_cache.get_or_load(cache_key, load)
+
         logger.debug(
             "Warmed products cache",
             branch_id=branch_id,
             product_count=len(products_data),
         )
+        return 1
 
 
 async def warm_caches_on_startup(redis: "Redis", db_session_factory) -> None:
     """
     Convenience function for startup cache warming.
-    
+
     Call from FastAPI lifespan:
-    
+
         @asynccontextmanager
         async def lifespan(app):
             redis = await get_redis_pool()
@@ -175,38 +259,62 @@ async def warm_caches_on_startup(redis: "Redis", db_session_factory) -> None:
 class RefreshAheadScheduler:
     """
     OPT-03: Proactively refresh caches before they expire.
-    
+
     Uses a background task to check TTL and refresh entries
     that are about to expire, preventing cache misses.
+
+    PERF-WARM-01: Only entries read at least min_hits_per_minute times per
+    minute in this process are refreshed; menu entries are also re-rendered
+    as soon as an admin change bumps the menu version.
     """
-    
+
     def __init__(
         self,
         redis: "Redis",
         db_session_factory,
-        refresh_threshold_seconds: int = 300,  # Refresh when TTL < 5 min
-        check_interval_seconds: int = 60,  # Check every minute
+        refresh_threshold_seconds: int | None = None,
+        check_interval_seconds: int | None = None,
+        min_hits_per_minute: float | None = None,
+        concurrency: int | None = None,
     ):
+        """
+        Initialize scheduler. Unset arguments default to the cache_* settings.
+
+        Args:
+            redis: Async Redis client.
+            db_session_factory: Creates sync database sessions.
+            refresh_threshold_seconds: Refresh entries expiring within this window.
+            check_interval_seconds: Seconds between checks.
+            min_hits_per_minute: Read rate above which an entry is hot.
+            concurrency: Refresh jobs run at once.
+        """
         self._redis = redis
         self._db_session_factory = db_session_factory
-        self._refresh_threshold = refresh_threshold_seconds
-        self._check_interval = check_interval_seconds
+        self._refresh_threshold = refresh_threshold_seconds or settings.cache_refresh_ahead_seconds
+        self._check_interval = check_interval_seconds or settings.cache_refresh_interval_seconds
+        self._min_rate = (
+            settings.cache_refresh_min_hits_per_minute
+            if min_hits_per_minute is None
+            else min_hits_per_minute
+        )
+        self._warmer = CacheWarmer(redis, db_session_factory, concurrency)
         self._running = False
         self._task = None
-    
+
     async def start(self) -> None:
         """Start the refresh-ahead background task."""
         if self._running:
             return
-        
+
         self._running = True
         self._task = asyncio.create_task(self._refresh_loop())
         logger.info(
             "Refresh-ahead scheduler started",
             threshold_seconds=self._refresh_threshold,
             check_interval_seconds=self._check_interval,
+            min_hits_per_minute=self._min_rate,
         )
-    
+
     async def stop(self) -> None:
         """Stop the refresh-ahead background task."""
         self._running = False
@@ -217,7 +325,7 @@ class RefreshAheadScheduler:
             except asyncio.CancelledError:
                 pass
         logger.info("Refresh-ahead scheduler stopped")
-    
+
     async def _refresh_loop(self) -> None:
         """Main loop that checks and refreshes expiring caches."""
         while self._running:
@@ -225,46 +333,52 @@ class RefreshAheadScheduler:
                 await self._check_and_refresh()
             except Exception as e:
                 logger.error("Refresh-ahead check failed", error=str(e))
-            
+
             await asyncio.sleep(self._check_interval)
-    
+
     async def _check_and_refresh(self) -> None:
-        """Check all monitored cache keys and refresh if needed."""
-        from sqlalchemy import select
-        from rest_api.models import Branch
-        
-        # Check product caches for each branch
-        with self._db_session_factory() as db:
-            branches = db.execute(
-                select(Branch).where(Branch.is_active.is_(True))
-            ).scalars().all()
-        
-        refreshed = 0
-        for branch in branches:
-            cache_key = get_branch_products_cache_key(branch.id, branch.tenant_id)
-            
-            try:
-                ttl = await self._redis.ttl(cache_key)
-                
-                # If TTL is below threshold, refresh proactively
-                if 0 < ttl < self._refresh_threshold:
-                    warmer = CacheWarmer(self._redis, self._db_session_factory)
-                    await warmer._warm_branch_products(branch.id, branch.tenant_id)
-                    refreshed += 1
-                    logger.debug(
-                        "Refresh-ahead: refreshed cache",
-                        cache_key=cache_key,
-                        remaining_ttl=ttl,
-                    )
-            except Exception as e:
-                logger.warning(
-                    "Failed to check/refresh cache",
-                    cache_key=cache_key,
-                    error=str(e),
-                )
-        
+        """Refresh the hot entries that are stale or about to expire."""
+        from rest_api.services.catalog.menu_cache import MENU_KINDS
+        from rest_api.services.catalog.product_view import BRANCH_PRODUCTS
+        from rest_api.services.catalog.reference_catalogs import REFERENCE_CATALOG
+        from shared.infrastructure.cache.access import get_access_tracker
+
+        hot = get_access_tracker().hot(self._min_rate)
+        if not hot:
+            return
+
+        threshold = self._refresh_threshold
+        jobs: list[WarmJob] = []
+        for kind, key, _ in hot:
+            if kind in MENU_KINDS:
+                jobs.append((
+                    "menus",
+                    f"menu:{kind}:{key}",
+                    partial(self._warmer._warm_branch_menus, key, (kind,), threshold),
+                ))
+            elif kind == BRANCH_PRODUCTS:
+                branch_id, tenant_id = key
+                jobs.append((
+                    "products",
+                    f"products:{branch_id}",
+                    partial(self._warmer._warm_branch_products, branch_id, tenant_id, min_ttl=threshold),
+                ))
+            elif kind == REFERENCE_CATALOG:
+                jobs.append((
+                    "catalogs",
+                    f"catalog:{key}",
+                    partial(self._warmer._warm_reference_catalog, key, min_ttl=threshold),
+                ))
+
+        results = await self._warmer.run_jobs(jobs, claim_seconds=self._check_interval)
+        refreshed = sum(results.values())
         if refreshed > 0:
-            logger.info("Refresh-ahead completed", refreshed_count=refreshed)
+            logger.info(
+                "Refresh-ahead completed",
+                refreshed_count=refreshed,
+                breakdown=results,
+                hot_entries=len(hot),
+            )
 
 
 # Global scheduler instance
@@ -274,9 +388,9 @@ _refresh_scheduler: RefreshAheadScheduler | None = None
 async def start_refresh_ahead(redis: "Redis", db_session_factory) -> None:
     """
     Start the refresh-ahead scheduler.
-    
+
     Call from FastAPI lifespan:
-    
+
         @asynccontextmanager
         async def lifespan(app):
             redis = await get_redis_pool()
@@ -1,15 +1,22 @@
 """
 Database configuration and session management.
 Uses SQLAlchemy 2.0 async-compatible patterns.
+
+PERF-ASYNCDB-01: Besides the sync engine, an AsyncSession engine backs the
+hot read endpoints (get_async_db). psycopg 3 serves both; the async engine
+uses its asyncio driver over the same DATABASE_URL.
 """
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator
 from contextlib import contextmanager
+from typing import Any, TypeVar
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from starlette.concurrency import run_in_threadpool
 
-from shared.config.settings import DATABASE_URL
+from shared.config.settings import DATABASE_URL, settings
 
 import os
 
@@ -45,6 +52,27 @@ SessionLocal = sessionmaker(
 )
 
 
+# PERF-ASYNCDB-01: Async engine for the hot read endpoints. Its pool is
+# separate from the sync one and not tied to the threadpool size, since
+# async sessions hold a connection only while a query runs.
+async_engine = create_async_engine(
+    DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=settings.db_async_pool_size,
+    max_overflow=settings.db_async_max_overflow,
+    pool_timeout=30,
+    pool_recycle=1800,
+    connect_args={"connect_timeout": 10},
+    echo=False,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,  # Attribute access after commit would need a greenlet
+)
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     FastAPI dependency for database sessions.
@@ -63,6 +91,77 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+T = TypeVar("T")
+
+# What AsyncSession.execute() does: fetch all rows before returning
+_PREBUFFER = {"prebuffer_rows": True}
+
+
+class SyncSessionAdapter:
+    """
+    PERF-ASYNCDB-01: AsyncSession-compatible facade over a sync Session.
+
+    Each call runs in Starlette's threadpool, so async endpoints served
+    through it behave like the former def endpoints (threadpool-bound,
+    sync connection pool). Used when DB_ASYNC_ENGINE is off, e.g. on
+    Windows event loops psycopg cannot run async on, for rollback and for
+    load-test comparisons; tests use it to serve the SQLite session.
+
+    Covers the subset used by the async endpoints: execute, scalar,
+    scalars, get, run_sync and close. Results are buffered like
+    AsyncSession's.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.sync_session = session
+
+    async def execute(self, statement, params=None, *, execution_options=None, **kwargs):
+        options = {**(execution_options or {}), **_PREBUFFER}
+        return await run_in_threadpool(
+            self.sync_session.execute, statement, params, execution_options=options, **kwargs
+        )
+
+    async def scalar(self, statement, params=None, **kwargs):
+        return (await self.execute(statement, params, **kwargs)).scalar()
+
+    async def scalars(self, statement, params=None, **kwargs):
+        return (await self.execute(statement, params, **kwargs)).scalars()
+
+    async def get(self, entity, ident, **kwargs):
+        return await run_in_threadpool(self.sync_session.get, entity, ident, **kwargs)
+
+    async def run_sync(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await run_in_threadpool(fn, self.sync_session, *args, **kwargs)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.sync_session.close)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    PERF-ASYNCDB-01: FastAPI dependency for async database sessions.
+
+    Usage:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_async_db)):
+            return (await db.scalars(select(Item))).all()
+
+    Relationships must be eager-loaded (selectinload/joinedload); lazy
+    loads raise outside db.run_sync(). With DB_ASYNC_ENGINE off, yields a
+    SyncSessionAdapter over SessionLocal instead.
+    """
+    if not settings.db_async_engine:
+        adapter = SyncSessionAdapter(SessionLocal())
+        try:
+            yield adapter
+        finally:
+            await adapter.close()
+        return
+
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
 @contextmanager
 def get_db_context() -> Generator[Session, None, None]:
     """
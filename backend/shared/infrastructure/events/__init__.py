@@ -67,6 +67,8 @@ from .event_types import (
     ENTITY_UPDATED,
     ENTITY_DELETED,
     CASCADE_DELETE,
+    # Staff assignments
+    SECTOR_ASSIGNMENTS_CHANGED,
     # Shared cart
     CART_ITEM_ADDED,
     CART_ITEM_UPDATED,
@@ -150,6 +152,7 @@ from .domain_publishers import (
     publish_table_event,
     publish_admin_crud_event,
     publish_cart_event,
+    publish_sector_assignment_event,
 )
 
 # =============================================================================
@@ -188,6 +191,7 @@ __all__ = [
     "ENTITY_UPDATED",
     "ENTITY_DELETED",
     "CASCADE_DELETE",
+    "SECTOR_ASSIGNMENTS_CHANGED",
     "CART_ITEM_ADDED",
     "CART_ITEM_UPDATED",
     "CART_ITEM_REMOVED",
@@ -231,4 +235,5 @@ __all__ = [
     "publish_table_event",
     "publish_admin_crud_event",
     "publish_cart_event",
+    "publish_sector_assignment_event",
 ]
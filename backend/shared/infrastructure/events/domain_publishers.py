@@ -26,6 +26,8 @@ from .event_types import (
     CART_ITEM_REMOVED,
     CART_CLEARED,
     CART_SYNC,
+    # Staff assignment events
+    SECTOR_ASSIGNMENTS_CHANGED,
 )
 from .event_schema import Event
 from .routing import (
@@ -326,3 +328,41 @@ async def publish_cart_event(
 
     # Cart events only go to session channel (diners at the table)
     await publish_to_session(redis_client, session_id, event)
+
+
+async def publish_sector_assignment_event(
+    redis_client: redis.Redis,
+    tenant_id: int,
+    branch_id: int,
+    waiter_ids: list[int],
+    assignment_date: str,
+    actor_user_id: int | None = None,
+) -> None:
+    """
+    Publish SECTOR_ASSIGNMENTS_CHANGED after waiter-sector assignments change.
+
+    PERF-SECTORS-01: Published ONLY to the branch waiters channel, which every
+    gateway with waiters of the branch is subscribed to. The gateway drops the
+    cached sectors of the listed waiters and re-indexes their connections; the
+    event itself is not forwarded to clients.
+
+    Args:
+        redis_client: Async Redis client.
+        tenant_id: Tenant ID.
+        branch_id: Branch ID of the assignments.
+        waiter_ids: Waiters whose assignments changed.
+        assignment_date: ISO date of the changed assignments.
+        actor_user_id: ID of user who performed the action.
+    """
+    event = Event(
+        type=SECTOR_ASSIGNMENTS_CHANGED,
+        tenant_id=tenant_id,
+        branch_id=branch_id,
+        entity={
+            "waiter_ids": sorted(set(waiter_ids)),
+            "assignment_date": assignment_date,
+        },
+        actor={"user_id": actor_user_id, "role": "ADMIN"},
+    )
+
+    await publish_to_waiters(redis_client, branch_id, event)
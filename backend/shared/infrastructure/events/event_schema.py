@@ -34,6 +34,8 @@ class Event:
     actor: dict[str, Any] = field(default_factory=dict)
     ts: str | None = None
     v: int = 1  # Schema version for future compatibility
+    # PERF-LATENCY-01: Epoch seconds, stamped by the publisher on each publish
+    published_at: float | None = None
 
     def __post_init__(self) -> None:
         """
@@ -76,6 +76,14 @@ ENTITY_UPDATED = "ENTITY_UPDATED"
 ENTITY_DELETED = "ENTITY_DELETED"
 CASCADE_DELETE = "CASCADE_DELETE"
 
+# =============================================================================
+# Staff assignment events
+# =============================================================================
+
+# PERF-SECTORS-01: Waiter-sector assignments changed (consumed by ws_gateway to
+# refresh its sector cache and connection index, not forwarded to clients)
+SECTOR_ASSIGNMENTS_CHANGED = "SECTOR_ASSIGNMENTS_CHANGED"
+
 # =============================================================================
 # Size limits
 # =============================================================================
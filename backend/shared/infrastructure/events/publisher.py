@@ -3,11 +3,14 @@ Core Event Publishing with Retry and Validation.
 
 REDIS-HIGH-03/04/07 FIX: Retry logic, validation, and size checking.
 REDIS-CRIT-03 FIX: Circuit breaker integration.
+PERF-LATENCY-01: Events are stamped with published_at so the gateway can
+measure publish-to-deliver latency.
 """
 
 from __future__ import annotations
 
 import asyncio
+import time
 
 import redis.asyncio as redis
 
@@ -61,6 +64,8 @@ async def publish_event(
         ValueError: If event is too large.
         Exception: If all retries fail and circuit breaker allows.
     """
+    # PERF-LATENCY-01: Start of the publish-to-deliver measurement
+    event.published_at = time.time()
     event_json = event.to_json()
 
     # REDIS-HIGH-07 FIX: Validate size before publishing
@@ -136,6 +141,8 @@ async def publish_to_stream(
         event: Event to publish.
         maxlen: Max stream length (approximate) to prevent unbounded growth.
     """
+    # PERF-LATENCY-01: Start of the publish-to-deliver measurement
+    event.published_at = time.time()
     event_json = event.to_json()
     _validate_event_size(event_json, event.type)
 
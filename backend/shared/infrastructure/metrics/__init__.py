@@ -12,6 +12,10 @@ from shared.infrastructure.metrics.prometheus import (
     get_metrics_registry,
     export_metrics,
 )
+from shared.infrastructure.metrics.compression import (
+    CompressionStats,
+    get_compression_stats,
+)
 
 __all__ = [
     "MetricsRegistry",
@@ -20,4 +24,7 @@ __all__ = [
     "get_app_metrics",
     "get_metrics_registry",
     "export_metrics",
+    # PERF-COMPRESS-01
+    "CompressionStats",
+    "get_compression_stats",
 ]
@@ -0,0 +1,139 @@
+"""
+Response Compression Metrics.
+
+PERF-COMPRESS-01: Bytes on the wire and compression CPU per endpoint and
+content encoding.
+
+Responses are counted in process (no Redis round-trip per response) and the
+accumulated deltas are flushed to the Redis-backed AppMetrics counters at
+most once per flush interval.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from shared.config.logging import get_logger
+
+logger = get_logger(__name__)
+
+FLUSH_INTERVAL_SECONDS = 10.0
+
+# Field order of the per-(endpoint, encoding) accumulators
+_RESPONSES, _RAW_BYTES, _WIRE_BYTES, _SECONDS = range(4)
+
+
+class CompressionStats:
+    """
+    Per-endpoint response size and compression time accumulator.
+
+    Recording is thread-safe: sync endpoints run in the threadpool and
+    account compression CPU of precompressed cache entries from there.
+
+    Usage:
+        stats = get_compression_stats()
+        stats.record_compression("/api/public/menu/{branch_slug}", "br", 0.004)
+        stats.record_response("/api/public/menu/{branch_slug}", "br", 48_000, 6_100)
+        stats.maybe_flush()  # from the event loop
+    """
+
+    def __init__(self, flush_interval: float = FLUSH_INTERVAL_SECONDS) -> None:
+        """
+        Initialize stats.
+
+        Args:
+            flush_interval: Min seconds between flushes to AppMetrics.
+        """
+        self._lock = threading.Lock()
+        self._flush_interval = flush_interval
+        self._totals: dict[tuple[str, str], list[float]] = {}
+        self._pending: dict[tuple[str, str], list[float]] = {}
+        self._next_flush = time.monotonic() + flush_interval
+        self._flush_task: asyncio.Task | None = None
+
+    def _add(self, endpoint: str, encoding: str, field: int, value: float) -> None:
+        key = (endpoint, encoding)
+        with self._lock:
+            for table in (self._totals, self._pending):
+                row = table.get(key)
+                if row is None:
+                    row = table[key] = [0.0, 0.0, 0.0, 0.0]
+                row[field] += value
+
+    def record_response(
+        self,
+        endpoint: str,
+        encoding: str,
+        raw_bytes: int,
+        wire_bytes: int,
+    ) -> None:
+        """Count a response body sent with the given encoding."""
+        key = (endpoint, encoding)
+        with self._lock:
+            for table in (self._totals, self._pending):
+                row = table.get(key)
+                if row is None:
+                    row = table[key] = [0.0, 0.0, 0.0, 0.0]
+                row[_RESPONSES] += 1
+                row[_RAW_BYTES] += raw_bytes
+                row[_WIRE_BYTES] += wire_bytes
+
+    def record_compression(self, endpoint: str, encoding: str, seconds: float) -> None:
+        """Account CPU time spent compressing a body for an endpoint."""
+        self._add(endpoint, encoding, _SECONDS, seconds)
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Totals since start: endpoint -> encoding -> counters."""
+        result: dict[str, dict[str, dict[str, float]]] = {}
+        with self._lock:
+            for (endpoint, encoding), row in self._totals.items():
+                result.setdefault(endpoint, {})[encoding] = {
+                    "responses": int(row[_RESPONSES]),
+                    "raw_bytes": int(row[_RAW_BYTES]),
+                    "wire_bytes": int(row[_WIRE_BYTES]),
+                    "compression_seconds": row[_SECONDS],
+                }
+        return result
+
+    def maybe_flush(self) -> None:
+        """Start a background flush if the interval elapsed. Call from the event loop."""
+        now = time.monotonic()
+        if now < self._next_flush or (self._flush_task and not self._flush_task.done()):
+            return
+        self._next_flush = now + self._flush_interval
+        self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+
+    async def flush(self) -> None:
+        """Add the deltas accumulated since the last flush to AppMetrics."""
+        from shared.infrastructure.metrics.prometheus import get_app_metrics
+
+        metrics = await get_app_metrics()
+        if metrics is None:
+            return
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        try:
+            for (endpoint, encoding), row in pending.items():
+                await metrics.response_compression(
+                    endpoint,
+                    encoding,
+                    responses=int(row[_RESPONSES]),
+                    raw_bytes=int(row[_RAW_BYTES]),
+                    wire_bytes=int(row[_WIRE_BYTES]),
+                    compression_seconds=row[_SECONDS],
+                )
+        except Exception as e:
+            logger.warning("Failed to flush compression metrics", error=str(e))
+
+
+# Created at import: recording happens from threadpool threads as well
+_stats = CompressionStats()
+
+
+def get_compression_stats() -> CompressionStats:
+    """Get singleton compression stats."""
+    return _stats
@@ -295,20 +295,61 @@ class AppMetrics:
     # Cache Metrics
     # -------------------------------------------------------------------------
     
-    async def cache_hit(self, cache_name: str) -> None:
-        """Increment cache hit counter."""
-        await self._registry.counter_inc(
-            "cache_hits_total",
-            labels={"cache": cache_name},
-        )
-    
-    async def cache_miss(self, cache_name: str) -> None:
-        """Increment cache miss counter."""
-        await self._registry.counter_inc(
-            "cache_misses_total",
-            labels={"cache": cache_name},
-        )
+    async def cache_hit(
+        self,
+        cache_name: str,
+        count: int = 1,
+        seconds: float = 0.0,
+        tier: str | None = None,
+    ) -> None:
+        """
+        Increment cache hit counter.
+
+        PERF-CACHE-01: Accepts batched counts, their summed lookup latency
+        and the tier that served them (local/redis).
+        """
+        labels = {"cache": cache_name}
+        if tier:
+            labels["tier"] = tier
+        await self._registry.counter_inc("cache_hits_total", count, labels=labels)
+        if seconds:
+            await self._registry.counter_inc("cache_hit_seconds_total", seconds, labels=labels)
+    
+    async def cache_miss(self, cache_name: str, count: int = 1, seconds: float = 0.0) -> None:
+        """
+        Increment cache miss counter.
+
+        PERF-CACHE-01: seconds is the summed latency of the misses (load included).
+        """
+        labels = {"cache": cache_name}
+        await self._registry.counter_inc("cache_misses_total", count, labels=labels)
+        if seconds:
+            await self._registry.counter_inc("cache_miss_seconds_total", seconds, labels=labels)
     
+    # -------------------------------------------------------------------------
+    # Response Compression Metrics (PERF-COMPRESS-01)
+    # -------------------------------------------------------------------------
+
+    async def response_compression(
+        self,
+        path: str,
+        encoding: str,
+        responses: int,
+        raw_bytes: int,
+        wire_bytes: int,
+        compression_seconds: float,
+    ) -> None:
+        """Add response sizes and compression CPU accumulated for an endpoint."""
+        labels = {"path": path, "encoding": encoding}
+        if responses:
+            await self._registry.counter_inc("http_responses_encoded_total", responses, labels=labels)
+            await self._registry.counter_inc("http_response_raw_bytes_total", raw_bytes, labels=labels)
+            await self._registry.counter_inc("http_response_wire_bytes_total", wire_bytes, labels=labels)
+        if compression_seconds:
+            await self._registry.counter_inc(
+                "http_response_compression_seconds_total", compression_seconds, labels=labels
+            )
+
     # -------------------------------------------------------------------------
     # Business Metrics
     # -------------------------------------------------------------------------
@@ -14,6 +14,10 @@ JWT_BLACKLIST_TTL = 3600  # 1 hour (should match generic access token lifetime)
 # Caching
 PRODUCT_CACHE_TTL = 300  # 5 minutes
 BRANCH_PRODUCTS_CACHE_TTL = 300  # 5 minutes
+# PERF-MENU-01: Menu entries are keyed by menu version, so the TTL only bounds memory
+MENU_CACHE_TTL = 3600  # 1 hour
+# PERF-WARM-01: Reference catalogs only change with the seed
+REFERENCE_CATALOG_CACHE_TTL = 3600  # 1 hour
 
 # Rate Limiting
 # Note: Rate limits use windows defined in settings, not fixed constants here
@@ -39,6 +43,26 @@ def get_branch_products_cache_key(branch_id: int, tenant_id: int) -> str:
     """PERF-MED-04: Generate cache key for branch products with consistent prefix."""
     return PREFIX_CACHE_BRANCH_PRODUCTS_TEMPLATE.format(branch_id=branch_id, tenant_id=tenant_id)
 
+# PERF-MENU-01: Pre-serialized public menu, versioned per branch
+PREFIX_CACHE_MENU = "cache:menu:"
+PREFIX_CACHE_MENU_VERSION = "cache:menu:version:"
+PREFIX_CACHE_MENU_SLUG = "cache:menu:slug:"
+
+# PERF-WARM-01: Active rows of a reference catalog (cooking methods, flavors, ...)
+PREFIX_CACHE_REFERENCE_CATALOG = "cache:catalog:"
+
+
+def get_reference_catalog_cache_key(name: str) -> str:
+    """PERF-WARM-01: Cache key of the active rows of a reference catalog."""
+    return f"{PREFIX_CACHE_REFERENCE_CATALOG}{name}"
+
+# PERF-CACHE-01: Two-tier cache rebuild locks
+PREFIX_CACHE_LOCK = "cache:lock:"
+# PERF-CACHE-01: Invalidation generation of a two-tier cache key (checked on write-back)
+PREFIX_CACHE_GENERATION = "cache:gen:"
+# PERF-WARM-01: Claims of a refresh-ahead cycle (one worker refreshes a hot entry)
+PREFIX_CACHE_REFRESH_CLAIM = "cache:refresh:"
+
 PREFIX_RATELIMIT_LOGIN = "ratelimit:login:"
 
 PREFIX_WEBHOOK_RETRY = "webhook:retry:"
@@ -53,3 +77,10 @@ STREAM_EVENTS_CRITICAL = "events:critical"
 # Consumer group for WebSocket Gateway
 CONSUMER_GROUP_WS_GATEWAY = "ws_gateway_group"
 
+# =============================================================================
+# Pub/Sub Channels
+# =============================================================================
+
+# PERF-CACHE-01: Two-tier cache invalidations (workers drop their local copy)
+CHANNEL_CACHE_INVALIDATION = "cache:invalidate"
+
@@ -23,7 +23,8 @@ from shared.config.logging import get_logger
 logger = get_logger(__name__)
 
 # Create limiter instance using client IP as key
-limiter = Limiter(key_func=get_remote_address)
+# PERF-ASYNCDB-01: Can be disabled for load tests (rejected in production)
+limiter = Limiter(key_func=get_remote_address, enabled=settings.ip_rate_limit_enabled)
 
 
 def set_rate_limit_email(request: Request, email: str) -> None:
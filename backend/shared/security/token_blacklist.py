@@ -225,6 +225,69 @@ async def check_token_validity(token_jti: str, user_id: int, token_iat: datetime
         return False  # Treat as invalid (fail closed)
 
 
+async def check_tokens_validity(
+    tokens: list[tuple[str | None, int | None, datetime | None]],
+) -> list[bool]:
+    """
+    Check many tokens against the blacklist and user revocation at once.
+
+    PERF-AUTH-01: One pipelined round-trip for the whole batch (EXISTS per
+    distinct jti, GET per distinct user), so the WebSocket gateway can
+    verify every connect/revalidation that falls due in the same event loop
+    tick without blocking on the sync client.
+
+    Args:
+        tokens: (jti, user_id, iat) per token; None skips that check.
+
+    Returns:
+        Validity per token, in input order (all False if Redis fails).
+    """
+    if not tokens:
+        return []
+
+    jtis = sorted({jti for jti, _, _ in tokens if jti})
+    user_ids = sorted({
+        user_id for _, user_id, iat in tokens if user_id is not None and iat is not None
+    })
+    if not jtis and not user_ids:
+        return [True] * len(tokens)
+
+    try:
+        redis = await get_redis_pool()
+        async with redis.pipeline(transaction=False) as pipe:
+            for jti in jtis:
+                pipe.exists(f"{BLACKLIST_PREFIX}{jti}")
+            for user_id in user_ids:
+                pipe.get(f"{USER_REVOKE_PREFIX}{user_id}")
+            results = await pipe.execute()
+
+        blacklisted = {jti for jti, exists in zip(jtis, results) if exists}
+        revoked_at = {
+            user_id: datetime.fromisoformat(revoke_time_str)
+            for user_id, revoke_time_str in zip(user_ids, results[len(jtis):])
+            if revoke_time_str
+        }
+
+        valid = []
+        for jti, user_id, iat in tokens:
+            revoke_time = revoked_at.get(user_id)
+            valid.append(
+                jti not in blacklisted
+                and not (revoke_time is not None and iat is not None and iat < revoke_time)
+            )
+        return valid
+
+    except Exception as e:
+        # CRIT-02 FIX: Fail CLOSED on Redis errors for security
+        logger.error(
+            "Failed to check token validity - failing closed",
+            tokens=len(tokens),
+            error=str(e),
+            sync=False,
+        )
+        return [False] * len(tokens)
+
+
 # =============================================================================
 # Synchronous wrappers using shared Redis sync client
 # REDIS-CRIT-02/03 FIX: Uses coordinated client from events.py
@@ -10,7 +10,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from rest_api.main import app
-from shared.infrastructure.db import get_db
+from shared.infrastructure.db import SyncSessionAdapter, get_async_db, get_db
 from rest_api.models import (
     Base, Tenant, Branch, User, UserBranchRole,
     Category, Product, BranchProduct, Table, TableSession,
@@ -63,7 +63,12 @@ def client(db_session):
         finally:
             pass
 
+    # PERF-ASYNCDB-01: Async endpoints read the same SQLite session
+    async def override_get_async_db():
+        yield SyncSessionAdapter(db_session)
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
     with TestClient(app) as test_client:
         yield test_client
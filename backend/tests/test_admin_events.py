@@ -6,10 +6,12 @@ Tests verify:
 - Error callback is properly attached to tasks
 - Task error handling works correctly
 - PERF-BGTASK-01: BackgroundTasks integration for FastAPI request context
+- PERF-SECTORS-01: Sector assignment changes are published for today only
 """
 
 import pytest
 import asyncio
+from datetime import date, timedelta
 from unittest.mock import patch, MagicMock, AsyncMock
 
 from rest_api.services.events.admin_events import (
@@ -20,6 +22,7 @@ from rest_api.services.events.admin_events import (
     publish_entity_updated,
     publish_entity_deleted,
     publish_cascade_delete,
+    publish_sector_assignments_changed,
 )
 
 
@@ -353,3 +356,47 @@ class TestBackgroundTasksIntegration:
         assert call_args[1]['entity_name'] == 'Summer Sale'
         assert call_args[1]['branch_id'] == 5
         assert call_args[1]['actor_user_id'] == 42
+
+
+class TestSectorAssignmentsChanged:
+    """Tests for PERF-SECTORS-01: SECTOR_ASSIGNMENTS_CHANGED publishing."""
+
+    def test_today_changes_are_published_with_unique_waiters(self):
+        """Should queue one event with deduplicated, sorted waiter IDs."""
+        mock_bg_tasks = MagicMock()
+
+        publish_sector_assignments_changed(
+            tenant_id=1,
+            branch_id=5,
+            waiter_ids=[7, 3, 7],
+            assignment_date=date.today(),
+            actor_user_id=42,
+            background_tasks=mock_bg_tasks,
+        )
+
+        mock_bg_tasks.add_task.assert_called_once()
+        call_args = mock_bg_tasks.add_task.call_args
+        assert call_args[0][0].__name__ == '_publish_sector_assignments_changed'
+        assert call_args[1]['branch_id'] == 5
+        assert call_args[1]['waiter_ids'] == [3, 7]
+
+    def test_other_dates_and_empty_changes_are_not_published(self):
+        """Gateways only track today's assignments."""
+        mock_bg_tasks = MagicMock()
+
+        publish_sector_assignments_changed(
+            tenant_id=1,
+            branch_id=5,
+            waiter_ids=[3],
+            assignment_date=date.today() + timedelta(days=1),
+            background_tasks=mock_bg_tasks,
+        )
+        publish_sector_assignments_changed(
+            tenant_id=1,
+            branch_id=5,
+            waiter_ids=[],
+            assignment_date=date.today(),
+            background_tasks=mock_bg_tasks,
+        )
+
+        mock_bg_tasks.add_task.assert_not_called()
@@ -0,0 +1,59 @@
+"""
+Tests for the async database session - PERF-ASYNCDB-01.
+
+Tests verify:
+- The sync session adapter buffers results, runs sync code through
+  run_sync and is what get_async_db yields with the async engine off
+- Endpoints ported to async sessions keep their responses
+"""
+
+import pytest
+from sqlalchemy import select
+
+from rest_api.models import Branch, Table
+from shared.infrastructure import db
+
+
+class TestAsyncDb:
+    """PERF-ASYNCDB-01: async sessions for hot read endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_sync_adapter_and_fallback_dependency(
+        self, db_session, seed_table, monkeypatch
+    ):
+        adapter = db.SyncSessionAdapter(db_session)
+
+        result = await adapter.execute(select(Table.code).where(Table.id == seed_table.id))
+        # Buffered: still readable after the session is used again
+        assert await adapter.scalar(select(Branch.slug)) == "test-branch"
+        assert result.scalars().all() == ["T-01"]
+
+        assert (await adapter.get(Table, seed_table.id)).code == "T-01"
+        assert [t.id for t in (await adapter.scalars(select(Table))).all()] == [seed_table.id]
+
+        def table_code(session, table_id):
+            return session.get(Table, table_id).code
+
+        assert await adapter.run_sync(table_code, seed_table.id) == "T-01"
+
+        monkeypatch.setattr(db.settings, "db_async_engine", False)
+        dependency = db.get_async_db()
+        session = await dependency.__anext__()
+        assert isinstance(session, db.SyncSessionAdapter)
+        await dependency.aclose()
+
+    def test_async_endpoints_serve_sync_session_override(
+        self, client, auth_headers, waiter_auth_headers, seed_table
+    ):
+        response = client.get("/api/waiter/tables", headers=auth_headers)
+        assert response.status_code == 200
+        tables = response.json()
+        assert [t["table_id"] for t in tables] == [seed_table.id]
+        assert tables[0]["session_id"] is None and tables[0]["open_rounds"] == 0
+
+        # Waiters without a sector assignment for today see no tables
+        response = client.get("/api/waiter/tables", headers=waiter_auth_headers)
+        assert response.status_code == 200 and response.json() == []
+
+        response = client.get("/api/kitchen/rounds", headers=auth_headers)
+        assert response.status_code == 200 and response.json() == []
@@ -5,12 +5,19 @@ Tests verify:
 - Future leak protection with timeout
 - Proper future cancellation on timeout
 - Broadcast metrics accuracy
+- Multi-audience sends reach each socket once (PERF-AUDIENCE-01)
 """
 
 import pytest
 import asyncio
 from unittest.mock import MagicMock, AsyncMock, patch
 
+from starlette.websockets import WebSocketState
+
+from ws_gateway.components.connection.index import ConnectionIndex
+from ws_gateway.components.connection.locks import LockManager
+from ws_gateway.core.connection.broadcaster import ConnectionBroadcaster
+
 
 class TestBroadcasterFutureProtection:
     """Tests for PERF-FUTURE-01 future leak protection."""
@@ -228,3 +235,96 @@ class TestBroadcastBatching:
         results = await asyncio.gather(*[process_item(i) for i in items])
 
         assert results == [2, 4, 6, 8, 10]
+
+
+class FakeWebSocket:
+    """Connected WebSocket that records the frames sent to it."""
+
+    client_state = WebSocketState.CONNECTED
+    application_state = WebSocketState.CONNECTED
+
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(text)
+
+
+class TestSendToAudiences:
+    """PERF-AUDIENCE-01: one delivery per socket across several audiences."""
+
+    BRANCH_ID = 7
+    SESSION_ID = 5
+    TENANT_ID = 1
+
+    def _broadcaster(self):
+        index = ConnectionIndex()
+        sockets = {}
+        for name, user_id, is_admin, is_kitchen in [
+            ("admin", 1, True, False),
+            ("waiter", 2, False, False),
+            ("kitchen", 3, False, True),
+        ]:
+            ws = FakeWebSocket()
+            record = index.register_user(ws, user_id, is_admin, is_kitchen, self.TENANT_ID)
+            index.register_branch(record, self.BRANCH_ID)
+            sockets[name] = ws
+        # The waiter is also following the table session
+        index.register_session(index.get_record(sockets["waiter"]), self.SESSION_ID)
+        broadcaster = ConnectionBroadcaster(
+            LockManager(), index, MagicMock(), AsyncMock()
+        )
+        return broadcaster, sockets
+
+    @pytest.mark.parametrize("outbox", [False, True])
+    @pytest.mark.asyncio
+    async def test_overlapping_audiences_deliver_once_per_socket(self, outbox):
+        broadcaster, sockets = self._broadcaster()
+        if outbox:
+            await broadcaster.start_workers()
+
+        counts = await broadcaster.send_to_audiences(
+            [
+                ("branch", self.BRANCH_ID),
+                ("admins", self.BRANCH_ID),
+                ("session", self.SESSION_ID),
+            ],
+            {"type": "CHECK_REQUESTED"},
+            tenant_id=self.TENANT_ID,
+        )
+        if outbox:
+            await broadcaster.stop_workers(timeout=1.0)
+
+        # Every socket is counted for the first audience that lists it
+        assert counts == {"branch": 3, "admins": 0, "session": 0}
+        for ws in sockets.values():
+            assert ws.sent == ['{"type":"CHECK_REQUESTED"}']
+
+    @pytest.mark.asyncio
+    async def test_counts_follow_target_priority(self):
+        broadcaster, sockets = self._broadcaster()
+
+        counts = await broadcaster.send_to_audiences(
+            [
+                ("admins", self.BRANCH_ID),
+                ("session", self.SESSION_ID),
+                ("kitchen", self.BRANCH_ID),
+                ("branch", self.BRANCH_ID),
+            ],
+            {"type": "ROUND_SUBMITTED"},
+            tenant_id=self.TENANT_ID,
+        )
+
+        assert counts == {"admins": 1, "session": 1, "kitchen": 1, "branch": 0}
+        assert all(len(ws.sent) == 1 for ws in sockets.values())
+
+    @pytest.mark.asyncio
+    async def test_other_tenants_are_not_reached(self):
+        broadcaster, sockets = self._broadcaster()
+
+        counts = await broadcaster.send_to_audiences(
+            [("branch", self.BRANCH_ID)], {"type": "TABLE_CLEARED"}, tenant_id=99
+        )
+
+        assert counts == {"branch": 0}
+        assert all(ws.sent == [] for ws in sockets.values())
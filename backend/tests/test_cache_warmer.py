@@ -0,0 +1,100 @@
+"""
+Tests for cache warming and refresh-ahead - PERF-WARM-01.
+
+Tests verify:
+- Read counts decay, and only resources read often enough are hot
+- Warming jobs run on a bounded pool, skip entries claimed by another
+  worker and survive failing jobs
+"""
+
+import asyncio
+
+import pytest
+
+from shared.infrastructure.cache import access as access_module
+from shared.infrastructure.cache import warmer as warmer_module
+
+
+class FakeClaimRedis:
+    """Async Redis subset for refresh claims (SET NX in a pipeline)."""
+
+    def __init__(self, claimed=()):
+        self.data = {key: "1" for key in claimed}
+
+    def pipeline(self, transaction=True):
+        return FakeClaimPipeline(self)
+
+
+class FakeClaimPipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._keys = []
+
+    def set(self, key, value, nx=False, ex=None):
+        self._keys.append(key)
+
+    async def execute(self):
+        results = []
+        for key in self._keys:
+            results.append(key not in self._redis.data or None)
+            self._redis.data.setdefault(key, "1")
+        return results
+
+
+class TestCacheWarmer:
+    """PERF-WARM-01: startup warming and access-driven refresh-ahead."""
+
+    def test_access_tracker_decays_and_ranks_hot_entries(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(access_module.time, "monotonic", lambda: now[0])
+        tracker = access_module.AccessTracker(half_life_seconds=60.0)
+
+        for _ in range(20):
+            tracker.record("public", 1)
+        for _ in range(5):
+            tracker.record("waiter", 2)
+        tracker.record("products", (3, 1))
+
+        hot = tracker.hot(min_per_minute=2.0)
+        assert [(kind, key) for kind, key, _ in hot] == [("public", 1), ("waiter", 2)]
+        assert hot[0][2] > hot[1][2]
+
+        # Two half-lives later the waiter menu is no longer hot
+        now[0] += 120.0
+        assert [(kind, key) for kind, key, _ in tracker.hot(min_per_minute=2.0)] == [("public", 1)]
+
+        # Idle entries are eventually forgotten
+        now[0] += 3600.0
+        assert tracker.hot(min_per_minute=0.0) == []
+        assert len(tracker) == 0
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_bounded_and_skip_claimed_entries(self):
+        redis = FakeClaimRedis(claimed=["cache:refresh:menus:2"])
+        warmer = warmer_module.CacheWarmer(redis, db_session_factory=None, concurrency=2)
+
+        running = 0
+        peak = 0
+        warmed = []
+
+        async def job(label):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            warmed.append(label)
+            return 1
+
+        async def failing():
+            raise RuntimeError("database unavailable")
+
+        jobs = [("menus", f"menus:{i}", lambda i=i: job(f"menus:{i}")) for i in range(1, 6)]
+        jobs.append(("products", "products:1", failing))
+
+        results = await warmer.run_jobs(jobs, claim_seconds=15)
+
+        assert peak == 2
+        assert sorted(warmed) == ["menus:1", "menus:3", "menus:4", "menus:5"]
+        assert results == {"menus": 4}
+        assert "cache:refresh:products:1" in redis.data
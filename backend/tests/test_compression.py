@@ -0,0 +1,121 @@
+"""
+Tests for response compression - PERF-COMPRESS-01.
+
+Tests verify:
+- Accept-Encoding negotiation honors q-values and precompressed variants decode
+- The middleware compresses large JSON, passes precompressed bodies through
+  and records bytes per route
+- Bodies above the thread threshold are compressed off the event loop
+"""
+
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from shared.utils import compression as compression_module
+
+
+class TestCompression:
+    """PERF-COMPRESS-01: gzip/brotli negotiation and accounting."""
+
+    def test_negotiation_and_precompressed_variants(self):
+        negotiate = compression_module.negotiate_encoding
+
+        assert negotiate("gzip", ("br", "gzip")) == "gzip"
+        assert negotiate("gzip, br", ("br", "gzip")) == "br"
+        assert negotiate("br;q=0.5, gzip", ("br", "gzip")) == "gzip"
+        assert negotiate("*;q=0.1, br;q=0", ("br", "gzip")) == "gzip"
+        assert negotiate("identity", ("br", "gzip")) is None
+        assert negotiate(None) is None
+
+        body = b'{"categories": []}' * 200
+        variants = compression_module.precompress(body)
+        assert gzip.decompress(variants["gzip"]) == body
+        assert all(len(data) < len(body) for data in variants.values())
+
+    def test_middleware_compresses_and_records_per_route(self):
+        from fastapi import FastAPI, Request, Response
+        from fastapi.testclient import TestClient
+
+        from rest_api.core.middlewares import CompressionMiddleware
+        from shared.infrastructure.metrics.compression import get_compression_stats
+
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware)
+        payload = {"products": [{"name": f"Producto {i}", "price_cents": 1000} for i in range(200)]}
+
+        @app.get("/big")
+        def big():
+            return payload
+
+        @app.get("/small")
+        def small():
+            return {"ok": True}
+
+        raw = json.dumps([0] * 2000).encode()
+
+        @app.get("/precompressed")
+        def precompressed(request: Request):
+            request.state.uncompressed_size = len(raw)
+            return Response(
+                content=gzip.compress(raw),
+                media_type="application/json",
+                headers={"Content-Encoding": "gzip"},
+            )
+
+        client = TestClient(app)
+        response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json() == payload
+
+        assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+        assert client.get("/precompressed", headers={"Accept-Encoding": "gzip"}).json() == [0] * 2000
+
+        stats = get_compression_stats().snapshot()
+        big_gzip = stats["/big"]["gzip"]
+        assert big_gzip["wire_bytes"] < big_gzip["raw_bytes"]
+        assert big_gzip["compression_seconds"] > 0
+        assert stats["/small"]["identity"]["raw_bytes"] == stats["/small"]["identity"]["wire_bytes"]
+        assert stats["/precompressed"]["gzip"]["raw_bytes"] >= len(raw)
+
+    def test_large_bodies_are_compressed_in_the_threadpool(self, monkeypatch):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from rest_api.core import middlewares
+        from shared.config.settings import settings
+
+        on_event_loop = {}
+
+        def recording_compress(body, encoding, endpoint=None):
+            try:
+                asyncio.get_running_loop()
+                on_event_loop[endpoint] = True
+            except RuntimeError:
+                on_event_loop[endpoint] = False
+            return compression_module.compress(body, encoding, endpoint)
+
+        monkeypatch.setattr(middlewares, "compress", recording_compress)
+        monkeypatch.setattr(settings, "response_compression_thread_min_bytes", 8 * 1024)
+
+        app = FastAPI()
+        app.add_middleware(middlewares.CompressionMiddleware)
+
+        @app.get("/menu")
+        def menu():
+            return {"items": ["x" * 64] * 500}
+
+        @app.get("/table")
+        def table():
+            return {"items": ["x" * 64] * 30}
+
+        client = TestClient(app)
+        for path in ("/menu", "/table"):
+            response = client.get(path, headers={"Accept-Encoding": "gzip"})
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.json()["items"]
+
+        assert on_event_loop == {"/menu": False, "/table": True}
@@ -0,0 +1,143 @@
+"""
+Tests for the tenant-partitioned connection indices - PERF-TENANT-01.
+
+Tests verify:
+- Tenant-scoped queries never return another tenant's connections
+- Waiter and kitchen audiences exclude admins (and waiters exclude kitchen)
+- Unregistering empties the tenant buckets as well as the global ones
+- record_in_audience() agrees with the bucket queries (PERF-REPLAY-01)
+"""
+
+import pytest
+
+from ws_gateway.components.connection.index import ConnectionIndex
+
+
+BRANCH_ID = 7
+TENANT_A = 1
+TENANT_B = 2
+
+
+class FakeWebSocket:
+    """Hashable stand-in for a connected WebSocket."""
+
+
+def _connect(
+    index: ConnectionIndex,
+    user_id: int,
+    tenant_id: int,
+    is_admin: bool = False,
+    is_kitchen: bool = False,
+    branch_id: int = BRANCH_ID,
+):
+    ws = FakeWebSocket()
+    record = index.register_user(ws, user_id, is_admin, is_kitchen, tenant_id)
+    index.register_branch(record, branch_id)
+    return ws, record
+
+
+class TestTenantPartitionedIndex:
+    """PERF-TENANT-01: recipients come straight from (tenant, key) buckets."""
+
+    def test_branch_queries_are_scoped_to_the_tenant(self):
+        index = ConnectionIndex()
+        ws_a, _ = _connect(index, 10, TENANT_A)
+        ws_b, _ = _connect(index, 20, TENANT_B)
+
+        assert index.get_branch_connections(BRANCH_ID, TENANT_A) == {ws_a}
+        assert index.get_branch_connections(BRANCH_ID, TENANT_B) == {ws_b}
+        assert index.get_branch_connections(BRANCH_ID) == {ws_a, ws_b}
+        assert index.get_branch_connections(BRANCH_ID, 99) == set()
+
+    def test_session_sector_and_user_queries_are_scoped_to_the_tenant(self):
+        index = ConnectionIndex()
+        ws_a, record_a = _connect(index, 10, TENANT_A)
+        ws_b, record_b = _connect(index, 10, TENANT_B)
+        for record in (record_a, record_b):
+            index.register_session(record, 5)
+            index.register_sectors(record, [3, 4])
+
+        assert index.get_session_connections(5, TENANT_A) == {ws_a}
+        assert index.get_sector_connections(3, TENANT_B) == {ws_b}
+        assert index.get_sectors_connections([3, 4], TENANT_A) == {ws_a}
+        assert index.get_user_connections(10, TENANT_B) == {ws_b}
+        assert index.get_user_connections(10) == {ws_a, ws_b}
+
+    def test_role_audiences_split_the_branch(self):
+        index = ConnectionIndex()
+        waiter, _ = _connect(index, 10, TENANT_A)
+        admin, _ = _connect(index, 11, TENANT_A, is_admin=True)
+        kitchen, _ = _connect(index, 12, TENANT_A, is_kitchen=True)
+        admin_kitchen, _ = _connect(index, 13, TENANT_A, is_admin=True, is_kitchen=True)
+        _connect(index, 20, TENANT_B, is_kitchen=True)
+
+        assert index.get_waiter_connections(BRANCH_ID, TENANT_A) == {waiter}
+        assert index.get_kitchen_staff_connections(BRANCH_ID, TENANT_A) == {kitchen}
+        assert index.get_admin_connections(BRANCH_ID, TENANT_A) == {admin, admin_kitchen}
+
+    def test_unregister_empties_tenant_buckets(self):
+        index = ConnectionIndex()
+        ws, record = _connect(index, 10, TENANT_A, is_admin=True)
+        index.register_session(record, 5)
+
+        index.unregister_session(record, 5)
+        index.unregister_branch(record, BRANCH_ID)
+        index.unregister_user(record)
+        index.registry.remove(record)
+
+        assert index.get_branch_connections(BRANCH_ID, TENANT_A) == set()
+        assert index.get_admin_connections(BRANCH_ID, TENANT_A) == set()
+        assert index.get_session_connections(5, TENANT_A) == set()
+        assert not index.has_local_interest(BRANCH_ID, 5)
+        stats = index.get_stats()
+        assert stats["admin_connections"] == 0
+        assert stats["tenants_count"] == 0
+
+
+class TestRecordInAudience:
+    """PERF-REPLAY-01: per-record audience check used to filter replays."""
+
+    @pytest.mark.parametrize(
+        "audience,key",
+        [
+            ("user", 10),
+            ("branch", BRANCH_ID),
+            ("session", 5),
+            ("sector", 3),
+            ("sectors", [3, 9]),
+            ("admins", BRANCH_ID),
+            ("waiters", BRANCH_ID),
+            ("kitchen", BRANCH_ID),
+        ],
+    )
+    def test_record_in_audience_matches_the_bucket_queries(self, audience, key):
+        index = ConnectionIndex()
+        records = []
+        for user_id, tenant_id, is_admin, is_kitchen in [
+            (10, TENANT_A, False, False),
+            (11, TENANT_A, True, False),
+            (12, TENANT_A, False, True),
+            (10, TENANT_B, False, False),
+        ]:
+            _, record = _connect(index, user_id, tenant_id, is_admin, is_kitchen)
+            index.register_session(record, 5)
+            index.register_sectors(record, [3])
+            records.append(record)
+        query = {
+            "user": index.get_user_connections,
+            "branch": index.get_branch_connections,
+            "session": index.get_session_connections,
+            "sector": index.get_sector_connections,
+            "sectors": index.get_sectors_connections,
+            "admins": index.get_admin_connections,
+            "waiters": index.get_waiter_connections,
+            "kitchen": index.get_kitchen_staff_connections,
+        }[audience]
+
+        for tenant_id in (TENANT_A, TENANT_B, None):
+            expected = query(key, tenant_id)
+            assert {
+                record.ws
+                for record in records
+                if index.record_in_audience(record, audience, key, tenant_id)
+            } == expected
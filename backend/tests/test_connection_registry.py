@@ -0,0 +1,54 @@
+"""
+Tests for the connection registry - PERF-REGISTRY-01.
+
+Tests verify:
+- Records get sequential integer ids that resolve both ways
+- Registering a socket twice returns its existing record
+- Removed records are forgotten and their ids never reused
+"""
+
+from ws_gateway.components.connection.registry import ConnectionRegistry
+
+
+TENANT_A = 1
+
+
+class FakeWebSocket:
+    """Hashable stand-in for a connected WebSocket."""
+
+
+class TestConnectionRegistry:
+    """PERF-REGISTRY-01: one record per connection, keyed by integer id."""
+
+    def test_ids_are_sequential_and_resolve_both_ways(self):
+        registry = ConnectionRegistry()
+        first, second = FakeWebSocket(), FakeWebSocket()
+
+        a = registry.add(first, user_id=10, tenant_id=TENANT_A)
+        b = registry.add(second, user_id=11, tenant_id=TENANT_A, is_admin=True)
+
+        assert (a.conn_id, b.conn_id) == (1, 2)
+        assert registry.get(first) is a
+        assert registry.get_by_id(2) is b
+        assert b.is_admin and not a.is_admin
+        assert registry.websockets([1, 2, 99]) == {first, second}
+        assert len(registry) == 2
+
+    def test_adding_the_same_socket_twice_returns_its_record(self):
+        registry = ConnectionRegistry()
+        ws = FakeWebSocket()
+
+        assert registry.add(ws, user_id=10) is registry.add(ws, user_id=10)
+        assert len(registry) == 1
+
+    def test_remove_forgets_the_record_and_never_reuses_its_id(self):
+        registry = ConnectionRegistry()
+        ws = FakeWebSocket()
+        record = registry.add(ws, user_id=10)
+
+        registry.remove(record)
+
+        assert registry.get(ws) is None
+        assert registry.get_by_id(record.conn_id) is None
+        assert registry.websockets([record.conn_id]) == set()
+        assert registry.add(ws, user_id=10).conn_id == record.conn_id + 1
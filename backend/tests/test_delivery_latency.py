@@ -0,0 +1,84 @@
+"""
+Tests for gateway latency metrics - PERF-LATENCY-01.
+
+Tests verify:
+- Outbound writers record latency per event type and audience, with
+  transit, queue wait and send time broken out
+- Frames without publish/receive times (replies, replays) are not recorded
+- Histograms are exported on /ws/metrics
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from ws_gateway.components.metrics import collector
+from ws_gateway.core.connection import outbox as outbox_module
+from ws_gateway.components.broadcast import frame as frame_module
+from ws_gateway.components.metrics import prometheus
+
+
+class FakeWebSocket:
+    """Hashable stand-in for a connected WebSocket."""
+
+
+class TestDeliveryLatency:
+    """PERF-LATENCY-01: latency of event frames leaving the outbox."""
+
+    @pytest.mark.asyncio
+    async def test_writer_records_latency_by_event_type_audience_and_stage(self):
+        async def send(ws, frame):
+            await asyncio.sleep(0.01)
+            return True
+
+        async def mark_dead(ws):
+            pass
+
+        metrics = collector.MetricsCollector()
+        queues = outbox_module.OutboundQueues(send, mark_dead, metrics)
+        queues.start()
+        now = time.time()
+        event = frame_module.EncodedFrame.from_payload(
+            {"type": "ROUND_SUBMITTED", "published_at": now - 0.2, "_enqueued_at": now - 0.1}
+        )
+        reply = frame_module.EncodedFrame.from_payload({"type": "pong"})
+
+        queues.enqueue(FakeWebSocket(), event, "kitchen")
+        queues.enqueue(FakeWebSocket(), reply)
+        await asyncio.sleep(0.05)
+        await queues.stop(timeout=0.1)
+
+        latency = metrics.get_delivery_latency_sync()
+        (total,) = latency["total"]
+        assert (total["event_type"], total["audience"], total["count"]) == (
+            "ROUND_SUBMITTED", "kitchen", 1,
+        )
+        assert 0.21 <= total["sum"] < 0.5
+        assert total["buckets"]["0.25"] == 1 and total["buckets"]["0.1"] == 0
+
+        stages = {entry["stage"]: entry["sum"] for entry in latency["stages"]}
+        assert stages["transit"] == pytest.approx(0.1, abs=0.01)
+        assert stages["queue_wait"] >= 0.1
+        assert stages["send"] >= 0.01
+
+    def test_histograms_are_exported(self):
+        metrics = collector.MetricsCollector()
+        metrics.record_delivery_latency_sync(
+            "ROUND_READY", "kitchen", transit=0.05, queue_wait=0.3, send=0.01
+        )
+
+        output = prometheus.PrometheusFormatter().format_all_metrics(
+            {"delivery_latency": metrics.get_delivery_latency_sync()}
+        )
+
+        assert "# TYPE wsgateway_event_delivery_seconds histogram" in output
+        assert (
+            'wsgateway_event_delivery_seconds_bucket'
+            '{event_type="ROUND_READY",audience="kitchen",le="0.5"} 1'
+        ) in output
+        assert (
+            'wsgateway_event_delivery_seconds_bucket'
+            '{event_type="ROUND_READY",audience="kitchen",le="0.25"} 0'
+        ) in output
+        assert 'wsgateway_event_delivery_stage_seconds_count{stage="queue_wait",audience="kitchen"} 1' in output
@@ -0,0 +1,61 @@
+"""
+Tests for WebSocket handshake admission - PERF-ADMISSION-01.
+
+Tests verify:
+- At most max_concurrent handshakes run; the rest wait FIFO with a deadline
+- A full queue rejects immediately with a bounded, backlog-scaled retry delay
+"""
+
+import asyncio
+
+import pytest
+
+from ws_gateway.components.connection import admission as admission_module
+
+
+class TestHandshakeAdmission:
+    """PERF-ADMISSION-01: bounded concurrent handshakes."""
+
+    @pytest.mark.asyncio
+    async def test_excess_handshakes_wait_fifo_until_deadline(self):
+        admission = admission_module.HandshakeAdmission(
+            max_concurrent=2, max_queued=10, queue_timeout=0.05
+        )
+        order = []
+
+        async def handshake(name):
+            if not await admission.acquire():
+                order.append(f"{name}:rejected")
+                return
+            order.append(name)
+            try:
+                await asyncio.sleep(0.01)
+            finally:
+                admission.release()
+
+        await asyncio.gather(*(handshake(name) for name in "abcde"))
+        assert order == ["a", "b", "c", "d", "e"]
+
+        assert await admission.acquire() and await admission.acquire()
+        assert await admission.acquire() is False
+        assert admission.get_stats()["in_flight"] == 2
+        assert admission.get_stats()["rejected_timeout"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_with_retry_delay(self):
+        admission = admission_module.HandshakeAdmission(
+            max_concurrent=1, max_queued=1, queue_timeout=1.0,
+            retry_after_base=2.0, retry_after_max=3.0,
+        )
+        assert await admission.acquire()
+        queued = asyncio.create_task(admission.acquire())
+        await asyncio.sleep(0)
+
+        assert await admission.acquire() is False
+        assert admission.get_stats()["rejected_queue_full"] == 1
+        # Backlog of 2 handshakes per slot: 2 * 2s, capped at 3s, jittered down
+        assert all(1.5 <= admission.retry_after() <= 3.0 for _ in range(20))
+
+        admission.release()
+        assert await queued is True
+        assert (admission.in_flight, admission.queued) == (1, 0)
@@ -0,0 +1,93 @@
+"""
+Tests for the heartbeat timing wheel - PERF-HEARTBEAT-01.
+
+Tests verify:
+- cleanup_stale() returns exactly the connections past the timeout,
+  including those in the partly expired current slot
+- Activity moves a connection to a later slot, so it survives cleanup
+- Removed or unregistered connections are never reported
+- Expired slots are popped, leaving only live slots on the wheel
+"""
+
+import time
+
+from ws_gateway.components.connection.heartbeat import HeartbeatTracker
+from ws_gateway.components.connection.registry import ConnectionRegistry
+
+
+TIMEOUT = 60.0
+RESOLUTION = 1.0
+
+
+class FakeWebSocket:
+    """Hashable stand-in for a connected WebSocket."""
+
+
+def _tracker(count: int) -> tuple[HeartbeatTracker, ConnectionRegistry, list[FakeWebSocket]]:
+    registry = ConnectionRegistry()
+    sockets = [FakeWebSocket() for _ in range(count)]
+    for user_id, ws in enumerate(sockets, start=1):
+        registry.add(ws, user_id)
+    tracker = HeartbeatTracker(TIMEOUT, registry, resolution_seconds=RESOLUTION)
+    return tracker, registry, sockets
+
+
+class TestHeartbeatWheel:
+    """PERF-HEARTBEAT-01: expiry by timing wheel slot."""
+
+    def test_cleanup_returns_only_expired_connections(self):
+        tracker, _, (old, boundary, fresh) = _tracker(3)
+        now = time.time()
+        tracker.record(old, now - TIMEOUT - 30)
+        # Same slot as the cutoff, but just past it
+        tracker.record(boundary, now - TIMEOUT - 0.01)
+        tracker.record(fresh, now - 1)
+
+        assert set(tracker.cleanup_stale()) == {old, boundary}
+        assert tracker.tracked_count == 1
+        assert tracker.get_last_activity(old) is None
+        assert tracker.get_last_activity(fresh) is not None
+        assert tracker.cleanup_stale() == []
+
+    def test_activity_moves_connection_out_of_expiring_slot(self):
+        tracker, _, (ws,) = _tracker(1)
+        now = time.time()
+        tracker.record(ws, now - TIMEOUT - 10)
+        tracker.record(ws, now)
+
+        assert tracker.cleanup_stale() == []
+        assert tracker.tracked_count == 1
+        assert tracker.get_stats()["wheel_slots"] == 1
+
+    def test_removed_and_unregistered_connections_are_not_reported(self):
+        tracker, registry, (removed, unregistered, stale) = _tracker(3)
+        expired_at = time.time() - TIMEOUT - 10
+        for ws in (removed, unregistered, stale):
+            tracker.record(ws, expired_at)
+
+        tracker.remove(removed)
+        registry.remove(registry.get(unregistered))
+
+        assert tracker.cleanup_stale() == [stale]
+        assert tracker.tracked_count == 0
+
+    def test_unregistered_sockets_are_ignored(self):
+        tracker, _, _ = _tracker(0)
+
+        tracker.record(FakeWebSocket())
+
+        assert tracker.tracked_count == 0
+
+    def test_expired_slots_are_popped(self):
+        tracker, _, sockets = _tracker(50)
+        now = time.time()
+        # 40 connections spread over 40 expired slots, 10 live ones
+        for i, ws in enumerate(sockets[:40]):
+            tracker.record(ws, now - TIMEOUT - 2 - i * RESOLUTION)
+        for ws in sockets[40:]:
+            tracker.record(ws, now)
+
+        assert len(tracker.cleanup_stale()) == 40
+        assert tracker.tracked_count == 10
+        assert tracker.get_stats()["wheel_slots"] == 1
+        assert tracker.get_stale_connections() == []
@@ -0,0 +1,107 @@
+"""
+Tests for the pre-serialized public menu cache - PERF-MENU-01.
+
+Tests verify:
+- Entries are served only for the current menu version; a bump invalidates
+  them and an unchanged body keeps its ETag
+- If-None-Match matching and fallback when Redis is unavailable
+"""
+
+import pytest
+
+from rest_api.services.catalog import menu_cache
+
+
+class FakeRedis:
+    """In-memory subset of the sync Redis client (decoded responses)."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value)
+        return True
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def hset(self, key, mapping):
+        self.data.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def expire(self, key, seconds):
+        return True
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((getattr(self._redis, name), args, kwargs))
+        return queue
+
+    def execute(self):
+        return [call(*args, **kwargs) for call, args, kwargs in self._calls]
+
+
+class TestMenuCache:
+    """PERF-MENU-01: versioned pre-serialized menus with ETag."""
+
+    def test_bump_invalidates_entry_and_unchanged_body_keeps_etag(self):
+        redis = FakeRedis()
+        cache = menu_cache.MenuCache(lambda: redis)
+
+        version, cached = cache.get(7)
+        assert cached is None
+        stored = cache.store(7, version, '{"branch_id":7}')
+
+        assert cache.get(7) == (version, stored)
+
+        cache.bump(7, None)
+        new_version, cached = cache.get(7)
+        assert new_version == version + 1 and cached is None
+
+        restored = cache.store(7, new_version, '{"branch_id":7}')
+        assert restored.etag == stored.etag
+
+        # A render that started before a bump is stored under its old version
+        cache.store(7, version, '{"stale":true}')
+        cache.bump(7)
+        assert cache.get(7)[1] is None
+
+    def test_etag_matching_and_redis_failure(self):
+        etag = menu_cache.compute_etag("{}")
+        matches = menu_cache.etag_matches
+
+        assert matches(etag, etag)
+        assert etag.startswith('W/"')
+        assert matches(f'"other", {etag}', etag)
+        assert matches(etag[2:], etag)
+        assert matches("*", etag)
+        assert not matches(None, etag) and not matches('"other"', etag)
+
+        def unavailable():
+            raise ConnectionError("redis down")
+
+        cache = menu_cache.MenuCache(unavailable)
+        assert cache.resolve_branch("centro") is None
+        assert cache.get(7) == (None, None)
+        assert cache.store(7, None, "{}").etag == etag
+        cache.bump(7, forget_slugs=("centro",))
@@ -0,0 +1,43 @@
+"""
+Tests for the lock-free metrics collector - PERF-METRICS-01.
+
+Tests verify:
+- Counters work from both the async and the _sync API
+- The snapshot keeps the keys of the lock-based collector
+- Outbound lag is kept in a fixed-bucket histogram
+"""
+
+import pytest
+
+from ws_gateway.components.metrics import collector
+
+
+class TestLockFreeCollector:
+    """PERF-METRICS-01: plain counters, same snapshot keys."""
+
+    LEGACY_KEYS = {
+        "broadcasts_total", "broadcasts_failed", "broadcasts_failed_recipients",
+        "broadcasts_rate_limited", "connections_rejected_limit",
+        "connections_rejected_rate_limit", "connections_rejected_auth",
+        "connections_timeouts", "events_processed", "events_dropped",
+        "events_invalid_schema", "events_callback_timeouts",
+        "outbound_frames_dropped", "outbound_frames_coalesced",
+        "outbound_slow_consumers_evicted", "outbound_lag_seconds_sum",
+        "outbound_lag_count", "outbound_lag_seconds_max", "locks_cleaned",
+    }
+
+    @pytest.mark.asyncio
+    async def test_counters_and_snapshot_keys(self):
+        metrics = collector.MetricsCollector()
+        await metrics.increment_broadcast_total()
+        metrics.increment_broadcast_total_sync()
+        metrics.record_outbound_lag_sync(0.003)
+        metrics.record_outbound_lag_sync(0.2)
+
+        snapshot = await metrics.get_snapshot()
+
+        assert set(snapshot) == self.LEGACY_KEYS
+        assert snapshot["broadcasts_total"] == 2
+        assert snapshot["outbound_lag_seconds_max"] == 0.2
+        lag = metrics.get_histograms_sync()["outbound_lag_seconds"]
+        assert (lag["buckets"]["0.005"], lag["buckets"]["0.5"], lag["count"]) == (1, 2, 2)
@@ -0,0 +1,177 @@
+"""
+Tests for per-connection outbound queues - PERF-OUTBOX-01 / PERF-REPLAY-01.
+
+Tests verify:
+- A socket that stops draining is evicted with WSCloseCode.SLOW_CONSUMER
+- A socket that keeps up is never evicted, however long it stays connected
+- Frames queued while a connection is held are sent after its replay,
+  in order, and live copies of replayed stream events are dropped
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from ws_gateway.components.broadcast.frame import EncodedFrame
+from ws_gateway.components.core.constants import WSCloseCode
+from ws_gateway.core.connection.outbox import OutboundQueues
+
+
+MAX_LAG_SECONDS = 0.05
+
+
+class FakeWebSocket:
+    """Hashable stand-in for a WebSocket that records how it was closed."""
+
+    def __init__(self):
+        self.close_code: int | None = None
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.close_code = code
+
+
+def _frame(seq: int, stream_id: str | None = None) -> EncodedFrame:
+    payload = {"type": "ROUND_SUBMITTED", "seq": seq}
+    if stream_id is not None:
+        payload["stream_id"] = stream_id
+    return EncodedFrame.from_payload(payload)
+
+
+class Harness:
+    """OutboundQueues wired to a recording send and mark_dead."""
+
+    def __init__(self):
+        self.sent: list[int] = []
+        self.dead: list[FakeWebSocket] = []
+        # Sends to these sockets never complete
+        self.stalled: set[FakeWebSocket] = set()
+        self.metrics = MagicMock()
+        self.queues = OutboundQueues(
+            self._send, self._mark_dead, self.metrics,
+            max_queue_size=100, max_lag_seconds=MAX_LAG_SECONDS,
+        )
+        self.queues.start()
+
+    async def _send(self, ws, frame) -> bool:
+        if ws in self.stalled:
+            await asyncio.Event().wait()
+        self.sent.append(json.loads(frame.text)["seq"])
+        return True
+
+    async def _mark_dead(self, ws) -> None:
+        self.dead.append(ws)
+
+    async def drain(self) -> None:
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+
+class TestSlowConsumerEviction:
+    """PERF-OUTBOX-01: lag-based eviction of stalled clients."""
+
+    @pytest.mark.asyncio
+    async def test_stalled_socket_is_evicted_with_slow_consumer(self):
+        harness = Harness()
+        ws = FakeWebSocket()
+        harness.stalled.add(ws)
+
+        assert harness.queues.enqueue(ws, _frame(1)) is True
+        await asyncio.sleep(MAX_LAG_SECONDS * 2)
+
+        assert harness.queues.enqueue(ws, _frame(2)) is False
+        await harness.drain()
+
+        assert ws.close_code == WSCloseCode.SLOW_CONSUMER
+        assert harness.dead == [ws]
+        harness.metrics.increment_slow_consumer_evicted_sync.assert_called_once()
+        # Evicted sockets reject further frames without a second eviction
+        assert harness.queues.enqueue(ws, _frame(3)) is False
+        harness.metrics.increment_slow_consumer_evicted_sync.assert_called_once()
+        await harness.queues.stop(timeout=0)
+
+    @pytest.mark.asyncio
+    async def test_stall_does_not_evict_other_sockets(self):
+        harness = Harness()
+        stalled, fast = FakeWebSocket(), FakeWebSocket()
+        harness.stalled.add(stalled)
+
+        harness.queues.enqueue(stalled, _frame(0))
+        for seq in range(1, 6):
+            await asyncio.sleep(MAX_LAG_SECONDS / 2)
+            assert harness.queues.enqueue(fast, _frame(seq)) is True
+            harness.queues.enqueue(stalled, _frame(100 + seq))
+        await harness.drain()
+
+        assert harness.sent == [1, 2, 3, 4, 5]
+        assert harness.dead == [stalled]
+        assert fast.close_code is None
+        await harness.queues.stop(timeout=0)
+
+    @pytest.mark.asyncio
+    async def test_socket_that_keeps_up_is_never_evicted(self):
+        harness = Harness()
+        ws = FakeWebSocket()
+
+        # Connected for several times the lag limit, always drained
+        for seq in range(10):
+            assert harness.queues.enqueue(ws, _frame(seq)) is True
+            await asyncio.sleep(MAX_LAG_SECONDS / 2)
+
+        assert harness.sent == list(range(10))
+        assert ws.close_code is None
+        assert harness.dead == []
+        harness.metrics.increment_slow_consumer_evicted_sync.assert_not_called()
+        await harness.queues.stop(timeout=0)
+
+
+class TestHoldAndResume:
+    """PERF-REPLAY-01: live frames wait behind the replay of missed events."""
+
+    @pytest.mark.asyncio
+    async def test_frames_sent_while_held_follow_the_replay_in_order(self):
+        harness = Harness()
+        ws = FakeWebSocket()
+
+        assert harness.queues.hold(ws) is True
+        for seq in (10, 11, 12):
+            harness.queues.enqueue(ws, _frame(seq))
+        # Held longer than the lag limit: waiting for a replay is not lag
+        await asyncio.sleep(MAX_LAG_SECONDS * 2)
+        assert harness.queues.enqueue(ws, _frame(13)) is True
+        await harness.drain()
+        assert harness.sent == []
+
+        assert harness.queues.resume(ws, [_frame(1), _frame(2)]) is True
+        await harness.drain()
+
+        assert harness.sent == [1, 2, 10, 11, 12, 13]
+        assert ws.close_code is None
+        await harness.queues.stop(timeout=0)
+
+    @pytest.mark.asyncio
+    async def test_live_copies_of_replayed_events_are_dropped(self):
+        harness = Harness()
+        ws = FakeWebSocket()
+
+        harness.queues.hold(ws)
+        harness.queues.enqueue(ws, _frame(2, stream_id="1700000000000-1"))
+        harness.queues.enqueue(ws, _frame(3, stream_id="1700000000000-2"))
+        harness.queues.resume(
+            ws, [_frame(1, stream_id="1700000000000-0"), _frame(2, stream_id="1700000000000-1")]
+        )
+        # Arrives after the resume but was already part of the replay
+        harness.queues.enqueue(ws, _frame(1, stream_id="1700000000000-0"))
+        harness.queues.enqueue(ws, _frame(4, stream_id="1700000000000-3"))
+        await harness.drain()
+
+        assert harness.sent == [1, 2, 3, 4]
+        await harness.queues.stop(timeout=0)
+
+    @pytest.mark.asyncio
+    async def test_resume_without_hold_is_rejected(self):
+        harness = Harness()
+
+        assert harness.queues.resume(FakeWebSocket(), [_frame(1)]) is False
+        await harness.queues.stop(timeout=0)
@@ -0,0 +1,58 @@
+"""
+Tests for the /ws/metrics exposition - PERF-PROM-01.
+
+Tests verify:
+- Concurrent scrapes share one rebuild of the cached exposition
+- Index gauges (admin connections, tenants) are kept on connect/disconnect
+"""
+
+import asyncio
+
+import pytest
+
+from ws_gateway.components.connection import index as index_module
+from ws_gateway.components.metrics import prometheus
+
+
+class FakeWebSocket:
+    """Hashable stand-in for a connected WebSocket."""
+
+
+class TestCachedExposition:
+    """PERF-PROM-01: cached /ws/metrics bytes and O(1) index gauges."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_scrapes_share_one_rebuild(self):
+        builds = []
+
+        async def build():
+            builds.append(1)
+            await asyncio.sleep(0.01)
+            return f"wsgateway_scrape {len(builds)}\n"
+
+        cache = prometheus.PrometheusExpositionCache(max_age_seconds=60)
+        bodies = await asyncio.gather(*(cache.get(build) for _ in range(5)))
+
+        assert bodies == [b"wsgateway_scrape 1\n"] * 5
+        assert cache.rebuilds == 1
+
+        uncached = prometheus.PrometheusExpositionCache(max_age_seconds=0)
+        await uncached.get(build)
+        assert await uncached.get(build) == b"wsgateway_scrape 3\n"
+
+    def test_index_gauges_follow_register_and_unregister(self):
+        index = index_module.ConnectionIndex()
+        admin = index.register_user(FakeWebSocket(), 1, is_admin=True, tenant_id=1)
+        waiter = index.register_user(FakeWebSocket(), 2, tenant_id=2)
+        for branch_id in (10, 11):
+            index.register_branch(admin, branch_id)
+        index.register_branch(admin, 10)
+        index.register_branch(waiter, 10)
+
+        stats = index.get_stats()
+        assert (stats["admin_connections"], stats["tenants_count"]) == (2, 2)
+
+        index.unregister_branch(admin, 11)
+        index.unregister_user(waiter)
+        stats = index.get_stats()
+        assert (stats["admin_connections"], stats["tenants_count"]) == (1, 1)
@@ -0,0 +1,169 @@
+"""
+Tests for WebSocket rate limiter - PERF-RATELIMIT-01.
+
+Tests verify:
+- GCRA allows bursts of max_messages and refills at the configured rate
+- Eviction penalty is carried over when an evicted connection returns
+- At 1k and 10k connections every message is decided without suspending
+  (no global lock) and only messages over a socket's limit are rejected
+- Benchmark (slow): throughput vs the legacy sliding-window limiter
+  (global lock and a timestamp list per connection)
+
+Run the benchmark with: pytest tests/test_rate_limiter.py -m slow
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ws_gateway.components.connection import rate_limiter
+from ws_gateway.components.connection import registry as registry_module
+
+
+MAX_MESSAGES = 20
+WINDOW_SECONDS = 1
+ROUNDS = 5
+
+
+class FakeWebSocket:
+    """Hashable stand-in for a connected WebSocket."""
+
+    client_state = None
+
+
+class LegacySlidingWindowLimiter:
+    """The pre-PERF-RATELIMIT-01 algorithm: pruned timestamp lists under one lock."""
+
+    def __init__(self, max_messages: int, window_seconds: int):
+        self._max_messages = max_messages
+        self._window_seconds = window_seconds
+        self._counters: dict[FakeWebSocket, list[float]] = {}
+        self._lock = asyncio.Lock()
+
+    async def is_allowed(self, ws: FakeWebSocket) -> bool:
+        now = time.time()
+        window_start = now - self._window_seconds
+        async with self._lock:
+            timestamps = [t for t in self._counters.get(ws, ()) if t > window_start]
+            self._counters[ws] = timestamps
+            if len(timestamps) >= self._max_messages:
+                return False
+            timestamps.append(now)
+            return True
+
+
+def _register(registry, count: int) -> list[FakeWebSocket]:
+    sockets = [FakeWebSocket() for _ in range(count)]
+    for user_id, ws in enumerate(sockets, start=1):
+        registry.add(ws, user_id)
+    return sockets
+
+
+async def _messages_per_second(limiter, sockets: list[FakeWebSocket]) -> float:
+    """Round-robin messages over all sockets, staying under the limit."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for ws in sockets:
+            await limiter.is_allowed(ws)
+    return ROUNDS * len(sockets) / (time.perf_counter() - start)
+
+
+def _decide_without_suspending(limiter, ws) -> bool:
+    """Run is_allowed() to completion in one step; fails if it awaits anything."""
+    coro = limiter.is_allowed(ws)
+    try:
+        coro.send(None)
+    except StopIteration as done:
+        return done.value
+    coro.close()
+    raise AssertionError("is_allowed() suspended (waited on a lock or I/O)")
+
+
+class TestGcraRateLimiter:
+    """PERF-RATELIMIT-01: token bucket semantics."""
+
+    @pytest.mark.asyncio
+    async def test_burst_up_to_limit_then_reject(self):
+        registry = registry_module.ConnectionRegistry()
+        limiter = rate_limiter.WebSocketRateLimiter(
+            MAX_MESSAGES, WINDOW_SECONDS, registry=registry
+        )
+        (ws,) = _register(registry, 1)
+
+        results = [await limiter.is_allowed(ws) for _ in range(MAX_MESSAGES + 5)]
+
+        assert results.count(True) == MAX_MESSAGES
+        assert results[MAX_MESSAGES:] == [False] * 5
+        assert limiter.get_connection_usage(ws)["messages_in_window"] == MAX_MESSAGES
+
+    @pytest.mark.asyncio
+    async def test_unregistered_connection_is_rejected(self):
+        limiter = rate_limiter.WebSocketRateLimiter(MAX_MESSAGES, WINDOW_SECONDS)
+
+        assert await limiter.is_allowed(FakeWebSocket()) is False
+
+    @pytest.mark.asyncio
+    async def test_eviction_penalty_is_applied_on_return(self):
+        registry = registry_module.ConnectionRegistry()
+        limiter = rate_limiter.WebSocketRateLimiter(
+            MAX_MESSAGES, WINDOW_SECONDS, max_tracked=1, registry=registry
+        )
+        first, second = _register(registry, 2)
+        for _ in range(MAX_MESSAGES):
+            assert await limiter.is_allowed(first)
+
+        # Tracking `second` evicts `first`, which keeps its message count
+        assert await limiter.is_allowed(second)
+        assert limiter.get_stats()["evictions"] == 1
+
+        # Back with the penalty: still over the limit in this window
+        assert await limiter.is_allowed(first) is False
+
+    @pytest.mark.parametrize("connections", [1_000, 10_000])
+    def test_many_connections_decide_without_lock(self, connections, monkeypatch):
+        # Frozen clock: no refill while the loop walks 10k sockets
+        monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(time=lambda: 1_000.0))
+        registry = registry_module.ConnectionRegistry()
+        sockets = _register(registry, connections)
+        limiter = rate_limiter.WebSocketRateLimiter(
+            MAX_MESSAGES, WINDOW_SECONDS, max_tracked=connections, registry=registry
+        )
+
+        # Round-robin under the limit: nothing is rejected
+        for _ in range(ROUNDS):
+            assert all(_decide_without_suspending(limiter, ws) for ws in sockets)
+        # One socket bursts past its limit; the others are unaffected
+        noisy = sockets[0]
+        burst = [
+            _decide_without_suspending(limiter, noisy)
+            for _ in range(MAX_MESSAGES)
+        ]
+
+        assert burst.count(True) == MAX_MESSAGES - ROUNDS
+        stats = limiter.get_stats()
+        assert stats["total_rejected"] == ROUNDS
+        assert stats["total_allowed"] == ROUNDS * connections + MAX_MESSAGES - ROUNDS
+        assert _decide_without_suspending(limiter, sockets[-1]) is True
+
+
+@pytest.mark.slow
+class TestRateLimiterThroughput:
+    """PERF-RATELIMIT-01: messages/sec at 1k and 10k connections."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("connections", [1_000, 10_000])
+    async def test_gcra_throughput_vs_sliding_window(self, connections):
+        registry = registry_module.ConnectionRegistry()
+        sockets = _register(registry, connections)
+        gcra = rate_limiter.WebSocketRateLimiter(
+            MAX_MESSAGES, WINDOW_SECONDS, max_tracked=connections, registry=registry
+        )
+        legacy = LegacySlidingWindowLimiter(MAX_MESSAGES, WINDOW_SECONDS)
+
+        legacy_rate = await _messages_per_second(legacy, sockets)
+        gcra_rate = await _messages_per_second(gcra, sockets)
+
+        assert gcra.get_stats()["total_rejected"] == 0
+        assert gcra_rate > legacy_rate
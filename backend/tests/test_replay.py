@@ -0,0 +1,139 @@
+"""
+Tests for last-event-id replay - PERF-REPLAY-01.
+
+Tests verify:
+- A held outbox sends replayed frames before the live frames queued meanwhile
+- Live copies of replayed stream events are dropped
+- Missed events are read after last_event_id, and a trimmed or too long
+  gap is reported as incomplete
+- Only events the client would have received count towards the cap
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from ws_gateway.core.connection import outbox as outbox_module
+from ws_gateway.components.broadcast import frame as frame_module
+from ws_gateway.core.subscriber import replay as replay_module
+
+
+class FakeWebSocket:
+    """Hashable stand-in for a connected WebSocket."""
+
+
+class FakeStreamRedis:
+    """XRANGE over an in-memory list of (id, fields) entries."""
+
+    def __init__(self, ids: list[str], branch_ids: list[int] | None = None):
+        branch_ids = branch_ids or [1] * len(ids)
+        self.entries = [
+            (stream_id, {"data": json.dumps({"type": "ROUND_READY", "branch_id": branch_id})})
+            for stream_id, branch_id in zip(ids, branch_ids)
+        ]
+        self.calls = 0
+
+    async def xrange(self, name, min="-", max="+", count=None):
+        self.calls += 1
+        exclusive = min.startswith("(")
+        start = tuple(map(int, min.lstrip("(").split("-")))
+        found = [
+            e for e in self.entries
+            if (position := tuple(map(int, e[0].split("-")))) > start
+            or (position == start and not exclusive)
+        ]
+        return found[:count]
+
+
+def _stream_id(offset_ms: int, seq: int = 0) -> str:
+    return f"{int(time.time() * 1000) - offset_ms}-{seq}"
+
+
+class TestHeldOutbox:
+    """PERF-REPLAY-01: replay goes first, duplicates are dropped."""
+
+    @pytest.mark.asyncio
+    async def test_replay_is_sent_before_held_live_frames(self):
+        sent: list[str] = []
+
+        async def send(ws, frame):
+            sent.append(frame.text)
+            return True
+
+        async def mark_dead(ws):
+            pass
+
+        def frame(text: str, stream_id: str | None = None):
+            return frame_module.EncodedFrame(
+                text=text, stream_position=frame_module.parse_stream_id(stream_id)
+            )
+
+        queues = outbox_module.OutboundQueues(send, mark_dead, MagicMock())
+        queues.start()
+        ws = FakeWebSocket()
+
+        assert queues.hold(ws)
+        queues.enqueue(ws, frame("live-2", "100-2"))
+        queues.enqueue(ws, frame("live-3", "100-3"))
+        queues.enqueue(ws, frame("table"))
+        await asyncio.sleep(0.01)
+        assert sent == []
+
+        assert queues.resume(ws, [frame("replay-1", "100-1"), frame("replay-2", "100-2")])
+        # Stream consumer catching up on an event already replayed
+        queues.enqueue(ws, frame("late-2", "100-2"))
+        await asyncio.sleep(0.01)
+
+        assert sent == ["replay-1", "replay-2", "live-3", "table"]
+        await queues.stop(timeout=0.1)
+
+
+class TestReadMissedEvents:
+    """PERF-REPLAY-01: bounded XRANGE after last_event_id."""
+
+    @pytest.mark.asyncio
+    async def test_reads_events_after_last_event_id(self):
+        ids = [_stream_id(3000), _stream_id(2000), _stream_id(1000)]
+
+        replay = await replay_module.read_missed_events(ids[0], FakeStreamRedis(ids))
+
+        assert replay.complete
+        assert [event["stream_id"] for event in replay.events] == ids[1:]
+
+    @pytest.mark.asyncio
+    async def test_gap_that_cannot_be_replayed_is_incomplete(self):
+        ids = [_stream_id(3000), _stream_id(2000), _stream_id(1000)]
+        redis = FakeStreamRedis(ids)
+
+        trimmed = await replay_module.read_missed_events(_stream_id(4000), redis)
+        too_many = await replay_module.read_missed_events(ids[0], redis, max_events=1)
+        too_old = await replay_module.read_missed_events(_stream_id(600_000), redis)
+
+        assert (trimmed.complete, trimmed.reason) == (False, "trimmed")
+        assert (too_many.complete, too_many.reason) == (False, "too_many")
+        assert (too_old.complete, too_old.reason) == (False, "too_old")
+
+    @pytest.mark.asyncio
+    async def test_cap_counts_only_accepted_events_across_pages(self):
+        # Other branches' traffic fills the stream between two of ours
+        ids = [_stream_id(5000, seq) for seq in range(12)]
+        branch_ids = [1, 2, 2, 2, 1, 2, 2, 2, 2, 2, 1, 2]
+        redis = FakeStreamRedis(ids, branch_ids)
+
+        replay = await replay_module.read_missed_events(
+            ids[0],
+            redis,
+            accept=lambda event: event["branch_id"] == 1,
+            max_events=2,
+            page_size=4,
+        )
+
+        assert replay.complete
+        assert [event["stream_id"] for event in replay.events] == [ids[4], ids[10]]
+        # Resume after everything read, not after the last matching event
+        assert replay.last_event_id == ids[-1]
+        assert replay.scanned == 11
+        assert redis.calls == 4
@@ -0,0 +1,71 @@
+"""
+Tests for the gateway sector repository - PERF-SECTORS-01.
+
+Tests verify:
+- Concurrent cache misses are served by one batched query per tenant
+- Concurrent lookups of the same waiter share one result
+- A lookup running when its waiter is invalidated is not cached
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from ws_gateway.components.data import sector_repository
+
+
+@pytest.fixture
+def repository():
+    """Repository whose batch query reads from an in-memory table."""
+
+    class InMemoryRepository(sector_repository.SectorAssignmentRepository):
+        def __init__(self, assignments: dict[int, list[int]]):
+            super().__init__(batch_window=0.01)
+            self.assignments = assignments
+            self.queries: list[tuple[tuple[int, ...], int]] = []
+            self.release = threading.Event()
+            self.release.set()
+
+        def _get_sectors_batch_sync(self, user_ids, tenant_id):
+            self.queries.append((tuple(user_ids), tenant_id))
+            self.release.wait(timeout=1.0)
+            return {
+                user_id: self.assignments[user_id]
+                for user_id in user_ids
+                if self.assignments.get(user_id)
+            }
+
+    return InMemoryRepository({1: [3, 4], 2: [5]})
+
+
+class TestSectorLookupBatching:
+    """PERF-SECTORS-01: one query for all waiting lookups."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_query(self, repository):
+        results = await asyncio.gather(
+            *(repository.get_waiter_sectors(user_id, 7) for user_id in (1, 2, 3, 1))
+        )
+
+        assert results == [[3, 4], [5], [], [3, 4]]
+        assert repository.queries == [((1, 2, 3), 7)]
+
+        # Served from cache afterwards
+        assert await repository.get_waiter_sectors(2, 7) == [5]
+        assert len(repository.queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_query_is_not_overwritten(self, repository):
+        repository.release.clear()
+        lookup = asyncio.create_task(repository.get_waiter_sectors(1, 7))
+        await asyncio.sleep(0.05)  # Batch query is running
+
+        repository.invalidate_cache(1, 7)
+        repository.release.set()
+        assert await lookup == [3, 4]
+
+        # The outdated result was not cached: the new assignment is queried
+        repository.assignments[1] = [9]
+        assert await repository.get_waiters_sectors([1, 2], 7) == {1: [9], 2: [5]}
+        assert repository.queries[-1] == ((1, 2), 7)
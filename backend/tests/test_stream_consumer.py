@@ -0,0 +1,97 @@
+"""
+Tests for the multi-instance stream consumer - SCALE-MULTI-01.
+
+Tests verify:
+- Multi-instance mode requires an explicit instance ID
+- Startup destroys only idle groups of other replicas
+"""
+
+import pytest
+
+from shared.config.settings import settings
+from ws_gateway.core.subscriber import stream_consumer
+
+
+class FakeStreamRedis:
+    """XINFO / XGROUP subset of the async Redis client."""
+
+    def __init__(self, groups: dict[str, list[int]]):
+        # group name -> idle ms of each consumer
+        self.groups = groups
+        self.destroyed: list[str] = []
+
+    async def xinfo_groups(self, name):
+        return [
+            {"name": group, "consumers": len(idle), "pending": 0}
+            for group, idle in self.groups.items()
+        ]
+
+    async def xinfo_consumers(self, name, groupname):
+        return [
+            {"name": f"c{i}", "pending": 0, "idle": idle}
+            for i, idle in enumerate(self.groups[groupname])
+        ]
+
+    async def xgroup_destroy(self, name, groupname):
+        self.destroyed.append(groupname)
+        del self.groups[groupname]
+        return 1
+
+
+class TestConsumerIdentity:
+    """Per-instance groups need a name that survives restarts."""
+
+    def test_multi_instance_requires_instance_id(self, monkeypatch):
+        monkeypatch.setattr(settings, "ws_gateway_multi_instance", True)
+        monkeypatch.setattr(settings, "ws_gateway_instance_id", " ")
+
+        with pytest.raises(ValueError, match="WS_GATEWAY_INSTANCE_ID"):
+            stream_consumer.get_consumer_identity()
+
+        monkeypatch.setattr(settings, "ws_gateway_instance_id", "gw-1")
+        identity = stream_consumer.get_consumer_identity()
+        assert identity.group.endswith(":gw-1")
+        assert identity.consumer == "gateway-gw-1"
+
+    def test_single_instance_keeps_shared_group(self, monkeypatch):
+        monkeypatch.setattr(settings, "ws_gateway_multi_instance", False)
+        monkeypatch.setattr(settings, "ws_gateway_instance_id", "")
+
+        identity = stream_consumer.get_consumer_identity()
+
+        assert identity.consumer == stream_consumer.CONSUMER_NAME
+
+
+class TestOrphanGroups:
+    """Groups of replicas that are gone are destroyed at startup."""
+
+    @pytest.mark.asyncio
+    async def test_only_idle_groups_of_other_replicas_are_destroyed(self):
+        prefix = stream_consumer.CONSUMER_GROUP_WS_GATEWAY
+        idle = stream_consumer.ORPHAN_GROUP_IDLE_MS
+        redis = FakeStreamRedis({
+            prefix: [idle * 2],  # shared single-instance group
+            f"{prefix}:gw-1": [idle * 2],  # this replica, restarted after a long outage
+            f"{prefix}:gw-2": [1000],  # live replica
+            f"{prefix}:gw-3": [idle * 2, 500],  # one consumer still active
+            f"{prefix}:old-pod": [idle + 1, idle * 3],  # gone
+            f"{prefix}:new-pod": [],  # created, not read yet
+        })
+        identity = stream_consumer.ConsumerIdentity(
+            group=f"{prefix}:gw-1", consumer="gateway-gw-1"
+        )
+
+        destroyed = await stream_consumer._destroy_orphan_groups(redis, identity)
+
+        assert destroyed == 1
+        assert redis.destroyed == [f"{prefix}:old-pod"]
+
+    @pytest.mark.asyncio
+    async def test_errors_do_not_stop_startup(self):
+        class BrokenRedis:
+            async def xinfo_groups(self, name):
+                raise ConnectionError("redis down")
+
+        identity = stream_consumer.ConsumerIdentity(group="g", consumer="c")
+
+        assert await stream_consumer._destroy_orphan_groups(BrokenRedis(), identity) == 0
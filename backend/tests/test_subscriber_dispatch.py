@@ -0,0 +1,528 @@
+"""
+Tests for Redis subscriber dispatch - PERF-PUBSUB-01 / PERF-DISPATCH-01.
+
+Compares publish-to-deliver latency of:
+- Legacy loop: poll get_message(timeout), drain the queue with the shipped
+  handle_incoming_message/process_event_batch only when a poll returns
+  None, sleep 10 ms when idle
+- run_subscriber: the shipped reader feeding EventLanes, with the keyed
+  dispatcher or dispatch_events (REDIS_DISPATCH_CONCURRENCY = 1)
+
+Both run against the same simulated pub/sub source. The default run
+checks delivery by counting polls: under steady traffic the source never
+returns an empty poll, which the legacy loop waits for and run_subscriber
+does not. The wall-clock latency comparison is a slow benchmark.
+
+Also covers KeyedDispatcher: concurrency across sessions/branches with
+strict ordering inside each, CartEventCoalescer (PERF-CART-01) and the
+priority lanes of EventLanes (PERF-LANES-01).
+
+Run the benchmark with: pytest tests/test_subscriber_dispatch.py -m slow
+"""
+
+import asyncio
+import itertools
+import json
+import statistics
+import time
+from collections import deque
+
+import pytest
+
+from ws_gateway import redis_subscriber
+from ws_gateway.core.subscriber import keyed_dispatcher
+from ws_gateway.core.subscriber import cart_coalescer
+from ws_gateway.core.subscriber import lanes as lanes_module
+from ws_gateway.core.subscriber.drop_tracker import EventDropRateTracker
+from ws_gateway.core.subscriber.processor import (
+    handle_incoming_message,
+    process_event_batch,
+)
+
+
+# Steady traffic: one message every 2 ms for 0.6 s
+PUBLISH_INTERVAL = 0.002
+PUBLISH_COUNT = 300
+POLL_TIMEOUT = 0.2
+BATCH_SIZE = 50
+
+
+class SimulatedPubSub:
+    """In-memory stand-in for redis.asyncio PubSub."""
+
+    def __init__(self):
+        self._messages: asyncio.Queue = asyncio.Queue()
+        self.subscribed = False
+        self.get_message_calls = 0
+        self.empty_polls = 0
+        self._stream = None
+
+    def publish(self, payload: dict) -> None:
+        self._messages.put_nowait({
+            "type": "pmessage",
+            "channel": f"branch:{payload['branch_id']}:waiters",
+            "data": json.dumps(payload),
+        })
+
+    def stream(self, events) -> None:
+        """Keep one message pending from ``events``: no poll comes back empty."""
+        self._stream = iter(events)
+        self._publish_next()
+
+    def end_stream(self) -> None:
+        self._stream = None
+
+    def _publish_next(self) -> None:
+        if self._stream is not None:
+            event = next(self._stream, None)
+            if event is not None:
+                self.publish(event)
+
+    async def psubscribe(self, *patterns):
+        self.subscribed = True
+
+    async def punsubscribe(self, *patterns):
+        self.subscribed = False
+
+    async def get_message(self, ignore_subscribe_messages: bool = False, timeout: float = 0.0):
+        self.get_message_calls += 1
+        try:
+            msg = await asyncio.wait_for(self._messages.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.empty_polls += 1
+            return None
+        self._publish_next()
+        # A socket read yields to the loop even when data is buffered
+        await asyncio.sleep(0)
+        return msg
+
+
+class SimulatedRedisPool:
+    def __init__(self, pubsub: SimulatedPubSub):
+        self._pubsub = pubsub
+
+    def pubsub(self):
+        return self._pubsub
+
+
+def _event(seq: int, sessions: int = 10) -> dict:
+    return {
+        "type": "ROUND_READY",
+        "tenant_id": 1,
+        "branch_id": 1,
+        "session_id": seq % sessions + 1,
+        "seq": seq,
+        "published_at": time.perf_counter(),
+    }
+
+
+async def _publish_steady(pubsub: SimulatedPubSub) -> None:
+    for seq in range(PUBLISH_COUNT):
+        pubsub.publish(_event(seq))
+        await asyncio.sleep(PUBLISH_INTERVAL)
+
+
+async def _legacy_loop(pubsub, on_message) -> None:
+    """The pre-PERF-PUBSUB-01 run_subscriber loop, on the shipped helpers."""
+    event_queue: deque = deque(maxlen=10_000)
+    events_dropped = {"count": 0}
+    drop_tracker = EventDropRateTracker()
+    while True:
+        msg = await pubsub.get_message(ignore_subscribe_messages=True, timeout=POLL_TIMEOUT)
+        if msg is None:
+            # Process queued events during idle time only
+            if event_queue:
+                await process_event_batch(
+                    event_queue, on_message, drop_tracker, batch_size=BATCH_SIZE
+                )
+            else:
+                await asyncio.sleep(0.01)
+            continue
+        handle_incoming_message(msg, event_queue, events_dropped, drop_tracker)
+
+
+@pytest.fixture
+def subscriber(monkeypatch):
+    """Start the shipped run_subscriber against a SimulatedPubSub."""
+    pubsub = SimulatedPubSub()
+
+    async def get_redis_pool():
+        return SimulatedRedisPool(pubsub)
+
+    monkeypatch.setattr(redis_subscriber, "get_redis_pool", get_redis_pool)
+
+    def start(on_message, concurrency: int = 8) -> asyncio.Task:
+        monkeypatch.setattr(redis_subscriber, "DISPATCH_CONCURRENCY", concurrency)
+        return asyncio.create_task(
+            redis_subscriber.run_subscriber(["branch:*"], on_message)
+        )
+
+    start.pubsub = pubsub
+    return start
+
+
+async def _stop(task: asyncio.Task) -> None:
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def _wait_until(predicate, timeout: float = 2.0) -> None:
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+async def _measure(pubsub: SimulatedPubSub, start) -> list[float]:
+    """Run a consumer against steady traffic, return per-event latency (ms)."""
+    latencies: list[float] = []
+
+    async def on_message(event: dict) -> None:
+        latencies.append((time.perf_counter() - event["published_at"]) * 1000)
+
+    task = start(on_message)
+    await _publish_steady(pubsub)
+
+    # Let the consumer deliver what is left
+    deadline = time.perf_counter() + 2.0
+    while len(latencies) < PUBLISH_COUNT and time.perf_counter() < deadline:
+        await asyncio.sleep(0.01)
+    await _stop(task)
+    return latencies
+
+
+def _p95(values: list[float]) -> float:
+    return statistics.quantiles(values, n=20)[-1]
+
+
+class TestRunSubscriberDispatch:
+    """PERF-PUBSUB-01: the shipped reader/dispatcher pipeline."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [1, 8])
+    async def test_delivers_every_event_once_in_order(self, subscriber, concurrency):
+        delivered: list[int] = []
+
+        async def on_message(event: dict) -> None:
+            delivered.append(event["seq"])
+
+        task = subscriber(on_message, concurrency)
+        for seq in range(100):
+            subscriber.pubsub.publish(_event(seq, sessions=1))
+        await asyncio.sleep(0.1)
+        await _stop(task)
+
+        assert delivered == list(range(100))
+
+    @pytest.mark.asyncio
+    async def test_idle_subscriber_does_no_busy_work(self, subscriber):
+        delivered: list[int] = []
+
+        async def on_message(event: dict) -> None:
+            delivered.append(event["seq"])
+
+        task = subscriber(on_message)
+        subscriber.pubsub.publish(_event(0))
+        await asyncio.sleep(0.05)
+        assert delivered == [0]
+
+        # Reader blocks in get_message, dispatcher waits on the lanes
+        calls = subscriber.pubsub.get_message_calls
+        await asyncio.sleep(0.3)
+        idle_calls = subscriber.pubsub.get_message_calls - calls
+        await _stop(task)
+
+        assert idle_calls == 0
+        assert delivered == [0]
+
+
+class TestSteadyTraffic:
+    """PERF-PUBSUB-01: delivery does not wait for a gap in the traffic."""
+
+    EVENTS = 100
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [1, 8])
+    async def test_events_are_dispatched_without_an_empty_poll(self, subscriber, concurrency):
+        pubsub = subscriber.pubsub
+        # Polls made when each event was delivered
+        polls_at_delivery: list[int] = []
+
+        async def on_message(event: dict) -> None:
+            polls_at_delivery.append(pubsub.get_message_calls)
+
+        pubsub.stream(_event(seq) for seq in itertools.count())
+        task = subscriber(on_message, concurrency)
+        await _wait_until(lambda: len(polls_at_delivery) >= self.EVENTS)
+        await _stop(task)
+
+        assert pubsub.empty_polls == 0
+        # Delivered while the reader was still on the first messages
+        assert polls_at_delivery[0] < self.EVENTS
+
+    @pytest.mark.asyncio
+    async def test_legacy_loop_holds_events_until_an_empty_poll(self):
+        pubsub = SimulatedPubSub()
+        delivered: list[int] = []
+
+        async def on_message(event: dict) -> None:
+            delivered.append(event["seq"])
+
+        pubsub.stream(_event(seq) for seq in itertools.count())
+        task = asyncio.create_task(_legacy_loop(pubsub, on_message))
+        await _wait_until(lambda: pubsub.get_message_calls >= self.EVENTS)
+        assert delivered == []
+
+        # Traffic pauses: the first empty poll releases a batch
+        pubsub.end_stream()
+        await _wait_until(lambda: len(delivered) >= BATCH_SIZE)
+        await _stop(task)
+
+        assert pubsub.empty_polls >= 1
+        assert delivered[:BATCH_SIZE] == list(range(BATCH_SIZE))
+
+
+@pytest.mark.slow
+class TestSubscriberDispatchLatency:
+    """PERF-PUBSUB-01: publish-to-deliver latency benchmark."""
+
+    @pytest.mark.asyncio
+    async def test_run_subscriber_lowers_latency_under_steady_traffic(self, subscriber):
+        legacy_pubsub = SimulatedPubSub()
+        legacy = await _measure(
+            legacy_pubsub,
+            lambda on_message: asyncio.create_task(_legacy_loop(legacy_pubsub, on_message)),
+        )
+        pushed = await _measure(subscriber.pubsub, subscriber)
+
+        assert len(pushed) == PUBLISH_COUNT
+        assert _p95(pushed) < _p95(legacy)
+
+
+class TestKeyedDispatcher:
+    """PERF-DISPATCH-01: concurrent dispatch with per-key ordering."""
+
+    @pytest.fixture
+    def drop_tracker(self):
+        return EventDropRateTracker()
+
+    def test_ordering_key_prefers_session_then_branch(self):
+        assert keyed_dispatcher.ordering_key({"session_id": 7, "branch_id": 1}) == ("session", 7)
+        assert keyed_dispatcher.ordering_key({"branch_id": 1}) == ("branch", 1)
+        assert keyed_dispatcher.ordering_key({"tenant_id": 3}) == ("tenant", 3)
+
+    @pytest.mark.asyncio
+    async def test_slow_branch_does_not_block_others_and_order_is_kept(
+        self, drop_tracker
+    ):
+        delivered: list[tuple[int, str]] = []
+
+        async def on_message(event: dict) -> None:
+            if event["branch_id"] == 1:
+                await asyncio.sleep(0.1)
+            delivered.append((event["session_id"], event["type"]))
+
+        dispatcher = keyed_dispatcher.KeyedDispatcher(
+            on_message, drop_tracker, max_concurrency=4, callback_timeout=1.0
+        )
+        event_queue: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(dispatcher.run(event_queue))
+
+        for session_id, branch_id in [(1, 1), (2, 2)]:
+            for event_type in ("ROUND_SUBMITTED", "ROUND_IN_KITCHEN"):
+                event_queue.put_nowait({
+                    "type": event_type,
+                    "tenant_id": 1,
+                    "branch_id": branch_id,
+                    "session_id": session_id,
+                })
+
+        await asyncio.sleep(0.05)
+        # Fast session delivered while the slow one is still in flight
+        assert delivered == [(2, "ROUND_SUBMITTED"), (2, "ROUND_IN_KITCHEN")]
+        assert dispatcher.get_stats()["key_depths"] == {"session:1": 1}
+
+        await asyncio.sleep(0.25)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        session_1 = [t for s, t in delivered if s == 1]
+        assert session_1 == ["ROUND_SUBMITTED", "ROUND_IN_KITCHEN"]
+        assert dispatcher.get_stats()["pending_events"] == 0
+
+    @pytest.mark.asyncio
+    async def test_timed_out_event_is_retried_before_later_events(self, drop_tracker):
+        delivered: list[str] = []
+        stalled = {"done": False}
+
+        async def on_message(event: dict) -> None:
+            if event["type"] == "A" and not stalled["done"]:
+                stalled["done"] = True
+                await asyncio.sleep(1.0)
+            delivered.append(event["type"])
+
+        dispatcher = keyed_dispatcher.KeyedDispatcher(
+            on_message, drop_tracker, max_concurrency=2, max_pending=2,
+            callback_timeout=0.05,
+        )
+        event_queue: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(dispatcher.run(event_queue))
+        for event_type in "ABCD":
+            event_queue.put_nowait({"type": event_type, "tenant_id": 1, "session_id": 9})
+
+        await asyncio.sleep(0.3)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert delivered == ["A", "B", "C", "D"]
+
+
+def _cart_event(event_type: str, item_id: int, quantity: int, cart_version: int) -> dict:
+    return {
+        "type": event_type,
+        "tenant_id": 1,
+        "branch_id": 1,
+        "session_id": 9,
+        "entity": {"item_id": item_id, "quantity": quantity, "cart_version": cart_version},
+    }
+
+
+class TestCartEventCoalescer:
+    """PERF-CART-01: per-session CART_SYNC deltas."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_merged_into_one_delta(self):
+        delivered: list[dict] = []
+
+        async def deliver(event: dict) -> None:
+            delivered.append(event)
+
+        coalescer = cart_coalescer.CartEventCoalescer(deliver, window_seconds=0.02)
+        await coalescer.submit(_cart_event("CART_ITEM_ADDED", 1, 1, 1))
+        await coalescer.submit(_cart_event("CART_ITEM_UPDATED", 1, 3, 2))
+        await coalescer.submit(_cart_event("CART_ITEM_ADDED", 2, 1, 3))
+        await coalescer.submit(_cart_event("CART_ITEM_REMOVED", 2, 0, 4))
+        assert delivered == []
+
+        await asyncio.sleep(0.05)
+
+        (sync,) = delivered
+        assert sync["type"] == "CART_SYNC"
+        assert sync["entity"]["cart_version"] == 4
+        assert sync["entity"]["items"] == [{"item_id": 1, "quantity": 3, "cart_version": 2}]
+        assert sync["entity"]["removed_item_ids"] == [2]
+        assert coalescer.get_stats()["events_merged"] == 4
+
+    @pytest.mark.asyncio
+    async def test_other_session_event_flushes_cart_first_and_is_not_delayed(self):
+        delivered: list[str] = []
+
+        async def deliver(event: dict) -> None:
+            delivered.append(event["type"])
+
+        coalescer = cart_coalescer.CartEventCoalescer(deliver, window_seconds=10.0)
+        await coalescer.submit(_cart_event("CART_ITEM_ADDED", 1, 1, 1))
+        await coalescer.submit(
+            {"type": "ROUND_SUBMITTED", "tenant_id": 1, "branch_id": 1, "session_id": 9}
+        )
+
+        # Lone cart event delivered unchanged, ahead of the round
+        assert delivered == ["CART_ITEM_ADDED", "ROUND_SUBMITTED"]
+        assert coalescer.get_stats()["pending_sessions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_window_closing_during_slow_delivery_is_not_lost(self):
+        delivered: list[int] = []
+        release = asyncio.Event()
+
+        async def deliver(event: dict) -> None:
+            if not delivered:
+                await release.wait()
+            delivered.append(event["entity"]["item_id"])
+
+        coalescer = cart_coalescer.CartEventCoalescer(deliver, window_seconds=0.01)
+        await coalescer.submit(_cart_event("CART_ITEM_ADDED", 1, 1, 1))
+        await asyncio.sleep(0.03)
+        # First window is blocked in deliver; the second one closes meanwhile
+        await coalescer.submit(_cart_event("CART_ITEM_ADDED", 2, 1, 2))
+        await asyncio.sleep(0.03)
+        assert delivered == []
+
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert delivered == [1, 2]
+        assert coalescer.get_stats()["pending_sessions"] == 0
+
+
+class TestEventLanes:
+    """PERF-LANES-01: weighted dispatch, low-priority lanes dropped first."""
+
+    def test_overflow_drops_bulk_first_and_never_displaces_critical(self):
+        lanes = lanes_module.EventLanes(maxsize=4, capacity_shares=(1.0, 1.0, 0.5))
+        assert lanes.put_nowait({"type": "CART_ITEM_ADDED", "seq": 1}) is None
+        assert lanes.put_nowait({"type": "CART_ITEM_ADDED", "seq": 2}) is None
+        # Bulk lane at its own capacity rotates its oldest event
+        assert lanes.put_nowait({"type": "ENTITY_UPDATED", "seq": 3})["seq"] == 1
+        assert lanes.put_nowait({"type": "PAYMENT_APPROVED", "seq": 4}) is None
+        assert lanes.put_nowait({"type": "CHECK_PAID", "seq": 5}) is None
+
+        # Queue full: bulk goes first, then a normal event can't push out critical ones
+        assert lanes.put_nowait({"type": "ROUND_READY", "seq": 6})["seq"] == 2
+        assert lanes.put_nowait({"type": "ROUND_SERVED", "seq": 7})["seq"] == 3
+        table = {"type": "TABLE_CLEARED", "seq": 8}
+        assert lanes.put_nowait(table) is table
+
+        assert lanes.qsize() == 4
+        stats = lanes.get_stats()["lanes"]
+        assert (stats["bulk"]["dropped"], stats["normal"]["dropped"]) == (3, 1)
+        assert stats["critical"]["dropped"] == 0
+
+    def test_lanes_are_served_by_weight_and_fifo_within_a_lane(self):
+        lanes = lanes_module.EventLanes(maxsize=100, weights=(3, 1, 1))
+        # One session per table, so lanes are free to reorder across them
+        for seq in range(4):
+            lanes.put_nowait({"type": "CART_ITEM_UPDATED", "seq": seq, "session_id": 100 + seq})
+        for seq in range(4):
+            lanes.put_nowait({"type": "ROUND_READY", "seq": seq, "session_id": 200 + seq})
+
+        order = [lanes.get_nowait() for _ in range(8)]
+
+        assert [e["type"][:4] for e in order[:4]] == ["ROUN", "ROUN", "CART", "ROUN"]
+        rounds = [e["seq"] for e in order if e["type"] == "ROUND_READY"]
+        carts = [e["seq"] for e in order if e["type"] == "CART_ITEM_UPDATED"]
+        assert rounds == carts == [0, 1, 2, 3]
+        with pytest.raises(asyncio.QueueEmpty):
+            lanes.get_nowait()
+
+    def test_events_of_one_session_keep_arrival_order_across_lanes(self):
+        lanes = lanes_module.EventLanes(maxsize=100, weights=(8, 3, 1))
+        session = [
+            {"type": "TABLE_SESSION_STARTED", "session_id": 9},
+            {"type": "CART_ITEM_ADDED", "session_id": 9},
+            {"type": "ROUND_SUBMITTED", "session_id": 9},
+        ]
+        for event in session:
+            lanes.put_nowait(event)
+        other = {"type": "ROUND_READY", "session_id": 5}
+        lanes.put_nowait(other)
+
+        order = [lanes.get_nowait()["type"] for _ in range(4)]
+
+        # The other table's round may go first, never this session's round
+        assert [t for t in order if t != "ROUND_READY"] == [e["type"] for e in session]
+        assert order.index("ROUND_READY") < order.index("ROUND_SUBMITTED")
+        assert lanes.get_stats()["lanes"]["critical"]["depth"] == 0
+
+    def test_evicting_a_session_head_keeps_the_rest_in_order(self):
+        lanes = lanes_module.EventLanes(maxsize=3, capacity_shares=(1.0, 1.0, 1.0))
+        lanes.put_nowait({"type": "CART_ITEM_ADDED", "session_id": 9, "seq": 1})
+        lanes.put_nowait({"type": "ROUND_SUBMITTED", "session_id": 9, "seq": 2})
+        lanes.put_nowait({"type": "CHECK_REQUESTED", "session_id": 9, "seq": 3})
+
+        # Full: the bulk head of the session is evicted
+        assert lanes.put_nowait({"type": "CHECK_PAID", "session_id": 9, "seq": 4})["seq"] == 1
+
+        assert [lanes.get_nowait()["seq"] for _ in range(3)] == [2, 3, 4]
+        assert lanes.empty()
@@ -0,0 +1,197 @@
+"""
+Tests for the two-tier cache - PERF-CACHE-01.
+
+Tests verify:
+- Concurrent misses share a single load and local hits skip Redis
+- Invalidation drops the local tier, publishes to other workers and a load
+  racing an invalidation is not cached
+- A load racing an invalidation on another worker is not written back to
+  Redis, even before the invalidation message arrives (generation check)
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from shared.infrastructure.cache import two_tier
+
+
+class FakeAsyncRedis:
+    """In-memory subset of the async Redis client."""
+
+    def __init__(self):
+        self.data = {}
+        self.published = []
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, px=None, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    async def expire(self, key, seconds):
+        return key in self.data
+
+    async def eval(self, script, numkeys, *args):
+        # Only _SET_IF_GENERATION_LUA is evaluated by the cache
+        assert script == two_tier._SET_IF_GENERATION_LUA and numkeys == 2
+        key, generation_key, envelope, ttl, generation = args
+        if self.data.get(generation_key, "") != generation:
+            return 0
+        self.data[key] = envelope
+        return 1
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 1
+
+    def pipeline(self, transaction=True):
+        return FakeAsyncPipeline(self)
+
+
+class FakeAsyncPipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((getattr(self._redis, name), args, kwargs))
+        return queue
+
+    async def execute(self):
+        return [await call(*args, **kwargs) for call, args, kwargs in self._calls]
+
+
+class TestTwoTierCache:
+    """PERF-CACHE-01: in-process LRU in front of Redis."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once_and_local_hits_skip_redis(self):
+        redis = FakeAsyncRedis()
+
+        async def factory():
+            return redis
+
+        cache = two_tier.TwoTierCache(
+            "test_single_flight", ttl=60, early_refresh_beta=0, redis_factory=factory
+        )
+        loads = 0
+
+        async def loader():
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(0.01)
+            return {"products": [1, 2, 3]}
+
+        results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(20)))
+        assert loads == 1
+        assert all(result == {"products": [1, 2, 3]} for result in results)
+        assert json.loads(redis.data["k"])["v"] == {"products": [1, 2, 3]}
+        assert not any(key.startswith("cache:lock:") for key in redis.data)
+
+        gets = redis.gets
+        assert await cache.get_or_load("k", loader) == {"products": [1, 2, 3]}
+        assert redis.gets == gets
+        assert cache.get_stats()["hits_local"] == 1
+
+        # Another worker (empty local tier) is served from Redis
+        other = two_tier.TwoTierCache(
+            "test_single_flight_other", ttl=60, early_refresh_beta=0, redis_factory=factory
+        )
+        assert await other.get_or_load("k", loader) == {"products": [1, 2, 3]}
+        assert loads == 1 and other.get_stats()["hits_redis"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reaches_other_workers(self):
+        redis = FakeAsyncRedis()
+
+        async def factory():
+            return redis
+
+        cache = two_tier.TwoTierCache(
+            "test_invalidation", ttl=60, early_refresh_beta=0, redis_factory=factory
+        )
+        await cache.get_or_load("k", lambda: "v1")
+
+        assert await cache.invalidate("k")
+        assert "k" not in redis.data and cache.get_stats()["local_entries"] == 0
+        channel, message = redis.published[-1]
+        assert channel == "cache:invalidate"
+        assert json.loads(message) == {
+            "cache": "test_invalidation",
+            "keys": ["k"],
+            "origin": two_tier._INSTANCE_ID,
+        }
+
+        # A message from another worker drops the local copy only
+        await cache.get_or_load("k", lambda: "v2")
+        two_tier.handle_invalidation_message(
+            json.dumps({"cache": "test_invalidation", "keys": ["k"], "origin": "other"})
+        )
+        assert cache.get_stats()["local_entries"] == 0
+        assert "k" in redis.data
+
+        # A load that overlaps an invalidation is returned but not cached
+        release = asyncio.Event()
+
+        async def slow_loader():
+            await release.wait()
+            return "stale"
+
+        await cache.invalidate("k")
+        pending = asyncio.create_task(cache.get_or_load("k", slow_loader))
+        await asyncio.sleep(0)
+        await cache.invalidate("k")
+        release.set()
+        assert await pending == "stale"
+        assert "k" not in redis.data and cache.get_stats()["local_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_load_racing_another_workers_invalidation_is_not_written_back(self):
+        redis = FakeAsyncRedis()
+
+        async def factory():
+            return redis
+
+        worker_a = two_tier.TwoTierCache(
+            "test_generation_a", ttl=60, early_refresh_beta=0, redis_factory=factory
+        )
+        worker_b = two_tier.TwoTierCache(
+            "test_generation_b", ttl=60, early_refresh_beta=0, redis_factory=factory
+        )
+        loading = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_loader():
+            loading.set()
+            await release.wait()
+            return "stale"
+
+        pending = asyncio.create_task(worker_a.get_or_load("k", slow_loader))
+        await loading.wait()
+        # Worker B invalidates; its message has not reached worker A yet
+        assert await worker_b.invalidate("k")
+        release.set()
+
+        assert await pending == "stale"
+        assert "k" not in redis.data
+        assert worker_a.get_stats()["local_entries"] == 0
+
+        # The next load sees the new generation and is cached again
+        assert await worker_a.get_or_load("k", lambda: "fresh") == "fresh"
+        assert json.loads(redis.data["k"])["v"] == "fresh"
+        assert await worker_b.get_or_load("k", lambda: "unused") == "fresh"
@@ -0,0 +1,52 @@
+"""
+Tests for non-blocking gateway auth - PERF-AUTH-01.
+
+Tests verify:
+- Revocation lookups requested in the same loop tick share one batch
+- Identical tokens are looked up once; failed lookups fail closed
+"""
+
+import asyncio
+
+import pytest
+
+from ws_gateway.components.auth import revocation as revocation_module
+
+
+def claims(jti, user_id=1, iat=1_700_000_000):
+    return {"jti": jti, "sub": str(user_id), "iat": iat, "tenant_id": 1}
+
+
+class TestRevocationChecker:
+    """PERF-AUTH-01: per-tick batching of blacklist/revocation lookups."""
+
+    @pytest.mark.asyncio
+    async def test_lookups_in_same_tick_share_one_batch(self):
+        batches = []
+
+        async def check_batch(tokens):
+            batches.append(tokens)
+            return [jti != "revoked" for jti, _, _ in tokens]
+
+        checker = revocation_module.RevocationChecker(check_batch)
+        results = await asyncio.gather(
+            checker.is_valid(claims("a")),
+            checker.is_valid(claims("revoked", user_id=2)),
+            checker.is_valid(claims("a")),
+        )
+
+        assert results == [True, False, True]
+        assert len(batches) == 1
+        assert [jti for jti, _, _ in batches[0]] == ["a", "revoked"]
+
+        await checker.is_valid(claims("b"))
+        assert checker.get_stats() == {"batches": 2, "lookups": 3, "pending": 0}
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_fails_closed(self):
+        async def check_batch(tokens):
+            raise ConnectionError("redis down")
+
+        checker = revocation_module.RevocationChecker(check_batch)
+
+        assert await checker.is_valid(claims("a")) is False
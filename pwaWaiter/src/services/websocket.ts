@@ -1,12 +1,14 @@
 import { wsLogger } from '../utils/logger'
 import { API_CONFIG, WS_CONFIG } from '../utils/constants'
-import type { WSEvent, WSEventType } from '../types'
+import type { WSEvent, WSEventType, WSReplayDone } from '../types'
 
 type EventCallback = (event: WSEvent) => void
 type ConnectionStateCallback = (isConnected: boolean) => void
 type TokenRefreshCallback = () => Promise<string | null>
 // RES-MED-01 FIX: Callback type for max reconnect notification
 type MaxReconnectCallback = () => void
+// PERF-REPLAY-01: Callback when missed events could not be replayed
+type ResyncCallback = () => void
 
 class WebSocketService {
   private ws: WebSocket | null = null
@@ -28,6 +30,9 @@ class WebSocketService {
   private visibilityHandler: (() => void) | null = null
   // RES-MED-01 FIX: Callback when max reconnect attempts reached
   private onMaxReconnectReached: MaxReconnectCallback | null = null
+  // PERF-REPLAY-01: stream_id of the last critical event received, sent on reconnect
+  private lastEventId: string | null = null
+  private resyncListeners: Set<ResyncCallback> = new Set()
 
   constructor() {
     // WS-31-MED-02 FIX: Set up visibility change listener
@@ -98,7 +103,11 @@ class WebSocketService {
     this.parseTokenExpiration(token)
 
     this.connectionPromise = new Promise((resolve, reject) => {
-      const wsUrl = `${API_CONFIG.WS_URL}/ws/waiter?token=${token}`
+      // PERF-REPLAY-01: Ask the gateway to replay what we missed instead of refetching
+      const replayParam = this.lastEventId
+        ? `&last_event_id=${encodeURIComponent(this.lastEventId)}`
+        : ''
+      const wsUrl = `${API_CONFIG.WS_URL}/ws/waiter?token=${token}${replayParam}`
 
       wsLogger.info('Connecting to WebSocket', { url: API_CONFIG.WS_URL })
 
@@ -139,7 +148,12 @@ class WebSocketService {
               this.onMaxReconnectReached?.()
               return
             }
-            this.scheduleReconnect()
+            // PERF-ADMISSION-01: Wait at least the delay suggested by a busy gateway
+            const retryAfterMs =
+              event.code === WS_CONFIG.TRY_AGAIN_LATER_CLOSE_CODE
+                ? Number(/retry_after_ms=(\d+)/.exec(event.reason)?.[1] ?? 0)
+                : 0
+            this.scheduleReconnect(retryAfterMs)
           }
         }
       } catch (error) {
@@ -181,6 +195,7 @@ class WebSocketService {
     this.connectionPromise = null
     this.reconnectAttempts = 0
     this.lastPongReceived = 0
+    this.lastEventId = null
 
     wsLogger.info('Disconnected from WebSocket')
   }
@@ -193,6 +208,7 @@ class WebSocketService {
     this.cleanupVisibilityListener()
     this.listeners.clear()
     this.connectionStateListeners.clear()
+    this.resyncListeners.clear()
     wsLogger.info('WebSocket service destroyed')
   }
 
@@ -279,6 +295,19 @@ class WebSocketService {
     }
   }
 
+  /**
+   * PERF-REPLAY-01: Subscribe to resync requests
+   * Called when the gateway could not replay the events missed while
+   * disconnected; the state must be refetched over REST.
+   * Returns unsubscribe function
+   */
+  onResyncRequired(callback: ResyncCallback): () => void {
+    this.resyncListeners.add(callback)
+    return () => {
+      this.resyncListeners.delete(callback)
+    }
+  }
+
   /**
    * CLIENT-LOW-01 FIX: Subscribe to events with throttling
    * Prevents excessive re-renders during high-traffic periods (multiple rapid orders)
@@ -354,9 +383,20 @@ class WebSocketService {
         return // Don't propagate pong to listeners
       }
 
+      // PERF-REPLAY-01: End of the replay sent after reconnecting with last_event_id
+      if (data.type === 'REPLAY_DONE') {
+        this.handleReplayDone(data as WSReplayDone)
+        return
+      }
+
       const wsEvent = data as WSEvent
       wsLogger.debug('Received event', { type: wsEvent.type, table_id: wsEvent.table_id })
 
+      // PERF-REPLAY-01: Only critical-stream events carry a stream_id
+      if (wsEvent.stream_id) {
+        this.lastEventId = wsEvent.stream_id
+      }
+
       // Notify specific listeners
       this.listeners.get(wsEvent.type)?.forEach((cb) => cb(wsEvent))
 
@@ -367,6 +407,21 @@ class WebSocketService {
     }
   }
 
+  /**
+   * PERF-REPLAY-01: Remember where to resume and resync if the gap was not covered
+   */
+  private handleReplayDone(done: WSReplayDone): void {
+    this.lastEventId = done.last_event_id ?? this.lastEventId
+    wsLogger.info('Missed events replayed', {
+      replayed: done.replayed,
+      complete: done.complete,
+      reason: done.reason,
+    })
+    if (!done.complete) {
+      this.resyncListeners.forEach((cb) => cb())
+    }
+  }
+
   /**
    * WS-31-HIGH-01 FIX: Refactored to use sendPing() with timeout detection
    */
@@ -432,8 +487,9 @@ class WebSocketService {
   /**
    * WS-HIGH-02 FIX: Changed from linear to exponential backoff with jitter
    * Matches Dashboard/pwaMenu implementation for consistency
+   * PERF-ADMISSION-01: minDelay is the gateway's suggested retry delay
    */
-  private scheduleReconnect(): void {
+  private scheduleReconnect(minDelay = 0): void {
     if (this.reconnectAttempts >= WS_CONFIG.MAX_RECONNECT_ATTEMPTS) {
       wsLogger.warn('Max reconnect attempts reached')
       // RES-MED-01 FIX: Notify UI about connection failure
@@ -453,7 +509,7 @@ class WebSocketService {
       MAX_DELAY
     )
     const jitter = exponentialDelay * JITTER_FACTOR * Math.random()
-    const delay = Math.round(exponentialDelay + jitter)
+    const delay = Math.max(Math.round(exponentialDelay + jitter), minDelay)
 
     wsLogger.info(`Scheduling reconnect in ${delay}ms`, {
       attempt: this.reconnectAttempts,
@@ -537,9 +593,11 @@ class WebSocketService {
     try {
       const newToken = await this.tokenRefreshCallback()
       if (newToken && !this.isIntentionalClose) {
-        // Reconnect with new token
+        // Reconnect with new token, resuming from the same stream position
+        const lastEventId = this.lastEventId
         this.disconnect()
         this.isIntentionalClose = false
+        this.lastEventId = lastEventId
         await this.connect(newToken)
         wsLogger.info('WebSocket reconnected with refreshed token')
       }
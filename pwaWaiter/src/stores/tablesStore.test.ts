@@ -47,6 +47,7 @@ vi.mock('../services/websocket', () => ({
   wsService: {
     on: vi.fn().mockReturnValue(() => {}),
     onConnectionChange: vi.fn().mockReturnValue(() => {}),
+    onResyncRequired: vi.fn().mockReturnValue(() => {}),
   },
 }))
 
@@ -306,6 +307,7 @@ describe('tablesStore', () => {
 
       expect(wsService.onConnectionChange).toHaveBeenCalled()
       expect(wsService.on).toHaveBeenCalledWith('*', expect.any(Function))
+      expect(wsService.onResyncRequired).toHaveBeenCalledWith(expect.any(Function))
       expect(typeof unsubscribe).toBe('function')
     })
 
@@ -464,10 +464,17 @@ export const useTablesStore = create<TablesState>()((set, get) => ({
       notificationService.notifyEvent(event)
     })
 
+    // PERF-REPLAY-01: Missed events could not be replayed after reconnecting
+    const unsubscribeResync = wsService.onResyncRequired(() => {
+      storeLogger.info('Missed events not replayed, refetching tables')
+      get().fetchTables(branchId)
+    })
+
     storeLogger.info('Subscribed to WebSocket events')
 
     return () => {
       unsubscribeEvents()
+      unsubscribeResync()
       unsubscribeConnection()
       storeLogger.info('Unsubscribed from WebSocket events')
     }
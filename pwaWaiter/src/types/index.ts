@@ -239,6 +239,21 @@ export interface WSEvent {
   ts?: string
   /** ISO timestamp when event was created */
   timestamp?: string
+  /** PERF-REPLAY-01: events:critical position, sent back as last_event_id on reconnect */
+  stream_id?: string
+}
+
+/**
+ * PERF-REPLAY-01: Sent after the events missed while disconnected were replayed
+ * complete=false means the gap could not be covered: refetch over REST.
+ */
+export interface WSReplayDone {
+  type: 'REPLAY_DONE'
+  complete: boolean
+  replayed: number
+  /** Position to reconnect from next time */
+  last_event_id: string | null
+  reason?: string
 }
 
 // API response types
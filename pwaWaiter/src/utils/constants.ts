@@ -116,6 +116,8 @@ export const WS_CONFIG = {
   JITTER_FACTOR: 0.3, // Add up to 30% random jitter
   // SEC-MED-02 FIX: Close codes that should NOT trigger reconnection
   NON_RECOVERABLE_CLOSE_CODES: [4001, 4003, 4029] as readonly number[],
+  // PERF-ADMISSION-01: Gateway busy (reconnect storm); reason is "retry_after_ms=<ms>"
+  TRY_AGAIN_LATER_CLOSE_CODE: 4013,
 } as const
 
 // MED-08 FIX: WebSocket event type constants to avoid magic strings
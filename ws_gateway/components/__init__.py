@@ -27,6 +27,7 @@ from ws_gateway.components.core.constants import (
     MSG_PING_JSON,
     MSG_PONG_JSON,
     MSG_REFRESH_SECTORS,
+    MSG_REPLAY_DONE,
     DEFAULT_ALLOWED_ORIGINS,
     validate_websocket_origin,
 )
@@ -35,6 +36,7 @@ from ws_gateway.components.core.dependencies import (
     ConnectionManagerDependencies,
     get_lock_manager,
     get_metrics_collector,
+    get_connection_registry,
     get_heartbeat_tracker,
     get_rate_limiter,
     reset_singletons,
@@ -44,6 +46,10 @@ from ws_gateway.components.core.dependencies import (
 # Connection Management
 # =============================================================================
 from ws_gateway.components.connection.index import ConnectionIndex
+from ws_gateway.components.connection.registry import (
+    ConnectionRecord,
+    ConnectionRegistry,
+)
 from ws_gateway.components.connection.locks import LockManager
 from ws_gateway.components.connection.lock_sequence import (
     LockSequence,
@@ -66,6 +72,7 @@ from ws_gateway.components.events.types import (
     OPTIONAL_EVENT_FIELDS,
 )
 from ws_gateway.components.events.router import (
+    Audience,
     EventRouter,
     RoutingResult,
     safe_int,
@@ -74,6 +81,7 @@ from ws_gateway.components.events.router import (
 # =============================================================================
 # Broadcasting
 # =============================================================================
+from ws_gateway.components.broadcast.frame import EncodedFrame, encode_frame
 from ws_gateway.components.broadcast.router import (
     BroadcastRouter,
     BroadcastStrategy,
@@ -169,6 +177,7 @@ __all__ = [
     "MSG_PING_JSON",
     "MSG_PONG_JSON",
     "MSG_REFRESH_SECTORS",
+    "MSG_REPLAY_DONE",
     "DEFAULT_ALLOWED_ORIGINS",
     "validate_websocket_origin",
     "WebSocketContext",
@@ -176,11 +185,14 @@ __all__ = [
     "ConnectionManagerDependencies",
     "get_lock_manager",
     "get_metrics_collector",
+    "get_connection_registry",
     "get_heartbeat_tracker",
     "get_rate_limiter",
     "reset_singletons",
     # Connection
     "ConnectionIndex",
+    "ConnectionRecord",
+    "ConnectionRegistry",
     "LockManager",
     "LockSequence",
     "LockOrder",
@@ -196,10 +208,13 @@ __all__ = [
     "VALID_EVENT_TYPES",
     "REQUIRED_EVENT_FIELDS",
     "OPTIONAL_EVENT_FIELDS",
+    "Audience",
     "EventRouter",
     "RoutingResult",
     "safe_int",
     # Broadcasting
+    "EncodedFrame",
+    "encode_frame",
     "BroadcastRouter",
     "BroadcastStrategy",
     "BatchBroadcastStrategy",
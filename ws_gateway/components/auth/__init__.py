@@ -12,6 +12,11 @@ from ws_gateway.components.auth.strategies import (
     CompositeAuthStrategy,
     NullAuthStrategy,
 )
+from ws_gateway.components.auth.revocation import (
+    RevocationChecker,
+    get_revocation_checker,
+    verify_jwt_async,
+)
 
 __all__ = [
     "AuthStrategy",
@@ -20,4 +25,7 @@ __all__ = [
     "TableTokenAuthStrategy",
     "CompositeAuthStrategy",
     "NullAuthStrategy",
+    "RevocationChecker",
+    "get_revocation_checker",
+    "verify_jwt_async",
 ]
@@ -0,0 +1,167 @@
+"""
+Async JWT verification for the WebSocket gateway.
+
+PERF-AUTH-01: shared.security.auth.verify_jwt checks the blacklist and the
+user-level revocation with the synchronous Redis client, which blocks every
+socket of the gateway for two round-trips per connect and per revalidation.
+Here the signature and claims are verified in-process and the revocation
+lookups of every token that falls due in the same event loop tick are sent
+as one pipelined async round-trip.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+from fastapi import HTTPException, status
+
+logger = logging.getLogger(__name__)
+
+# (jti, user_id, iat) as taken by check_tokens_validity()
+TokenKey = tuple[str | None, int | None, datetime | None]
+BatchCheck = Callable[[list[TokenKey]], Awaitable[list[bool]]]
+
+
+def token_key(claims: dict[str, Any]) -> TokenKey:
+    """Revocation lookup key of already verified JWT claims."""
+    user_id = claims.get("sub")
+    iat = claims.get("iat")
+    return (
+        claims.get("jti") or None,
+        int(user_id) if user_id else None,
+        datetime.fromtimestamp(iat, tz=timezone.utc) if iat else None,
+    )
+
+
+async def _check_tokens_validity(tokens: list[TokenKey]) -> list[bool]:
+    from shared.security.token_blacklist import check_tokens_validity
+
+    return await check_tokens_validity(tokens)
+
+
+class RevocationChecker:
+    """
+    Batches blacklist/user-revocation lookups per event loop tick.
+
+    The first lookup of a tick schedules a flush with call_soon; every
+    lookup requested before it runs joins the same pipelined round-trip.
+    Identical tokens share one lookup. Failures are fail-closed.
+
+    Usage:
+        checker = RevocationChecker()
+        if not await checker.is_valid(claims):
+            ...  # revoked
+    """
+
+    def __init__(self, check_batch: BatchCheck | None = None) -> None:
+        """
+        Initialize checker.
+
+        Args:
+            check_batch: Batch lookup returning validity per token
+                (defaults to token_blacklist.check_tokens_validity).
+        """
+        self._check_batch = check_batch or _check_tokens_validity
+        self._pending: dict[TokenKey, asyncio.Future[bool]] = {}
+        self._flush_scheduled = False
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._batches = 0
+        self._lookups = 0
+
+    async def is_valid(self, claims: dict[str, Any]) -> bool:
+        """
+        Check that a verified token has not been blacklisted or revoked.
+
+        Args:
+            claims: Claims returned by a signature-verified decode.
+
+        Returns:
+            True if the token is still valid.
+        """
+        key = token_key(claims)
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                loop.call_soon(self._start_flush)
+        # Shielded: a cancelled caller must not cancel the lookup of the others
+        return await asyncio.shield(future)
+
+    def _start_flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._flush_scheduled = False
+        task = asyncio.get_running_loop().create_task(self._flush(pending))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, pending: dict[TokenKey, asyncio.Future[bool]]) -> None:
+        keys = list(pending)
+        self._batches += 1
+        self._lookups += len(keys)
+        try:
+            results = await self._check_batch(keys)
+        except Exception as e:
+            logger.error("Token revocation lookup failed - failing closed", tokens=len(keys), error=str(e))
+            results = [False] * len(keys)
+
+        for key, valid in zip(keys, results):
+            future = pending[key]
+            if not future.done():
+                future.set_result(valid)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get batching statistics for monitoring."""
+        return {
+            "batches": self._batches,
+            "lookups": self._lookups,
+            "pending": len(self._pending),
+        }
+
+
+_checker: RevocationChecker | None = None
+
+
+def get_revocation_checker() -> RevocationChecker:
+    """Get singleton revocation checker."""
+    global _checker
+    if _checker is None:
+        _checker = RevocationChecker()
+    return _checker
+
+
+async def verify_jwt_async(token: str) -> dict[str, Any]:
+    """
+    Non-blocking equivalent of shared.security.auth.verify_jwt.
+
+    Args:
+        token: The JWT token string.
+
+    Returns:
+        Decoded token claims.
+
+    Raises:
+        HTTPException: If token is invalid, expired, or revoked.
+    """
+    from shared.security.auth import verify_jwt
+
+    claims = verify_jwt(token, check_blacklist=False)
+    if not await get_revocation_checker().is_valid(claims):
+        logger.warning("Revoked token used", user_id=claims.get("sub"))
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+        )
+    return claims
+
+
+__all__ = [
+    "RevocationChecker",
+    "get_revocation_checker",
+    "token_key",
+    "verify_jwt_async",
+]
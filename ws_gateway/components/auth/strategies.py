@@ -216,7 +216,8 @@ class JWTAuthStrategy(AuthStrategy, OriginValidationMixin):
         token: str,
     ) -> AuthResult:
         """Authenticate using JWT token."""
-        from shared.security.auth import verify_jwt
+        # PERF-AUTH-01: Pipelined async revocation lookup (no sync Redis on the loop)
+        from ws_gateway.components.auth.revocation import verify_jwt_async
 
         # Step 1: Validate origin
         if not self.validate_origin(websocket):
@@ -229,7 +230,7 @@ class JWTAuthStrategy(AuthStrategy, OriginValidationMixin):
 
         # Step 2: Verify JWT
         try:
-            claims = verify_jwt(token)
+            claims = await verify_jwt_async(token)
         except HTTPException as e:
             logger.warning("JWT validation failed", error=str(e.detail))
             return AuthResult.fail(
@@ -284,10 +285,10 @@ class JWTAuthStrategy(AuthStrategy, OriginValidationMixin):
 
     async def revalidate(self, token: str) -> bool:
         """Revalidate JWT token."""
-        from shared.security.auth import verify_jwt
+        from ws_gateway.components.auth.revocation import verify_jwt_async
 
         try:
-            claims = verify_jwt(token)
+            claims = await verify_jwt_async(token)
             if self._reject_refresh_tokens and claims.get("type") == "refresh":
                 return False
             return True
@@ -4,6 +4,12 @@ Broadcasting components.
 Message broadcasting with Strategy pattern and multi-tenant isolation.
 """
 
+from ws_gateway.components.broadcast.frame import (
+    EncodedFrame,
+    encode_frame,
+    parse_stream_id,
+    send_frame,
+)
 from ws_gateway.components.broadcast.router import (
     BroadcastRouter,
     BroadcastStrategy,
@@ -20,6 +26,11 @@ from ws_gateway.components.broadcast.tenant_filter import (
 )
 
 __all__ = [
+    # Pre-encoded frames
+    "EncodedFrame",
+    "encode_frame",
+    "parse_stream_id",
+    "send_frame",
     # Broadcast router
     "BroadcastRouter",
     "BroadcastStrategy",
@@ -0,0 +1,128 @@
+"""
+Pre-encoded WebSocket Frames.
+
+Serializes an event payload once so the same text can be sent to every
+recipient of a fan-out, instead of JSON-encoding it per connection.
+
+PERF-FANOUT-01: Serialize-once fan-out for broadcasts.
+PERF-REPLAY-01: Frames of Redis Stream events carry their stream position
+so replayed and live copies of the same event can be deduplicated.
+PERF-LATENCY-01: Frames of routed events carry their publish and gateway
+receive times (epoch seconds) for publish-to-deliver latency metrics.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fastapi import WebSocket
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedFrame:
+    """
+    Immutable, already-serialized WebSocket text frame.
+
+    Encoding matches Starlette's WebSocket.send_json() (compact separators,
+    ensure_ascii=False), so clients receive byte-identical messages.
+
+    Usage:
+        frame = EncodedFrame.from_payload(event)
+        await ws.send_text(frame.text)
+    """
+
+    text: str
+    event_type: str | None = None
+    # PERF-REPLAY-01: (ms, seq) of the events:critical entry, None for pub/sub
+    stream_position: tuple[int, int] | None = None
+    # PERF-LATENCY-01: Set by the backend publisher / the gateway on receipt
+    published_at: float | None = None
+    received_at: float | None = None
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "EncodedFrame":
+        """
+        Encode a payload dict into a frame.
+
+        Args:
+            payload: JSON-serializable message payload.
+
+        Returns:
+            EncodedFrame holding the serialized text.
+        """
+        return cls(
+            text=json.dumps(payload, separators=(",", ":"), ensure_ascii=False),
+            event_type=payload.get("type"),
+            stream_position=parse_stream_id(payload.get("stream_id")),
+            published_at=_timestamp(payload.get("published_at")),
+            received_at=_timestamp(payload.get("_enqueued_at")),
+        )
+
+    @property
+    def size(self) -> int:
+        """Size of the frame in characters."""
+        return len(self.text)
+
+
+def parse_stream_id(stream_id: Any) -> tuple[int, int] | None:
+    """
+    Parse a Redis Stream entry id ("<ms>-<seq>") into a comparable tuple.
+
+    Args:
+        stream_id: Entry id as str/bytes, or None.
+
+    Returns:
+        (milliseconds, sequence), or None if missing or malformed.
+    """
+    if isinstance(stream_id, bytes):
+        stream_id = stream_id.decode("ascii", "replace")
+    if not isinstance(stream_id, str):
+        return None
+    ms, sep, seq = stream_id.partition("-")
+    if not sep or not ms.isdigit() or not seq.isdigit():
+        return None
+    return int(ms), int(seq)
+
+
+def _timestamp(value: Any) -> float | None:
+    """Epoch seconds from a payload field, or None if missing or malformed."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+        return float(value)
+    return None
+
+
+def encode_frame(payload: dict[str, Any] | EncodedFrame) -> EncodedFrame:
+    """
+    Return an EncodedFrame for a payload, reusing it if already encoded.
+
+    Args:
+        payload: Raw payload dict or an existing frame.
+
+    Returns:
+        EncodedFrame for the payload.
+    """
+    if isinstance(payload, EncodedFrame):
+        return payload
+    return EncodedFrame.from_payload(payload)
+
+
+async def send_frame(ws: "WebSocket", frame: EncodedFrame) -> None:
+    """
+    Send a pre-encoded frame over a WebSocket.
+
+    Args:
+        ws: Target WebSocket connection.
+        frame: Frame to send.
+    """
+    await ws.send_text(frame.text)
+
+
+__all__ = [
+    "EncodedFrame",
+    "encode_frame",
+    "parse_stream_id",
+    "send_frame",
+]
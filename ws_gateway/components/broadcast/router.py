@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 from starlette.websockets import WebSocketState
 
+from ws_gateway.components.broadcast.frame import EncodedFrame, encode_frame, send_frame
 from ws_gateway.components.core.constants import WSConstants
 
 if TYPE_CHECKING:
@@ -160,17 +161,18 @@ class BroadcastStrategy(ABC):
     async def _send_single(
         self,
         ws: "WebSocket",
-        payload: dict[str, Any],
+        frame: EncodedFrame,
     ) -> bool:
         """
         Send to a single connection.
 
         MED-01 FIX: Common implementation moved from concrete strategies
         to base class to avoid code duplication.
+        PERF-FANOUT-01: Sends a pre-encoded frame (no per-recipient JSON encoding).
 
         Args:
             ws: WebSocket connection to send to.
-            payload: Message payload.
+            frame: Pre-encoded message frame.
 
         Returns:
             True if successful, False otherwise.
@@ -181,7 +183,7 @@ class BroadcastStrategy(ABC):
             return False
 
         try:
-            await ws.send_json(payload)
+            await send_frame(ws, frame)
             return True
         except Exception as e:
             logger.debug("Send failed: %s", str(e))
@@ -193,15 +195,18 @@ class BroadcastStrategy(ABC):
     async def send_to_connections(
         self,
         connections: list["WebSocket"],
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         context: str,
     ) -> tuple[int, int]:
         """
         Send payload to connections.
 
+        Implementations should encode the payload once (encode_frame) and
+        reuse the frame for every connection.
+
         Args:
             connections: WebSocket connections to send to.
-            payload: Message payload.
+            payload: Message payload or pre-encoded frame.
             context: Context string for logging.
 
         Returns:
@@ -242,13 +247,16 @@ class BatchBroadcastStrategy(BroadcastStrategy):
     async def send_to_connections(
         self,
         connections: list["WebSocket"],
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         context: str,
     ) -> tuple[int, int]:
         """Send to connections in parallel batches."""
         if not connections:
             return 0, 0
 
+        # PERF-FANOUT-01: Encode once for all recipients
+        frame = encode_frame(payload)
+
         sent = 0
         failed = 0
 
@@ -256,7 +264,7 @@ class BatchBroadcastStrategy(BroadcastStrategy):
         for i in range(0, len(connections), self._batch_size):
             batch = connections[i:i + self._batch_size]
             results = await asyncio.gather(
-                *[self._send_single(ws, payload) for ws in batch],
+                *[self._send_single(ws, frame) for ws in batch],
                 return_exceptions=True,
             )
 
@@ -347,13 +355,16 @@ class AdaptiveBatchStrategy(BroadcastStrategy):
     async def send_to_connections(
         self,
         connections: list["WebSocket"],
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         context: str,
     ) -> tuple[int, int]:
         """Send to connections with adaptive batching."""
         if not connections:
             return 0, 0
 
+        # PERF-FANOUT-01: Encode once for all recipients
+        frame = encode_frame(payload)
+
         sent = 0
         failed = 0
 
@@ -363,7 +374,7 @@ class AdaptiveBatchStrategy(BroadcastStrategy):
 
             start_time = time.perf_counter()
             results = await asyncio.gather(
-                *[self._send_single(ws, payload) for ws in batch],
+                *[self._send_single(ws, frame) for ws in batch],
                 return_exceptions=True,
             )
             batch_latency_ms = (time.perf_counter() - start_time) * 1000
@@ -500,7 +511,7 @@ class BroadcastRouter:
     async def broadcast_to_connections(
         self,
         connections: list["WebSocket"],
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         context: str = "broadcast",
     ) -> int:
         """
@@ -508,7 +519,7 @@ class BroadcastRouter:
 
         Args:
             connections: List of WebSocket connections.
-            payload: Message payload.
+            payload: Message payload or pre-encoded frame.
             context: Context string for logging.
 
         Returns:
@@ -5,6 +5,10 @@ Handles connection lifecycle: indices, locks, heartbeat, rate limiting.
 """
 
 from ws_gateway.components.connection.index import ConnectionIndex
+from ws_gateway.components.connection.registry import (
+    ConnectionRecord,
+    ConnectionRegistry,
+)
 from ws_gateway.components.connection.locks import LockManager
 from ws_gateway.components.connection.lock_sequence import (
     LockSequence,
@@ -15,9 +19,12 @@ from ws_gateway.components.connection.lock_sequence import (
 )
 from ws_gateway.components.connection.heartbeat import HeartbeatTracker
 from ws_gateway.components.connection.rate_limiter import WebSocketRateLimiter
+from ws_gateway.components.connection.admission import HandshakeAdmission
 
 __all__ = [
     "ConnectionIndex",
+    "ConnectionRecord",
+    "ConnectionRegistry",
     "LockManager",
     "LockSequence",
     "LockOrder",
@@ -26,4 +33,5 @@ __all__ = [
     "with_counter_and_user",
     "HeartbeatTracker",
     "WebSocketRateLimiter",
+    "HandshakeAdmission",
 ]
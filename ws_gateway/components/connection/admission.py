@@ -0,0 +1,171 @@
+"""
+Handshake Admission Control.
+
+Caps concurrent WebSocket handshakes (authentication, context creation,
+registration and replay) so a reconnect storm after a gateway restart does
+not run every JWT check and sector lookup at the same moment.
+
+PERF-ADMISSION-01: Excess handshakes wait in a FIFO queue with a deadline;
+clients that cannot be admitted get a suggested retry delay so their
+reconnects spread out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections import deque
+
+from ws_gateway.components.core.constants import WSConstants
+
+logger = logging.getLogger(__name__)
+
+
+class HandshakeAdmission:
+    """
+    Admission controller for WebSocket handshakes.
+
+    A counting semaphore with a bounded waiting queue:
+    - Up to max_concurrent handshakes run at once
+    - Up to max_queued wait for a slot, first come first served, each for
+      at most queue_timeout seconds
+    - Anyone else is rejected immediately
+
+    A released slot is handed directly to the oldest waiter, so newcomers
+    cannot overtake the queue. All bookkeeping happens without awaits and
+    is atomic on the event loop.
+
+    Usage:
+        if not await admission.acquire():
+            close(TRY_AGAIN_LATER, retry_after_ms(admission.retry_after()))
+        try:
+            ...  # handshake
+        finally:
+            admission.release()
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = WSConstants.HANDSHAKE_MAX_CONCURRENT,
+        max_queued: int = WSConstants.HANDSHAKE_MAX_QUEUED,
+        queue_timeout: float = WSConstants.HANDSHAKE_QUEUE_TIMEOUT,
+        retry_after_base: float = WSConstants.HANDSHAKE_RETRY_AFTER_BASE,
+        retry_after_max: float = WSConstants.HANDSHAKE_RETRY_AFTER_MAX,
+    ) -> None:
+        """
+        Initialize admission controller.
+
+        Args:
+            max_concurrent: Handshakes allowed to run at once.
+            max_queued: Handshakes allowed to wait for a slot.
+            queue_timeout: Max seconds a handshake waits for a slot.
+            retry_after_base: Suggested retry delay per max_concurrent
+                handshakes ahead.
+            retry_after_max: Upper bound of the suggested retry delay.
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self._max_concurrent = max_concurrent
+        self._max_queued = max_queued
+        self._queue_timeout = queue_timeout
+        self._retry_after_base = retry_after_base
+        self._retry_after_max = retry_after_max
+
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+        self._admitted = 0
+        self._queued_total = 0
+        self._rejected_queue_full = 0
+        self._rejected_timeout = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Handshakes currently running."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Handshakes waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """
+        Wait for a handshake slot.
+
+        Returns:
+            True if admitted (call release() when the handshake ends),
+            False if the queue is full or the deadline passed.
+        """
+        if self._in_flight < self._max_concurrent and not self._waiters:
+            self._in_flight += 1
+            self._admitted += 1
+            return True
+
+        if len(self._waiters) >= self._max_queued:
+            self._rejected_queue_full += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._queued_total += 1
+        try:
+            await asyncio.wait_for(waiter, timeout=self._queue_timeout)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over right at the deadline
+                self._admitted += 1
+                return True
+            self._discard_waiter(waiter)
+            self._rejected_timeout += 1
+            return False
+        except BaseException:
+            self._discard_waiter(waiter)
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over just before the cancellation
+                self.release()
+            raise
+
+        # release() transferred its slot; _in_flight is already counted
+        self._admitted += 1
+        return True
+
+    def release(self) -> None:
+        """Release a slot, handing it to the oldest waiter if any."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._in_flight = max(0, self._in_flight - 1)
+
+    def _discard_waiter(self, waiter: asyncio.Future[None]) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def retry_after(self) -> float:
+        """
+        Suggested delay before a rejected client reconnects.
+
+        Grows with the backlog ahead (one base delay per max_concurrent
+        handshakes) and is jittered down to half so rejected clients do
+        not return together.
+        """
+        backlog = (self._in_flight + len(self._waiters)) / self._max_concurrent
+        delay = min(self._retry_after_max, self._retry_after_base * max(1.0, backlog))
+        return random.uniform(delay / 2, delay)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get admission statistics for monitoring."""
+        return {
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "max_concurrent": self._max_concurrent,
+            "admitted": self._admitted,
+            "queued_total": self._queued_total,
+            "rejected_queue_full": self._rejected_queue_full,
+            "rejected_timeout": self._rejected_timeout,
+        }
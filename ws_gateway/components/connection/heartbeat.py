@@ -7,16 +7,26 @@ Identifies stale connections that haven't sent heartbeats.
 ARCH-01 FIX: Extracted from ConnectionManager (Single Responsibility).
 CRIT-03 FIX: Added thread-safety with threading.Lock.
 HIGH-DEEP-03 FIX: Moved logger import to module level.
+PERF-REGISTRY-01: Timestamps live on ConnectionRecord instead of a
+WebSocket-keyed dict.
+PERF-HEARTBEAT-01: Expiry uses a timing wheel instead of full scans.
 """
 
 from __future__ import annotations
 
+import heapq
 import logging
 import threading
 import time
 from typing import TYPE_CHECKING
 
-from ws_gateway.components.core.constants import MSG_PING_PLAIN, MSG_PING_JSON, MSG_PONG_JSON
+from ws_gateway.components.core.constants import (
+    MSG_PING_PLAIN,
+    MSG_PING_JSON,
+    MSG_PONG_JSON,
+    WSConstants,
+)
+from ws_gateway.components.connection.registry import ConnectionRecord, ConnectionRegistry
 
 if TYPE_CHECKING:
     from fastapi import WebSocket
@@ -29,8 +39,18 @@ class HeartbeatTracker:
     """
     Tracks heartbeat timestamps for WebSocket connections.
 
+    PERF-REGISTRY-01: The last activity time is stored on each connection's
+    ConnectionRecord, so only registered connections are tracked and the
+    state disappears with the record on disconnect.
+
+    PERF-HEARTBEAT-01: Records are also kept in a hashed timing wheel,
+    bucketed by the slot in which they expire (last activity + timeout,
+    `resolution` seconds per slot). Activity moves a record to its new
+    slot in O(1). Expiry pops only the slots that have fully passed plus
+    the current one, so a cleanup tick costs O(expired), not O(tracked).
+
     CRIT-03 FIX: Thread-safe implementation using threading.Lock.
-    All dictionary operations are protected to prevent RuntimeError
+    Timestamp and wheel updates are guarded, preventing RuntimeError
     from concurrent modification.
 
     Each connection's last activity time is recorded when:
@@ -40,18 +60,32 @@ class HeartbeatTracker:
     Connections without recent activity are considered stale.
     """
 
-    def __init__(self, timeout_seconds: float = 60.0):
+    def __init__(
+        self,
+        timeout_seconds: float = 60.0,
+        registry: ConnectionRegistry | None = None,
+        resolution_seconds: float = WSConstants.HEARTBEAT_WHEEL_RESOLUTION,
+    ):
         """
         Initialize heartbeat tracker.
 
         Args:
             timeout_seconds: Seconds without activity before connection is stale.
+            registry: Registry holding the connection records (created if not given).
+            resolution_seconds: Width of a timing wheel slot.
         """
         self._timeout = timeout_seconds
-        self._last_heartbeat: dict[WebSocket, float] = {}
+        self._registry = registry if registry is not None else ConnectionRegistry()
+        self._resolution = max(resolution_seconds, 0.001)
         # CRIT-03 FIX: Lock for thread-safe operations
         self._lock = threading.Lock()
 
+        # PERF-HEARTBEAT-01: expiry slot -> records expiring in it
+        self._slots: dict[int, set[ConnectionRecord]] = {}
+        # Min-heap of slot numbers (may hold slots that were emptied since)
+        self._slot_heap: list[int] = []
+        self._tracked = 0
+
     @property
     def timeout(self) -> float:
         """Get the heartbeat timeout in seconds."""
@@ -60,8 +94,31 @@ class HeartbeatTracker:
     @property
     def tracked_count(self) -> int:
         """Get number of connections being tracked."""
-        with self._lock:
-            return len(self._last_heartbeat)
+        return self._tracked
+
+    def _slot_of(self, timestamp: float) -> int:
+        """Wheel slot in which activity at `timestamp` expires."""
+        return int((timestamp + self._timeout) // self._resolution)
+
+    def _unslot(self, record: ConnectionRecord) -> None:
+        """Take a record out of its wheel slot. MUST be called with _lock."""
+        slot = record.heartbeat_slot
+        if slot is None:
+            return
+        bucket = self._slots.get(slot)
+        if bucket is not None:
+            bucket.discard(record)
+            if not bucket:
+                del self._slots[slot]
+        record.heartbeat_slot = None
+
+    def _untrack(self, record: ConnectionRecord) -> None:
+        """Stop tracking a record. MUST be called with _lock."""
+        if record.last_heartbeat is None:
+            return
+        self._unslot(record)
+        record.last_heartbeat = None
+        self._tracked -= 1
 
     def record(self, websocket: WebSocket, timestamp: float | None = None) -> None:
         """
@@ -72,16 +129,34 @@ class HeartbeatTracker:
         external timestamp control.
 
         Call this when:
-        - A new connection is established
+        - A new connection is established (after it is registered)
         - Any message is received from the connection
 
+        Unregistered connections are ignored.
+
         Args:
             websocket: The WebSocket connection to record.
             timestamp: Optional Unix timestamp. If None, uses current time.
                        Useful for testing and when timestamp is known externally.
         """
+        record = self._registry.get(websocket)
+        if record is None:
+            return
+        now = timestamp if timestamp is not None else time.time()
+        slot = self._slot_of(now)
         with self._lock:
-            self._last_heartbeat[websocket] = timestamp if timestamp is not None else time.time()
+            if record.last_heartbeat is None:
+                self._tracked += 1
+            record.last_heartbeat = now
+            if record.heartbeat_slot == slot:
+                return
+            self._unslot(record)
+            bucket = self._slots.get(slot)
+            if bucket is None:
+                bucket = self._slots[slot] = set()
+                heapq.heappush(self._slot_heap, slot)
+            bucket.add(record)
+            record.heartbeat_slot = slot
 
     def remove(self, websocket: WebSocket) -> None:
         """
@@ -94,23 +169,24 @@ class HeartbeatTracker:
         Args:
             websocket: The WebSocket connection to remove.
         """
+        record = self._registry.get(websocket)
+        if record is None:
+            return
         with self._lock:
-            self._last_heartbeat.pop(websocket, None)
+            self._untrack(record)
 
     def get_last_activity(self, websocket: WebSocket) -> float | None:
         """
         Get the last activity time for a connection.
 
-        CRIT-03 FIX: Thread-safe with lock.
-
         Args:
             websocket: The WebSocket connection to check.
 
         Returns:
             Unix timestamp of last activity, or None if not tracked.
         """
-        with self._lock:
-            return self._last_heartbeat.get(websocket)
+        record = self._registry.get(websocket)
+        return None if record is None else record.last_heartbeat
 
     def get_last_heartbeat_time(self, websocket: WebSocket, default: float | None = None) -> float:
         """
@@ -118,7 +194,6 @@ class HeartbeatTracker:
         MED-WS-11 FIX: Changed default from 0.0 to None (uses current time).
 
         Thread-safe method for external callers that need a default value.
-        Use this instead of accessing _last_heartbeat directly.
 
         Args:
             websocket: The WebSocket connection to check.
@@ -130,56 +205,69 @@ class HeartbeatTracker:
             Unix timestamp (seconds since epoch, float) of last heartbeat,
             or default/current time if not tracked.
         """
-        with self._lock:
-            result = self._last_heartbeat.get(websocket)
-            if result is not None:
-                return result
-            # MED-WS-11 FIX: Return current time for unknown connections
-            # This prevents unknown connections from appearing "oldest"
-            return default if default is not None else time.time()
+        result = self.get_last_activity(websocket)
+        if result is not None:
+            return result
+        # MED-WS-11 FIX: Return current time for unknown connections
+        # This prevents unknown connections from appearing "oldest"
+        return default if default is not None else time.time()
 
     def is_stale(self, websocket: WebSocket) -> bool:
         """
         Check if a connection is stale (no recent activity).
 
-        CRIT-03 FIX: Thread-safe with lock.
-
         Args:
             websocket: The WebSocket connection to check.
 
         Returns:
             True if the connection hasn't had activity within timeout period.
         """
-        with self._lock:
-            last_time = self._last_heartbeat.get(websocket)
+        last_time = self.get_last_activity(websocket)
         if last_time is None:
             return True  # Unknown connections are considered stale
         return time.time() - last_time > self._timeout
 
+    def _expired(self, now: float) -> list[ConnectionRecord]:
+        """
+        Records whose last activity is older than the timeout.
+
+        Slots before the current one are expired as a whole; the current
+        slot is checked per record. MUST be called with _lock.
+        """
+        cutoff = now - self._timeout
+        current = self._slot_of(cutoff)
+        expired = [
+            record
+            for slot, bucket in self._slots.items()
+            if slot < current
+            for record in bucket
+        ]
+        expired.extend(
+            record
+            for record in self._slots.get(current, ())
+            if record.last_heartbeat < cutoff
+        )
+        return expired
+
     def get_stale_connections(self) -> list[WebSocket]:
         """
         Get all connections that haven't sent a heartbeat within timeout.
 
-        CRIT-03 FIX: Thread-safe - copies dict under lock.
+        PERF-HEARTBEAT-01: Walks only expired wheel slots (O(slots + stale)).
 
         Returns:
             List of stale WebSocket connections.
         """
-        now = time.time()
-        stale = []
-        # CRIT-03 FIX: Copy under lock to prevent concurrent modification
         with self._lock:
-            items = list(self._last_heartbeat.items())
-        for ws, last_time in items:
-            if now - last_time > self._timeout:
-                stale.append(ws)
-        return stale
+            return [record.ws for record in self._expired(time.time())]
 
     def cleanup_stale(self) -> list[WebSocket]:
         """
         Remove and return stale connections from tracking.
 
         CRIT-03 FIX: Thread-safe atomic operation.
+        PERF-HEARTBEAT-01: Pops expired slots off the wheel, so the cost is
+        proportional to the number of stale connections.
 
         This both identifies stale connections and removes them from
         tracking in one operation.
@@ -188,25 +276,48 @@ class HeartbeatTracker:
             List of stale connections that were removed.
         """
         now = time.time()
-        stale = []
+        cutoff = now - self._timeout
+        current = self._slot_of(cutoff)
+        stale: list[WebSocket] = []
         # CRIT-03 FIX: Single lock for atomic read-modify-write
         with self._lock:
-            for ws, last_time in list(self._last_heartbeat.items()):
-                if now - last_time > self._timeout:
-                    stale.append(ws)
-                    del self._last_heartbeat[ws]
+            heap = self._slot_heap
+            while heap and heap[0] < current:
+                bucket = self._slots.pop(heapq.heappop(heap), None)
+                if not bucket:
+                    continue
+                for record in bucket:
+                    record.heartbeat_slot = None
+                    record.last_heartbeat = None
+                    self._tracked -= 1
+                    # Records removed from the registry without remove()
+                    if self._registry.get_by_id(record.conn_id) is record:
+                        stale.append(record.ws)
+
+            for record in [
+                r for r in self._slots.get(current, ()) if r.last_heartbeat < cutoff
+            ]:
+                self._untrack(record)
+                if self._registry.get_by_id(record.conn_id) is record:
+                    stale.append(record.ws)
         return stale
 
     def get_stats(self) -> dict[str, float | int]:
         """Get heartbeat tracker statistics."""
+        now = time.time()
         with self._lock:
-            now = time.time()
-            ages = [now - t for t in self._last_heartbeat.values()]
-            tracked = len(self._last_heartbeat)
+            slots = list(self._slots.values())
+        ages = [
+            now - record.last_heartbeat
+            for bucket in slots
+            for record in bucket
+            if record.last_heartbeat is not None
+        ]
 
         return {
-            "tracked_connections": tracked,
+            "tracked_connections": self._tracked,
             "timeout_seconds": self._timeout,
+            "wheel_slots": len(slots),
             "oldest_heartbeat_age": max(ages) if ages else 0,
             "newest_heartbeat_age": min(ages) if ages else 0,
             "average_heartbeat_age": sum(ages) / len(ages) if ages else 0,
@@ -4,6 +4,12 @@ Connection Index - Manages all WebSocket connection indices.
 ARCH-AUDIT-01: Extracted from ConnectionManager to follow Single Responsibility Principle.
 This class handles all connection indexing by user, branch, sector, session, and admin status.
 
+PERF-REGISTRY-01: Indices hold integer connection ids; per-connection state
+(roles, memberships, tenant) lives in ConnectionRecord (registry.py).
+
+PERF-TENANT-01: Every index has a tenant-partitioned twin keyed by
+(tenant_id, key), so tenant-scoped lookups return the exact recipients.
+
 The ConnectionManager now delegates index operations to this class, reducing its
 size from 1060 lines to ~700 lines.
 """
@@ -12,13 +18,33 @@ from __future__ import annotations
 
 import logging
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Hashable, Protocol, TypeAlias
+
+from ws_gateway.components.connection.registry import ConnectionRecord, ConnectionRegistry
 
 if TYPE_CHECKING:
     from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+# PERF-TENANT-01: Key of the tenant-partitioned indices
+TenantKey: TypeAlias = tuple[int | None, int]
+
+_NO_CONNECTIONS: frozenset[int] = frozenset()
+
+
+class InterestListener(Protocol):
+    """
+    Observer notified when a branch/session/sector gains its first local
+    connection or loses its last one.
+
+    PERF-SUBS-01: Drives interest-based Redis subscriptions. Called
+    synchronously under the index locks, so implementations must not block.
+    """
+
+    def interest_added(self, kind: str, key: int) -> None: ...
+    def interest_removed(self, kind: str, key: int) -> None: ...
+
 
 class LockManagerProtocol(Protocol):
     """Protocol for lock manager to avoid circular imports."""
@@ -40,85 +66,160 @@ class ConnectionIndex:
     """
     Manages WebSocket connection indices.
 
-    Indices maintained:
-    - by_user: user_id -> set[WebSocket]
-    - by_branch: branch_id -> set[WebSocket]
-    - by_session: session_id -> set[WebSocket]
-    - by_sector: sector_id -> set[WebSocket]
-    - admins_by_branch: branch_id -> set[WebSocket] (admin/manager only)
-
-    Reverse mappings for efficient disconnect:
-    - ws_to_user: WebSocket -> user_id
-    - ws_to_branches: WebSocket -> list[branch_id]
-    - ws_to_sessions: WebSocket -> set[session_id]
-    - ws_to_sectors: WebSocket -> list[sector_id]
-    - ws_is_admin: WebSocket -> bool
-    - ws_to_tenant: WebSocket -> tenant_id (multi-tenant isolation)
+    Indices maintained (values are connection ids):
+    - by_user: user_id -> set[conn_id]
+    - by_branch: branch_id -> set[conn_id]
+    - by_session: session_id -> set[conn_id]
+    - by_sector: sector_id -> set[conn_id]
+    - admins_by_branch: branch_id -> set[conn_id] (admin/manager only)
+    - kitchen_by_branch: branch_id -> set[conn_id] (kitchen only)
+
+    PERF-REGISTRY-01: The former WebSocket-keyed reverse mappings (user,
+    branches, sessions, sectors, admin, kitchen, tenant) are fields of the
+    connection's ConnectionRecord, so disconnect needs a single lookup.
+    Query methods still return WebSockets, resolved through the registry.
+
+    PERF-TENANT-01: Each index is mirrored by one keyed by
+    (tenant_id, key). Query methods take an optional tenant_id and, when
+    given, read the partitioned index instead of filtering per connection,
+    so a connection of another tenant can never be part of the result.
 
     Thread Safety:
     - All mutations require appropriate locks from LockManager
     - Read-only properties return immutable views (MappingProxyType)
     """
 
-    def __init__(self) -> None:
-        """Initialize empty indices."""
-        # Primary indices
-        self._by_user: dict[int, set[WebSocket]] = {}
-        self._by_branch: dict[int, set[WebSocket]] = {}
-        self._by_session: dict[int, set[WebSocket]] = {}
-        self._by_sector: dict[int, set[WebSocket]] = {}
-        self._admins_by_branch: dict[int, set[WebSocket]] = {}
-        self._kitchen_by_branch: dict[int, set[WebSocket]] = {}
-
+    def __init__(self, registry: ConnectionRegistry | None = None) -> None:
+        """
+        Initialize empty indices.
 
-        # Reverse mappings
-        self._ws_to_user: dict[WebSocket, int] = {}
-        self._ws_to_branches: dict[WebSocket, list[int]] = {}
-        self._ws_to_sessions: dict[WebSocket, set[int]] = {}
-        self._ws_to_sectors: dict[WebSocket, list[int]] = {}
-        self._ws_is_admin: dict[WebSocket, bool] = {}
-        self._ws_is_kitchen: dict[WebSocket, bool] = {}
+        Args:
+            registry: Shared connection registry (created if not given).
+        """
+        self._registry = registry if registry is not None else ConnectionRegistry()
 
-        self._ws_to_tenant: dict[WebSocket, int] = {}
+        # Primary indices
+        self._by_user: dict[int, set[int]] = {}
+        self._by_branch: dict[int, set[int]] = {}
+        self._by_session: dict[int, set[int]] = {}
+        self._by_sector: dict[int, set[int]] = {}
+        self._admins_by_branch: dict[int, set[int]] = {}
+        self._kitchen_by_branch: dict[int, set[int]] = {}
+
+        # PERF-TENANT-01: Tenant-partitioned indices, keyed by (tenant_id, key)
+        self._by_tenant_user: dict[TenantKey, set[int]] = {}
+        self._by_tenant_branch: dict[TenantKey, set[int]] = {}
+        self._by_tenant_session: dict[TenantKey, set[int]] = {}
+        self._by_tenant_sector: dict[TenantKey, set[int]] = {}
+        self._admins_by_tenant_branch: dict[TenantKey, set[int]] = {}
+        self._kitchen_by_tenant_branch: dict[TenantKey, set[int]] = {}
 
         # Connection counter
         self._total_connections = 0
 
+        # PERF-PROM-01: Gauges kept on connect/disconnect so stats never walk indices
+        self._admin_memberships = 0  # (admin connection, branch) pairs
+        self._users_by_tenant: dict[int | None, int] = {}
+
+        # PERF-SUBS-01: Notified on first/last connection per branch/session/sector
+        self._interest_listener: InterestListener | None = None
+
+    def set_interest_listener(self, listener: InterestListener | None) -> None:
+        """Set the observer for first/last connection changes (PERF-SUBS-01)."""
+        self._interest_listener = listener
+
+    def _index_add(
+        self, index: dict[int, set[int]], key: int, conn_id: int, kind: str
+    ) -> None:
+        """Add a connection to an index bucket, notifying the listener on first connection."""
+        bucket = index.get(key)
+        if bucket is None:
+            bucket = index[key] = set()
+            if self._interest_listener is not None:
+                self._interest_listener.interest_added(kind, key)
+        bucket.add(conn_id)
+
+    def _index_discard(
+        self, index: dict[int, set[int]], key: int, conn_id: int, kind: str
+    ) -> None:
+        """Remove a connection from an index bucket, notifying the listener on last connection."""
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket.discard(conn_id)
+        if not bucket:
+            del index[key]
+            if self._interest_listener is not None:
+                self._interest_listener.interest_removed(kind, key)
+
+    @staticmethod
+    def _bucket_add(index: dict[Hashable, set[int]], key: Hashable, conn_id: int) -> None:
+        """Add a connection to a bucket that has no interest listener."""
+        bucket = index.get(key)
+        if bucket is None:
+            bucket = index[key] = set()
+        bucket.add(conn_id)
+
+    @staticmethod
+    def _bucket_discard(index: dict[Hashable, set[int]], key: Hashable, conn_id: int) -> None:
+        """Remove a connection from a bucket that has no interest listener."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.discard(conn_id)
+            if not bucket:
+                del index[key]
+
+    @staticmethod
+    def _bucket(
+        index: dict[int, set[int]],
+        tenant_index: dict[TenantKey, set[int]],
+        key: int,
+        tenant_id: int | None,
+    ) -> set[int] | frozenset[int]:
+        """Connection ids for a key, from the tenant partition when tenant_id is given."""
+        if tenant_id is None:
+            return index.get(key, _NO_CONNECTIONS)
+        return tenant_index.get((tenant_id, key), _NO_CONNECTIONS)
+
     # =========================================================================
     # Immutable views (MED-NEW-01 FIX: Prevent external mutation)
     # =========================================================================
 
     @property
-    def by_user(self) -> MappingProxyType[int, set["WebSocket"]]:
-        """Connections indexed by user ID (immutable view)."""
+    def registry(self) -> ConnectionRegistry:
+        """Registry owning the per-connection records."""
+        return self._registry
+
+    @property
+    def by_user(self) -> MappingProxyType[int, set[int]]:
+        """Connection ids indexed by user ID (immutable view)."""
         return MappingProxyType(self._by_user)
 
     @property
-    def by_branch(self) -> MappingProxyType[int, set["WebSocket"]]:
-        """Connections indexed by branch ID (immutable view)."""
+    def by_branch(self) -> MappingProxyType[int, set[int]]:
+        """Connection ids indexed by branch ID (immutable view)."""
         return MappingProxyType(self._by_branch)
 
     @property
-    def by_session(self) -> MappingProxyType[int, set["WebSocket"]]:
-        """Connections indexed by session ID (immutable view)."""
+    def by_session(self) -> MappingProxyType[int, set[int]]:
+        """Connection ids indexed by session ID (immutable view)."""
         return MappingProxyType(self._by_session)
 
     @property
-    def by_sector(self) -> MappingProxyType[int, set["WebSocket"]]:
-        """Connections indexed by sector ID (immutable view)."""
+    def by_sector(self) -> MappingProxyType[int, set[int]]:
+        """Connection ids indexed by sector ID (immutable view)."""
         return MappingProxyType(self._by_sector)
 
     @property
-    def admins_by_branch(self) -> MappingProxyType[int, set["WebSocket"]]:
-        """Admin connections indexed by branch ID (immutable view)."""
+    def admins_by_branch(self) -> MappingProxyType[int, set[int]]:
+        """Admin connection ids indexed by branch ID (immutable view)."""
         return MappingProxyType(self._admins_by_branch)
 
     @property
-    def kitchen_by_branch(self) -> MappingProxyType[int, set["WebSocket"]]:
-        """Kitchen connections indexed by branch ID (immutable view)."""
+    def kitchen_by_branch(self) -> MappingProxyType[int, set[int]]:
+        """Kitchen connection ids indexed by branch ID (immutable view)."""
         return MappingProxyType(self._kitchen_by_branch)
 
-
     @property
     def total_connections(self) -> int:
         """Total number of active connections."""
@@ -128,63 +229,98 @@ class ConnectionIndex:
     # Query methods (no locks needed - read-only)
     # =========================================================================
 
+    def get_record(self, ws: "WebSocket") -> ConnectionRecord | None:
+        """Get the registry record of a WebSocket connection."""
+        return self._registry.get(ws)
+
     def get_user_id(self, ws: "WebSocket") -> int | None:
         """Get user ID for a WebSocket connection."""
-        return self._ws_to_user.get(ws)
+        record = self._registry.get(ws)
+        return None if record is None else record.user_id
 
     def get_branch_ids(self, ws: "WebSocket") -> list[int]:
         """Get branch IDs for a WebSocket connection."""
-        return self._ws_to_branches.get(ws, [])
+        record = self._registry.get(ws)
+        return [] if record is None else list(record.branch_ids)
 
     def get_sector_ids(self, ws: "WebSocket") -> list[int]:
         """Get sector IDs for a WebSocket connection."""
-        return self._ws_to_sectors.get(ws, [])
+        record = self._registry.get(ws)
+        return [] if record is None else list(record.sector_ids)
 
     def get_session_ids(self, ws: "WebSocket") -> set[int]:
         """Get session IDs for a WebSocket connection."""
-        return self._ws_to_sessions.get(ws, set())
+        record = self._registry.get(ws)
+        if record is None or record.session_ids is None:
+            return set()
+        return set(record.session_ids)
 
     def is_admin(self, ws: "WebSocket") -> bool:
         """Check if connection is admin/manager."""
-        return self._ws_is_admin.get(ws, False)
+        record = self._registry.get(ws)
+        return record is not None and record.is_admin
 
     def is_kitchen(self, ws: "WebSocket") -> bool:
         """Check if connection is kitchen staff."""
-        return self._ws_is_kitchen.get(ws, False)
-
+        record = self._registry.get(ws)
+        return record is not None and record.is_kitchen
 
     def get_tenant_id(self, ws: "WebSocket") -> int | None:
         """Get tenant ID for a WebSocket connection (multi-tenant isolation)."""
-        return self._ws_to_tenant.get(ws)
+        record = self._registry.get(ws)
+        return None if record is None else record.tenant_id
 
-    def get_connections_for_user(self, user_id: int) -> set["WebSocket"]:
+    def get_connections_for_user(
+        self, user_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get all connections for a user (returns copy for safety)."""
-        return set(self._by_user.get(user_id, set()))
+        return self._registry.websockets(
+            self._bucket(self._by_user, self._by_tenant_user, user_id, tenant_id)
+        )
 
-    def get_connections_for_branch(self, branch_id: int) -> set["WebSocket"]:
+    def get_connections_for_branch(
+        self, branch_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get all connections for a branch (returns copy for safety)."""
-        return set(self._by_branch.get(branch_id, set()))
+        return self._registry.websockets(
+            self._bucket(self._by_branch, self._by_tenant_branch, branch_id, tenant_id)
+        )
 
-    def get_connections_for_sector(self, sector_id: int) -> set["WebSocket"]:
+    def get_connections_for_sector(
+        self, sector_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get all connections for a sector (returns copy for safety)."""
-        return set(self._by_sector.get(sector_id, set()))
+        return self._registry.websockets(
+            self._bucket(self._by_sector, self._by_tenant_sector, sector_id, tenant_id)
+        )
 
-    def get_connections_for_session(self, session_id: int) -> set["WebSocket"]:
+    def get_connections_for_session(
+        self, session_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get all connections for a session (returns copy for safety)."""
-        return set(self._by_session.get(session_id, set()))
+        return self._registry.websockets(
+            self._bucket(self._by_session, self._by_tenant_session, session_id, tenant_id)
+        )
 
-    def get_admin_connections_for_branch(self, branch_id: int) -> set["WebSocket"]:
+    def get_admin_connections_for_branch(
+        self, branch_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get admin connections for a branch (returns copy for safety)."""
-        return set(self._admins_by_branch.get(branch_id, set()))
+        return self._registry.websockets(
+            self._bucket(self._admins_by_branch, self._admins_by_tenant_branch, branch_id, tenant_id)
+        )
 
-    def get_kitchen_connections_for_branch(self, branch_id: int) -> set["WebSocket"]:
+    def get_kitchen_connections_for_branch(
+        self, branch_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get kitchen connections for a branch (returns copy for safety)."""
-        return set(self._kitchen_by_branch.get(branch_id, set()))
-
+        return self._registry.websockets(
+            self._bucket(self._kitchen_by_branch, self._kitchen_by_tenant_branch, branch_id, tenant_id)
+        )
 
     def count_user_connections(self, user_id: int) -> int:
         """Count connections for a user."""
-        return len(self._by_user.get(user_id, set()))
+        return len(self._by_user.get(user_id, ()))
 
     # =========================================================================
     # Registration methods (require locks from caller)
@@ -205,9 +341,9 @@ class ConnectionIndex:
         is_admin: bool = False,
         is_kitchen: bool = False,
         tenant_id: int | None = None,
-    ) -> None:
+    ) -> ConnectionRecord:
         """
-        Register connection for a user with admin status and tenant.
+        Create the connection record and register it for a user.
         MUST be called with user_lock.
 
         Args:
@@ -216,193 +352,232 @@ class ConnectionIndex:
             is_admin: Whether this is an admin connection
             is_kitchen: Whether this is a kitchen connection
             tenant_id: Tenant ID for multi-tenant isolation
+
+        Returns:
+            The connection's record.
         """
-        if user_id not in self._by_user:
-            self._by_user[user_id] = set()
-        self._by_user[user_id].add(ws)
-        self._ws_to_user[ws] = user_id
-        self._ws_is_admin[ws] = is_admin
-        self._ws_is_kitchen[ws] = is_kitchen
-        if tenant_id is not None:
-            self._ws_to_tenant[ws] = tenant_id
-
-    def register_admin_status(self, ws: "WebSocket", is_admin: bool) -> None:
-        """Register admin status. MUST be called with user_lock."""
-        self._ws_is_admin[ws] = is_admin
-
-    def register_kitchen_status(self, ws: "WebSocket", is_kitchen: bool) -> None:
-        """Register kitchen status. MUST be called with user_lock."""
-        self._ws_is_kitchen[ws] = is_kitchen
-
-
-    def register_tenant(self, ws: "WebSocket", tenant_id: int) -> None:
-        """Register tenant ID for multi-tenant isolation. MUST be called with user_lock."""
-        self._ws_to_tenant[ws] = tenant_id
-
-    def register_branch(
-        self, ws: "WebSocket", branch_id: int, is_admin: bool = False, is_kitchen: bool = False
-    ) -> None:
+        record = self._registry.add(ws, user_id, tenant_id, is_admin, is_kitchen)
+        self._bucket_add(self._by_user, user_id, record.conn_id)
+        tenant_key = (record.tenant_id, user_id)
+        if tenant_key not in self._by_tenant_user:
+            self._users_by_tenant[record.tenant_id] = (
+                self._users_by_tenant.get(record.tenant_id, 0) + 1
+            )
+        self._bucket_add(self._by_tenant_user, tenant_key, record.conn_id)
+        return record
+
+    def register_branch(self, record: ConnectionRecord, branch_id: int) -> None:
         """
         Register connection for a branch. MUST be called with branch_lock.
 
         Args:
-            ws: WebSocket connection
+            record: Connection record (admin/kitchen flags are taken from it)
             branch_id: Branch ID
-            is_admin: Whether this is an admin connection
-            is_kitchen: Whether this is a kitchen connection
         """
-        if branch_id not in self._by_branch:
-            self._by_branch[branch_id] = set()
-        self._by_branch[branch_id].add(ws)
-
-        if is_admin:
-            if branch_id not in self._admins_by_branch:
-                self._admins_by_branch[branch_id] = set()
-            self._admins_by_branch[branch_id].add(ws)
-
-        if is_kitchen:
-            if branch_id not in self._kitchen_by_branch:
-                self._kitchen_by_branch[branch_id] = set()
-            self._kitchen_by_branch[branch_id].add(ws)
-
-
-    def set_branches(self, ws: "WebSocket", branch_ids: list[int]) -> None:
-        """Set branch IDs for reverse mapping. MUST be called with user_lock."""
-        self._ws_to_branches[ws] = branch_ids
-
-    def register_sector(self, ws: "WebSocket", sector_id: int) -> None:
-        """Register connection for a sector. MUST be called with sector_lock."""
-        if sector_id not in self._by_sector:
-            self._by_sector[sector_id] = set()
-        self._by_sector[sector_id].add(ws)
+        conn_id = record.conn_id
+        tenant_key = (record.tenant_id, branch_id)
+        self._index_add(self._by_branch, branch_id, conn_id, "branch")
+        self._bucket_add(self._by_tenant_branch, tenant_key, conn_id)
+        if branch_id not in record.branch_ids:
+            record.branch_ids.append(branch_id)
+
+        if record.is_admin:
+            if conn_id not in self._admins_by_branch.get(branch_id, _NO_CONNECTIONS):
+                self._admin_memberships += 1
+            self._bucket_add(self._admins_by_branch, branch_id, conn_id)
+            self._bucket_add(self._admins_by_tenant_branch, tenant_key, conn_id)
+
+        if record.is_kitchen:
+            self._bucket_add(self._kitchen_by_branch, branch_id, conn_id)
+            self._bucket_add(self._kitchen_by_tenant_branch, tenant_key, conn_id)
+
+    def register_session(self, record: ConnectionRecord, session_id: int) -> None:
+        """Register connection for a session. MUST be called with session_lock."""
+        self._index_add(self._by_session, session_id, record.conn_id, "session")
+        self._bucket_add(
+            self._by_tenant_session, (record.tenant_id, session_id), record.conn_id
+        )
 
-    def set_sectors(self, ws: "WebSocket", sector_ids: list[int]) -> None:
-        """Set sector IDs for reverse mapping. MUST be called with sector_lock."""
-        self._ws_to_sectors[ws] = sector_ids
+        if record.session_ids is None:
+            record.session_ids = set()
+        record.session_ids.add(session_id)
 
-    def register_session(self, ws: "WebSocket", session_id: int) -> None:
-        """Register connection for a session. MUST be called with session_lock."""
-        if session_id not in self._by_session:
-            self._by_session[session_id] = set()
-        self._by_session[session_id].add(ws)
+    def register_sectors(self, record: ConnectionRecord, sector_ids: list[int]) -> None:
+        """
+        Register connection for multiple sectors. MUST be called with sector_lock.
 
-        if ws not in self._ws_to_sessions:
-            self._ws_to_sessions[ws] = set()
-        self._ws_to_sessions[ws].add(session_id)
+        Args:
+            record: Connection record
+            sector_ids: List of sector IDs
+        """
+        record.sector_ids = list(sector_ids)
+        for sector_id in sector_ids:
+            self._index_add(self._by_sector, sector_id, record.conn_id, "sector")
+            self._bucket_add(
+                self._by_tenant_sector, (record.tenant_id, sector_id), record.conn_id
+            )
 
     # =========================================================================
     # Unregistration methods (require locks from caller)
     # =========================================================================
 
-    def unregister_user(self, ws: "WebSocket") -> int | None:
+    def unregister_user(self, record: ConnectionRecord) -> int:
         """
-        Unregister connection from user index and clean up related mappings.
-        MUST be called with user_lock.
+        Unregister connection from user index. MUST be called with user_lock.
 
-        Returns:
-            The user_id that was unregistered, or None if not found.
-        """
-        user_id = self._ws_to_user.pop(ws, None)
-        if user_id is not None and user_id in self._by_user:
-            self._by_user[user_id].discard(ws)
-            if not self._by_user[user_id]:
-                del self._by_user[user_id]
-        # Clean up admin status, kitchen status and tenant
-        self._ws_is_admin.pop(ws, None)
-        self._ws_is_kitchen.pop(ws, None)
-        self._ws_to_tenant.pop(ws, None)
-
-        return user_id
-
-    def unregister_admin_status(self, ws: "WebSocket") -> bool:
-        """
-        Unregister admin status. MUST be called with user_lock.
+        The record itself stays in the registry until the caller has removed
+        it from the branch/session/sector indices.
 
         Returns:
-            True if was admin, False otherwise.
+            The user_id that was unregistered.
         """
-        return self._ws_is_admin.pop(ws, False)
+        self._bucket_discard(self._by_user, record.user_id, record.conn_id)
+        tenant_key = (record.tenant_id, record.user_id)
+        had_user = tenant_key in self._by_tenant_user
+        self._bucket_discard(self._by_tenant_user, tenant_key, record.conn_id)
+        if had_user and tenant_key not in self._by_tenant_user:
+            remaining = self._users_by_tenant.get(record.tenant_id, 1) - 1
+            if remaining > 0:
+                self._users_by_tenant[record.tenant_id] = remaining
+            else:
+                self._users_by_tenant.pop(record.tenant_id, None)
+        return record.user_id
+
+    def unregister_branch(self, record: ConnectionRecord, branch_id: int) -> None:
+        """Unregister connection from branch. MUST be called with branch_lock."""
+        conn_id = record.conn_id
+        tenant_key = (record.tenant_id, branch_id)
+        self._index_discard(self._by_branch, branch_id, conn_id, "branch")
+        self._bucket_discard(self._by_tenant_branch, tenant_key, conn_id)
+
+        if record.is_admin:
+            if conn_id in self._admins_by_branch.get(branch_id, _NO_CONNECTIONS):
+                self._admin_memberships -= 1
+            self._bucket_discard(self._admins_by_branch, branch_id, conn_id)
+            self._bucket_discard(self._admins_by_tenant_branch, tenant_key, conn_id)
+
+        if record.is_kitchen:
+            self._bucket_discard(self._kitchen_by_branch, branch_id, conn_id)
+            self._bucket_discard(self._kitchen_by_tenant_branch, tenant_key, conn_id)
+
+    def unregister_session(self, record: ConnectionRecord, session_id: int) -> None:
+        """Unregister connection from session. MUST be called with session_lock."""
+        self._index_discard(self._by_session, session_id, record.conn_id, "session")
+        self._bucket_discard(
+            self._by_tenant_session, (record.tenant_id, session_id), record.conn_id
+        )
 
-    def unregister_kitchen_status(self, ws: "WebSocket") -> bool:
-        """
-        Unregister kitchen status. MUST be called with user_lock.
+        if record.session_ids is not None:
+            record.session_ids.discard(session_id)
 
-        Returns:
-            True if was kitchen, False otherwise.
+    def unregister_sectors(self, record: ConnectionRecord) -> None:
         """
-        return self._ws_is_kitchen.pop(ws, False)
+        Unregister connection from all its sectors. MUST be called with sector_lock.
 
+        Args:
+            record: Connection record
+        """
+        self._discard_sectors(record)
+        record.sector_ids = []
 
-    def unregister_tenant(self, ws: "WebSocket") -> int | None:
-        """Unregister tenant. MUST be called with user_lock."""
-        return self._ws_to_tenant.pop(ws, None)
+    def update_sectors(self, record: ConnectionRecord, new_sector_ids: list[int]) -> None:
+        """
+        Update sector assignments for a connection. MUST be called with sector_lock.
 
-    def unregister_branch(
-        self, ws: "WebSocket", branch_id: int, is_admin: bool = False, is_kitchen: bool = False
-    ) -> None:
-        """Unregister connection from branch. MUST be called with branch_lock."""
-        if branch_id in self._by_branch:
-            self._by_branch[branch_id].discard(ws)
-            if not self._by_branch[branch_id]:
-                del self._by_branch[branch_id]
-
-        if is_admin and branch_id in self._admins_by_branch:
-            self._admins_by_branch[branch_id].discard(ws)
-            if not self._admins_by_branch[branch_id]:
-                del self._admins_by_branch[branch_id]
-
-        if is_kitchen and branch_id in self._kitchen_by_branch:
-            self._kitchen_by_branch[branch_id].discard(ws)
-            if not self._kitchen_by_branch[branch_id]:
-                del self._kitchen_by_branch[branch_id]
-
-
-    def pop_branches(self, ws: "WebSocket") -> list[int]:
-        """Remove and return branch IDs for reverse mapping. MUST be called with user_lock."""
-        return self._ws_to_branches.pop(ws, [])
-
-    def unregister_sector(self, ws: "WebSocket", sector_id: int) -> None:
-        """Unregister connection from sector. MUST be called with sector_lock."""
-        if sector_id in self._by_sector:
-            self._by_sector[sector_id].discard(ws)
-            if not self._by_sector[sector_id]:
-                del self._by_sector[sector_id]
-
-    def pop_sectors(self, ws: "WebSocket") -> list[int]:
-        """Remove and return sector IDs for reverse mapping. MUST be called with sector_lock."""
-        return self._ws_to_sectors.pop(ws, [])
-
-    def clear_sectors(self, ws: "WebSocket") -> None:
-        """Clear sector IDs for a connection. MUST be called with sector_lock."""
-        self._ws_to_sectors[ws] = []
-
-    def unregister_session(self, ws: "WebSocket", session_id: int) -> None:
-        """Unregister connection from session. MUST be called with session_lock."""
-        if session_id in self._by_session:
-            self._by_session[session_id].discard(ws)
-            if not self._by_session[session_id]:
-                del self._by_session[session_id]
+        Args:
+            record: Connection record
+            new_sector_ids: New list of sector IDs
+        """
+        # Remove from old sectors
+        self._discard_sectors(record)
 
-        if ws in self._ws_to_sessions:
-            self._ws_to_sessions[ws].discard(session_id)
+        # Add to new sectors
+        self.register_sectors(record, new_sector_ids)
 
-    def pop_sessions(self, ws: "WebSocket") -> set[int]:
-        """Remove and return session IDs for reverse mapping. MUST be called with session_lock."""
-        return self._ws_to_sessions.pop(ws, set())
+    def _discard_sectors(self, record: ConnectionRecord) -> None:
+        """Remove a connection from the indices of all its current sectors."""
+        for sector_id in record.sector_ids:
+            self._index_discard(self._by_sector, sector_id, record.conn_id, "sector")
+            self._bucket_discard(
+                self._by_tenant_sector, (record.tenant_id, sector_id), record.conn_id
+            )
 
     # =========================================================================
     # Utility methods
     # =========================================================================
 
+    def has_local_interest(self, branch_id: int | None, session_id: int | None) -> bool:
+        """
+        Check if any local connection could receive an event for these IDs.
+
+        SCALE-MULTI-01: Used by multi-instance gateways to skip routing events
+        for branches/sessions connected to other replicas. O(1) dict lookups;
+        diners register by branch as well, so branch covers most events.
+        """
+        if branch_id is not None and branch_id in self._by_branch:
+            return True
+        return session_id is not None and session_id in self._by_session
+
+    @staticmethod
+    def record_in_audience(
+        record: ConnectionRecord,
+        audience: str,
+        key: int | list[int],
+        tenant_id: int | None = None,
+    ) -> bool:
+        """
+        Check if a connection belongs to an audience, without the buckets.
+
+        PERF-REPLAY-01: Used to filter replayed events for one connection;
+        mirrors the get_*_connections queries of each audience.
+
+        Args:
+            record: Connection record.
+            audience: Audience name as in send_to_audiences().
+            key: User, branch, session or sector ID (list of IDs for "sectors").
+            tenant_id: Tenant of the event (None = any tenant).
+
+        Returns:
+            True if a send to (audience, key) would reach the connection.
+        """
+        if tenant_id is not None and record.tenant_id != tenant_id:
+            return False
+        if audience == "user":
+            return record.user_id == key
+        if audience == "session":
+            return record.session_ids is not None and key in record.session_ids
+        if audience == "sector":
+            return key in record.sector_ids
+        if audience == "sectors":
+            return any(sector_id in record.sector_ids for sector_id in key)
+        if key not in record.branch_ids:
+            return False
+        if audience == "branch":
+            return True
+        if audience == "admins":
+            return record.is_admin
+        if audience == "waiters":
+            return not record.is_admin and not record.is_kitchen
+        if audience == "kitchen":
+            return record.is_kitchen and not record.is_admin
+        raise ValueError(f"Unknown audience: {audience}")
+
     def get_stats(self) -> dict:
-        """Get index statistics for monitoring."""
+        """
+        Get index statistics for monitoring.
+
+        PERF-PROM-01: O(1); admin and tenant counts are maintained on
+        register/unregister instead of walking the indices per scrape.
+        """
         return {
             "total_connections": self._total_connections,
+            "registered_connections": len(self._registry),
             "users_count": len(self._by_user),
             "branches_count": len(self._by_branch),
             "sectors_count": len(self._by_sector),
             "sessions_count": len(self._by_session),
-            "admin_connections": sum(len(admins) for admins in self._admins_by_branch.values()),
+            "admin_connections": self._admin_memberships,
+            "tenants_count": len(self._users_by_tenant),
         }
 
     def filter_by_tenant(
@@ -411,6 +586,9 @@ class ConnectionIndex:
         """
         Filter connections by tenant ID for multi-tenant isolation.
 
+        PERF-TENANT-01: The send paths no longer need this; pass tenant_id
+        to the get_*_connections queries instead.
+
         Args:
             connections: List or set of WebSocket connections to filter
             tenant_id: Tenant ID to filter by (None = no filtering)
@@ -421,9 +599,13 @@ class ConnectionIndex:
         if tenant_id is None:
             return list(connections)
 
-        return [
-            ws for ws in connections if self._ws_to_tenant.get(ws) == tenant_id
-        ]
+        get = self._registry.get
+        result = []
+        for ws in connections:
+            record = get(ws)
+            if record is not None and record.tenant_id == tenant_id:
+                result.append(ws)
+        return result
 
     def filter_non_admin(self, connections: set["WebSocket"]) -> list["WebSocket"]:
         """
@@ -435,58 +617,87 @@ class ConnectionIndex:
         Returns:
             List of non-admin connections
         """
-        return [ws for ws in connections if not self._ws_is_admin.get(ws, False)]
+        return [ws for ws in connections if not self.is_admin(ws)]
 
     # =========================================================================
     # Convenience methods for ConnectionManager (ARCH-AUDIT-01)
     # =========================================================================
 
-    def get_user_connections(self, user_id: int) -> set["WebSocket"]:
+    def get_user_connections(
+        self, user_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get all connections for a user (alias for get_connections_for_user)."""
-        return self.get_connections_for_user(user_id)
+        return self.get_connections_for_user(user_id, tenant_id)
 
-    def get_branch_connections(self, branch_id: int) -> set["WebSocket"]:
+    def get_branch_connections(
+        self, branch_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get all connections for a branch (alias for get_connections_for_branch)."""
-        return self.get_connections_for_branch(branch_id)
+        return self.get_connections_for_branch(branch_id, tenant_id)
 
-    def get_session_connections(self, session_id: int) -> set["WebSocket"]:
+    def get_session_connections(
+        self, session_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get all connections for a session (alias for get_connections_for_session)."""
-        return self.get_connections_for_session(session_id)
+        return self.get_connections_for_session(session_id, tenant_id)
 
-    def get_sector_connections(self, sector_id: int) -> set["WebSocket"]:
+    def get_sector_connections(
+        self, sector_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get all connections for a sector (alias for get_connections_for_sector)."""
-        return self.get_connections_for_sector(sector_id)
+        return self.get_connections_for_sector(sector_id, tenant_id)
 
-    def get_admin_connections(self, branch_id: int) -> set["WebSocket"]:
+    def get_admin_connections(
+        self, branch_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get admin connections for a branch (alias for get_admin_connections_for_branch)."""
-        return self.get_admin_connections_for_branch(branch_id)
+        return self.get_admin_connections_for_branch(branch_id, tenant_id)
 
-    def get_kitchen_connections(self, branch_id: int) -> set["WebSocket"]:
+    def get_kitchen_connections(
+        self, branch_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get kitchen connections for a branch (alias for get_kitchen_connections_for_branch)."""
-        return self.get_kitchen_connections_for_branch(branch_id)
+        return self.get_kitchen_connections_for_branch(branch_id, tenant_id)
 
-    def get_waiter_connections(self, branch_id: int) -> set["WebSocket"]:
+    def get_waiter_connections(
+        self, branch_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get non-admin, non-kitchen connections for a branch (waiters)."""
-
-        all_branch = self._by_branch.get(branch_id, set())
-        admins = self._admins_by_branch.get(branch_id, set())
-        kitchen = self._kitchen_by_branch.get(branch_id, set())
-        return set(all_branch - admins - kitchen)
-
-
-    def get_sectors_connections(self, sector_ids: list[int]) -> set["WebSocket"]:
+        all_branch = self._bucket(self._by_branch, self._by_tenant_branch, branch_id, tenant_id)
+        admins = self._bucket(
+            self._admins_by_branch, self._admins_by_tenant_branch, branch_id, tenant_id
+        )
+        kitchen = self._bucket(
+            self._kitchen_by_branch, self._kitchen_by_tenant_branch, branch_id, tenant_id
+        )
+        return self._registry.websockets(all_branch - admins - kitchen)
+
+    def get_kitchen_staff_connections(
+        self, branch_id: int, tenant_id: int | None = None
+    ) -> set["WebSocket"]:
+        """Get kitchen connections for a branch, excluding admins (they get admin events)."""
+        kitchen = self._bucket(
+            self._kitchen_by_branch, self._kitchen_by_tenant_branch, branch_id, tenant_id
+        )
+        admins = self._bucket(
+            self._admins_by_branch, self._admins_by_tenant_branch, branch_id, tenant_id
+        )
+        return self._registry.websockets(kitchen - admins)
+
+    def get_sectors_connections(
+        self, sector_ids: list[int], tenant_id: int | None = None
+    ) -> set["WebSocket"]:
         """Get all connections assigned to any of the given sectors."""
-        result: set["WebSocket"] = set()
+        conn_ids: set[int] = set()
         for sector_id in sector_ids:
-            result.update(self._by_sector.get(sector_id, set()))
-        return result
+            conn_ids.update(
+                self._bucket(self._by_sector, self._by_tenant_sector, sector_id, tenant_id)
+            )
+        return self._registry.websockets(conn_ids)
 
     def get_all_connections(self) -> set["WebSocket"]:
         """Get all registered connections."""
-        all_connections: set["WebSocket"] = set()
-        for connections in self._by_user.values():
-            all_connections.update(connections)
-        return all_connections
+        return {record.ws for record in self._registry.records()}
 
     def get_active_branch_ids(self) -> set[int]:
         """Get set of branch IDs with active connections."""
@@ -495,55 +706,3 @@ class ConnectionIndex:
     def get_active_user_ids(self) -> set[int]:
         """Get set of user IDs with active connections."""
         return set(self._by_user.keys())
-
-    def register_sectors(self, ws: "WebSocket", sector_ids: list[int]) -> None:
-        """
-        Register connection for multiple sectors. MUST be called with sector_lock.
-
-        Args:
-            ws: WebSocket connection
-            sector_ids: List of sector IDs
-        """
-        self._ws_to_sectors[ws] = sector_ids
-        for sector_id in sector_ids:
-            if sector_id not in self._by_sector:
-                self._by_sector[sector_id] = set()
-            self._by_sector[sector_id].add(ws)
-
-    def unregister_sectors(self, ws: "WebSocket", sector_ids: list[int]) -> None:
-        """
-        Unregister connection from multiple sectors. MUST be called with sector_lock.
-
-        Args:
-            ws: WebSocket connection
-            sector_ids: List of sector IDs to unregister from
-        """
-        self._ws_to_sectors.pop(ws, None)
-        for sector_id in sector_ids:
-            if sector_id in self._by_sector:
-                self._by_sector[sector_id].discard(ws)
-                if not self._by_sector[sector_id]:
-                    del self._by_sector[sector_id]
-
-    def update_sectors(self, ws: "WebSocket", new_sector_ids: list[int]) -> None:
-        """
-        Update sector assignments for a connection. MUST be called with sector_lock.
-
-        Args:
-            ws: WebSocket connection
-            new_sector_ids: New list of sector IDs
-        """
-        # Remove from old sectors
-        old_sector_ids = self._ws_to_sectors.get(ws, [])
-        for sector_id in old_sector_ids:
-            if sector_id in self._by_sector:
-                self._by_sector[sector_id].discard(ws)
-                if not self._by_sector[sector_id]:
-                    del self._by_sector[sector_id]
-
-        # Add to new sectors
-        self._ws_to_sectors[ws] = new_sector_ids
-        for sector_id in new_sector_ids:
-            if sector_id not in self._by_sector:
-                self._by_sector[sector_id] = set()
-            self._by_sector[sector_id].add(ws)
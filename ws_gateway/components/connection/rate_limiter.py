@@ -1,35 +1,53 @@
 """
 WebSocket Rate Limiter.
 
-Per-connection rate limiting using sliding window counter algorithm.
+Per-connection rate limiting using GCRA (token bucket).
 Prevents message flooding and DoS attacks.
 
 ARCH-01 FIX: Extracted from ConnectionManager (Single Responsibility).
+PERF-REGISTRY-01: Per-connection state lives on ConnectionRecord.
+PERF-RATELIMIT-01: O(1) GCRA state instead of per-message timestamp lists.
 """
 
 from __future__ import annotations
 
-import asyncio
+import heapq
 import logging
+import math
 import time
 from typing import TYPE_CHECKING
 
 from ws_gateway.components.core.constants import WSConstants
+from ws_gateway.components.connection.registry import ConnectionRecord, ConnectionRegistry
 
 if TYPE_CHECKING:
     from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+# Absorbs float rounding so exactly max_messages fit in a burst
+_GCRA_TOLERANCE = 1e-9
+
 
 class WebSocketRateLimiter:
     """
     Per-connection rate limiter for WebSocket messages.
 
-    Uses a sliding window counter algorithm:
-    - Each connection has a list of message timestamps
-    - Timestamps outside the window are removed
-    - If timestamps within window exceed limit, message is rejected
+    PERF-RATELIMIT-01: Uses GCRA (generic cell rate algorithm), a token
+    bucket kept as a single float per connection, the theoretical arrival
+    time (TAT):
+    - Each message advances TAT by one emission interval (window / limit)
+    - A message is rejected if it would push TAT more than one window
+      ahead of now, so at most max_messages fit in any window and bursts
+      of up to max_messages are allowed
+    - O(1) time and memory per message, no per-message timestamps
+
+    The check has no await, so it is atomic on the event loop and needs no
+    lock; inbound messages of different sockets are never serialized.
+
+    PERF-REGISTRY-01: The TAT lives on the connection's ConnectionRecord
+    (rate_tat); messages from connections that are not registered (already
+    disconnected) are rejected.
 
     Memory bounded by MAX_TRACKED_CONNECTIONS to prevent leaks.
 
@@ -41,6 +59,7 @@ class WebSocketRateLimiter:
         max_messages: int,
         window_seconds: int,
         max_tracked: int = WSConstants.MAX_TRACKED_CONNECTIONS,
+        registry: ConnectionRegistry | None = None,
     ):
         """
         Initialize the rate limiter.
@@ -49,20 +68,27 @@ class WebSocketRateLimiter:
             max_messages: Maximum messages allowed per window.
             window_seconds: Window size in seconds.
             max_tracked: Maximum connections to track (memory bound).
+            registry: Registry holding the connection records (created if not given).
         """
         self._max_messages = max_messages
         self._window_seconds = window_seconds
         self._max_tracked = max_tracked
+        self._registry = registry if registry is not None else ConnectionRegistry()
 
-        self._counters: dict[WebSocket, list[float]] = {}
-        self._lock = asyncio.Lock()
+        # PERF-RATELIMIT-01: Each allowed message costs one emission interval;
+        # a TAT at most one window ahead of now is allowed
+        self._emission_interval = window_seconds / max(1, max_messages)
+        self._max_backlog = window_seconds + _GCRA_TOLERANCE
+
+        # Records with rate_tat set (kept in sync by this class)
+        self._tracked = 0
         self._overflow_warning_logged = False
 
         # HIGH-AUD-03 FIX: Track evicted connections to prevent rate limit reset
-        # When a connection is evicted, it's added here with its timestamp count
+        # When a connection is evicted, it's added here with its message count
         # If it tries to reconnect, it inherits the penalty
         # CRIT-06 FIX: Store (message_count, eviction_timestamp) to support TTL expiration
-        self._evicted_penalty: dict[int, tuple[int, float]] = {}  # id(ws) -> (message_count, eviction_time)
+        self._evicted_penalty: dict[int, tuple[int, float]] = {}  # conn_id -> (message_count, eviction_time)
         self._max_evicted_penalty_entries = max_tracked // 10  # 10% of max tracked
         self._penalty_ttl_seconds = 3600.0  # CRIT-06 FIX: Penalties expire after 1 hour
 
@@ -84,112 +110,119 @@ class WebSocketRateLimiter:
     @property
     def tracked_count(self) -> int:
         """Number of connections currently being tracked."""
-        return len(self._counters)
+        return self._tracked
+
+    def _untrack(self, record: ConnectionRecord) -> None:
+        """Drop rate state of a record."""
+        if record.rate_tat is not None:
+            record.rate_tat = None
+            self._tracked -= 1
+
+    def _messages_in_window(self, tat: float | None, now: float) -> int:
+        """Messages still counted against the connection at `now`."""
+        if tat is None or tat <= now:
+            return 0
+        return min(self._max_messages, math.ceil((tat - now) / self._emission_interval))
 
     async def is_allowed(self, ws: WebSocket) -> bool:
         """
         Check if a message from this connection is allowed.
 
-        Thread-safe implementation using asyncio lock.
+        PERF-RATELIMIT-01: O(1), no lock (no await between read and update).
 
         Args:
             ws: The WebSocket connection sending the message.
 
         Returns:
-            True if message is allowed, False if rate limited.
+            True if message is allowed, False if rate limited or not registered.
         """
+        record = self._registry.get(ws)
+        if record is None:
+            return False
+
         now = time.time()
-        window_start = now - self._window_seconds
-
-        async with self._lock:
-            ws_id = id(ws)
-
-            # Handle new connections with capacity check
-            if ws not in self._counters:
-                if len(self._counters) >= self._max_tracked:
-                    await self._evict_oldest_entries()
-
-                # HIGH-AUD-03 FIX: Check for eviction penalty
-                # CRIT-06 FIX: Check TTL on penalty entries before applying
-                penalty_entry = self._evicted_penalty.pop(ws_id, None)
-                if penalty_entry is not None:
-                    penalty_count, eviction_time = penalty_entry
-                    # Only apply penalty if within TTL
-                    if now - eviction_time < self._penalty_ttl_seconds and penalty_count > 0:
-                        # MED-WS-14 FIX: Start penalty timestamps INSIDE the window
-                        # Use (i+1) to ensure first timestamp is > window_start
-                        # This ensures all penalty timestamps survive the filter
-                        penalty_count_capped = min(penalty_count, self._max_messages)
-                        penalty_timestamps = [
-                            window_start + ((i + 1) * self._window_seconds / (penalty_count_capped + 1))
-                            for i in range(penalty_count_capped)
-                        ]
-                        self._counters[ws] = penalty_timestamps
-                        logger.debug(
-                            "Connection reappeared after eviction, applying penalty",
-                            ws_id=ws_id,
-                            penalty_messages=len(penalty_timestamps),
-                            penalty_age_seconds=round(now - eviction_time, 1),
-                        )
-                    else:
-                        # Penalty expired, start fresh
-                        self._counters[ws] = []
-                        if penalty_count > 0:
-                            logger.debug(
-                                "Penalty expired for evicted connection",
-                                ws_id=ws_id,
-                                penalty_age_seconds=round(now - eviction_time, 1),
-                            )
-                else:
-                    self._counters[ws] = []
-
-            # Remove timestamps outside the window
-            timestamps = self._counters[ws]
-            self._counters[ws] = [t for t in timestamps if t > window_start]
-
-            # Check if under limit
-            if len(self._counters[ws]) >= self._max_messages:
-                self._total_rejected += 1
-                return False
-
-            # Record this message
-            self._counters[ws].append(now)
-            self._total_allowed += 1
-            return True
-
-    async def _evict_oldest_entries(self) -> None:
+        tat = record.rate_tat
+
+        # Handle new connections with capacity check
+        if tat is None:
+            if self._tracked >= self._max_tracked:
+                self._evict_oldest_entries()
+            tat = self._initial_tat(record.conn_id, now)
+            self._tracked += 1
+
+        new_tat = max(tat, now) + self._emission_interval
+        if new_tat - now > self._max_backlog:
+            record.rate_tat = tat
+            self._total_rejected += 1
+            return False
+
+        record.rate_tat = new_tat
+        self._total_allowed += 1
+        return True
+
+    def _initial_tat(self, conn_id: int, now: float) -> float:
+        """Starting TAT for a newly tracked connection (with eviction penalty)."""
+        # HIGH-AUD-03 FIX: Check for eviction penalty
+        # CRIT-06 FIX: Check TTL on penalty entries before applying
+        penalty_entry = self._evicted_penalty.pop(conn_id, None)
+        if penalty_entry is None:
+            return now
+
+        penalty_count, eviction_time = penalty_entry
+        # Only apply penalty if within TTL
+        if now - eviction_time < self._penalty_ttl_seconds and penalty_count > 0:
+            # Start with the evicted message count already in the window;
+            # it drains at the normal rate
+            penalty_count_capped = min(penalty_count, self._max_messages)
+            logger.debug(
+                "Connection reappeared after eviction, applying penalty",
+                conn_id=conn_id,
+                penalty_messages=penalty_count_capped,
+                penalty_age_seconds=round(now - eviction_time, 1),
+            )
+            return now + penalty_count_capped * self._emission_interval
+
+        # Penalty expired, start fresh
+        if penalty_count > 0:
+            logger.debug(
+                "Penalty expired for evicted connection",
+                conn_id=conn_id,
+                penalty_age_seconds=round(now - eviction_time, 1),
+            )
+        return now
+
+    def _evict_oldest_entries(self) -> None:
         """
         Evict oldest entries when at capacity.
 
-        Removes EVICTION_PERCENTAGE of entries to make room.
+        Removes EVICTION_PERCENTAGE of entries to make room, starting with
+        the connections that have been idle longest (lowest TAT).
         """
         if not self._overflow_warning_logged:
             logger.warning(
                 "Rate limiter at capacity, evicting oldest entries",
                 max_tracked=self._max_tracked,
-                current_tracked=len(self._counters),
+                current_tracked=self._tracked,
             )
             self._overflow_warning_logged = True
 
         # Remove percentage of oldest entries
-        # DEF-01 FIX: Sort by oldest timestamp to evict truly oldest connections
+        # DEF-01 FIX: Evict the least recently active connections
         entries_to_remove = max(1, self._max_tracked * WSConstants.EVICTION_PERCENTAGE // 100)
-
-        # Sort connections by their oldest timestamp (or 0 if empty)
-        sorted_connections = sorted(
-            self._counters.items(),
-            key=lambda x: min(x[1]) if x[1] else 0,
+        oldest_records = heapq.nsmallest(
+            entries_to_remove,
+            (r for r in self._registry.records() if r.rate_tat is not None),
+            key=lambda r: r.rate_tat,
         )
 
-        for i in range(min(entries_to_remove, len(sorted_connections))):
-            ws, timestamps = sorted_connections[i]
-            ws_id = id(ws)
+        now = time.time()
+        for record in oldest_records:
+            message_count = self._messages_in_window(record.rate_tat, now)
 
             # HIGH-AUD-03 FIX: Record penalty for evicted connections
             # So they can't reset their rate limit by forcing eviction
             # CRIT-06 FIX: Store timestamp with penalty for TTL-based expiration
-            if timestamps:
-                now = time.time()
+            if message_count:
 
                 # CRIT-06 FIX: Clean up expired penalty entries by TTL, not arbitrary halving
                 if len(self._evicted_penalty) >= self._max_evicted_penalty_entries:
@@ -210,9 +243,9 @@ class WebSocketRateLimiter:
                         for key in keys_to_remove:
                             del self._evicted_penalty[key]
 
-                self._evicted_penalty[ws_id] = (len(timestamps), now)
+                self._evicted_penalty[record.conn_id] = (message_count, now)
 
-            del self._counters[ws]
+            self._untrack(record)
             self._evictions += 1
 
     async def remove_connection(self, ws: WebSocket) -> None:
@@ -224,12 +257,13 @@ class WebSocketRateLimiter:
         Args:
             ws: The WebSocket connection to remove.
         """
-        async with self._lock:
-            self._counters.pop(ws, None)
+        record = self._registry.get(ws)
+        if record is not None:
+            self._untrack(record)
 
     async def cleanup_stale(self) -> int:
         """
-        Remove entries with no recent timestamps.
+        Remove entries whose bucket has fully refilled.
 
         CRIT-WS-03 FIX: More aggressive cleanup for disconnected WebSockets.
         HIGH-WS-04 FIX: Separated identification and removal phases.
@@ -238,85 +272,62 @@ class WebSocketRateLimiter:
             Number of entries cleaned up.
         """
         now = time.time()
-        window_start = now - self._window_seconds
         cleaned = 0
 
-        async with self._lock:
-            # HIGH-WS-04 FIX: Phase 1 - Identify entries to clean (no modification)
-            # LOW-DEEP-04 FIX: Added explicit type annotations for clarity
-            to_remove: list[WebSocket] = []
-            to_update: dict[WebSocket, list[float]] = {}
-
-            for ws, timestamps in self._counters.items():
-                # Filter timestamps within window
-                valid_timestamps = [t for t in timestamps if t > window_start]
+        # PERF-RATELIMIT-01: No await below, so no lock is needed
+        tracked = [r for r in self._registry.records() if r.rate_tat is not None]
 
-                if not valid_timestamps:
-                    to_remove.append(ws)
-                elif len(valid_timestamps) != len(timestamps):
-                    to_update[ws] = valid_timestamps
-
-            # HIGH-WS-04 FIX: Phase 2 - Apply changes
-            for ws in to_remove:
-                del self._counters[ws]
+        for record in tracked:
+            # Bucket fully refilled: nothing left to remember
+            if record.rate_tat <= now:
+                self._untrack(record)
                 cleaned += 1
-
-            for ws, timestamps in to_update.items():
-                self._counters[ws] = timestamps
+                continue
 
             # CRIT-WS-03 FIX: Also clean up entries where WebSocket appears closed
             # CRIT-NEW-02 FIX: Safer WebSocket state check with defensive coding
-            # Check for WebSockets that may have been disconnected
-            additional_cleanup = []
-            for ws in list(self._counters.keys()):  # Copy keys to avoid modification during iteration
-                try:
-                    # Check if WebSocket is still valid by accessing a property
-                    # If the WebSocket is garbage collected or closed, this may fail
-                    client_state = getattr(ws, 'client_state', None)
-                    if client_state is not None:
-                        from starlette.websockets import WebSocketState
-                        if client_state != WebSocketState.CONNECTED:
-                            additional_cleanup.append(ws)
-                except (AttributeError, ReferenceError, RuntimeError):
-                    # CRIT-NEW-02 FIX: Handle garbage collected or invalidated references
-                    # ReferenceError: weak reference is dead
-                    # RuntimeError: event loop issues
-                    additional_cleanup.append(ws)
-                except Exception as e:
-                    # Log unexpected exceptions but still clean up
-                    logger.debug("Unexpected error checking WebSocket state", error=str(e))
-                    additional_cleanup.append(ws)
-
-            for ws in additional_cleanup:
-                if ws in self._counters:
-                    del self._counters[ws]
-                    cleaned += 1
-
-            # Reset overflow warning if below threshold
-            if len(self._counters) < self._max_tracked * 0.9:
-                self._overflow_warning_logged = False
-
-            # HIGH-WS-12 FIX: Also clean up expired penalty entries
-            # This ensures penalty dict doesn't grow unbounded even without evictions
-            expired_penalties = [
-                ws_id for ws_id, (_, evict_time) in self._evicted_penalty.items()
-                if now - evict_time > self._penalty_ttl_seconds
-            ]
-            for ws_id in expired_penalties:
-                del self._evicted_penalty[ws_id]
-            if expired_penalties:
-                logger.debug(
-                    "Cleaned up expired eviction penalties",
-                    count=len(expired_penalties),
-                    remaining=len(self._evicted_penalty),
-                )
+            try:
+                client_state = getattr(record.ws, 'client_state', None)
+                if client_state is not None:
+                    from starlette.websockets import WebSocketState
+                    if client_state != WebSocketState.CONNECTED:
+                        self._untrack(record)
+                        cleaned += 1
+            except (AttributeError, ReferenceError, RuntimeError):
+                # CRIT-NEW-02 FIX: Handle garbage collected or invalidated references
+                self._untrack(record)
+                cleaned += 1
+            except Exception as e:
+                # Log unexpected exceptions but still clean up
+                logger.debug("Unexpected error checking WebSocket state", error=str(e))
+                self._untrack(record)
+                cleaned += 1
+
+        # Reset overflow warning if below threshold
+        if self._tracked < self._max_tracked * 0.9:
+            self._overflow_warning_logged = False
+
+        # HIGH-WS-12 FIX: Also clean up expired penalty entries
+        # This ensures penalty dict doesn't grow unbounded even without evictions
+        expired_penalties = [
+            conn_id for conn_id, (_, evict_time) in self._evicted_penalty.items()
+            if now - evict_time > self._penalty_ttl_seconds
+        ]
+        for conn_id in expired_penalties:
+            del self._evicted_penalty[conn_id]
+        if expired_penalties:
+            logger.debug(
+                "Cleaned up expired eviction penalties",
+                count=len(expired_penalties),
+                remaining=len(self._evicted_penalty),
+            )
 
         return cleaned
 
     def get_stats(self) -> dict[str, int | float]:
         """Get rate limiter statistics."""
         return {
-            "tracked_connections": len(self._counters),
+            "tracked_connections": self._tracked,
             "max_tracked": self._max_tracked,
             "max_messages_per_window": self._max_messages,
             "window_seconds": self._window_seconds,
@@ -339,10 +350,10 @@ class WebSocketRateLimiter:
         Returns:
             Dict with current message count and percentage used.
         """
-        timestamps = self._counters.get(ws, [])
-        now = time.time()
-        window_start = now - self._window_seconds
-        current_count = sum(1 for t in timestamps if t > window_start)
+        record = self._registry.get(ws)
+        current_count = self._messages_in_window(
+            record.rate_tat if record is not None else None, time.time()
+        )
 
         return {
             "messages_in_window": current_count,
@@ -0,0 +1,168 @@
+"""
+Connection Registry - One compact record per WebSocket connection.
+
+PERF-REGISTRY-01: Replaces the WebSocket-keyed reverse maps of
+ConnectionIndex (user, branches, sessions, sectors, admin, kitchen,
+tenant) and the per-WebSocket dicts of HeartbeatTracker and
+WebSocketRateLimiter with a single __slots__ record per socket.
+
+Indices store integer connection ids; a disconnect is one lookup of the
+record, which already lists everything that has to be unregistered.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionRecord:
+    """
+    All per-connection state of the gateway.
+
+    Owned by ConnectionRegistry. Role and membership fields are written by
+    ConnectionIndex, last_heartbeat by HeartbeatTracker and rate_tat by
+    WebSocketRateLimiter.
+    """
+
+    __slots__ = (
+        "conn_id",
+        "ws",
+        "user_id",
+        "tenant_id",
+        "is_admin",
+        "is_kitchen",
+        "branch_ids",
+        "sector_ids",
+        "session_ids",
+        "last_heartbeat",
+        "heartbeat_slot",
+        "rate_tat",
+    )
+
+    def __init__(
+        self,
+        conn_id: int,
+        ws: "WebSocket",
+        user_id: int,
+        tenant_id: int | None = None,
+        is_admin: bool = False,
+        is_kitchen: bool = False,
+    ) -> None:
+        self.conn_id = conn_id
+        self.ws = ws
+        self.user_id = user_id
+        self.tenant_id = tenant_id
+        self.is_admin = is_admin
+        self.is_kitchen = is_kitchen
+        self.branch_ids: list[int] = []
+        self.sector_ids: list[int] = []
+        # Most connections never join a session (staff); allocate lazily
+        self.session_ids: set[int] | None = None
+        # HeartbeatTracker state (None = not tracked)
+        self.last_heartbeat: float | None = None
+        # HeartbeatTracker timing wheel slot (None = not in the wheel)
+        self.heartbeat_slot: int | None = None
+        # WebSocketRateLimiter GCRA theoretical arrival time (None = not tracked)
+        self.rate_tat: float | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"ConnectionRecord(conn_id={self.conn_id}, user_id={self.user_id}, "
+            f"tenant_id={self.tenant_id})"
+        )
+
+
+class ConnectionRegistry:
+    """
+    Owns the ConnectionRecord of every registered connection.
+
+    Lookups:
+    - get(ws): WebSocket -> record (the only WebSocket-keyed map)
+    - get_by_id(conn_id): connection id -> record
+
+    Thread Safety:
+    - Mutated only from the event loop under the caller's index locks
+    - Iteration helpers return snapshots, safe across awaits
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty registry."""
+        self._records: dict[int, ConnectionRecord] = {}
+        self._ids: dict["WebSocket", int] = {}
+        self._next_id = itertools.count(1)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(
+        self,
+        ws: "WebSocket",
+        user_id: int,
+        tenant_id: int | None = None,
+        is_admin: bool = False,
+        is_kitchen: bool = False,
+    ) -> ConnectionRecord:
+        """
+        Create the record for a new connection.
+
+        Args:
+            ws: WebSocket connection.
+            user_id: User ID (negative for diners).
+            tenant_id: Tenant ID for multi-tenant isolation.
+            is_admin: Whether this is an admin/manager connection.
+            is_kitchen: Whether this is a kitchen connection.
+
+        Returns:
+            The new record (or the existing one if ws is already registered).
+        """
+        conn_id = self._ids.get(ws)
+        if conn_id is not None:
+            logger.warning("Connection registered twice", conn_id=conn_id, user_id=user_id)
+            return self._records[conn_id]
+
+        record = ConnectionRecord(
+            next(self._next_id), ws, user_id, tenant_id, is_admin, is_kitchen
+        )
+        self._records[record.conn_id] = record
+        self._ids[ws] = record.conn_id
+        return record
+
+    def get(self, ws: "WebSocket") -> ConnectionRecord | None:
+        """Get the record of a WebSocket, or None if not registered."""
+        conn_id = self._ids.get(ws)
+        return None if conn_id is None else self._records[conn_id]
+
+    def get_by_id(self, conn_id: int) -> ConnectionRecord | None:
+        """Get a record by connection id."""
+        return self._records.get(conn_id)
+
+    def remove(self, record: ConnectionRecord) -> None:
+        """Forget a connection and all its state."""
+        self._records.pop(record.conn_id, None)
+        if self._ids.get(record.ws) == record.conn_id:
+            del self._ids[record.ws]
+
+    def websockets(self, conn_ids: Iterable[int]) -> set["WebSocket"]:
+        """Resolve connection ids to WebSockets (unknown ids are skipped)."""
+        records = self._records
+        return {records[cid].ws for cid in conn_ids if cid in records}
+
+    def records(self) -> list[ConnectionRecord]:
+        """Snapshot of all records."""
+        return list(self._records.values())
+
+    def __iter__(self) -> Iterator[ConnectionRecord]:
+        return iter(self.records())
+
+
+__all__ = [
+    "ConnectionRecord",
+    "ConnectionRegistry",
+]
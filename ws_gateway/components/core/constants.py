@@ -17,6 +17,7 @@ __all__ = [
     "MSG_PING_JSON",
     "MSG_PONG_JSON",
     "MSG_REFRESH_SECTORS",
+    "MSG_REPLAY_DONE",
     "DEFAULT_ALLOWED_ORIGINS",
     "validate_websocket_origin",
     "HasStats",
@@ -48,6 +49,8 @@ class WSCloseCode(IntEnum):
     # LOW-WS-02: These codes are documented in CLAUDE.md and used by all frontends
     AUTH_FAILED = 4001  # JWT/table token validation failed or expired
     FORBIDDEN = 4003  # Valid auth but insufficient permissions or invalid origin
+    SLOW_CONSUMER = 4008  # Client fell too far behind its outbound queue (see ws_outbound_max_lag_seconds)
+    TRY_AGAIN_LATER = 4013  # Handshake not admitted during a reconnect storm; reason is "retry_after_ms=<ms>"
     RATE_LIMITED = 4029  # Too many messages per second (see ws_message_rate_limit setting)
 
 
@@ -106,6 +109,18 @@ class WSConstants:
     # all branch events as fallback.
     DB_LOOKUP_TIMEOUT: Final[float] = 2.0
 
+    # PERF-SECTORS-01: SECTOR_BATCH_WINDOW: 10 milliseconds
+    # Rationale: Sector cache misses are collected for this long and served
+    # by one IN (...) query in one worker thread. During startup or a
+    # reconnect storm hundreds of waiters authenticate within a few ms;
+    # a 10 ms wait is invisible next to the WebSocket handshake.
+    SECTOR_BATCH_WINDOW: Final[float] = 0.01
+
+    # PERF-SECTORS-01: SECTOR_BATCH_MAX_SIZE: 500 waiters
+    # Rationale: Flush early when this many lookups are queued, keeping the
+    # IN (...) list well below database parameter limits.
+    SECTOR_BATCH_MAX_SIZE: Final[int] = 500
+
     # WS_ACCEPT_TIMEOUT: 5 seconds
     # Rationale: WebSocket handshake should complete within TCP timeout.
     # 5 seconds handles slow networks while rejecting stuck connections.
@@ -225,6 +240,13 @@ class WSConstants:
     # less frequent delays dead connection cleanup.
     HEARTBEAT_CLEANUP_INTERVAL: Final[float] = 30.0
 
+    # HEARTBEAT_WHEEL_RESOLUTION: 1 second
+    # Rationale: Slot width of the heartbeat timing wheel (PERF-HEARTBEAT-01).
+    # A connection changes slot at most once per second of activity, and a
+    # 60s timeout spans ~60 live slots. Expiry stays exact: the current slot
+    # is checked per connection.
+    HEARTBEAT_WHEEL_RESOLUTION: Final[float] = 1.0
+
     # LOCK_CLEANUP_CYCLE: 5 (every 5 heartbeat cycles = 2.5 minutes)
     # Rationale: Lock cleanup is less urgent than connection cleanup.
     # Running every 2.5 minutes balances memory reclamation with CPU usage.
@@ -250,6 +272,149 @@ class WSConstants:
     # immediately instead of waiting for periodic cleanup.
     MAX_DEAD_CONNECTIONS: Final[int] = 500
 
+    # ==========================================================================
+    # PERF-OUTBOX-01: Per-connection Outbound Queues
+    # ==========================================================================
+
+    # OUTBOUND_QUEUE_SIZE: 64
+    # Rationale: A healthy client drains its queue within milliseconds, so
+    # depth rarely exceeds a handful of frames. 64 absorbs a burst (e.g. a
+    # kitchen ticket storm) while bounding memory per stalled client. When
+    # full, the oldest pending frame is dropped.
+    OUTBOUND_QUEUE_SIZE: Final[int] = 64
+
+    # OUTBOUND_MAX_LAG_SECONDS: 10 seconds
+    # Rationale: If the oldest pending frame has waited this long, the client
+    # is not keeping up (bad Wi-Fi, suspended tab). Closing with
+    # SLOW_CONSUMER lets it reconnect and resync instead of receiving stale
+    # events. Well below the heartbeat timeout (60s).
+    OUTBOUND_MAX_LAG_SECONDS: Final[float] = 10.0
+
+    # OUTBOUND_CLOSE_TIMEOUT: 1 second
+    # Rationale: Closing a stalled socket can itself block on the TCP send
+    # buffer. Bound the close handshake so eviction never hangs.
+    OUTBOUND_CLOSE_TIMEOUT: Final[float] = 1.0
+
+    # OUTBOUND_LAG_BUCKETS: 1ms .. 10s
+    # Rationale: Histogram buckets for enqueue-to-sent lag (PERF-METRICS-01).
+    # A healthy client is in the first buckets; 10s is OUTBOUND_MAX_LAG_SECONDS,
+    # past which the client is evicted.
+    OUTBOUND_LAG_BUCKETS: Final[tuple[float, ...]] = (
+        0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0,
+    )
+
+    # ==========================================================================
+    # PERF-REPLAY-01: Last-event-id Replay on Reconnect
+    # ==========================================================================
+
+    # REPLAY_MAX_EVENTS: 200
+    # Rationale: A waiter offline for a few minutes during service misses at
+    # most tens of critical events for their branch. Only events the
+    # connection would have received count; past 200 of them the client is
+    # told to refetch over REST instead.
+    REPLAY_MAX_EVENTS: Final[int] = 200
+
+    # REPLAY_PAGE_SIZE: 500 stream entries per XRANGE
+    # Rationale: events:critical holds every tenant's events, so a few
+    # minutes' gap can span thousands of entries. Pages keep each reply
+    # small; the whole read is still bounded by REPLAY_READ_TIMEOUT.
+    REPLAY_PAGE_SIZE: Final[int] = 500
+
+    # REPLAY_MAX_AGE_SECONDS: 5 minutes
+    # Rationale: Covers Wi-Fi drops, tab suspension and gateway restarts.
+    # After a longer absence a REST refetch is cheaper than replaying and
+    # the client state is likely stale in other ways too.
+    REPLAY_MAX_AGE_SECONDS: Final[float] = 300.0
+
+    # REPLAY_READ_TIMEOUT: 1 second (all pages)
+    # Rationale: Live frames are held while the stream is read. If Redis is
+    # slow the client gets complete=false and resyncs over REST rather than
+    # waiting with a held outbox.
+    REPLAY_READ_TIMEOUT: Final[float] = 1.0
+
+    # ==========================================================================
+    # PERF-LANES-01: Priority Lanes between Reader and Dispatcher
+    # ==========================================================================
+    # Lane order everywhere: critical, normal, bulk
+
+    # EVENT_LANE_WEIGHTS: 8 / 3 / 1
+    # Rationale: Under backlog a critical event (payment, check, round,
+    # service call) is dispatched 8 times as often as a bulk one (cart,
+    # admin CRUD). Bulk still gets 1 in 12 slots, so it is slowed but
+    # never starved.
+    EVENT_LANE_WEIGHTS: Final[tuple[int, ...]] = (8, 3, 1)
+
+    # EVENT_LANE_CAPACITY_SHARES: 100% / 50% / 25% of redis_event_queue_size
+    # Rationale: Critical events may use the whole queue. A cart storm can
+    # hold at most a quarter of it, so it can never push billing or
+    # kitchen events out; once the queue is full, bulk events are evicted
+    # first, then normal ones.
+    EVENT_LANE_CAPACITY_SHARES: Final[tuple[float, ...]] = (1.0, 0.5, 0.25)
+
+    # EVENT_LANE_DISPATCH_DEPTH: 4 events per dispatch worker
+    # Rationale: Events the keyed dispatcher takes ahead of its workers are
+    # out of reach of the lanes. Keeping only a few per worker leaves the
+    # backlog in the lanes, where it is prioritized, while workers never
+    # wait for input.
+    EVENT_LANE_DISPATCH_DEPTH: Final[int] = 4
+
+    # EVENT_LANE_LATENCY_BUCKETS: 5ms .. 5s
+    # Rationale: Histogram buckets for enqueue-to-delivered latency per
+    # lane. Healthy delivery is well under 50ms; the staleness warning
+    # fires at 5s.
+    EVENT_LANE_LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+    )
+
+    # ==========================================================================
+    # PERF-LATENCY-01: Publish-to-deliver Latency
+    # ==========================================================================
+
+    # DELIVERY_LATENCY_BUCKETS: 10ms .. 10s
+    # Rationale: The SLO is "kitchen sees the order within 500 ms", so the
+    # buckets are densest around it (250ms, 500ms, 1s). Beyond 10s the
+    # client is being evicted as a slow consumer anyway.
+    DELIVERY_LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+        0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+    )
+
+    # DELIVERY_LATENCY_MAX_SERIES: 300 (event type, audience) pairs
+    # Rationale: ~35 event types times a handful of audiences stay well
+    # below this. The cap bounds memory and label cardinality if unknown
+    # event types show up; further pairs are counted as event_type="other".
+    DELIVERY_LATENCY_MAX_SERIES: Final[int] = 300
+
+    # ==========================================================================
+    # PERF-ADMISSION-01: Handshake Admission (reconnect storms)
+    # ==========================================================================
+
+    # HANDSHAKE_MAX_CONCURRENT: 50
+    # Rationale: A handshake is JWT verification, sector lookup in the DB
+    # and registration under the connection locks. 50 at once keeps the DB
+    # pool (and the loop) responsive while ~1000 clients reconnect after a
+    # restart in a few seconds.
+    HANDSHAKE_MAX_CONCURRENT: Final[int] = 50
+
+    # HANDSHAKE_MAX_QUEUED: 500
+    # Rationale: Half of ws_max_total_connections may wait for a slot; each
+    # waiter is just an open socket and a future. Beyond that the client is
+    # told to come back later.
+    HANDSHAKE_MAX_QUEUED: Final[int] = 500
+
+    # HANDSHAKE_QUEUE_TIMEOUT: 5 seconds
+    # Rationale: Waiting longer than a fresh reconnect with a suggested
+    # delay would take helps nobody; browsers also give up on a pending
+    # WebSocket handshake after some seconds.
+    HANDSHAKE_QUEUE_TIMEOUT: Final[float] = 5.0
+
+    # HANDSHAKE_RETRY_AFTER: 1 .. 30 seconds
+    # Rationale: Suggested delay sent with TRY_AGAIN_LATER grows with the
+    # backlog (one base delay per HANDSHAKE_MAX_CONCURRENT waiting clients)
+    # and is jittered down to half, so rejected clients come back spread out
+    # instead of as the next storm. 30s matches the client backoff cap.
+    HANDSHAKE_RETRY_AFTER_BASE: Final[float] = 1.0
+    HANDSHAKE_RETRY_AFTER_MAX: Final[float] = 30.0
+
     # ==========================================================================
     # DOC-IMP-01 FIX: Redis Subscription Channels
     # ==========================================================================
@@ -301,6 +466,9 @@ MSG_PING_JSON: Final[str] = '{"type":"ping"}'
 MSG_PONG_JSON: Final[str] = '{"type":"pong"}'
 MSG_REFRESH_SECTORS: Final[str] = "refresh_sectors"
 
+# PERF-REPLAY-01: Sent after missed events, before live delivery resumes
+MSG_REPLAY_DONE: Final[str] = "REPLAY_DONE"
+
 
 # ==========================================================================
 # HIGH-NEW-03 FIX: Shared Origin Validation
@@ -20,6 +20,7 @@ from ws_gateway.components.core.constants import WSConstants
 from ws_gateway.components.connection.locks import LockManager
 from ws_gateway.components.metrics.collector import MetricsCollector
 from ws_gateway.components.connection.heartbeat import HeartbeatTracker
+from ws_gateway.components.connection.registry import ConnectionRegistry
 from ws_gateway.components.connection.rate_limiter import WebSocketRateLimiter
 from ws_gateway.components.data.sector_repository import (
     SectorAssignmentRepository,
@@ -52,6 +53,7 @@ if TYPE_CHECKING:
 
 _lock_manager: LockManager | None = None
 _metrics_collector: MetricsCollector | None = None
+_connection_registry: ConnectionRegistry | None = None
 _heartbeat_tracker: HeartbeatTracker | None = None
 _rate_limiter: WebSocketRateLimiter | None = None
 _singleton_lock = threading.Lock()
@@ -90,6 +92,23 @@ def get_metrics_collector() -> MetricsCollector:
     return _metrics_collector
 
 
+def get_connection_registry() -> ConnectionRegistry:
+    """
+    Get singleton ConnectionRegistry instance.
+
+    PERF-REGISTRY-01: Shared by HeartbeatTracker and WebSocketRateLimiter,
+    which keep their state on the connection records.
+
+    Thread-safe with double-check locking.
+    """
+    global _connection_registry
+    if _connection_registry is None:
+        with _singleton_lock:
+            if _connection_registry is None:
+                _connection_registry = ConnectionRegistry()
+    return _connection_registry
+
+
 def get_heartbeat_tracker() -> HeartbeatTracker:
     """
     Get singleton HeartbeatTracker instance.
@@ -97,11 +116,13 @@ def get_heartbeat_tracker() -> HeartbeatTracker:
     Thread-safe with double-check locking.
     """
     global _heartbeat_tracker
+    registry = get_connection_registry()
     if _heartbeat_tracker is None:
         with _singleton_lock:
             if _heartbeat_tracker is None:
                 _heartbeat_tracker = HeartbeatTracker(
                     timeout_seconds=settings.ws_heartbeat_timeout,
+                    registry=registry,
                 )
     return _heartbeat_tracker
 
@@ -113,12 +134,14 @@ def get_rate_limiter() -> WebSocketRateLimiter:
     Thread-safe with double-check locking.
     """
     global _rate_limiter
+    registry = get_connection_registry()
     if _rate_limiter is None:
         with _singleton_lock:
             if _rate_limiter is None:
                 _rate_limiter = WebSocketRateLimiter(
                     max_messages=settings.ws_message_rate_limit,
                     window_seconds=settings.ws_message_rate_window,
+                    registry=registry,
                 )
     return _rate_limiter
 
@@ -264,11 +287,13 @@ def reset_singletons() -> None:
 
     Useful for testing to ensure clean state between tests.
     """
-    global _lock_manager, _metrics_collector, _heartbeat_tracker, _rate_limiter
+    global _lock_manager, _metrics_collector, _connection_registry
+    global _heartbeat_tracker, _rate_limiter
 
     with _singleton_lock:
         _lock_manager = None
         _metrics_collector = None
+        _connection_registry = None
         _heartbeat_tracker = None
         _rate_limiter = None
 
@@ -6,6 +6,8 @@ Separates data access from WebSocket handling logic.
 
 ARCH-03 FIX: Implemented Repository pattern for clean architecture.
 ARCH-OPP-06 FIX: Added caching layer to reduce database load.
+PERF-SECTORS-01: Cache misses are coalesced into batched queries, and
+entries are invalidated by SECTOR_ASSIGNMENTS_CHANGED events.
 """
 
 from __future__ import annotations
@@ -16,7 +18,7 @@ import threading
 import time
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Any, TYPE_CHECKING
+from typing import Any, Iterable, TYPE_CHECKING
 
 from sqlalchemy import select
 
@@ -241,12 +243,22 @@ class SectorAssignmentRepository:
 
     ARCH-OPP-06 FIX: Added caching layer to reduce database load.
 
+    PERF-SECTORS-01: Cache misses are not queried one thread hop per user.
+    They are queued for batch_window seconds (or until batch_max_size are
+    queued) and served by one query per tenant in one worker thread.
+    Concurrent lookups of the same waiter share the pending result.
+    invalidate_cache() detaches pending lookups, so a result loaded before
+    an assignment change is never cached after it.
+
     Usage:
         repo = SectorAssignmentRepository()
         sector_ids = await repo.get_waiter_sectors(user_id, tenant_id)
 
         # With cache control:
         sector_ids = await repo.get_waiter_sectors(user_id, tenant_id, skip_cache=True)
+
+        # Several waiters at once (one query):
+        sectors_by_user = await repo.get_waiters_sectors(user_ids, tenant_id)
     """
 
     def __init__(
@@ -254,6 +266,8 @@ class SectorAssignmentRepository:
         timeout: float = WSConstants.DB_LOOKUP_TIMEOUT,
         cache_ttl: float = 60.0,
         cache_max_size: int = 1000,
+        batch_window: float = WSConstants.SECTOR_BATCH_WINDOW,
+        batch_max_size: int = WSConstants.SECTOR_BATCH_MAX_SIZE,
     ):
         """
         Initialize the repository.
@@ -262,6 +276,8 @@ class SectorAssignmentRepository:
             timeout: Timeout in seconds for database lookups.
             cache_ttl: Cache entry time-to-live in seconds.
             cache_max_size: Maximum cache entries.
+            batch_window: Seconds to collect cache misses before querying.
+            batch_max_size: Queued misses that trigger an immediate query.
         """
         self._timeout = timeout
         # ARCH-OPP-06 FIX: Add caching layer
@@ -269,6 +285,18 @@ class SectorAssignmentRepository:
             ttl_seconds=cache_ttl,
             max_size=cache_max_size,
         )
+        # PERF-SECTORS-01: Lookup coalescing (event loop only, no lock needed)
+        self._batch_window = batch_window
+        self._batch_max_size = max(1, batch_max_size)
+        # (user_id, tenant_id) -> pending result, queued or being queried
+        self._pending: dict[tuple[int, int], asyncio.Future[list[int]]] = {}
+        # Not yet queried: tenant_id -> user_ids
+        self._queued: dict[int, list[int]] = {}
+        self._queued_count = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._batch_queries = 0
+        self._batched_lookups = 0
         # MED-07 FIX: Add metrics for sector lookup fallback tracking
         self._lookup_success = 0
         self._lookup_timeouts = 0
@@ -316,14 +344,13 @@ class SectorAssignmentRepository:
                 )
                 return cached
 
-        # Query database
+        # PERF-SECTORS-01: Query database in the next batch
         try:
+            # Shielded: a caller timing out must not cancel a shared lookup
             result = await asyncio.wait_for(
-                asyncio.to_thread(self._get_sectors_sync, user_id, tenant_id),
-                timeout=self._timeout,
+                asyncio.shield(self._load(user_id, tenant_id)),
+                timeout=self._timeout + self._batch_window,
             )
-            # Store in cache
-            self._cache.set(cache_key, result)
             # MED-07 FIX: Track successful lookup
             self._lookup_success += 1
             return result
@@ -352,17 +379,178 @@ class SectorAssignmentRepository:
             )
             return []
 
+    async def get_waiters_sectors(
+        self,
+        user_ids: Iterable[int],
+        tenant_id: int,
+        skip_cache: bool = False,
+    ) -> dict[int, list[int]]:
+        """
+        Get today's sector IDs of several waiters with at most one query.
+
+        PERF-SECTORS-01: Used to refresh all waiters of an assignment change.
+
+        Args:
+            user_ids: The waiters' user IDs.
+            tenant_id: The tenant ID.
+            skip_cache: If True, bypass cache and query database.
+
+        Returns:
+            Dict of user_id -> sector IDs. Waiters whose lookup failed are
+            missing (unlike get_waiter_sectors, no fallback to empty).
+        """
+        sectors_by_user: dict[int, list[int]] = {}
+        misses: list[int] = []
+        for user_id in dict.fromkeys(user_ids):
+            cached = None if skip_cache else self._cache.get((user_id, tenant_id))
+            if cached is None:
+                misses.append(user_id)
+            else:
+                sectors_by_user[user_id] = cached
+        if not misses:
+            return sectors_by_user
+
+        lookups = [self._load(user_id, tenant_id) for user_id in misses]
+        try:
+            results = await asyncio.wait_for(
+                asyncio.shield(asyncio.gather(*lookups, return_exceptions=True)),
+                timeout=self._timeout + self._batch_window,
+            )
+        except asyncio.TimeoutError:
+            self._lookup_timeouts += len(misses)
+            logger.error(
+                "DB lookup timeout for waiters sectors",
+                tenant_id=tenant_id,
+                waiters=len(misses),
+                timeout=self._timeout,
+            )
+            return sectors_by_user
+
+        for user_id, result in zip(misses, results):
+            if isinstance(result, BaseException):
+                self._lookup_errors += 1
+                continue
+            self._lookup_success += 1
+            sectors_by_user[user_id] = result
+        if len(sectors_by_user) < len(misses):
+            logger.error(
+                "Error fetching some waiters sectors",
+                tenant_id=tenant_id,
+                failed=[uid for uid in misses if uid not in sectors_by_user],
+            )
+        return sectors_by_user
+
+    # =========================================================================
+    # PERF-SECTORS-01: Lookup coalescing
+    # =========================================================================
+
+    def _load(self, user_id: int, tenant_id: int) -> asyncio.Future[list[int]]:
+        """
+        Get the pending lookup of a waiter, queueing one if there is none.
+
+        Must be called from the event loop.
+        """
+        key = (user_id, tenant_id)
+        future = self._pending.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[key] = future
+        self._queued.setdefault(tenant_id, []).append(user_id)
+        self._queued_count += 1
+
+        if self._queued_count >= self._batch_max_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._batch_window, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Start one batch query per tenant (and per batch_max_size waiters)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        queued, self._queued = self._queued, {}
+        self._queued_count = 0
+
+        for tenant_id, user_ids in queued.items():
+            for start in range(0, len(user_ids), self._batch_max_size):
+                batch = {
+                    user_id: self._pending[(user_id, tenant_id)]
+                    for user_id in user_ids[start:start + self._batch_max_size]
+                }
+                task = asyncio.create_task(
+                    self._run_batch(tenant_id, batch),
+                    name=f"sector_batch:{tenant_id}",
+                )
+                self._batch_tasks.add(task)
+                task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(
+        self, tenant_id: int, batch: dict[int, asyncio.Future[list[int]]]
+    ) -> None:
+        """Query a batch of waiters and resolve their pending lookups."""
+        self._batch_queries += 1
+        self._batched_lookups += len(batch)
+        try:
+            result = await asyncio.wait_for(
+                asyncio.to_thread(self._get_sectors_batch_sync, list(batch), tenant_id),
+                timeout=self._timeout,
+            )
+        except asyncio.CancelledError:
+            self._fail_batch(tenant_id, batch, None)
+            raise
+        except Exception as e:
+            self._fail_batch(tenant_id, batch, e)
+            return
+
+        for user_id, future in batch.items():
+            key = (user_id, tenant_id)
+            sector_ids = result.get(user_id, [])
+            # Only cache if not invalidated while the query was running
+            if self._pending.get(key) is future:
+                del self._pending[key]
+                self._cache.set(key, sector_ids)
+            if not future.done():
+                future.set_result(sector_ids)
+
+    def _fail_batch(
+        self,
+        tenant_id: int,
+        batch: dict[int, asyncio.Future[list[int]]],
+        error: Exception | None,
+    ) -> None:
+        """Fail (or cancel, if error is None) the pending lookups of a batch."""
+        for user_id, future in batch.items():
+            key = (user_id, tenant_id)
+            if self._pending.get(key) is future:
+                del self._pending[key]
+            if future.done():
+                continue
+            if error is None:
+                future.cancel()
+            else:
+                future.set_exception(error)
+                # Mark retrieved: a shared lookup may have no caller left
+                future.exception()
+
     def invalidate_cache(self, user_id: int, tenant_id: int) -> None:
         """
         Invalidate cache entry for a specific user/tenant.
 
         Call this when sector assignments are updated.
 
+        PERF-SECTORS-01: Also detaches a pending lookup, so its (possibly
+        outdated) result is returned to current callers but not cached.
+
         Args:
             user_id: User ID to invalidate.
             tenant_id: Tenant ID to invalidate.
         """
         self._cache.invalidate((user_id, tenant_id))
+        self._pending.pop((user_id, tenant_id), None)
         logger.debug(
             "Cache invalidated for waiter sectors",
             user_id=user_id,
@@ -378,6 +566,12 @@ class SectorAssignmentRepository:
         return {
             "timeout": self._timeout,
             "cache": self._cache.get_stats(),
+            # PERF-SECTORS-01: Lookups served per query
+            "batching": {
+                "queries": self._batch_queries,
+                "lookups": self._batched_lookups,
+                "pending": len(self._pending),
+            },
             # MED-07 FIX: Sector lookup metrics
             "lookups": {
                 "success": self._lookup_success,
@@ -433,6 +627,45 @@ class SectorAssignmentRepository:
             )
             return []
 
+    def _get_sectors_batch_sync(
+        self, user_ids: list[int], tenant_id: int
+    ) -> dict[int, list[int]]:
+        """
+        Synchronous sector lookup for several waiters in one query.
+
+        PERF-SECTORS-01: Errors are raised (not mapped to empty sectors) so
+        a failed batch is not cached.
+
+        Args:
+            user_ids: The waiters' user IDs.
+            tenant_id: The tenant ID.
+
+        Returns:
+            Dict of user_id -> unique sector IDs (waiters without
+            assignments are missing).
+        """
+        from shared.infrastructure.db import get_db_context
+        from rest_api.models import WaiterSectorAssignment
+
+        with get_db_context() as db:
+            rows = db.execute(
+                select(WaiterSectorAssignment.waiter_id, WaiterSectorAssignment.sector_id)
+                .where(
+                    WaiterSectorAssignment.waiter_id.in_(user_ids),
+                    WaiterSectorAssignment.tenant_id == tenant_id,
+                    WaiterSectorAssignment.assignment_date == date.today(),
+                    WaiterSectorAssignment.is_active.is_(True),
+                )
+            ).all()
+
+        sectors_by_user: dict[int, set[int]] = {}
+        for waiter_id, sector_id in rows:
+            sectors_by_user.setdefault(waiter_id, set()).add(sector_id)
+        return {
+            waiter_id: sorted(sector_ids)
+            for waiter_id, sector_ids in sectors_by_user.items()
+        }
+
     def get_sectors_sync(self, user_id: int, tenant_id: int) -> list[int]:
         """
         Synchronous version for non-async contexts.
@@ -78,6 +78,7 @@ class WebSocketEndpointBase(
         endpoint_name: str,
         receive_timeout: float = WSConstants.WS_RECEIVE_TIMEOUT,
         jwt_revalidation_interval: float = WSConstants.JWT_REVALIDATION_INTERVAL,
+        last_event_id: str | None = None,
     ):
         """
         Initialize the endpoint handler.
@@ -88,12 +89,15 @@ class WebSocketEndpointBase(
             endpoint_name: Name for logging (e.g., "/ws/waiter").
             receive_timeout: Timeout for receiving messages.
             jwt_revalidation_interval: Interval for JWT revalidation.
+            last_event_id: Last stream_id the client received, to replay
+                missed events after a reconnect (PERF-REPLAY-01).
         """
         self.websocket = websocket
         self.manager = manager
         self.endpoint_name = endpoint_name
         self.receive_timeout = receive_timeout
         self.jwt_revalidation_interval = jwt_revalidation_interval
+        self.last_event_id = last_event_id
 
         self.context: WebSocketContext | None = None
         self._last_jwt_revalidation = time.time()
@@ -184,48 +188,108 @@ class WebSocketEndpointBase(
         Handles the complete lifecycle:
         1. Validate authentication
         2. Create context
-        3. Register connection
+        3. Register connection (replaying missed events if last_event_id)
         4. Message loop
         5. Unregister on disconnect
+
+        PERF-ADMISSION-01: Steps 1-3 run under a handshake admission slot;
+        when none frees up in time the client is closed with TRY_AGAIN_LATER
+        and a suggested retry delay.
+        """
+        admission = self.manager.admission
+        if not await admission.acquire():
+            await self._reject_not_admitted(admission.retry_after())
+            return
+        try:
+            if not await self._handshake():
+                return
+        finally:
+            admission.release()
+
+        # Step 4: Message loop
+        self._is_running = True
+        try:
+            await self._message_loop()
+        except WebSocketDisconnect:
+            # ARCH-AUDIT-04 FIX: Use mixin for lifecycle logging
+            self.log_disconnect("client_disconnect")
+        finally:
+            # Step 5: Unregister
+            self._is_running = False
+            await self.unregister_connection(self.context)
+
+    async def _handshake(self) -> bool:
+        """
+        Authenticate, create the context and register the connection.
+
+        Returns:
+            True if the connection is registered (and missed events are
+            queued), False if it was rejected.
         """
         # Step 1: Validate authentication
         auth_data = await self.validate_auth()
         if auth_data is None:
-            return  # Auth failed, connection already closed
+            return False  # Auth failed, connection already closed
 
         # Step 2: Create context
         self.context = await self.create_context(auth_data)
 
+        # PERF-REPLAY-01: Hold live events until the missed ones are queued
+        replay = bool(self.last_event_id)
+        if replay:
+            self.manager.hold_delivery(self.websocket)
+
         # Step 3: Register connection
         try:
             await self.register_connection(self.context)
         except ConnectionError as e:
+            if replay:
+                self.manager.release_delivery(self.websocket)
             # ARCH-AUDIT-04 FIX: Use mixin for lifecycle logging
             self.log_connect_rejected(str(e))
-            return
+            return False
         except Exception as e:
+            if replay:
+                self.manager.release_delivery(self.websocket)
             logger.error(
                 "Unexpected error during connection",
                 endpoint=self.endpoint_name,
                 identifier=self.context.identifier,
                 error=str(e),
             )
-            return
+            return False
 
         # ARCH-AUDIT-04 FIX: Use mixin for lifecycle logging
         self.log_connect()
 
-        # Step 4: Message loop
-        self._is_running = True
+        if replay:
+            await self.manager.replay_missed_events(self.websocket, self.last_event_id)
+        return True
+
+    async def _reject_not_admitted(self, retry_after: float) -> None:
+        """
+        Close a handshake that got no admission slot (PERF-ADMISSION-01).
+
+        The socket is accepted first: a close before accept is an HTTP 403
+        and the client would never see the close code or the delay.
+
+        Args:
+            retry_after: Suggested seconds before reconnecting.
+        """
+        retry_after_ms = int(retry_after * 1000)
+        logger.info(
+            "WebSocket handshake not admitted",
+            endpoint=self.endpoint_name,
+            retry_after_ms=retry_after_ms,
+        )
         try:
-            await self._message_loop()
-        except WebSocketDisconnect:
-            # ARCH-AUDIT-04 FIX: Use mixin for lifecycle logging
-            self.log_disconnect("client_disconnect")
-        finally:
-            # Step 5: Unregister
-            self._is_running = False
-            await self.unregister_connection(self.context)
+            await self.websocket.accept()
+            await self.websocket.close(
+                code=WSCloseCode.TRY_AGAIN_LATER,
+                reason=f"retry_after_ms={retry_after_ms}",
+            )
+        except Exception as e:
+            logger.debug("Failed to close non-admitted WebSocket", error=str(e))
 
     async def _pre_message_hook(self) -> bool:
         """
@@ -364,8 +428,8 @@ class JWTWebSocketEndpoint(
         Returns:
             JWT claims if valid, None if invalid.
         """
-        from shared.security.auth import verify_jwt
         from shared.config.logging import audit_ws_connection
+        from ws_gateway.components.auth.revocation import verify_jwt_async
 
         origin = self.websocket.headers.get("origin")
 
@@ -387,9 +451,9 @@ class JWTWebSocketEndpoint(
             )
             return None
 
-        # Verify JWT
+        # Verify JWT (PERF-AUTH-01: revocation lookup batched per loop tick)
         try:
-            claims = verify_jwt(self.token)
+            claims = await verify_jwt_async(self.token)
         except HTTPException as e:
             logger.warning(
                 "WebSocket JWT validation failed",
@@ -38,12 +38,14 @@ class WaiterEndpoint(JWTWebSocketEndpoint):
         websocket: WebSocket,
         manager: "ConnectionManager",
         token: str,
+        last_event_id: str | None = None,
     ):
         super().__init__(
             websocket=websocket,
             manager=manager,
             endpoint_name="/ws/waiter",
             token=token,
+            last_event_id=last_event_id,
             required_roles=["WAITER", "MANAGER", "ADMIN"],
         )
         self._user_id: int = 0
@@ -143,12 +145,14 @@ class KitchenEndpoint(JWTWebSocketEndpoint):
         websocket: WebSocket,
         manager: "ConnectionManager",
         token: str,
+        last_event_id: str | None = None,
     ):
         super().__init__(
             websocket=websocket,
             manager=manager,
             endpoint_name="/ws/kitchen",
             token=token,
+            last_event_id=last_event_id,
             required_roles=["KITCHEN", "MANAGER", "ADMIN"],
         )
         self._user_id: int = 0
@@ -214,12 +218,14 @@ class AdminEndpoint(JWTWebSocketEndpoint):
         websocket: WebSocket,
         manager: "ConnectionManager",
         token: str,
+        last_event_id: str | None = None,
     ):
         super().__init__(
             websocket=websocket,
             manager=manager,
             endpoint_name="/ws/admin",
             token=token,
+            last_event_id=last_event_id,
             required_roles=["MANAGER", "ADMIN"],
         )
         self._user_id: int = 0
@@ -281,11 +287,13 @@ class DinerEndpoint(WebSocketEndpointBase):
         websocket: WebSocket,
         manager: "ConnectionManager",
         table_token: str,
+        last_event_id: str | None = None,
     ):
         super().__init__(
             websocket=websocket,
             manager=manager,
             endpoint_name="/ws/diner",
+            last_event_id=last_event_id,
         )
         self.table_token = table_token
         self._session_id: int = 0
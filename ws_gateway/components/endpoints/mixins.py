@@ -214,13 +214,16 @@ class JWTRevalidationMixin:
         """
         Perform actual JWT revalidation.
 
+        PERF-AUTH-01: Revalidations that fall due in the same loop tick share
+        one pipelined Redis round-trip.
+
         Returns:
             True if valid, False if invalid.
         """
-        from shared.security.auth import verify_jwt
+        from ws_gateway.components.auth.revocation import verify_jwt_async
 
         try:
-            claims = verify_jwt(self.token)
+            claims = await verify_jwt_async(self.token)
             if claims.get("type") == "refresh":
                 logger.warning("Refresh token detected during revalidation")
                 return False
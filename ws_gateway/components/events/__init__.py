@@ -12,6 +12,7 @@ from ws_gateway.components.events.types import (
     OPTIONAL_EVENT_FIELDS,
 )
 from ws_gateway.components.events.router import (
+    Audience,
     EventRouter,
     RoutingResult,
     safe_int,
@@ -25,6 +26,7 @@ __all__ = [
     "REQUIRED_EVENT_FIELDS",
     "OPTIONAL_EVENT_FIELDS",
     # Event router
+    "Audience",
     "EventRouter",
     "RoutingResult",
     "safe_int",
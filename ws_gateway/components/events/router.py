@@ -13,7 +13,10 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol
+from enum import IntFlag
+from typing import TYPE_CHECKING, Protocol, Sequence
+
+from ws_gateway.components.broadcast.frame import EncodedFrame
 
 if TYPE_CHECKING:
     pass
@@ -25,29 +28,60 @@ class ConnectionManagerProtocol(Protocol):
     """Protocol for ConnectionManager to avoid circular imports."""
 
     async def send_to_admins(
-        self, branch_id: int, event: dict, tenant_id: int | None = None
+        self, branch_id: int, event: dict | EncodedFrame, tenant_id: int | None = None
     ) -> int: ...
 
     async def send_to_sector(
-        self, sector_id: int, event: dict, tenant_id: int | None = None
+        self, sector_id: int, event: dict | EncodedFrame, tenant_id: int | None = None
     ) -> int: ...
 
     async def send_to_waiters_only(
-        self, branch_id: int, event: dict, tenant_id: int | None = None
+        self, branch_id: int, event: dict | EncodedFrame, tenant_id: int | None = None
     ) -> int: ...
 
     async def send_to_session(
-        self, session_id: int, event: dict, tenant_id: int | None = None
+        self, session_id: int, event: dict | EncodedFrame, tenant_id: int | None = None
     ) -> int: ...
 
     async def send_to_branch(
-        self, branch_id: int, event: dict, tenant_id: int | None = None
+        self, branch_id: int, event: dict | EncodedFrame, tenant_id: int | None = None
     ) -> int: ...
 
     async def send_to_kitchen(
-        self, branch_id: int, event: dict, tenant_id: int | None = None
+        self, branch_id: int, event: dict | EncodedFrame, tenant_id: int | None = None
     ) -> int: ...
 
+    async def send_to_audiences(
+        self,
+        targets: Sequence[tuple[str, int | list[int]]],
+        event: dict | EncodedFrame,
+        tenant_id: int | None = None,
+    ) -> dict[str, int]: ...
+
+
+class Audience(IntFlag):
+    """
+    Audiences of an event type.
+
+    PERF-AUDIENCE-01: Combined into one mask per event type, computed once.
+    """
+
+    NONE = 0
+    ADMINS = 1
+    WAITERS = 2
+    BRANCH_WIDE_WAITERS = 4  # With WAITERS: all branch waiters, ignore sector_id
+    KITCHEN = 8
+    SESSION = 16
+
+
+# RoutingResult field reporting each audience of send_to_audiences()
+_RESULT_FIELDS = {
+    "admins": "admin_sent",
+    "waiters": "waiter_sent",
+    "sector": "waiter_sent",
+    "kitchen": "kitchen_sent",
+    "session": "diner_sent",
+}
 
 
 @dataclass
@@ -119,6 +153,15 @@ class EventRouter:
     - PAYMENT_*: admins + session
     - TABLE_*: admins + session
     - ENTITY_*: admins only (CRUD events)
+
+    PERF-FANOUT-01: Each routed event is encoded once into an EncodedFrame
+    that is shared by every audience and every recipient.
+
+    PERF-AUDIENCE-01: The audiences of each event type are precomputed as an
+    Audience mask. All audiences of an event are resolved together and sent
+    in one pass, once per socket, even if a socket is in several audiences.
+    RoutingResult still reports per-audience counts, and each socket counts
+    for the first audience it belongs to: admins, waiters, kitchen, diners.
     """
 
     # Events that should also go to kitchen
@@ -177,6 +220,86 @@ class EventRouter:
             manager: ConnectionManager instance for sending events
         """
         self._manager = manager
+        # PERF-AUDIENCE-01: Masks for all known event types
+        known_types = (
+            self.KITCHEN_EVENTS
+            | self.SESSION_EVENTS
+            | self.ADMIN_ONLY_EVENTS
+            | self.BRANCH_WIDE_WAITER_EVENTS
+        )
+        self._audience_masks: dict[str, Audience] = {
+            event_type: self.audience_mask(event_type) for event_type in known_types
+        }
+
+    @classmethod
+    def audience_mask(cls, event_type: str) -> Audience:
+        """
+        Compute the audiences of an event type from the routing tables.
+
+        Admins always get branch events; waiters get everything except
+        admin-only events.
+        """
+        mask = Audience.ADMINS
+        if event_type not in cls.ADMIN_ONLY_EVENTS:
+            mask |= Audience.WAITERS
+            if event_type in cls.BRANCH_WIDE_WAITER_EVENTS:
+                mask |= Audience.BRANCH_WIDE_WAITERS
+        if event_type in cls.KITCHEN_EVENTS:
+            mask |= Audience.KITCHEN
+        if event_type in cls.SESSION_EVENTS:
+            mask |= Audience.SESSION
+        return mask
+
+    @staticmethod
+    def audience_targets(
+        mask: Audience,
+        branch_id: int | None,
+        sector_id: int | None,
+        session_id: int | None,
+    ) -> list[tuple[str, int]]:
+        """
+        Turn an audience mask into (audience, key) targets, in priority order.
+
+        Args:
+            mask: Audiences of the event type.
+            branch_id: Branch of the event (admins, waiters, kitchen).
+            sector_id: Sector for targeted waiter notifications.
+            session_id: Table session (diners).
+
+        Returns:
+            Targets for ConnectionManager.send_to_audiences().
+        """
+        targets: list[tuple[str, int]] = []
+        if branch_id is not None:
+            if mask & Audience.ADMINS:
+                targets.append(("admins", branch_id))
+            if mask & Audience.WAITERS:
+                # High-priority events bypass sector filtering; without a
+                # sector, fall back to all waiters in the branch
+                if mask & Audience.BRANCH_WIDE_WAITERS or sector_id is None:
+                    targets.append(("waiters", branch_id))
+                else:
+                    targets.append(("sector", sector_id))
+            if mask & Audience.KITCHEN:
+                targets.append(("kitchen", branch_id))
+        if mask & Audience.SESSION and session_id is not None:
+            targets.append(("session", session_id))
+        return targets
+
+    async def _send_to_targets(
+        self,
+        result: RoutingResult,
+        targets: list[tuple[str, int]],
+        frame: EncodedFrame,
+        tenant_id: int | None,
+    ) -> None:
+        """Send to all targets at once and record per-audience counts in result."""
+        if not targets:
+            return
+        counts = await self._manager.send_to_audiences(targets, frame, tenant_id=tenant_id)
+        for audience, sent in counts.items():
+            field = _RESULT_FIELDS[audience]
+            setattr(result, field, getattr(result, field) + sent)
 
     async def route_event(self, event: dict) -> RoutingResult:
         """
@@ -204,117 +327,38 @@ class EventRouter:
             session_id = safe_int(event.get("session_id"), "session_id")
             sector_id = safe_int(event.get("sector_id"), "sector_id")
 
-            # Determine routing based on event type
-            to_kitchen = event_type in self.KITCHEN_EVENTS
-            to_session = event_type in self.SESSION_EVENTS
-            admin_only = event_type in self.ADMIN_ONLY_EVENTS
-
-            # Branch-level routing
-            if branch_id is not None:
-                # Always send to admins/managers
-                try:
-                    result.admin_sent = await self._manager.send_to_admins(
-                        branch_id, event, tenant_id=tenant_id
+            # PERF-FANOUT-01: Serialize once for all audiences
+            frame = EncodedFrame.from_payload(event)
+
+            # PERF-AUDIENCE-01: Precomputed audiences, resolved and sent together
+            mask = self._audience_masks.get(event_type)
+            if mask is None:
+                mask = self.audience_mask(event_type)
+            targets = self.audience_targets(mask, branch_id, sector_id, session_id)
+
+            try:
+                await self._send_to_targets(result, targets, frame, tenant_id)
+                if result.total_sent > 0:
+                    logger.debug(
+                        "Dispatched event",
+                        event_type=event_type,
+                        branch_id=branch_id,
+                        sector_id=sector_id,
+                        session_id=session_id,
+                        tenant_id=tenant_id,
+                        admins=result.admin_sent,
+                        waiters=result.waiter_sent,
+                        kitchen=result.kitchen_sent,
+                        diners=result.diner_sent,
                     )
-                    if result.admin_sent > 0:
-                        logger.debug(
-                            "Dispatched event to admins",
-                            event_type=event_type,
-                            branch_id=branch_id,
-                            tenant_id=tenant_id,
-                            clients=result.admin_sent,
-                        )
-                except Exception as e:
-                    errors.append(f"Failed to send to admins: {e}")
-                    logger.error("Error sending to admins", error=str(e))
-
-                # Waiter routing (unless admin-only event)
-                if not admin_only:
-                    try:
-                        # Check if this event should go to ALL waiters in branch
-                        # (bypass sector filtering for high-priority notifications)
-                        branch_wide = event_type in self.BRANCH_WIDE_WAITER_EVENTS
-
-                        if branch_wide:
-                            # Always send to all branch waiters for high-priority events
-                            result.waiter_sent = await self._manager.send_to_waiters_only(
-                                branch_id, event, tenant_id=tenant_id
-                            )
-                            if result.waiter_sent > 0:
-                                logger.debug(
-                                    "Dispatched event to all branch waiters (high priority)",
-                                    event_type=event_type,
-                                    branch_id=branch_id,
-                                    tenant_id=tenant_id,
-                                    clients=result.waiter_sent,
-                                )
-                        elif sector_id is not None:
-                            # Sector-targeted waiter notification
-                            result.waiter_sent = await self._manager.send_to_sector(
-                                sector_id, event, tenant_id=tenant_id
-                            )
-                            if result.waiter_sent > 0:
-                                logger.debug(
-                                    "Dispatched event to sector waiters",
-                                    event_type=event_type,
-                                    sector_id=sector_id,
-                                    tenant_id=tenant_id,
-                                    clients=result.waiter_sent,
-                                )
-                        else:
-                            # Fallback to all waiters in branch
-                            result.waiter_sent = await self._manager.send_to_waiters_only(
-                                branch_id, event, tenant_id=tenant_id
-                            )
-                            if result.waiter_sent > 0:
-                                logger.debug(
-                                    "Dispatched event to all branch waiters",
-                                    event_type=event_type,
-                                    branch_id=branch_id,
-                                    tenant_id=tenant_id,
-                                    clients=result.waiter_sent,
-                                )
-                    except Exception as e:
-                        errors.append(f"Failed to send to waiters: {e}")
-                        logger.error("Error sending to waiters", error=str(e))
-
-                # Kitchen routing: use send_to_kitchen
-                if to_kitchen:
-                    try:
-                        # Kitchen events go to kitchen connections
-                        result.kitchen_sent = await self._manager.send_to_kitchen(
-                            branch_id, event, tenant_id=tenant_id
-                        )
-
-                        if result.kitchen_sent > 0:
-                            logger.debug(
-                                "Dispatched event to branch (kitchen)",
-                                event_type=event_type,
-                                branch_id=branch_id,
-                                tenant_id=tenant_id,
-                                clients=result.kitchen_sent,
-                            )
-                    except Exception as e:
-                        errors.append(f"Failed to send to branch (kitchen): {e}")
-                        logger.error("Error sending to branch", error=str(e))
-
-            # Session-level routing (diners)
-            if to_session and session_id is not None:
-                try:
-                    result.diner_sent = await self._manager.send_to_session(
-                        session_id, event, tenant_id=tenant_id
-                    )
-                    if result.diner_sent > 0:
-                        logger.debug(
-                            "Dispatched event to session",
-                            event_type=event_type,
-                            session_id=session_id,
-                            tenant_id=tenant_id,
-                            diners=result.diner_sent,
-                        )
-                except Exception as e:
-                    errors.append(f"Failed to send to session: {e}")
-                    logger.error("Error sending to session", error=str(e))
+            except Exception as e:
+                errors.append(f"Failed to send to audiences: {e}")
+                logger.error(
+                    "Error sending event",
+                    event_type=event_type,
+                    targets=[audience for audience, _ in targets],
+                    error=str(e),
+                )
 
             if errors:
                 result.errors = errors
@@ -353,31 +397,20 @@ class EventRouter:
             RoutingResult
         """
         result = RoutingResult()
+        frame = EncodedFrame.from_payload(event)
 
-        result.admin_sent = await self._manager.send_to_admins(
-            branch_id, event, tenant_id=tenant_id
-        )
-
+        mask = Audience.ADMINS
         if include_waiters:
-            event_type = event.get("type", "")
-            branch_wide = event_type in self.BRANCH_WIDE_WAITER_EVENTS
-            sector_id = safe_int(event.get("sector_id"), "sector_id")
-
-            if branch_wide or not sector_id:
-                # High-priority events or no sector: send to all branch waiters
-                result.waiter_sent = await self._manager.send_to_waiters_only(
-                    branch_id, event, tenant_id=tenant_id
-                )
-            else:
-                result.waiter_sent = await self._manager.send_to_sector(
-                    sector_id, event, tenant_id=tenant_id
-                )
-
+            mask |= Audience.WAITERS
+            if event.get("type", "") in self.BRANCH_WIDE_WAITER_EVENTS:
+                mask |= Audience.BRANCH_WIDE_WAITERS
         if include_kitchen:
-            result.kitchen_sent = await self._manager.send_to_kitchen(
-                branch_id, event, tenant_id=tenant_id
-            )
+            mask |= Audience.KITCHEN
 
+        # No sector (or an invalid one): send to all branch waiters
+        sector_id = safe_int(event.get("sector_id"), "sector_id") if include_waiters else None
+        targets = self.audience_targets(mask, branch_id, sector_id, None)
+        await self._send_to_targets(result, targets, frame, tenant_id)
 
         return result
 
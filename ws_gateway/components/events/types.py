@@ -74,6 +74,10 @@ class EventType(str, Enum):
     ENTITY_DELETED = "ENTITY_DELETED"
     CASCADE_DELETE = "CASCADE_DELETE"
 
+    # Staff assignment events (PERF-SECTORS-01: consumed by the gateway,
+    # not forwarded to clients)
+    SECTOR_ASSIGNMENTS_CHANGED = "SECTOR_ASSIGNMENTS_CHANGED"
+
 
 # Set for O(1) lookup
 VALID_EVENT_TYPES: frozenset[str] = frozenset(e.value for e in EventType)
@@ -100,6 +104,10 @@ OPTIONAL_EVENT_FIELDS: frozenset[str] = frozenset({
     "entity", "actor",
     # Metadata fields
     "timestamp", "ts", "v",
+    # PERF-REPLAY-01: events:critical entry id
+    "stream_id",
+    # PERF-LATENCY-01: Epoch seconds when the backend published the event
+    "published_at",
 })
 
 
@@ -9,10 +9,15 @@ from ws_gateway.components.metrics.collector import (
     BroadcastMetrics,
     ConnectionMetrics,
     EventMetrics,
+    OutboundMetrics,
+    DeliveryLatencyMetrics,
 )
+from ws_gateway.components.metrics.histogram import LatencyHistogram
 from ws_gateway.components.metrics.prometheus import (
     PrometheusFormatter,
+    PrometheusExpositionCache,
     generate_prometheus_metrics,
+    get_exposition_cache,
 )
 
 __all__ = [
@@ -21,7 +26,12 @@ __all__ = [
     "BroadcastMetrics",
     "ConnectionMetrics",
     "EventMetrics",
+    "OutboundMetrics",
+    "DeliveryLatencyMetrics",
+    "LatencyHistogram",
     # Prometheus
     "PrometheusFormatter",
+    "PrometheusExpositionCache",
     "generate_prometheus_metrics",
+    "get_exposition_cache",
 ]
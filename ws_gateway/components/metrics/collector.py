@@ -2,20 +2,26 @@
 Metrics Collector for WebSocket Gateway.
 
 Centralizes metrics collection for observability.
-Thread-safe counter operations for concurrent access.
 
 ARCH-01 FIX: Extracted from ConnectionManager (Single Responsibility).
+
+PERF-METRICS-01: Lock-free. Every recorder runs on the event loop thread
+and is a plain attribute increment with no await point, so updates can
+never interleave. The asyncio.Lock taken per counter bump (and the
+threading.Lock of CRIT-WS-08) only added await points and contention.
+Dicts are copied and histograms snapshotted only when metrics are read.
 """
 
 from __future__ import annotations
 
-import asyncio
-import threading
 from dataclasses import dataclass, field  # LOW-WS-05 NOTE: field is used in @dataclass definitions below
 from typing import Any
 
+from ws_gateway.components.core.constants import WSConstants
+from ws_gateway.components.metrics.histogram import LatencyHistogram
+
 
-@dataclass
+@dataclass(slots=True)
 class BroadcastMetrics:
     """Metrics for broadcast operations."""
     total: int = 0
@@ -24,7 +30,7 @@ class BroadcastMetrics:
     rate_limited: int = 0  # HIGH-NEW-01 FIX: Track rate-limited broadcasts
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionMetrics:
     """Metrics for connection management."""
     rejected_limit: int = 0
@@ -33,7 +39,7 @@ class ConnectionMetrics:
     timeouts: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class EventMetrics:
     """Metrics for event processing."""
     processed: int = 0
@@ -42,27 +48,59 @@ class EventMetrics:
     callback_timeouts: int = 0
 
 
+@dataclass(slots=True)
+class OutboundMetrics:
+    """
+    Metrics for per-connection outbound queues.
+
+    PERF-OUTBOX-01: Lag is tracked as sum/count (Prometheus summary style)
+    plus the max observed, so averages can be derived per scrape interval.
+    PERF-METRICS-01: Lag is also kept as a fixed-bucket histogram.
+    """
+    frames_dropped: int = 0
+    frames_coalesced: int = 0
+    slow_consumers_evicted: int = 0
+    lag_seconds_sum: float = 0.0
+    lag_count: int = 0
+    lag_seconds_max: float = 0.0
+    lag_histogram: LatencyHistogram = field(
+        default_factory=lambda: LatencyHistogram(WSConstants.OUTBOUND_LAG_BUCKETS)
+    )
+
+
+@dataclass(slots=True)
+class DeliveryLatencyMetrics:
+    """
+    Publish-to-sent latency histograms of event frames.
+
+    PERF-LATENCY-01: End-to-end latency per (event_type, audience), and
+    its stages (transit, queue_wait, send) per (stage, audience).
+    """
+    total: dict[tuple[str, str], LatencyHistogram] = field(default_factory=dict)
+    stages: dict[tuple[str, str], LatencyHistogram] = field(default_factory=dict)
+
+
 class MetricsCollector:
     """
-    Thread-safe metrics collector for WebSocket Gateway.
+    Lock-free metrics collector for WebSocket Gateway.
 
-    Provides atomic increment operations and snapshot retrieval.
+    Counters are plain integers owned by the event loop; all methods must
+    be called from the loop thread. The async methods are kept for API
+    compatibility and never suspend; hot paths use the _sync variants.
 
     Usage:
         metrics = MetricsCollector()
-        metrics.increment_broadcast_total()
-        stats = metrics.get_snapshot()
+        metrics.increment_broadcast_total_sync()
+        stats = metrics.get_snapshot_sync()
     """
 
     def __init__(self):
         """Initialize metrics collector."""
-        self._lock = asyncio.Lock()
-        # CRIT-WS-08 FIX: Add threading lock for sync methods
-        # Ensures thread safety even in non-GIL Python implementations (PyPy, etc.)
-        self._sync_lock = threading.Lock()
         self._broadcast = BroadcastMetrics()
         self._connection = ConnectionMetrics()
         self._event = EventMetrics()
+        self._outbound = OutboundMetrics()
+        self._delivery = DeliveryLatencyMetrics()
         self._locks_cleaned = 0
         self._custom: dict[str, int] = {}
 
@@ -72,54 +110,31 @@ class MetricsCollector:
 
     async def increment_broadcast_total(self) -> None:
         """Increment total broadcast count."""
-        async with self._lock:
-            self._broadcast.total += 1
+        self._broadcast.total += 1
 
     async def increment_broadcast_failed(self) -> None:
         """Increment failed broadcast count."""
-        async with self._lock:
-            self._broadcast.failed += 1
+        self._broadcast.failed += 1
 
     async def add_failed_recipients(self, count: int) -> None:
         """Add count of failed recipients in a broadcast."""
-        async with self._lock:
-            self._broadcast.recipients_failed += count
+        self._broadcast.recipients_failed += count
 
     def increment_broadcast_total_sync(self) -> None:
-        """
-        Increment total broadcast count (sync version for hot path).
-
-        CRIT-WS-08 FIX: Uses threading.Lock for thread safety in all Python implementations.
-        """
-        with self._sync_lock:
-            self._broadcast.total += 1
+        """Increment total broadcast count (hot path)."""
+        self._broadcast.total += 1
 
     def increment_broadcast_failed_sync(self) -> None:
-        """
-        Increment failed broadcast count (sync version).
-
-        CRIT-WS-08 FIX: Uses threading.Lock for thread safety.
-        """
-        with self._sync_lock:
-            self._broadcast.failed += 1
+        """Increment failed broadcast count."""
+        self._broadcast.failed += 1
 
     def add_failed_recipients_sync(self, count: int) -> None:
-        """
-        Add failed recipients count (sync version).
-
-        CRIT-WS-08 FIX: Uses threading.Lock for thread safety.
-        """
-        with self._sync_lock:
-            self._broadcast.recipients_failed += count
+        """Add failed recipients count."""
+        self._broadcast.recipients_failed += count
 
     def increment_broadcast_rate_limited_sync(self) -> None:
-        """
-        Increment rate-limited broadcasts count (sync version).
-
-        CRIT-WS-08 FIX: Uses threading.Lock for thread safety.
-        """
-        with self._sync_lock:
-            self._broadcast.rate_limited += 1
+        """Increment rate-limited broadcasts count."""
+        self._broadcast.rate_limited += 1
 
     # ==========================================================================
     # Connection Metrics
@@ -127,33 +142,27 @@ class MetricsCollector:
 
     async def increment_connection_rejected_limit(self) -> None:
         """Increment count of connections rejected due to limit."""
-        async with self._lock:
-            self._connection.rejected_limit += 1
+        self._connection.rejected_limit += 1
 
     async def increment_connection_rejected_rate_limit(self) -> None:
         """Increment count of connections rejected due to rate limiting."""
-        async with self._lock:
-            self._connection.rejected_rate_limit += 1
+        self._connection.rejected_rate_limit += 1
 
     async def increment_connection_rejected_auth(self) -> None:
         """Increment count of connections rejected due to auth failure."""
-        async with self._lock:
-            self._connection.rejected_auth += 1
+        self._connection.rejected_auth += 1
 
     async def increment_connection_timeouts(self) -> None:
         """Increment count of connection timeouts."""
-        async with self._lock:
-            self._connection.timeouts += 1
+        self._connection.timeouts += 1
 
     def increment_connection_rejected_limit_sync(self) -> None:
-        """Increment connection rejected limit (sync version). CRIT-WS-08 FIX."""
-        with self._sync_lock:
-            self._connection.rejected_limit += 1
+        """Increment connections rejected due to limit."""
+        self._connection.rejected_limit += 1
 
     def increment_connection_rejected_rate_limit_sync(self) -> None:
-        """Increment connection rejected rate limit (sync version). CRIT-WS-08 FIX."""
-        with self._sync_lock:
-            self._connection.rejected_rate_limit += 1
+        """Increment connections rejected due to rate limiting."""
+        self._connection.rejected_rate_limit += 1
 
     # ==========================================================================
     # Event Metrics
@@ -161,28 +170,124 @@ class MetricsCollector:
 
     async def increment_events_processed(self) -> None:
         """Increment count of events processed."""
-        async with self._lock:
-            self._event.processed += 1
+        self._event.processed += 1
 
     async def increment_events_dropped(self) -> None:
         """Increment count of events dropped due to queue full."""
-        async with self._lock:
-            self._event.dropped += 1
+        self._event.dropped += 1
 
     async def increment_events_invalid_schema(self) -> None:
         """Increment count of events with invalid schema."""
-        async with self._lock:
-            self._event.invalid_schema += 1
+        self._event.invalid_schema += 1
 
     async def increment_callback_timeouts(self) -> None:
         """Increment count of callback timeouts."""
-        async with self._lock:
-            self._event.callback_timeouts += 1
+        self._event.callback_timeouts += 1
 
     def increment_events_dropped_sync(self) -> None:
-        """Increment events dropped (sync version). CRIT-WS-08 FIX."""
-        with self._sync_lock:
-            self._event.dropped += 1
+        """Increment events dropped due to queue full."""
+        self._event.dropped += 1
+
+    # ==========================================================================
+    # Outbound Queue Metrics (PERF-OUTBOX-01)
+    # ==========================================================================
+
+    def increment_outbound_dropped_sync(self, count: int = 1) -> None:
+        """Add frames dropped from full per-connection queues."""
+        self._outbound.frames_dropped += count
+
+    def increment_outbound_coalesced_sync(self) -> None:
+        """Increment frames coalesced into an identical pending frame."""
+        self._outbound.frames_coalesced += 1
+
+    def increment_slow_consumer_evicted_sync(self) -> None:
+        """Increment connections closed for falling behind."""
+        self._outbound.slow_consumers_evicted += 1
+
+    def record_outbound_lag_sync(self, lag_seconds: float) -> None:
+        """Record enqueue-to-sent lag for one delivered frame."""
+        outbound = self._outbound
+        outbound.lag_seconds_sum += lag_seconds
+        outbound.lag_count += 1
+        if lag_seconds > outbound.lag_seconds_max:
+            outbound.lag_seconds_max = lag_seconds
+        outbound.lag_histogram.observe(lag_seconds)
+
+    # ==========================================================================
+    # Publish-to-deliver Latency (PERF-LATENCY-01)
+    # ==========================================================================
+
+    def record_delivery_latency_sync(
+        self,
+        event_type: str | None,
+        audience: str | None,
+        transit: float,
+        queue_wait: float,
+        send: float,
+    ) -> None:
+        """
+        Record the latency of one event frame sent to one connection.
+
+        Stages are clamped at 0 (backend and gateway clocks may differ
+        slightly); the end-to-end value is their sum.
+
+        Args:
+            event_type: Type of the event.
+            audience: Audience the connection was reached through.
+            transit: Publish to gateway receipt (Redis and network).
+            queue_wait: Gateway receipt to start of the socket write.
+            send: Duration of the socket write.
+        """
+        audience = audience or "direct"
+        stages = (
+            ("transit", max(0.0, transit)),
+            ("queue_wait", max(0.0, queue_wait)),
+            ("send", max(0.0, send)),
+        )
+        total = self._delivery.total
+        key = (event_type or "unknown", audience)
+        if key not in total and len(total) >= WSConstants.DELIVERY_LATENCY_MAX_SERIES:
+            key = ("other", audience)
+        histogram = total.get(key)
+        if histogram is None:
+            histogram = total[key] = LatencyHistogram(WSConstants.DELIVERY_LATENCY_BUCKETS)
+        histogram.observe(sum(seconds for _, seconds in stages))
+
+        for stage, seconds in stages:
+            histogram = self._delivery.stages.get((stage, audience))
+            if histogram is None:
+                histogram = self._delivery.stages[(stage, audience)] = LatencyHistogram(
+                    WSConstants.DELIVERY_LATENCY_BUCKETS
+                )
+            histogram.observe(seconds)
+
+    def get_delivery_latency_sync(self) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get latency histogram snapshots for /ws/metrics.
+
+        Returns:
+            {"total": [{event_type, audience, buckets, sum, count}, ...],
+             "stages": [{stage, audience, buckets, sum, count}, ...]}
+        """
+        return {
+            "total": [
+                {"event_type": event_type, "audience": audience, **histogram.snapshot()}
+                for (event_type, audience), histogram in sorted(self._delivery.total.items())
+            ],
+            "stages": [
+                {"stage": stage, "audience": audience, **histogram.snapshot()}
+                for (stage, audience), histogram in sorted(self._delivery.stages.items())
+            ],
+        }
+
+    def get_histograms_sync(self) -> dict[str, dict[str, Any]]:
+        """
+        Get snapshots of the unlabeled histograms (PERF-METRICS-01).
+
+        Returns:
+            {"outbound_lag_seconds": {buckets, sum, count}}
+        """
+        return {"outbound_lag_seconds": self._outbound.lag_histogram.snapshot()}
 
     # ==========================================================================
     # Lock Metrics
@@ -190,13 +295,11 @@ class MetricsCollector:
 
     async def add_locks_cleaned(self, count: int) -> None:
         """Add count of locks cleaned."""
-        async with self._lock:
-            self._locks_cleaned += count
+        self._locks_cleaned += count
 
     def add_locks_cleaned_sync(self, count: int) -> None:
-        """Add locks cleaned count (sync version). CRIT-WS-08 FIX."""
-        with self._sync_lock:
-            self._locks_cleaned += count
+        """Add locks cleaned count."""
+        self._locks_cleaned += count
 
     # ==========================================================================
     # Custom Metrics
@@ -204,13 +307,11 @@ class MetricsCollector:
 
     async def increment_custom(self, name: str, count: int = 1) -> None:
         """Increment a custom metric by name."""
-        async with self._lock:
-            self._custom[name] = self._custom.get(name, 0) + count
+        self.increment_custom_sync(name, count)
 
     def increment_custom_sync(self, name: str, count: int = 1) -> None:
-        """Increment custom metric (sync version). CRIT-WS-08 FIX."""
-        with self._sync_lock:
-            self._custom[name] = self._custom.get(name, 0) + count
+        """Increment a custom metric by name."""
+        self._custom[name] = self._custom.get(name, 0) + count
 
     # ==========================================================================
     # Snapshot
@@ -222,13 +323,11 @@ class MetricsCollector:
 
         Returns a copy to prevent modification of internal state.
         """
-        async with self._lock:
-            return self._get_snapshot_internal()
+        return self._get_snapshot_internal()
 
     def get_snapshot_sync(self) -> dict[str, Any]:
-        """Get metrics snapshot (sync version for health checks). CRIT-WS-08 FIX."""
-        with self._sync_lock:
-            return self._get_snapshot_internal()
+        """Get metrics snapshot (for health checks and scrapes)."""
+        return self._get_snapshot_internal()
 
     def _get_snapshot_internal(self) -> dict[str, Any]:
         """
@@ -253,6 +352,13 @@ class MetricsCollector:
             "events_dropped": self._event.dropped,
             "events_invalid_schema": self._event.invalid_schema,
             "events_callback_timeouts": self._event.callback_timeouts,  # LOW-AUD-03 FIX
+            # Outbound queue metrics (PERF-OUTBOX-01)
+            "outbound_frames_dropped": self._outbound.frames_dropped,
+            "outbound_frames_coalesced": self._outbound.frames_coalesced,
+            "outbound_slow_consumers_evicted": self._outbound.slow_consumers_evicted,
+            "outbound_lag_seconds_sum": round(self._outbound.lag_seconds_sum, 6),
+            "outbound_lag_count": self._outbound.lag_count,
+            "outbound_lag_seconds_max": round(self._outbound.lag_seconds_max, 6),
             # Other metrics
             "locks_cleaned": self._locks_cleaned,
             **self._custom,
@@ -264,11 +370,12 @@ class MetricsCollector:
 
         Useful for periodic metric collection systems.
         """
-        async with self._lock:
-            snapshot = self._get_snapshot_internal()
-            self._broadcast = BroadcastMetrics()
-            self._connection = ConnectionMetrics()
-            self._event = EventMetrics()
-            self._locks_cleaned = 0
-            self._custom.clear()
-            return snapshot
+        snapshot = self._get_snapshot_internal()
+        self._broadcast = BroadcastMetrics()
+        self._connection = ConnectionMetrics()
+        self._event = EventMetrics()
+        self._outbound = OutboundMetrics()
+        self._delivery = DeliveryLatencyMetrics()
+        self._locks_cleaned = 0
+        self._custom.clear()
+        return snapshot
@@ -0,0 +1,63 @@
+"""
+Fixed-bucket Latency Histograms.
+
+Cumulative-bucket histograms in Prometheus style, cheap enough to observe
+on the delivery hot path: one bisect and three increments per sample.
+
+PERF-LATENCY-01: Shared by per-lane dispatch latency (PERF-LANES-01) and
+publish-to-deliver latency per event type and audience.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Any
+
+
+class LatencyHistogram:
+    """
+    Histogram of seconds over fixed upper bounds.
+
+    Usage:
+        histogram = LatencyHistogram((0.01, 0.1, 1.0))
+        histogram.observe(0.042)
+        histogram.snapshot()  # {"buckets": {"0.01": 0, ...}, "sum": ..., "count": 1}
+    """
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """
+        Initialize histogram.
+
+        Args:
+            bounds: Bucket upper bounds in seconds, ascending.
+        """
+        self.bounds = bounds
+        # One count per bound plus +Inf
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        """Record one sample (negative values count as 0)."""
+        if seconds < 0:
+            seconds = 0.0
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Cumulative bucket counts keyed by upper bound, plus sum and count."""
+        buckets: dict[str, int] = {}
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+        return {"buckets": buckets, "sum": round(self.total, 6), "count": self.count}
+
+
+__all__ = [
+    "LatencyHistogram",
+]
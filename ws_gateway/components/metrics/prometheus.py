@@ -9,10 +9,11 @@ ARCH-OPP-07 FIX: Added Prometheus-compatible metrics endpoint.
 
 from __future__ import annotations
 
+import asyncio
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ws_gateway.connection_manager import ConnectionManager
@@ -142,6 +143,118 @@ METRIC_DEFINITIONS: list[MetricDefinition] = [
         metric_type=MetricType.COUNTER,
     ),
 
+    # Outbound queue metrics (PERF-OUTBOX-01)
+    MetricDefinition(
+        name="wsgateway_outbound_queued_frames",
+        help_text="Frames waiting in per-connection outbound queues",
+        metric_type=MetricType.GAUGE,
+    ),
+    MetricDefinition(
+        name="wsgateway_outbound_max_queue_depth",
+        help_text="Deepest per-connection outbound queue",
+        metric_type=MetricType.GAUGE,
+    ),
+    MetricDefinition(
+        name="wsgateway_outbound_max_pending_lag_seconds",
+        help_text="Age of the oldest frame waiting in any outbound queue",
+        metric_type=MetricType.GAUGE,
+    ),
+    MetricDefinition(
+        name="wsgateway_outbound_lag_seconds",
+        help_text="Enqueue-to-send lag of delivered frames",
+        metric_type=MetricType.HISTOGRAM,
+    ),
+    MetricDefinition(
+        name="wsgateway_outbound_frames_dropped",
+        help_text="Frames dropped from full outbound queues",
+        metric_type=MetricType.COUNTER,
+    ),
+    MetricDefinition(
+        name="wsgateway_outbound_frames_coalesced",
+        help_text="Frames coalesced into an identical pending frame",
+        metric_type=MetricType.COUNTER,
+    ),
+    MetricDefinition(
+        name="wsgateway_outbound_slow_consumers_evicted",
+        help_text="Connections closed for falling behind",
+        metric_type=MetricType.COUNTER,
+    ),
+
+    # Keyed event dispatch metrics (PERF-DISPATCH-01)
+    MetricDefinition(
+        name="wsgateway_dispatch_in_flight",
+        help_text="Events currently being delivered",
+        metric_type=MetricType.GAUGE,
+    ),
+    MetricDefinition(
+        name="wsgateway_dispatch_pending_events",
+        help_text="Events waiting in per-key dispatch queues",
+        metric_type=MetricType.GAUGE,
+    ),
+    MetricDefinition(
+        name="wsgateway_dispatch_active_keys",
+        help_text="Ordering keys (sessions/branches) with pending events",
+        metric_type=MetricType.GAUGE,
+    ),
+    MetricDefinition(
+        name="wsgateway_dispatch_key_queue_depth",
+        help_text="Queue depth of the deepest ordering keys",
+        metric_type=MetricType.GAUGE,
+        labels=["key"],
+    ),
+
+    # Event priority lane metrics (PERF-LANES-01)
+    MetricDefinition(
+        name="wsgateway_event_lane_depth",
+        help_text="Events waiting in each priority lane",
+        metric_type=MetricType.GAUGE,
+        labels=["lane"],
+    ),
+    MetricDefinition(
+        name="wsgateway_event_lane_dropped",
+        help_text="Events dropped from each priority lane on overflow",
+        metric_type=MetricType.COUNTER,
+        labels=["lane"],
+    ),
+    MetricDefinition(
+        name="wsgateway_event_lane_latency_seconds",
+        help_text="Enqueue-to-delivered latency of events per priority lane",
+        metric_type=MetricType.HISTOGRAM,
+        labels=["lane"],
+    ),
+
+    # Publish-to-deliver latency (PERF-LATENCY-01)
+    MetricDefinition(
+        name="wsgateway_event_delivery_seconds",
+        help_text="Publish-to-sent latency of event frames",
+        metric_type=MetricType.HISTOGRAM,
+        labels=["event_type", "audience"],
+    ),
+    MetricDefinition(
+        name="wsgateway_event_delivery_stage_seconds",
+        help_text="Publish-to-sent latency by stage (transit, queue_wait, send)",
+        metric_type=MetricType.HISTOGRAM,
+        labels=["stage", "audience"],
+    ),
+
+    # Handshake admission metrics (PERF-ADMISSION-01)
+    MetricDefinition(
+        name="wsgateway_handshakes_in_flight",
+        help_text="WebSocket handshakes currently running",
+        metric_type=MetricType.GAUGE,
+    ),
+    MetricDefinition(
+        name="wsgateway_handshakes_queued",
+        help_text="WebSocket handshakes waiting for an admission slot",
+        metric_type=MetricType.GAUGE,
+    ),
+    MetricDefinition(
+        name="wsgateway_handshakes_rejected_total",
+        help_text="Handshakes closed with TRY_AGAIN_LATER by reason",
+        metric_type=MetricType.COUNTER,
+        labels=["reason"],
+    ),
+
     # Lock metrics
     MetricDefinition(
         name="wsgateway_locks_cleaned",
@@ -243,6 +356,35 @@ class PrometheusFormatter:
 
         return "\n".join(lines)
 
+    def format_histogram(
+        self,
+        name: str,
+        help_text: str,
+        series: list[tuple[dict[str, Any], dict[str, Any]]],
+    ) -> str:
+        """
+        Format a labeled histogram in Prometheus format.
+
+        Args:
+            name: Metric name (without _bucket/_sum/_count).
+            help_text: Help text description.
+            series: (labels, snapshot) pairs; snapshots as returned by
+                LatencyHistogram.snapshot().
+
+        Returns:
+            Prometheus-formatted histogram string.
+        """
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for labels, snapshot in series:
+            pairs = [f'{k}="{v}"' for k, v in labels.items()]
+            suffix = f"{{{','.join(pairs)}}}" if pairs else ""
+            for bound, count in snapshot.get("buckets", {}).items():
+                bucket_labels = ",".join(pairs + [f'le="{bound}"'])
+                lines.append(f"{name}_bucket{{{bucket_labels}}} {count}")
+            lines.append(f"{name}_sum{suffix} {snapshot.get('sum', 0)}")
+            lines.append(f"{name}_count{suffix} {snapshot.get('count', 0)}")
+        return "\n".join(lines)
+
     def format_all_metrics(self, stats: dict[str, Any]) -> str:
         """
         Format all metrics from ConnectionManager stats.
@@ -256,6 +398,12 @@ class PrometheusFormatter:
         lines: list[str] = []
         metrics = stats.get("metrics", {})
         heartbeat_stats = stats.get("heartbeat_stats", {})
+        outbound_stats = stats.get("outbound_stats", {})
+        dispatch_stats = stats.get("dispatch_stats", {})
+        lane_stats = stats.get("lane_stats", {})
+        delivery_latency = stats.get("delivery_latency", {})
+        histograms = stats.get("histograms", {})
+        admission_stats = stats.get("admission_stats", {})
 
         # Connection gauges
         lines.append(self.format_metric(
@@ -379,6 +527,147 @@ class PrometheusFormatter:
             MetricType.COUNTER,
         ))
 
+        # Outbound queue metrics (PERF-OUTBOX-01)
+        lines.append(self.format_metric(
+            "wsgateway_outbound_queued_frames",
+            outbound_stats.get("queued_frames", 0),
+            "Frames waiting in per-connection outbound queues",
+            MetricType.GAUGE,
+        ))
+
+        lines.append(self.format_metric(
+            "wsgateway_outbound_max_queue_depth",
+            outbound_stats.get("max_queue_depth", 0),
+            "Deepest per-connection outbound queue",
+            MetricType.GAUGE,
+        ))
+
+        lines.append(self.format_metric(
+            "wsgateway_outbound_max_pending_lag_seconds",
+            outbound_stats.get("max_pending_lag_seconds", 0),
+            "Age of the oldest frame waiting in any outbound queue",
+            MetricType.GAUGE,
+        ))
+
+        # PERF-METRICS-01: Histogram; _sum/_count keep their summary values
+        outbound_lag = histograms.get("outbound_lag_seconds") or {
+            "sum": metrics.get("outbound_lag_seconds_sum", 0),
+            "count": metrics.get("outbound_lag_count", 0),
+        }
+        lines.append(self.format_histogram(
+            "wsgateway_outbound_lag_seconds",
+            "Enqueue-to-send lag of delivered frames",
+            [({}, outbound_lag)],
+        ))
+
+        lines.append(self.format_metric(
+            "wsgateway_outbound_frames_dropped",
+            metrics.get("outbound_frames_dropped", 0),
+            "Frames dropped from full outbound queues",
+            MetricType.COUNTER,
+        ))
+
+        lines.append(self.format_metric(
+            "wsgateway_outbound_frames_coalesced",
+            metrics.get("outbound_frames_coalesced", 0),
+            "Frames coalesced into an identical pending frame",
+            MetricType.COUNTER,
+        ))
+
+        lines.append(self.format_metric(
+            "wsgateway_outbound_slow_consumers_evicted",
+            metrics.get("outbound_slow_consumers_evicted", 0),
+            "Connections closed for falling behind",
+            MetricType.COUNTER,
+        ))
+
+        # Keyed event dispatch metrics (PERF-DISPATCH-01)
+        lines.append(self.format_metric(
+            "wsgateway_dispatch_in_flight",
+            dispatch_stats.get("in_flight", 0),
+            "Events currently being delivered",
+            MetricType.GAUGE,
+        ))
+
+        lines.append(self.format_metric(
+            "wsgateway_dispatch_pending_events",
+            dispatch_stats.get("pending_events", 0),
+            "Events waiting in per-key dispatch queues",
+            MetricType.GAUGE,
+        ))
+
+        lines.append(self.format_metric(
+            "wsgateway_dispatch_active_keys",
+            dispatch_stats.get("active_keys", 0),
+            "Ordering keys (sessions/branches) with pending events",
+            MetricType.GAUGE,
+        ))
+
+        # Only the deepest keys are exported to bound label cardinality
+        lines.append("# HELP wsgateway_dispatch_key_queue_depth Queue depth of the deepest ordering keys")
+        lines.append("# TYPE wsgateway_dispatch_key_queue_depth gauge")
+        for key, depth in dispatch_stats.get("key_depths", {}).items():
+            lines.append(f'wsgateway_dispatch_key_queue_depth{{key="{key}"}} {depth}')
+
+        # Event priority lane metrics (PERF-LANES-01)
+        lines.append("# HELP wsgateway_event_lane_depth Events waiting in each priority lane")
+        lines.append("# TYPE wsgateway_event_lane_depth gauge")
+        for lane, lane_info in lane_stats.items():
+            lines.append(f'wsgateway_event_lane_depth{{lane="{lane}"}} {lane_info.get("depth", 0)}')
+
+        lines.append("# HELP wsgateway_event_lane_dropped Events dropped from each priority lane on overflow")
+        lines.append("# TYPE wsgateway_event_lane_dropped counter")
+        for lane, lane_info in lane_stats.items():
+            lines.append(f'wsgateway_event_lane_dropped{{lane="{lane}"}} {lane_info.get("dropped", 0)}')
+
+        lines.append(self.format_histogram(
+            "wsgateway_event_lane_latency_seconds",
+            "Enqueue-to-delivered latency of events per priority lane",
+            [
+                ({"lane": lane}, lane_info.get("latency_seconds", {}))
+                for lane, lane_info in lane_stats.items()
+            ],
+        ))
+
+        # Publish-to-deliver latency (PERF-LATENCY-01)
+        lines.append(self.format_histogram(
+            "wsgateway_event_delivery_seconds",
+            "Publish-to-sent latency of event frames",
+            [
+                ({"event_type": entry["event_type"], "audience": entry["audience"]}, entry)
+                for entry in delivery_latency.get("total", [])
+            ],
+        ))
+
+        lines.append(self.format_histogram(
+            "wsgateway_event_delivery_stage_seconds",
+            "Publish-to-sent latency by stage (transit, queue_wait, send)",
+            [
+                ({"stage": entry["stage"], "audience": entry["audience"]}, entry)
+                for entry in delivery_latency.get("stages", [])
+            ],
+        ))
+
+        # Handshake admission metrics (PERF-ADMISSION-01)
+        lines.append(self.format_metric(
+            "wsgateway_handshakes_in_flight",
+            admission_stats.get("in_flight", 0),
+            "WebSocket handshakes currently running",
+            MetricType.GAUGE,
+        ))
+
+        lines.append(self.format_metric(
+            "wsgateway_handshakes_queued",
+            admission_stats.get("queued", 0),
+            "WebSocket handshakes waiting for an admission slot",
+            MetricType.GAUGE,
+        ))
+
+        lines.append("# HELP wsgateway_handshakes_rejected_total Handshakes closed with TRY_AGAIN_LATER by reason")
+        lines.append("# TYPE wsgateway_handshakes_rejected_total counter")
+        lines.append(f'wsgateway_handshakes_rejected_total{{reason="queue_full"}} {admission_stats.get("rejected_queue_full", 0)}')
+        lines.append(f'wsgateway_handshakes_rejected_total{{reason="timeout"}} {admission_stats.get("rejected_timeout", 0)}')
+
         # Lock metrics
         lines.append(self.format_metric(
             "wsgateway_locks_cleaned",
@@ -457,6 +746,79 @@ def get_prometheus_formatter() -> PrometheusFormatter:
     return _formatter
 
 
+# =============================================================================
+# Cached exposition (PERF-PROM-01)
+# =============================================================================
+
+
+class PrometheusExpositionCache:
+    """
+    Serves the exposition as cached bytes, rebuilt at most once per interval.
+
+    PERF-PROM-01: Several Prometheus replicas and Grafana live panels scrape
+    /ws/metrics; every rebuild aggregates stats and formats the whole text on
+    the event loop. Scrapes arriving while a rebuild is running wait for it
+    instead of starting another one.
+
+    Usage:
+        cache = PrometheusExpositionCache(max_age_seconds=5.0)
+        body = await cache.get(lambda: generate_prometheus_metrics(manager))
+    """
+
+    def __init__(self, max_age_seconds: float) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_age_seconds: Reuse the last exposition while younger than
+                this; 0 rebuilds on every scrape.
+        """
+        self._max_age = max_age_seconds
+        self._body = b""
+        self._built_at = float("-inf")
+        self._lock = asyncio.Lock()
+        self._rebuilds = 0
+
+    @property
+    def rebuilds(self) -> int:
+        """Number of times the exposition was rebuilt."""
+        return self._rebuilds
+
+    def _is_fresh(self) -> bool:
+        return time.monotonic() - self._built_at < self._max_age
+
+    async def get(self, build: Callable[[], Awaitable[str]]) -> bytes:
+        """
+        Return the cached exposition, rebuilding it if it is too old.
+
+        Args:
+            build: Coroutine factory producing the exposition text.
+
+        Returns:
+            UTF-8 encoded exposition.
+        """
+        if self._is_fresh():
+            return self._body
+        async with self._lock:
+            if not self._is_fresh():
+                text = await build()
+                self._body = text.encode("utf-8")
+                self._built_at = time.monotonic()
+                self._rebuilds += 1
+        return self._body
+
+
+_exposition_cache: PrometheusExpositionCache | None = None
+
+
+def get_exposition_cache(max_age_seconds: float) -> PrometheusExpositionCache:
+    """Get singleton exposition cache (max_age_seconds applies on first call)."""
+    global _exposition_cache
+    if _exposition_cache is None:
+        _exposition_cache = PrometheusExpositionCache(max_age_seconds)
+    return _exposition_cache
+
+
 async def generate_prometheus_metrics(manager: "ConnectionManager") -> str:
     """
     Generate Prometheus metrics from ConnectionManager.
@@ -467,6 +829,11 @@ async def generate_prometheus_metrics(manager: "ConnectionManager") -> str:
     Returns:
         Prometheus exposition format string.
     """
+    from ws_gateway.redis_subscriber import get_subscriber_metrics
+
     stats = await manager.get_stats()
+    subscriber_metrics = get_subscriber_metrics()
+    stats["dispatch_stats"] = subscriber_metrics.get("dispatch", {})
+    stats["lane_stats"] = subscriber_metrics.get("event_queue", {}).get("lanes", {})
     formatter = get_prometheus_formatter()
     return formatter.format_all_metrics(stats)
@@ -18,19 +18,26 @@ from __future__ import annotations
 import asyncio
 import logging
 from types import MappingProxyType
-from typing import Any, TYPE_CHECKING
+from typing import Any, Sequence, TYPE_CHECKING
 
 from shared.config.settings import settings
 from ws_gateway.components.core.constants import (
+    MSG_REPLAY_DONE,
     WSCloseCode,
     WSConstants,
 )
+from ws_gateway.components.connection.admission import HandshakeAdmission
 from ws_gateway.components.connection.locks import LockManager
 from ws_gateway.components.metrics.collector import MetricsCollector
 from ws_gateway.components.connection.heartbeat import HeartbeatTracker, handle_heartbeat
 from ws_gateway.components.connection.rate_limiter import WebSocketRateLimiter
 from ws_gateway.components.core.context import sanitize_log_data
 from ws_gateway.components.connection.index import ConnectionIndex
+from ws_gateway.components.connection.registry import ConnectionRecord, ConnectionRegistry
+from ws_gateway.components.broadcast.frame import EncodedFrame
+from ws_gateway.components.events.router import EventRouter, safe_int
+from ws_gateway.core.subscriber.interest import ChannelInterest
+from ws_gateway.core.subscriber.replay import StreamReplay, read_missed_events
 
 # Import modular components
 from ws_gateway.core.connection import (
@@ -113,12 +120,28 @@ class ConnectionManager:
         # Core components
         self._lock_manager = LockManager()
         self._metrics = MetricsCollector()
-        self._heartbeat_tracker = HeartbeatTracker(timeout_seconds=self.HEARTBEAT_TIMEOUT)
+        # PERF-REGISTRY-01: One record per socket holds index, heartbeat and
+        # rate-limit state
+        self._registry = ConnectionRegistry()
+        self._heartbeat_tracker = HeartbeatTracker(
+            timeout_seconds=self.HEARTBEAT_TIMEOUT,
+            registry=self._registry,
+        )
         self._rate_limiter = WebSocketRateLimiter(
             max_messages=settings.ws_message_rate_limit,
             window_seconds=settings.ws_message_rate_window,
+            registry=self._registry,
+        )
+        self._index = ConnectionIndex(self._registry)
+        # PERF-SUBS-01: Index drives interest-based Redis subscriptions
+        self._channel_interest = ChannelInterest()
+        self._index.set_interest_listener(self._channel_interest)
+        # PERF-ADMISSION-01: Bounds concurrent handshakes during reconnect storms
+        self._admission = HandshakeAdmission(
+            max_concurrent=settings.ws_handshake_max_concurrent,
+            max_queued=settings.ws_handshake_max_queued,
+            queue_timeout=settings.ws_handshake_queue_timeout,
         )
-        self._index = ConnectionIndex()
 
         # Lifecycle component
         self._lifecycle = ConnectionLifecycle(
@@ -137,7 +160,7 @@ class ConnectionManager:
             metrics=self._metrics,
             heartbeat_tracker=self._heartbeat_tracker,
             index=self._index,
-            disconnect_callback=self._lifecycle.disconnect,
+            disconnect_callback=self.disconnect,
         )
 
         # Broadcaster component (needs mark_dead callback)
@@ -147,6 +170,8 @@ class ConnectionManager:
             metrics=self._metrics,
             mark_dead_callback=self._cleanup.mark_dead_connection,
             batch_size=self.BROADCAST_BATCH_SIZE,
+            outbound_queue_size=settings.ws_outbound_queue_size,
+            outbound_max_lag_seconds=settings.ws_outbound_max_lag_seconds,
         )
 
         # Stats component
@@ -159,6 +184,8 @@ class ConnectionManager:
             get_total_connections=lambda: self._lifecycle.total_connections,
             get_dead_connections_count=lambda: self._cleanup.dead_connections_count,
             max_total_connections=self.MAX_TOTAL_CONNECTIONS,
+            get_outbound_stats=self._broadcaster.get_outbound_stats,
+            get_admission_stats=self._admission.get_stats,
         )
 
     # =========================================================================
@@ -166,28 +193,28 @@ class ConnectionManager:
     # =========================================================================
 
     @property
-    def by_user(self) -> MappingProxyType[int, set["WebSocket"]]:
-        """Connections indexed by user ID."""
+    def by_user(self) -> MappingProxyType[int, set[int]]:
+        """Connection ids indexed by user ID."""
         return self._index.by_user
 
     @property
-    def by_branch(self) -> MappingProxyType[int, set["WebSocket"]]:
-        """Connections indexed by branch ID."""
+    def by_branch(self) -> MappingProxyType[int, set[int]]:
+        """Connection ids indexed by branch ID."""
         return self._index.by_branch
 
     @property
-    def by_session(self) -> MappingProxyType[int, set["WebSocket"]]:
-        """Connections indexed by session ID."""
+    def by_session(self) -> MappingProxyType[int, set[int]]:
+        """Connection ids indexed by session ID."""
         return self._index.by_session
 
     @property
-    def by_sector(self) -> MappingProxyType[int, set["WebSocket"]]:
-        """Connections indexed by sector ID."""
+    def by_sector(self) -> MappingProxyType[int, set[int]]:
+        """Connection ids indexed by sector ID."""
         return self._index.by_sector
 
     @property
-    def admins_by_branch(self) -> MappingProxyType[int, set["WebSocket"]]:
-        """Admin connections indexed by branch ID."""
+    def admins_by_branch(self) -> MappingProxyType[int, set[int]]:
+        """Admin connection ids indexed by branch ID."""
         return self._index.admins_by_branch
 
     @property
@@ -195,25 +222,35 @@ class ConnectionManager:
         """Total number of active connections."""
         return self._lifecycle.total_connections
 
+    @property
+    def channel_interest(self) -> ChannelInterest:
+        """Redis channels needed by local connections (PERF-SUBS-01)."""
+        return self._channel_interest
+
+    @property
+    def admission(self) -> HandshakeAdmission:
+        """Handshake admission controller (PERF-ADMISSION-01)."""
+        return self._admission
+
     # =========================================================================
-    # SCALE-HIGH-01: Broadcast Worker Pool
+    # PERF-OUTBOX-01: Outbound Writers (replaces SCALE-HIGH-01 worker pool)
     # =========================================================================
 
     async def start_broadcast_workers(self) -> None:
         """
-        SCALE-HIGH-01 FIX: Start broadcast worker pool.
-        
-        Call this during application startup (lifespan) to enable
-        parallel broadcast processing for high-throughput scenarios.
+        Start per-connection outbound writers.
+
+        Call this during application startup (lifespan).
+        PERF-OUTBOX-01: Each connection gets its own bounded send queue.
         """
         await self._broadcaster.start_workers()
 
     async def stop_broadcast_workers(self, timeout: float = 5.0) -> None:
         """
-        SCALE-HIGH-01 FIX: Stop broadcast worker pool.
-        
+        Stop per-connection outbound writers.
+
         Call this during application shutdown. Waits for pending
-        broadcasts to complete or timeout.
+        frames to drain or timeout.
         """
         await self._broadcaster.stop_workers(timeout=timeout)
 
@@ -258,21 +295,105 @@ class ConnectionManager:
 
     async def disconnect(self, websocket: "WebSocket") -> None:
         """Remove a WebSocket connection from all registrations."""
+        self._broadcaster.release_connection(websocket)
         await self._lifecycle.disconnect(websocket)
 
+    # =========================================================================
+    # Missed event replay (PERF-REPLAY-01)
+    # =========================================================================
+
+    def hold_delivery(self, websocket: "WebSocket") -> bool:
+        """Queue live events for a connection until replay_missed_events()."""
+        return self._broadcaster.hold_connection(websocket)
+
+    def release_delivery(self, websocket: "WebSocket") -> None:
+        """Drop the held outbox of a connection that failed to register."""
+        self._broadcaster.release_connection(websocket)
+
+    async def replay_missed_events(self, websocket: "WebSocket", last_event_id: str) -> int:
+        """
+        Send the critical events a reconnecting client missed, then resume live delivery.
+
+        Events are filtered with the same audience rules as EventRouter and
+        followed by a REPLAY_DONE message. complete=false tells the client
+        to refetch its state over REST; last_event_id is the position to
+        reconnect from next time.
+
+        Args:
+            websocket: Connection held with hold_delivery() and now registered.
+            last_event_id: Last stream_id the client received.
+
+        Returns:
+            Number of events replayed.
+        """
+        record = self._index.get_record(websocket)
+        if record is None:
+            replay = StreamReplay(complete=False, reason="not_registered")
+        else:
+            replay = await read_missed_events(
+                last_event_id,
+                accept=lambda event: self._is_replay_recipient(record, event),
+            )
+        frames = [EncodedFrame.from_payload(event) for event in replay.events]
+        replayed = len(frames)
+
+        done: dict[str, Any] = {
+            "type": MSG_REPLAY_DONE,
+            "complete": replay.complete,
+            "replayed": replayed,
+            "last_event_id": replay.last_event_id or last_event_id,
+        }
+        if replay.reason:
+            done["reason"] = replay.reason
+        frames.append(EncodedFrame.from_payload(done))
+
+        await self._broadcaster.resume_connection(websocket, frames)
+        logger.debug(
+            "Replayed missed events",
+            user_id=record.user_id if record is not None else None,
+            replayed=replayed,
+            scanned=replay.scanned,
+            complete=replay.complete,
+            reason=replay.reason,
+        )
+        return replayed
+
+    def _is_replay_recipient(self, record: ConnectionRecord, event: dict[str, Any]) -> bool:
+        """Whether EventRouter would have delivered event to this connection."""
+        event_type = event.get("type")
+        if not event_type:
+            return False
+        targets = EventRouter.audience_targets(
+            EventRouter.audience_mask(event_type),
+            safe_int(event.get("branch_id"), "branch_id"),
+            safe_int(event.get("sector_id"), "sector_id"),
+            safe_int(event.get("session_id"), "session_id"),
+        )
+        tenant_id = safe_int(event.get("tenant_id"), "tenant_id")
+        return any(
+            self._index.record_in_audience(record, audience, key, tenant_id)
+            for audience, key in targets
+        )
+
     # =========================================================================
     # Session management (delegate to index with locking)
     # =========================================================================
 
     async def register_session(self, websocket: "WebSocket", session_id: int) -> None:
         """Register a WebSocket connection to a table session."""
+        record = self._index.get_record(websocket)
+        if record is None:
+            return
         async with self._lock_manager.session_lock:
-            self._index.register_session(websocket, session_id)
+            self._index.register_session(record, session_id)
 
     async def unregister_session(self, websocket: "WebSocket", session_id: int) -> None:
         """Unregister a WebSocket connection from a table session."""
+        record = self._index.get_record(websocket)
+        if record is None:
+            return
         async with self._lock_manager.session_lock:
-            self._index.unregister_session(websocket, session_id)
+            self._index.unregister_session(record, session_id)
 
     # =========================================================================
     # Sector management (delegate to index with locking)
@@ -286,24 +407,80 @@ class ConnectionManager:
             if not isinstance(sector_id, int) or sector_id <= 0:
                 raise ValueError(f"Invalid sector_id: {sector_id}")
 
+        record = self._index.get_record(websocket)
+        if record is None:
+            return
+
         # Log warning when clearing all sectors
-        if not sector_ids:
-            user_id = self._index.get_user_id(websocket) or "unknown"
-            old_sectors = self._index.get_sector_ids(websocket)
-            if old_sectors:
-                logger.warning(
-                    "Clearing all sector assignments for connection",
-                    user_id=user_id,
-                    old_sectors=old_sectors,
-                )
+        if not sector_ids and record.sector_ids:
+            logger.warning(
+                "Clearing all sector assignments for connection",
+                user_id=record.user_id,
+                old_sectors=list(record.sector_ids),
+            )
 
         async with self._lock_manager.sector_lock:
-            self._index.update_sectors(websocket, sector_ids)
+            self._index.update_sectors(record, sector_ids)
+
+    async def refresh_user_sectors(
+        self,
+        sectors_by_user: dict[int, list[int]],
+        tenant_id: int,
+    ) -> int:
+        """
+        Apply new sector assignments to the local waiter connections of users.
+
+        PERF-SECTORS-01: Called on SECTOR_ASSIGNMENTS_CHANGED. Kitchen
+        connections and admin connections without sectors (Dashboard) are
+        left alone. Each re-indexed connection is sent the same
+        "sectors_updated:<ids>" message as the refresh_sectors command.
+
+        Args:
+            sectors_by_user: user_id -> today's sector IDs.
+            tenant_id: Tenant of the users.
+
+        Returns:
+            Number of connections whose sectors changed.
+        """
+        changed: dict[tuple[int, ...], list["WebSocket"]] = {}
+        async with self._lock_manager.sector_lock:
+            for user_id, sector_ids in sectors_by_user.items():
+                new_sectors = tuple(sorted(set(sector_ids)))
+                for ws in self._index.get_connections_for_user(user_id, tenant_id):
+                    record = self._index.get_record(ws)
+                    if record is None or record.is_kitchen:
+                        continue
+                    if record.is_admin and not record.sector_ids:
+                        continue
+                    if tuple(sorted(record.sector_ids)) == new_sectors:
+                        continue
+                    self._index.update_sectors(record, list(new_sectors))
+                    changed.setdefault(new_sectors, []).append(ws)
+
+        for sector_ids, connections in changed.items():
+            frame = EncodedFrame(text=f"sectors_updated:{','.join(map(str, sector_ids))}")
+            await self._broadcaster._broadcast_to_connections(
+                connections, frame, context="sectors_updated"
+            )
+        return sum(len(connections) for connections in changed.values())
 
     def get_sectors(self, websocket: "WebSocket") -> list[int]:
         """Get the sector IDs assigned to a WebSocket connection."""
         return self._index.get_sector_ids(websocket)
 
+    def has_local_interest(self, event: dict[str, Any]) -> bool:
+        """
+        Check if this instance has connections that could receive an event.
+
+        SCALE-MULTI-01: Events without branch/session IDs are kept so the
+        router can decide.
+        """
+        branch_id = safe_int(event.get("branch_id"), "branch_id")
+        session_id = safe_int(event.get("session_id"), "session_id")
+        if branch_id is None and session_id is None:
+            return True
+        return self._index.has_local_interest(branch_id, session_id)
+
     def get_tenant_id(self, websocket: "WebSocket") -> int | None:
         """Get the tenant ID for a WebSocket connection."""
         return self._index.get_tenant_id(websocket)
@@ -356,14 +533,16 @@ class ConnectionManager:
     # Broadcast methods (delegate to broadcaster)
     # =========================================================================
 
-    async def _send_to_connection(self, ws: "WebSocket", payload: dict[str, Any]) -> bool:
+    async def _send_to_connection(
+        self, ws: "WebSocket", payload: dict[str, Any] | EncodedFrame
+    ) -> bool:
         """Send to a single connection, returning success status."""
         return await self._broadcaster._send_to_connection(ws, payload)
 
     async def _broadcast_to_connections(
         self,
         connections: list["WebSocket"],
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         context: str = "broadcast",
     ) -> int:
         """Send to multiple connections in parallel batches."""
@@ -372,7 +551,7 @@ class ConnectionManager:
     async def send_to_user(
         self,
         user_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
         """Send a message to all connections of a specific user."""
@@ -381,7 +560,7 @@ class ConnectionManager:
     async def send_to_branch(
         self,
         branch_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
         """Send a message to all connections in a branch."""
@@ -390,7 +569,7 @@ class ConnectionManager:
     async def send_to_session(
         self,
         session_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
         """Send a message to all connections in a table session."""
@@ -399,7 +578,7 @@ class ConnectionManager:
     async def send_to_sector(
         self,
         sector_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
         """Send a message to all connections assigned to a sector."""
@@ -408,7 +587,7 @@ class ConnectionManager:
     async def send_to_admins(
         self,
         branch_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
         """Send a message to admin connections in a branch."""
@@ -417,14 +596,14 @@ class ConnectionManager:
     async def send_to_waiters_only(
         self,
         branch_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
         """Send a message to NON-admin connections in a branch."""
         return await self._broadcaster.send_to_waiters_only(branch_id, payload, tenant_id)
 
     async def send_to_kitchen(
-        self, branch_id: int, payload: dict[str, Any], tenant_id: int | None = None
+        self, branch_id: int, payload: dict[str, Any] | EncodedFrame, tenant_id: int | None = None
     ) -> int:
         """Send to kitchen connections in a branch."""
         return await self._broadcaster.send_to_kitchen(
@@ -434,13 +613,22 @@ class ConnectionManager:
     async def send_to_sectors(
         self,
         sector_ids: list[int],
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
         """Send a message to all connections assigned to any of the given sectors."""
         return await self._broadcaster.send_to_sectors(sector_ids, payload, tenant_id)
 
-    async def broadcast(self, payload: dict[str, Any]) -> int:
+    async def send_to_audiences(
+        self,
+        targets: Sequence[tuple[str, int | list[int]]],
+        payload: dict[str, Any] | EncodedFrame,
+        tenant_id: int | None = None,
+    ) -> dict[str, int]:
+        """Send once per socket to the union of several audiences (PERF-AUDIENCE-01)."""
+        return await self._broadcaster.send_to_audiences(targets, payload, tenant_id)
+
+    async def broadcast(self, payload: dict[str, Any] | EncodedFrame) -> int:
         """Send a message to all connected clients."""
         return await self._broadcaster.broadcast(payload)
 
@@ -4,6 +4,7 @@ Connection Management Module.
 Modular components extracted from ConnectionManager:
 - lifecycle.py: Connection accept/disconnect
 - broadcaster.py: Message broadcasting
+- outbox.py: Per-connection outbound queues
 - cleanup.py: Stale/dead connection cleanup
 - stats.py: Statistics aggregation
 
@@ -12,12 +13,15 @@ ARCH-MODULAR: Each component has single responsibility for maintainability.
 
 from ws_gateway.core.connection.lifecycle import ConnectionLifecycle
 from ws_gateway.core.connection.broadcaster import ConnectionBroadcaster, is_ws_connected
+from ws_gateway.core.connection.outbox import ConnectionOutbox, OutboundQueues
 from ws_gateway.core.connection.cleanup import ConnectionCleanup
 from ws_gateway.core.connection.stats import ConnectionStats
 
 __all__ = [
     "ConnectionLifecycle",
     "ConnectionBroadcaster",
+    "ConnectionOutbox",
+    "OutboundQueues",
     "ConnectionCleanup",
     "ConnectionStats",
     "is_ws_connected",
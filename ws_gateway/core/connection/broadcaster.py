@@ -13,11 +13,13 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Any, Callable, Awaitable, TYPE_CHECKING
+from typing import Any, Callable, Awaitable, Sequence, TYPE_CHECKING
 
 from starlette.websockets import WebSocketState
 
-from ws_gateway.components.core.constants import WSCloseCode, WSConstants
+from ws_gateway.components.broadcast.frame import EncodedFrame, encode_frame, send_frame
+from ws_gateway.components.core.constants import WSConstants
+from ws_gateway.core.connection.outbox import OutboundQueues
 
 if TYPE_CHECKING:
     from fastapi import WebSocket
@@ -27,6 +29,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# PERF-AUDIENCE-01: Audiences accepted by send_to_audiences()
+AUDIENCES = frozenset({
+    "user",
+    "branch",
+    "session",
+    "sector",
+    "sectors",
+    "admins",
+    "waiters",
+    "kitchen",
+})
+
 
 def is_ws_connected(ws: "WebSocket") -> bool:
     """
@@ -56,13 +70,20 @@ class ConnectionBroadcaster:
     - Filter by user, branch, sector, session
     - Rate limit global broadcasts
 
-    SCALE-HIGH-01 FIX: Uses worker pool for efficient large-scale broadcasts.
-    Workers process send tasks from a queue in true parallel.
-    """
+    PERF-OUTBOX-01: When started, every connection gets its own bounded
+    outbound queue and writer task (see outbox.py), replacing the shared
+    SCALE-HIGH-01 worker pool. A stalled client only delays itself and is
+    evicted with WSCloseCode.SLOW_CONSUMER if it stays behind.
 
-    # SCALE-HIGH-01: Worker pool configuration
-    DEFAULT_WORKER_COUNT = 10  # Number of parallel workers
-    QUEUE_MAX_SIZE = 5000  # Max pending sends before backpressure
+    PERF-FANOUT-01: Payloads are encoded once per fan-out into an
+    EncodedFrame and the same text is sent to every recipient.
+
+    PERF-AUDIENCE-01: send_to_audiences() resolves several audiences of one
+    event, sends once per unique socket and reports per-audience counts.
+
+    PERF-LATENCY-01: Each queued frame is tagged with the audience its
+    recipient was reached through, for publish-to-deliver histograms.
+    """
 
     def __init__(
         self,
@@ -72,7 +93,8 @@ class ConnectionBroadcaster:
         mark_dead_callback: Callable[["WebSocket"], Awaitable[None]],
         batch_size: int = 50,
         broadcast_rate_limit: int = WSConstants.MAX_BROADCASTS_PER_SECOND,
-        worker_count: int | None = None,
+        outbound_queue_size: int = WSConstants.OUTBOUND_QUEUE_SIZE,
+        outbound_max_lag_seconds: float = WSConstants.OUTBOUND_MAX_LAG_SECONDS,
     ) -> None:
         """
         Initialize broadcaster with dependencies.
@@ -84,7 +106,8 @@ class ConnectionBroadcaster:
             mark_dead_callback: Callback to mark dead connections
             batch_size: Number of connections per batch (legacy mode)
             broadcast_rate_limit: Max broadcasts per second
-            worker_count: Number of parallel workers (default: 10)
+            outbound_queue_size: Pending frames per connection before dropping oldest
+            outbound_max_lag_seconds: Lag that gets a client evicted as slow consumer
         """
         self._lock_manager = lock_manager
         self._index = index
@@ -92,12 +115,15 @@ class ConnectionBroadcaster:
         self._mark_dead = mark_dead_callback
         self._batch_size = batch_size
         self._broadcast_rate_limit = broadcast_rate_limit
-        
-        # SCALE-HIGH-01: Worker pool
-        self._worker_count = worker_count or self.DEFAULT_WORKER_COUNT
-        self._queue: asyncio.Queue | None = None
-        self._workers: list[asyncio.Task] = []
-        self._running = False
+
+        # PERF-OUTBOX-01: Per-connection outbound queues
+        self._outbound = OutboundQueues(
+            send=self._send_to_connection_internal,
+            mark_dead_callback=mark_dead_callback,
+            metrics=metrics,
+            max_queue_size=outbound_queue_size,
+            max_lag_seconds=outbound_max_lag_seconds,
+        )
 
         # Rate limiting state
         self._broadcast_timestamps: deque[float] = deque(
@@ -106,120 +132,85 @@ class ConnectionBroadcaster:
 
     async def start_workers(self) -> None:
         """
-        SCALE-HIGH-01 FIX: Start the worker pool.
-        
-        Call this during application startup (lifespan).
-        Workers process send tasks from the queue in parallel.
+        Start per-connection outbound writers.
+
+        Call this during application startup (lifespan). Until started,
+        broadcasts use the legacy batch mode.
         """
-        if self._running:
-            logger.warning("Worker pool already running")
+        if self._outbound.running:
+            logger.warning("Outbound queues already running")
             return
-        
-        self._queue = asyncio.Queue(maxsize=self.QUEUE_MAX_SIZE)
-        self._running = True
-        
-        for i in range(self._worker_count):
-            worker = asyncio.create_task(
-                self._worker_loop(i),
-                name=f"broadcast_worker_{i}"
-            )
-            self._workers.append(worker)
-        
-        logger.info(
-            "Broadcast worker pool started",
-            worker_count=self._worker_count,
-            queue_max_size=self.QUEUE_MAX_SIZE,
-        )
+        self._outbound.start()
 
     async def stop_workers(self, timeout: float = 5.0) -> None:
         """
-        SCALE-HIGH-01 FIX: Gracefully stop the worker pool.
-        
+        Gracefully stop all outbound writers.
+
         Call this during application shutdown.
-        Waits for queue to drain or timeout.
+        Waits for queues to drain or timeout.
         """
-        if not self._running:
-            return
-        
-        self._running = False
-        
-        # Wait for queue to drain (with timeout)
-        if self._queue and not self._queue.empty():
-            try:
-                await asyncio.wait_for(self._queue.join(), timeout=timeout)
-            except asyncio.TimeoutError:
-                logger.warning(
-                    "Broadcast queue drain timeout",
-                    remaining=self._queue.qsize(),
-                )
-        
-        # Cancel workers
-        for worker in self._workers:
-            worker.cancel()
-        
-        if self._workers:
-            await asyncio.gather(*self._workers, return_exceptions=True)
-        
-        self._workers.clear()
-        self._queue = None
-        
-        logger.info("Broadcast worker pool stopped")
-
-    async def _worker_loop(self, worker_id: int) -> None:
+        await self._outbound.stop(timeout=timeout)
+
+    def release_connection(self, ws: "WebSocket") -> None:
+        """
+        PERF-OUTBOX-01: Drop the outbound queue of a disconnected connection.
+
+        Args:
+            ws: Connection being removed.
+        """
+        self._outbound.release(ws)
+
+    def hold_connection(self, ws: "WebSocket") -> bool:
+        """
+        PERF-REPLAY-01: Queue live frames for ws without sending them yet.
+
+        Args:
+            ws: Connection about to be registered.
+
+        Returns:
+            True if held, False in legacy mode (frames are sent directly).
+        """
+        return self._outbound.hold(ws)
+
+    async def resume_connection(
+        self,
+        ws: "WebSocket",
+        replay: list[EncodedFrame],
+    ) -> bool:
         """
-        SCALE-HIGH-01 FIX: Worker loop that processes send tasks.
-        
-        Each worker pulls tasks from the queue and sends messages.
+        PERF-REPLAY-01: Send replayed frames, then the live frames held meanwhile.
+
+        Args:
+            ws: Connection passed to hold_connection().
+            replay: Frames to deliver first, in order.
+
+        Returns:
+            True if the replay was queued or sent.
         """
-        while self._running:
-            try:
-                # Get task from queue (blocking with timeout)
-                task = await asyncio.wait_for(
-                    self._queue.get(),
-                    timeout=1.0
-                )
-                
-                ws, payload, result_future = task
-                
-                try:
-                    success = await self._send_to_connection_internal(ws, payload)
-                    if result_future and not result_future.done():
-                        result_future.set_result(success)
-                except Exception as e:
-                    if result_future and not result_future.done():
-                        result_future.set_result(False)
-                    logger.debug(
-                        "Worker send error",
-                        worker_id=worker_id,
-                        error=str(e),
-                    )
-                finally:
-                    self._queue.task_done()
-                    
-            except asyncio.TimeoutError:
-                # No tasks, continue loop
-                continue
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(
-                    "Worker loop error",
-                    worker_id=worker_id,
-                    error=str(e),
-                )
-                await asyncio.sleep(0.1)  # Prevent tight loop on error
+        if self._outbound.resume(ws, replay):
+            return True
+        if self._outbound.running:
+            return False
+        for frame in replay:
+            if not await self._send_to_connection(ws, frame):
+                return False
+        return True
+
+    def get_outbound_stats(self) -> dict[str, Any]:
+        """Get outbound queue depth and lag statistics."""
+        return self._outbound.get_stats()
 
     async def _send_to_connection_internal(
         self,
         ws: "WebSocket",
-        payload: dict[str, Any],
+        frame: EncodedFrame,
     ) -> bool:
-        """Internal send without queue (used by workers)."""
+        """Internal send without queue (used by outbound writers)."""
         if not is_ws_connected(ws):
             await self._mark_dead(ws)
             return False
         try:
-            await ws.send_json(payload)
+            await send_frame(ws, frame)
             return True
         except Exception as e:
             logger.debug("Send failed: %s", str(e))
@@ -246,14 +237,14 @@ class ConnectionBroadcaster:
     async def _send_to_connection(
         self,
         ws: "WebSocket",
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
     ) -> bool:
         """
         Send to a single connection, returning success status.
 
         Args:
             ws: The WebSocket connection.
-            payload: Message payload to send.
+            payload: Message payload or pre-encoded frame to send.
 
         Returns:
             True if sent successfully, False otherwise.
@@ -261,8 +252,11 @@ class ConnectionBroadcaster:
         if not is_ws_connected(ws):
             await self._mark_dead(ws)
             return False
+        # PERF-OUTBOX-01: Keep per-connection ordering with queued broadcasts
+        if self._outbound.running:
+            return self._outbound.enqueue(ws, encode_frame(payload))
         try:
-            await ws.send_json(payload)
+            await send_frame(ws, encode_frame(payload))
             return True
         except Exception as e:
             logger.debug("Send failed: %s", str(e))
@@ -272,98 +266,83 @@ class ConnectionBroadcaster:
     async def _broadcast_to_connections(
         self,
         connections: list["WebSocket"],
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         context: str = "broadcast",
     ) -> int:
         """
         Send to multiple connections in parallel.
 
-        SCALE-HIGH-01 FIX: Uses worker pool for large broadcasts when running.
-        Falls back to legacy batch mode for small broadcasts or when pool not started.
+        PERF-OUTBOX-01: Enqueues to per-connection outbound queues when running.
+        Falls back to legacy batch mode when queues are not started.
+        PERF-FANOUT-01: Payload is encoded once here and shared by all sends.
 
         Args:
             connections: List of WebSocket connections.
-            payload: Message payload to send.
+            payload: Message payload or pre-encoded frame to send.
             context: Context string for logging.
 
         Returns:
-            Number of connections that received the message.
+            Number of connections that received (or had queued) the message.
         """
         if not connections:
             return 0
 
-        # SCALE-HIGH-01: Use worker pool for large broadcasts
-        if self._running and self._queue and len(connections) > self._batch_size:
-            return await self._broadcast_via_workers(connections, payload, context)
-        
-        # Legacy: sequential batch processing for small broadcasts or no worker pool
-        return await self._broadcast_legacy(connections, payload, context)
+        # PERF-LATENCY-01: Context is "<audience>:<key>" (or "global")
+        audience = context.partition(":")[0]
+        delivered = await self._deliver(
+            connections, encode_frame(payload), context, [audience] * len(connections)
+        )
+        return sum(delivered)
 
-    async def _broadcast_via_workers(
+    async def _deliver(
         self,
         connections: list["WebSocket"],
-        payload: dict[str, Any],
+        frame: EncodedFrame,
         context: str,
-    ) -> int:
+        audiences: list[str] | None = None,
+    ) -> list[bool]:
+        """
+        Send a frame to each connection once.
+
+        Args:
+            connections: Recipients.
+            frame: Frame to send.
+            context: Context string for logging.
+            audiences: PERF-LATENCY-01: Audience of each recipient, for
+                latency metrics (outbox mode only).
+
+        Returns:
+            Per-connection delivery flags, in the order of connections.
         """
-        SCALE-HIGH-01 FIX: Broadcast using worker pool.
+        if self._outbound.running:
+            return await self._broadcast_via_outbox(connections, frame, context, audiences)
 
-        Distributes sends across workers for true parallel processing.
-        Uses futures to track completion and collect results.
+        # Legacy: sequential batch processing when outbound queues not started
+        return await self._broadcast_legacy(connections, frame, context)
 
-        PERF-FUTURE-01 FIX: Added timeout protection to prevent future leaks
-        if workers crash before setting results.
+    async def _broadcast_via_outbox(
+        self,
+        connections: list["WebSocket"],
+        frame: EncodedFrame,
+        context: str,
+        audiences: list[str] | None = None,
+    ) -> list[bool]:
         """
-        # PERF-FUTURE-01: Use get_running_loop() instead of deprecated get_event_loop()
-        loop = asyncio.get_running_loop()
-
-        # Create futures for all sends
-        futures: list[asyncio.Future] = []
-
-        for ws in connections:
-            future: asyncio.Future = loop.create_future()
-            futures.append(future)
-
-            try:
-                # Non-blocking put with timeout
-                await asyncio.wait_for(
-                    self._queue.put((ws, payload, future)),
-                    timeout=1.0
-                )
-            except asyncio.TimeoutError:
-                # Queue full, mark as failed
-                if not future.done():
-                    future.set_result(False)
-                logger.warning(
-                    "Broadcast queue full, dropping message",
-                    context=context,
-                    queue_size=self._queue.qsize(),
-                )
-
-        # PERF-FUTURE-01 FIX: Wait with timeout to prevent hanging forever
-        # if workers crash before setting results
-        try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*futures, return_exceptions=True),
-                timeout=10.0  # 10 second timeout for entire broadcast
-            )
-        except asyncio.TimeoutError:
-            # Some futures didn't complete - count completed ones
-            logger.warning(
-                "Broadcast timeout - some sends did not complete",
-                context=context,
-                total=len(futures),
-            )
-            # Cancel pending futures to prevent leaks
-            for f in futures:
-                if not f.done():
-                    f.cancel()
-            # Count what we have
-            results = [f.result() if f.done() and not f.cancelled() else False for f in futures]
+        PERF-OUTBOX-01: Broadcast by enqueueing to per-connection queues.
 
-        # Count results
-        sent = sum(1 for r in results if r is True)
-        failed = len(results) - sent
+        Never awaits a socket write, so the fan-out cost is independent of
+        how fast individual clients drain their queues.
+        """
+        delivered: list[bool] = []
+        for i, ws in enumerate(connections):
+            if not is_ws_connected(ws):
+                await self._mark_dead(ws)
+                delivered.append(False)
+            else:
+                audience = audiences[i] if audiences is not None else None
+                delivered.append(self._outbound.enqueue(ws, frame, audience))
+        sent = sum(delivered)
+        failed = len(delivered) - sent
 
         # Update metrics
         self._metrics.increment_broadcast_total_sync()
@@ -371,43 +350,40 @@ class ConnectionBroadcaster:
             self._metrics.increment_broadcast_failed_sync()
             self._metrics.add_failed_recipients_sync(failed)
             logger.debug(
-                "Worker broadcast completed",
+                "Outbox broadcast completed with failures",
                 context=context,
                 sent=sent,
                 failed=failed,
                 total=len(connections),
             )
 
-        return sent
+        return delivered
 
     async def _broadcast_legacy(
         self,
         connections: list["WebSocket"],
-        payload: dict[str, Any],
+        frame: EncodedFrame,
         context: str,
-    ) -> int:
+    ) -> list[bool]:
         """
         Legacy broadcast using sequential batch processing.
-        
-        Used for small broadcasts or when worker pool is not running.
+
+        Used when outbound queues are not running.
         """
-        sent = 0
-        failed = 0
+        delivered: list[bool] = []
 
         # Process in batches
         for i in range(0, len(connections), self._batch_size):
             batch = connections[i : i + self._batch_size]
             results = await asyncio.gather(
-                *[self._send_to_connection(ws, payload) for ws in batch],
+                *[self._send_to_connection_internal(ws, frame) for ws in batch],
                 return_exceptions=True,
             )
 
-            # Count successes and failures
+            # Record successes and failures
             for idx, result in enumerate(results):
-                if result is True:
-                    sent += 1
-                else:
-                    failed += 1
+                delivered.append(result is True)
+                if result is not True:
                     if isinstance(result, Exception):
                         logger.debug(
                             "Batch send exception",
@@ -417,6 +393,8 @@ class ConnectionBroadcaster:
                         )
 
         # Update metrics
+        sent = sum(delivered)
+        failed = len(delivered) - sent
         self._metrics.increment_broadcast_total_sync()
         if failed > 0:
             self._metrics.increment_broadcast_failed_sync()
@@ -429,17 +407,104 @@ class ConnectionBroadcaster:
                 total=len(connections),
             )
 
-        return sent
+        return delivered
+
+    async def _recipients(
+        self,
+        audience: str,
+        key: int | list[int],
+        tenant_id: int | None,
+    ) -> list["WebSocket"]:
+        """
+        Resolve the connections of one audience.
+
+        PERF-TENANT-01: Every send_to_* method gets its recipients here,
+        straight from the tenant-partitioned index under the lock guarding
+        that audience's buckets, with no per-connection filtering.
+
+        Args:
+            audience: One of AUDIENCES.
+            key: User, branch, session or sector ID (list of IDs for "sectors").
+            tenant_id: Tenant to restrict to (None = all tenants).
+
+        Returns:
+            Snapshot list of connections.
+        """
+        if audience == "user":
+            return list(self._index.get_user_connections(key, tenant_id))
+        if audience == "session":
+            async with self._lock_manager.session_lock:
+                return list(self._index.get_session_connections(key, tenant_id))
+        if audience == "sector":
+            async with self._lock_manager.sector_lock:
+                return list(self._index.get_sector_connections(key, tenant_id))
+        if audience == "sectors":
+            async with self._lock_manager.sector_lock:
+                return list(self._index.get_sectors_connections(key, tenant_id))
+
+        branch_query = {
+            "branch": self._index.get_branch_connections,
+            "admins": self._index.get_admin_connections,
+            "waiters": self._index.get_waiter_connections,
+            "kitchen": self._index.get_kitchen_staff_connections,
+        }.get(audience)
+        if branch_query is None:
+            raise ValueError(f"Unknown audience: {audience}")
+        branch_lock = await self._lock_manager.get_branch_lock(key)
+        async with branch_lock:
+            return list(branch_query(key, tenant_id))
+
+    async def send_to_audiences(
+        self,
+        targets: Sequence[tuple[str, int | list[int]]],
+        payload: dict[str, Any] | EncodedFrame,
+        tenant_id: int | None = None,
+    ) -> dict[str, int]:
+        """
+        Send one message to the union of several audiences.
+
+        PERF-AUDIENCE-01: A socket that belongs to more than one audience
+        gets the message once, and all recipients go through a single
+        delivery pass. Each socket is counted for the first target that
+        lists it.
+
+        Args:
+            targets: (audience, key) pairs in priority order, see _recipients().
+            payload: Message payload or pre-encoded frame to send.
+            tenant_id: Tenant to restrict to (None = all tenants).
+
+        Returns:
+            Delivered count per audience (every target's audience is present).
+        """
+        counts = {audience: 0 for audience, _ in targets}
+        seen: set["WebSocket"] = set()
+        connections: list["WebSocket"] = []
+        owners: list[str] = []
+        for audience, key in targets:
+            for ws in await self._recipients(audience, key, tenant_id):
+                if ws not in seen:
+                    seen.add(ws)
+                    connections.append(ws)
+                    owners.append(audience)
+
+        if not connections:
+            return counts
+
+        context = ",".join(f"{audience}:{key}" for audience, key in targets)
+        delivered = await self._deliver(connections, encode_frame(payload), context, owners)
+        for audience, ok in zip(owners, delivered):
+            if ok:
+                counts[audience] += 1
+        return counts
 
     async def send_to_user(
         self,
         user_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
         """Send a message to all connections of a specific user."""
-        connections = list(self._index.get_user_connections(user_id))
-        connections = self.filter_by_tenant(connections, tenant_id)
+        connections = await self._recipients("user", user_id, tenant_id)
         return await self._broadcast_to_connections(
             connections, payload, f"user:{user_id}"
         )
@@ -447,18 +512,11 @@ class ConnectionBroadcaster:
     async def send_to_branch(
         self,
         branch_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
-        """
-        Send a message to all connections in a branch.
-
-        Tenant filtering performed inside lock to prevent race condition.
-        """
-        branch_lock = await self._lock_manager.get_branch_lock(branch_id)
-        async with branch_lock:
-            connections = list(self._index.get_branch_connections(branch_id))
-            connections = self.filter_by_tenant(connections, tenant_id)
+        """Send a message to all connections in a branch."""
+        connections = await self._recipients("branch", branch_id, tenant_id)
         return await self._broadcast_to_connections(
             connections, payload, f"branch:{branch_id}"
         )
@@ -466,17 +524,11 @@ class ConnectionBroadcaster:
     async def send_to_session(
         self,
         session_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
-        """
-        Send a message to all connections in a table session.
-
-        Tenant filtering performed inside lock to prevent race condition.
-        """
-        async with self._lock_manager.session_lock:
-            connections = list(self._index.get_session_connections(session_id))
-            connections = self.filter_by_tenant(connections, tenant_id)
+        """Send a message to all connections in a table session."""
+        connections = await self._recipients("session", session_id, tenant_id)
         return await self._broadcast_to_connections(
             connections, payload, f"session:{session_id}"
         )
@@ -484,17 +536,11 @@ class ConnectionBroadcaster:
     async def send_to_sector(
         self,
         sector_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
-        """
-        Send a message to all connections assigned to a sector.
-
-        Tenant filtering performed inside lock to prevent race condition.
-        """
-        async with self._lock_manager.sector_lock:
-            connections = list(self._index.get_sector_connections(sector_id))
-            connections = self.filter_by_tenant(connections, tenant_id)
+        """Send a message to all connections assigned to a sector."""
+        connections = await self._recipients("sector", sector_id, tenant_id)
         return await self._broadcast_to_connections(
             connections, payload, f"sector:{sector_id}"
         )
@@ -502,17 +548,11 @@ class ConnectionBroadcaster:
     async def send_to_sectors(
         self,
         sector_ids: list[int],
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
-        """
-        Send a message to all connections assigned to any of the given sectors.
-
-        Tenant filtering performed inside lock to prevent race condition.
-        """
-        async with self._lock_manager.sector_lock:
-            connections = list(self._index.get_sectors_connections(sector_ids))
-            connections = self.filter_by_tenant(connections, tenant_id)
+        """Send a message to all connections assigned to any of the given sectors."""
+        connections = await self._recipients("sectors", sector_ids, tenant_id)
         return await self._broadcast_to_connections(
             connections, payload, f"sectors:{sector_ids}"
         )
@@ -520,18 +560,11 @@ class ConnectionBroadcaster:
     async def send_to_admins(
         self,
         branch_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
-        """
-        Send a message to admin/manager connections in a branch.
-
-        Tenant filtering performed inside lock to prevent race condition.
-        """
-        branch_lock = await self._lock_manager.get_branch_lock(branch_id)
-        async with branch_lock:
-            connections = list(self._index.get_admin_connections(branch_id))
-            connections = self.filter_by_tenant(connections, tenant_id)
+        """Send a message to admin/manager connections in a branch."""
+        connections = await self._recipients("admins", branch_id, tenant_id)
         return await self._broadcast_to_connections(
             connections, payload, f"admins:{branch_id}"
         )
@@ -539,18 +572,11 @@ class ConnectionBroadcaster:
     async def send_to_waiters_only(
         self,
         branch_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
-        """
-        Send a message to NON-admin connections in a branch.
-
-        Tenant filtering performed inside lock to prevent race condition.
-        """
-        branch_lock = await self._lock_manager.get_branch_lock(branch_id)
-        async with branch_lock:
-            connections = list(self._index.get_waiter_connections(branch_id))
-            connections = self.filter_by_tenant(connections, tenant_id)
+        """Send a message to NON-admin connections in a branch."""
+        connections = await self._recipients("waiters", branch_id, tenant_id)
         return await self._broadcast_to_connections(
             connections, payload, f"waiters:{branch_id}"
         )
@@ -558,27 +584,17 @@ class ConnectionBroadcaster:
     async def send_to_kitchen(
         self,
         branch_id: int,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | EncodedFrame,
         tenant_id: int | None = None,
     ) -> int:
-        """
-        Send a message to kitchen connections in a branch.
-
-        Tenant filtering performed inside lock to prevent race condition.
-        """
-        branch_lock = await self._lock_manager.get_branch_lock(branch_id)
-        async with branch_lock:
-            connections = list(self._index.get_kitchen_connections(branch_id))
-            # Exclude admins as they receive events via send_to_admins
-            connections = [c for c in connections if not self._index.is_admin(c)]
-            connections = self.filter_by_tenant(connections, tenant_id)
+        """Send a message to kitchen connections in a branch."""
+        # Excludes admins as they receive events via send_to_admins
+        connections = await self._recipients("kitchen", branch_id, tenant_id)
         return await self._broadcast_to_connections(
             connections, payload, f"kitchen:{branch_id}"
         )
 
-
-
-    async def broadcast(self, payload: dict[str, Any]) -> int:
+    async def broadcast(self, payload: dict[str, Any] | EncodedFrame) -> int:
         """
         Send a message to all connected clients.
 
@@ -597,7 +613,11 @@ class ConnectionBroadcaster:
                 "Broadcast rate limit exceeded, dropping message",
                 current_rate=recent_count,
                 limit=self._broadcast_rate_limit,
-                payload_type=payload.get("type"),
+                payload_type=(
+                    payload.event_type
+                    if isinstance(payload, EncodedFrame)
+                    else payload.get("type")
+                ),
             )
             self._metrics.increment_broadcast_rate_limited_sync()
             return 0
@@ -159,45 +159,45 @@ class ConnectionLifecycle:
         Args:
             websocket: The WebSocket to disconnect.
         """
-        # Remove from heartbeat tracker and rate limiter
+        # PERF-REGISTRY-01: One lookup; the record lists every membership
+        record = self._index.get_record(websocket)
+        if record is None:
+            return
+
+        # PERF-HEARTBEAT-01: Take the record out of the heartbeat wheel
         self._heartbeat_tracker.remove(websocket)
         await self._rate_limiter.remove_connection(websocket)
 
-        # Get user ID via ConnectionIndex
-        user_id = self._index.get_user_id(websocket)
-        if user_id is None:
-            return
-
-        user_lock = await self._lock_manager.get_user_lock(user_id)
+        user_lock = await self._lock_manager.get_user_lock(record.user_id)
         async with user_lock:
+            # Already disconnected by a concurrent caller
+            if self._index.get_record(websocket) is not record:
+                return
+
             # Decrement connection counter
             await self._decrement_connection_count()
 
-            # Get info before unregistering
-            is_admin = self._index.is_admin(websocket)
-            is_kitchen = self._index.is_kitchen(websocket)
-            branch_ids = self._index.get_branch_ids(websocket)
-            session_ids = self._index.get_session_ids(websocket)
-            sector_ids = self._index.get_sector_ids(websocket)
-
             # Unregister from user index
-            self._index.unregister_user(websocket)
+            self._index.unregister_user(record)
 
             # Remove from branch indices (sorted for consistent lock ordering)
-            for branch_id in sorted(branch_ids):
+            for branch_id in sorted(record.branch_ids):
                 branch_lock = await self._lock_manager.get_branch_lock(branch_id)
                 async with branch_lock:
-                    self._index.unregister_branch(websocket, branch_id, is_admin, is_kitchen)
-
+                    self._index.unregister_branch(record, branch_id)
 
             # Remove from session indices
-            async with self._lock_manager.session_lock:
-                for session_id in session_ids:
-                    self._index.unregister_session(websocket, session_id)
+            if record.session_ids:
+                async with self._lock_manager.session_lock:
+                    for session_id in list(record.session_ids):
+                        self._index.unregister_session(record, session_id)
 
             # Remove from sector indices
-            async with self._lock_manager.sector_lock:
-                self._index.unregister_sectors(websocket, sector_ids)
+            if record.sector_ids:
+                async with self._lock_manager.sector_lock:
+                    self._index.unregister_sectors(record)
+
+            self._index.registry.remove(record)
 
     def _validate_branch_ids(self, branch_ids: list[int], user_id: int) -> None:
         """Validate branch_ids format and values."""
@@ -273,20 +273,21 @@ class ConnectionLifecycle:
                     f"User {user_id} exceeded max connections ({self._max_connections_per_user})"
                 )
 
+            # Register via ConnectionIndex (creates the ConnectionRecord)
+            record = self._index.register_user(
+                websocket, user_id, is_admin, is_kitchen, tenant_id
+            )
+
             # Record heartbeat
             self._heartbeat_tracker.record(websocket)
 
-            # Register via ConnectionIndex
-            self._index.register_user(websocket, user_id, is_admin, is_kitchen, tenant_id)
-
             # Register by branches (sorted for consistent lock ordering)
             for branch_id in sorted(branch_ids):
                 branch_lock = await self._lock_manager.get_branch_lock(branch_id)
                 async with branch_lock:
-                    self._index.register_branch(websocket, branch_id, is_admin, is_kitchen)
-
+                    self._index.register_branch(record, branch_id)
 
             # Register by sectors
             if sector_ids:
                 async with self._lock_manager.sector_lock:
-                    self._index.register_sectors(websocket, sector_ids)
+                    self._index.register_sectors(record, sector_ids)
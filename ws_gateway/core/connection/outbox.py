@@ -0,0 +1,458 @@
+"""
+Per-connection Outbound Queues.
+
+Each WebSocket connection gets its own small bounded send queue drained by
+a dedicated writer task, so one stalled client cannot delay sends to
+everyone else.
+
+PERF-OUTBOX-01: Replaces the shared broadcast queue/worker pool
+(SCALE-HIGH-01) with per-connection queues and slow-consumer eviction.
+
+PERF-REPLAY-01: An outbox can be held while missed stream events are read
+for a reconnecting client; the replay is then placed ahead of the live
+frames that arrived meanwhile, and stream events already replayed are
+dropped when they show up live.
+
+PERF-LATENCY-01: Writers record publish-to-sent latency of event frames
+per event type and audience, with transit, queue wait and send time
+broken out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Awaitable, TYPE_CHECKING
+
+from ws_gateway.components.core.constants import WSCloseCode, WSConstants
+
+if TYPE_CHECKING:
+    from fastapi import WebSocket
+    from ws_gateway.components.broadcast.frame import EncodedFrame
+    from ws_gateway.components.metrics.collector import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionOutbox:
+    """
+    Bounded FIFO of frames waiting to be written to one connection.
+
+    Frames are stored with their enqueue time (monotonic) so the writer can
+    measure delivery lag and detect clients that stay behind, and with the
+    audience they were sent to (PERF-LATENCY-01).
+
+    Overflow policy:
+    - A frame identical to the last pending one is coalesced (not queued twice)
+    - When full, the oldest pending frame is dropped
+
+    Lag is measured from the oldest undelivered frame, including the one
+    currently being written and any frames dropped since the queue last
+    drained, so dropping does not hide a client that never catches up.
+
+    While held (PERF-REPLAY-01) frames are queued but not written.
+    """
+
+    __slots__ = (
+        "ws", "_frames", "_max_size", "_wakeup", "_inflight_since",
+        "_behind_since", "task", "closed", "held", "_replayed_until",
+    )
+
+    def __init__(self, ws: "WebSocket", max_size: int) -> None:
+        self.ws = ws
+        self._frames: deque[tuple["EncodedFrame", float, str | None]] = deque()
+        self._max_size = max_size
+        self._wakeup = asyncio.Event()
+        self._inflight_since: float | None = None
+        self._behind_since: float | None = None
+        self.task: asyncio.Task | None = None
+        self.closed = False
+        self.held = False
+        # Stream position of the newest replayed event (None = no replay)
+        self._replayed_until: tuple[int, int] | None = None
+
+    @property
+    def depth(self) -> int:
+        """Number of frames waiting to be sent."""
+        return len(self._frames)
+
+    def lag(self, now: float) -> float:
+        """Seconds the oldest undelivered frame has been waiting (0 if idle)."""
+        oldest = self._inflight_since
+        if self._frames:
+            head = self._frames[0][1]
+            oldest = head if oldest is None else min(oldest, head)
+        if self._behind_since is not None:
+            oldest = self._behind_since if oldest is None else min(oldest, self._behind_since)
+        return 0.0 if oldest is None else now - oldest
+
+    def push(
+        self, frame: "EncodedFrame", now: float, audience: str | None = None
+    ) -> tuple[bool, bool]:
+        """
+        Queue a frame for sending.
+
+        Args:
+            frame: Pre-encoded frame.
+            now: Current monotonic time.
+            audience: Audience the frame was sent to (for latency metrics).
+
+        Returns:
+            Tuple of (coalesced, dropped_oldest).
+        """
+        if self._frames and self._frames[-1][0].text == frame.text:
+            return True, False
+        if self._is_replayed(frame):
+            return True, False
+
+        dropped = False
+        if len(self._frames) >= self._max_size:
+            _, dropped_at, _ = self._frames.popleft()
+            if self._behind_since is None:
+                self._behind_since = dropped_at
+            dropped = True
+
+        self._frames.append((frame, now, audience))
+        self._wakeup.set()
+        return False, dropped
+
+    def resume(self, replay: list["EncodedFrame"], now: float) -> None:
+        """
+        Put replayed frames ahead of everything queued and start writing.
+
+        Live frames for stream events covered by the replay are discarded.
+        The replay may temporarily exceed max_size. Time spent held is not
+        lag, so frames queued meanwhile are re-stamped with `now`.
+
+        Args:
+            replay: Frames to deliver first, in order.
+            now: Current monotonic time.
+        """
+        positions = [f.stream_position for f in replay if f.stream_position is not None]
+        if positions:
+            self._replayed_until = max(positions)
+        live = [
+            (frame, now, audience)
+            for frame, _, audience in self._frames
+            if not self._is_replayed(frame)
+        ]
+        self._frames = deque((frame, now, None) for frame in replay)
+        self._frames.extend(live)
+        if self._behind_since is not None:
+            self._behind_since = now
+        self.held = False
+        self._wakeup.set()
+
+    def _is_replayed(self, frame: "EncodedFrame") -> bool:
+        """Whether frame is a stream event already delivered by the replay."""
+        return (
+            self._replayed_until is not None
+            and frame.stream_position is not None
+            and frame.stream_position <= self._replayed_until
+        )
+
+    async def pop(self) -> tuple["EncodedFrame", float, str | None]:
+        """Wait for the next (frame, enqueued_at, audience) and mark it in flight."""
+        while not self._frames or self.held:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        item = self._frames.popleft()
+        self._inflight_since = item[1]
+        return item
+
+    def mark_sent(self) -> None:
+        """Clear in-flight state; the client caught up if nothing is pending."""
+        self._inflight_since = None
+        if not self._frames:
+            self._behind_since = None
+
+    def close(self) -> None:
+        """Discard pending frames and stop accepting new ones."""
+        self.closed = True
+        self._frames.clear()
+
+
+class OutboundQueues:
+    """
+    Owns the outboxes and writer tasks for all connections.
+
+    Responsibilities:
+    - Lazily create an outbox + writer task per connection on first send
+    - Record delivery lag, drops and coalesced frames in MetricsCollector
+    - PERF-LATENCY-01: Record publish-to-sent latency of event frames
+    - Evict slow consumers with WSCloseCode.SLOW_CONSUMER
+    - Expose queue depth/lag for /ws/metrics
+
+    Usage:
+        queues = OutboundQueues(send, mark_dead, metrics)
+        queues.start()
+        accepted = queues.enqueue(ws, frame)
+    """
+
+    def __init__(
+        self,
+        send: Callable[["WebSocket", "EncodedFrame"], Awaitable[bool]],
+        mark_dead_callback: Callable[["WebSocket"], Awaitable[None]],
+        metrics: "MetricsCollector",
+        max_queue_size: int = WSConstants.OUTBOUND_QUEUE_SIZE,
+        max_lag_seconds: float = WSConstants.OUTBOUND_MAX_LAG_SECONDS,
+    ) -> None:
+        """
+        Initialize outbound queues.
+
+        Args:
+            send: Coroutine that writes a frame, returning success status.
+                  Expected to mark the connection dead on failure.
+            mark_dead_callback: Callback to mark evicted connections dead.
+            metrics: Collects outbound queue metrics.
+            max_queue_size: Pending frames per connection before dropping oldest.
+            max_lag_seconds: Oldest-frame age that triggers eviction.
+        """
+        self._send = send
+        self._mark_dead = mark_dead_callback
+        self._metrics = metrics
+        self._max_queue_size = max_queue_size
+        self._max_lag_seconds = max_lag_seconds
+        self._outboxes: dict["WebSocket", ConnectionOutbox] = {}
+        # Keep references so eviction tasks are not garbage collected
+        self._eviction_tasks: set[asyncio.Task] = set()
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        """Whether writer tasks are being created."""
+        return self._running
+
+    def start(self) -> None:
+        """Start accepting frames."""
+        self._running = True
+        logger.info(
+            "Outbound queues started",
+            max_queue_size=self._max_queue_size,
+            max_lag_seconds=self._max_lag_seconds,
+        )
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop all writers, giving pending frames up to `timeout` to drain.
+
+        Args:
+            timeout: Max seconds to wait for queues to drain.
+        """
+        if not self._running:
+            return
+        self._running = False
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and any(
+            outbox.depth and not outbox.closed for outbox in self._outboxes.values()
+        ):
+            await asyncio.sleep(0.05)
+
+        remaining = sum(outbox.depth for outbox in self._outboxes.values())
+        if remaining:
+            logger.warning("Outbound queue drain timeout", remaining=remaining)
+
+        outboxes = list(self._outboxes.values())
+        self._outboxes.clear()
+        tasks = []
+        for outbox in outboxes:
+            outbox.close()
+            if outbox.task is not None:
+                outbox.task.cancel()
+                tasks.append(outbox.task)
+        tasks.extend(self._eviction_tasks)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        logger.info("Outbound queues stopped", writers=len(outboxes))
+
+    def enqueue(
+        self, ws: "WebSocket", frame: "EncodedFrame", audience: str | None = None
+    ) -> bool:
+        """
+        Queue a frame for a connection without waiting for the send.
+
+        Args:
+            ws: Target connection.
+            frame: Pre-encoded frame.
+            audience: Audience the connection was reached through
+                (admins, waiters, kitchen, session...), for latency metrics.
+
+        Returns:
+            True if the frame was queued (or coalesced), False if the
+            connection is closed or was evicted as a slow consumer.
+        """
+        outbox = self._get_outbox(ws)
+        if outbox.closed:
+            return False
+
+        now = time.monotonic()
+
+        # Writer may be blocked inside a send on a stalled socket, so lag is
+        # also checked here where new frames keep arriving. A held outbox is
+        # not behind, it is waiting for its replay.
+        if not outbox.held and outbox.lag(now) > self._max_lag_seconds:
+            self._evict(outbox, now)
+            return False
+
+        coalesced, dropped = outbox.push(frame, now, audience)
+        if coalesced:
+            self._metrics.increment_outbound_coalesced_sync()
+        elif dropped:
+            self._metrics.increment_outbound_dropped_sync()
+        return True
+
+    def hold(self, ws: "WebSocket") -> bool:
+        """
+        Queue but do not write frames for a connection until resume().
+
+        PERF-REPLAY-01: Called before the connection is registered, so no
+        live frame can overtake the replay of missed events.
+
+        Args:
+            ws: Connection about to be registered.
+
+        Returns:
+            True if the outbox is held, False if queues are not running.
+        """
+        if not self._running:
+            return False
+        outbox = self._get_outbox(ws)
+        if outbox.closed:
+            return False
+        outbox.held = True
+        return True
+
+    def resume(self, ws: "WebSocket", replay: list["EncodedFrame"]) -> bool:
+        """
+        Deliver replayed frames first, then everything queued while held.
+
+        Args:
+            ws: Held connection.
+            replay: Frames to send ahead of queued live frames.
+
+        Returns:
+            False if the connection has no open outbox.
+        """
+        outbox = self._outboxes.get(ws)
+        if outbox is None or outbox.closed:
+            return False
+        outbox.resume(replay, time.monotonic())
+        return True
+
+    def _get_outbox(self, ws: "WebSocket") -> ConnectionOutbox:
+        """Get the outbox of a connection, starting its writer on first use."""
+        outbox = self._outboxes.get(ws)
+        if outbox is None:
+            outbox = ConnectionOutbox(ws, self._max_queue_size)
+            outbox.task = asyncio.create_task(
+                self._writer_loop(outbox), name=f"ws_writer_{id(ws)}"
+            )
+            self._outboxes[ws] = outbox
+        return outbox
+
+    def release(self, ws: "WebSocket") -> None:
+        """
+        Drop the outbox for a disconnected connection.
+
+        Args:
+            ws: Connection being removed.
+        """
+        outbox = self._outboxes.pop(ws, None)
+        if outbox is None:
+            return
+        outbox.close()
+        if outbox.task is not None and outbox.task is not asyncio.current_task():
+            outbox.task.cancel()
+
+    async def _writer_loop(self, outbox: ConnectionOutbox) -> None:
+        """Drain one connection's outbox in order."""
+        try:
+            while not outbox.closed:
+                frame, enqueued_at, audience = await outbox.pop()
+                now = time.monotonic()
+                if outbox.lag(now) > self._max_lag_seconds:
+                    self._evict(outbox, now)
+                    break
+
+                send_started_at = time.time()
+                if not await self._send(outbox.ws, frame):
+                    break
+                sent = time.monotonic()
+                outbox.mark_sent()
+                self._metrics.record_outbound_lag_sync(sent - enqueued_at)
+                if frame.published_at is not None and frame.received_at is not None:
+                    self._metrics.record_delivery_latency_sync(
+                        frame.event_type,
+                        audience,
+                        transit=frame.received_at - frame.published_at,
+                        queue_wait=send_started_at - frame.received_at,
+                        send=sent - now,
+                    )
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error("Outbound writer error", ws_id=id(outbox.ws), error=str(e))
+        finally:
+            # Entry stays registered (closed) until release() on disconnect,
+            # so late frames for a dead/evicted socket are rejected cheaply.
+            outbox.close()
+
+    def _evict(self, outbox: ConnectionOutbox, now: float) -> None:
+        """Close a connection that fell too far behind."""
+        lag = outbox.lag(now)
+        pending = outbox.depth
+        outbox.close()
+        if outbox.task is not None and outbox.task is not asyncio.current_task():
+            outbox.task.cancel()
+
+        self._metrics.increment_slow_consumer_evicted_sync()
+        logger.warning(
+            "Evicting slow consumer",
+            ws_id=id(outbox.ws),
+            lag_seconds=round(lag, 2),
+            pending_frames=pending,
+        )
+
+        task = asyncio.create_task(self._close_slow_consumer(outbox.ws))
+        self._eviction_tasks.add(task)
+        task.add_done_callback(self._eviction_tasks.discard)
+
+    async def _close_slow_consumer(self, ws: "WebSocket") -> None:
+        """Close with SLOW_CONSUMER and hand off to dead-connection cleanup."""
+        try:
+            await asyncio.wait_for(
+                ws.close(code=WSCloseCode.SLOW_CONSUMER, reason="Slow consumer"),
+                timeout=WSConstants.OUTBOUND_CLOSE_TIMEOUT,
+            )
+        except Exception as e:
+            logger.debug("Failed to close slow consumer: %s", str(e))
+        await self._mark_dead(ws)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get current queue depth and lag across all connections.
+
+        O(n) over active writers; called only on stats/metrics requests.
+        """
+        now = time.monotonic()
+        active = [outbox for outbox in self._outboxes.values() if not outbox.closed]
+        depths = [outbox.depth for outbox in active]
+        max_lag = max((outbox.lag(now) for outbox in active), default=0.0)
+        return {
+            "writers": len(depths),
+            "queued_frames": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "max_pending_lag_seconds": round(max_lag, 3),
+            "queue_size_limit": self._max_queue_size,
+            "max_lag_seconds": self._max_lag_seconds,
+        }
+
+
+__all__ = [
+    "ConnectionOutbox",
+    "OutboundQueues",
+]
@@ -38,6 +38,8 @@ class ConnectionStats:
         get_total_connections: callable,
         get_dead_connections_count: callable,
         max_total_connections: int,
+        get_outbound_stats: callable | None = None,
+        get_admission_stats: callable | None = None,
     ) -> None:
         """
         Initialize stats aggregator with dependencies.
@@ -51,6 +53,8 @@ class ConnectionStats:
             get_total_connections: Callback to get total connection count
             get_dead_connections_count: Callback to get dead connections count
             max_total_connections: Maximum allowed connections
+            get_outbound_stats: Callback to get outbound queue depth/lag
+            get_admission_stats: Callback to get handshake admission stats
         """
         self._lock_manager = lock_manager
         self._metrics = metrics
@@ -60,6 +64,8 @@ class ConnectionStats:
         self._get_total_connections = get_total_connections
         self._get_dead_connections_count = get_dead_connections_count
         self._max_total_connections = max_total_connections
+        self._get_outbound_stats = get_outbound_stats
+        self._get_admission_stats = get_admission_stats
 
     async def get_stats(self) -> dict[str, Any]:
         """
@@ -72,6 +78,8 @@ class ConnectionStats:
         heartbeat_stats = self._heartbeat_tracker.get_stats()
         rate_limiter_stats = self._rate_limiter.get_stats()
         index_stats = self._index.get_stats()
+        outbound_stats = self._get_outbound_stats() if self._get_outbound_stats else {}
+        admission_stats = self._get_admission_stats() if self._get_admission_stats else {}
 
         total = self._get_total_connections()
 
@@ -91,7 +99,14 @@ class ConnectionStats:
             "branch_locks_count": lock_stats["branch_locks_count"],
             "user_locks_count": lock_stats["user_locks_count"],
             "heartbeat_stats": heartbeat_stats,
+            "outbound_stats": outbound_stats,
+            # PERF-ADMISSION-01: Handshakes in flight/queued/rejected
+            "admission_stats": admission_stats,
             "metrics": metrics_snapshot,
+            # PERF-LATENCY-01: Publish-to-deliver histograms
+            "delivery_latency": self._metrics.get_delivery_latency_sync(),
+            # PERF-METRICS-01: Unlabeled histograms (outbound lag)
+            "histograms": self._metrics.get_histograms_sync(),
         }
 
     def get_stats_sync(self) -> dict[str, Any]:
@@ -5,6 +5,10 @@ Modular components extracted from redis_subscriber.py:
 - drop_tracker.py: Event drop rate tracking
 - validator.py: Event schema validation
 - processor.py: Event batch processing
+- interest.py: Interest-based Redis subscriptions
+- keyed_dispatcher.py: Concurrent dispatch with per-key ordering
+- cart_coalescer.py: Per-session merging of shared-cart events
+- lanes.py: Priority lanes between reader and dispatcher
 
 ARCH-MODULAR: Each component has single responsibility for maintainability.
 """
@@ -23,8 +27,16 @@ from ws_gateway.core.subscriber.validator import (
 )
 from ws_gateway.core.subscriber.processor import (
     process_event_batch,
+    process_event,
     handle_incoming_message,
+    parse_incoming_message,
+    enqueue_incoming_message,
+    dispatch_events,
 )
+from ws_gateway.core.subscriber.interest import ChannelInterest
+from ws_gateway.core.subscriber.keyed_dispatcher import KeyedDispatcher, ordering_key
+from ws_gateway.core.subscriber.cart_coalescer import CartEventCoalescer
+from ws_gateway.core.subscriber.lanes import EventLane, EventLanes, lane_for
 
 __all__ = [
     # Drop tracker
@@ -39,5 +51,20 @@ __all__ = [
     "reset_unknown_event_tracker",
     # Processor
     "process_event_batch",
+    "process_event",
     "handle_incoming_message",
+    "parse_incoming_message",
+    "enqueue_incoming_message",
+    "dispatch_events",
+    # Interest-based subscriptions
+    "ChannelInterest",
+    # Keyed dispatch
+    "KeyedDispatcher",
+    "ordering_key",
+    # Cart coalescing
+    "CartEventCoalescer",
+    # Priority lanes
+    "EventLane",
+    "EventLanes",
+    "lane_for",
 ]
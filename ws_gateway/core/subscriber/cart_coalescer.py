@@ -0,0 +1,232 @@
+"""
+Per-session Coalescing of Shared-Cart Events.
+
+Diners at one table tapping quantities produce bursts of CART_ITEM_*
+events, each fanned out to every diner of the session. Within a short
+window per session they are merged into one CART_SYNC delta.
+
+PERF-CART-01: Only cart events are held back. Any other event of the
+session (rounds, checks, service calls) first flushes the pending delta
+and is then delivered right away, so it is never delayed and never
+overtakes a cart change made before it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+# Events merged into CART_SYNC deltas
+COALESCED_EVENT_TYPES = frozenset({
+    "CART_ITEM_ADDED",
+    "CART_ITEM_UPDATED",
+    "CART_ITEM_REMOVED",
+    "CART_CLEARED",
+})
+
+
+class _PendingCart:
+    """Cart events of one session merged so far."""
+
+    __slots__ = (
+        "first", "last", "count", "items", "removed", "cleared", "cart_version", "timer",
+    )
+
+    def __init__(self, event: dict[str, Any]) -> None:
+        self.first = event
+        self.last = event
+        self.count = 0
+        # item_id -> latest item payload (added or updated)
+        self.items: dict[Any, dict[str, Any]] = {}
+        self.removed: set[Any] = set()
+        self.cleared = False
+        self.cart_version: int | None = None
+        self.timer: asyncio.TimerHandle | None = None
+
+    def add(self, event: dict[str, Any]) -> None:
+        """Merge an event; later changes of an item replace earlier ones."""
+        self.count += 1
+        self.last = event
+        entity = event.get("entity") or {}
+
+        version = entity.get("cart_version")
+        if isinstance(version, int) and (self.cart_version is None or version > self.cart_version):
+            self.cart_version = version
+
+        if event["type"] == "CART_CLEARED":
+            self.items.clear()
+            self.removed.clear()
+            self.cleared = True
+            return
+
+        item_id = entity["item_id"]
+        if event["type"] == "CART_ITEM_REMOVED":
+            self.items.pop(item_id, None)
+            self.removed.add(item_id)
+        else:
+            self.removed.discard(item_id)
+            self.items[item_id] = entity
+
+    def to_event(self) -> dict[str, Any]:
+        """The single original event, or a CART_SYNC delta of all merged ones."""
+        if self.count == 1:
+            return self.first
+        last = self.last
+        return {
+            "type": "CART_SYNC",
+            "tenant_id": last.get("tenant_id"),
+            "branch_id": last.get("branch_id"),
+            "session_id": last.get("session_id"),
+            # Apply in order: cleared, removed_item_ids, items
+            "entity": {
+                "delta": True,
+                "cart_version": self.cart_version,
+                "cleared": self.cleared,
+                "removed_item_ids": sorted(self.removed),
+                "items": list(self.items.values()),
+                "coalesced": self.count,
+            },
+            # Several diners may have contributed
+            "actor": {"user_id": None, "role": "DINER"},
+            "ts": last.get("ts"),
+            "v": last.get("v", 1),
+        }
+
+
+class CartEventCoalescer:
+    """
+    Delivery stage that merges cart events per (tenant, session).
+
+    The first cart event of a session opens a window; cart events arriving
+    before it closes are merged, and the result is delivered when it
+    closes. A lone event is delivered unchanged. Events of other types
+    pass through immediately, after flushing their session's window.
+
+    Usage:
+        coalescer = CartEventCoalescer(handle_event, window_seconds=0.05)
+        await coalescer.submit(event)  # instead of handle_event(event)
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[dict], Awaitable[None]],
+        window_seconds: float,
+    ) -> None:
+        """
+        Initialize coalescer.
+
+        Args:
+            deliver: Callback receiving the (possibly merged) events.
+            window_seconds: How long cart events of a session are collected.
+        """
+        self._deliver = deliver
+        self._window = window_seconds
+        self._pending: dict[Hashable, _PendingCart] = {}
+        # Windows being delivered; later events of the session wait for them
+        self._flushing: dict[Hashable, asyncio.Task] = {}
+
+        self._events_merged = 0
+        self._syncs_sent = 0
+
+    @staticmethod
+    def _is_mergeable(event: dict[str, Any]) -> bool:
+        event_type = event.get("type")
+        if event_type not in COALESCED_EVENT_TYPES or event.get("session_id") is None:
+            return False
+        return event_type == "CART_CLEARED" or "item_id" in (event.get("entity") or {})
+
+    async def submit(self, event: dict[str, Any]) -> None:
+        """
+        Deliver an event, or hold it in its session's window if it is a cart event.
+
+        Args:
+            event: Parsed event dict.
+        """
+        session_id = event.get("session_id")
+        if session_id is None:
+            await self._deliver(event)
+            return
+
+        key = (event.get("tenant_id"), session_id)
+        if self._is_mergeable(event):
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = _PendingCart(event)
+                pending.timer = asyncio.get_running_loop().call_later(
+                    self._window, self._flush_later, key
+                )
+            pending.add(event)
+            return
+
+        # Never delayed, but must not overtake earlier cart changes
+        await self._flush(key)
+        flushing = self._flushing.get(key)
+        if flushing is not None:
+            await asyncio.shield(flushing)
+        await self._deliver(event)
+
+    def _flush_later(self, key: Hashable) -> None:
+        """Window closed: deliver the merged events in the background."""
+        pending = self._pending.get(key)
+        if pending is None:
+            return
+        # Window is due; if an earlier one is still being delivered,
+        # _flush_done picks this one up when it finishes
+        pending.timer = None
+        if key in self._flushing:
+            return
+        task = asyncio.create_task(self._flush(key), name="cart_coalescer_flush")
+        self._flushing[key] = task
+        task.add_done_callback(lambda _, key=key: self._flush_done(key))
+
+    def _flush_done(self, key: Hashable) -> None:
+        """Background flush finished: deliver a window that closed meanwhile."""
+        self._flushing.pop(key, None)
+        pending = self._pending.get(key)
+        if pending is not None and pending.timer is None:
+            self._flush_later(key)
+
+    async def _flush(self, key: Hashable) -> None:
+        """Deliver the pending window of a session, if any."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+        if pending.count > 1:
+            self._events_merged += pending.count
+            self._syncs_sent += 1
+        try:
+            await self._deliver(pending.to_event())
+        except Exception as e:
+            logger.error(
+                "Failed to deliver coalesced cart events",
+                session_id=key[1],
+                events=pending.count,
+                error=str(e),
+            )
+
+    async def close(self) -> None:
+        """Deliver every pending window (shutdown)."""
+        for key in list(self._pending):
+            await self._flush(key)
+        if self._flushing:
+            await asyncio.gather(*self._flushing.values(), return_exceptions=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get coalescing statistics."""
+        return {
+            "window_ms": round(self._window * 1000, 1),
+            "pending_sessions": len(self._pending),
+            "events_merged": self._events_merged,
+            "syncs_sent": self._syncs_sent,
+        }
+
+
+__all__ = [
+    "COALESCED_EVENT_TYPES",
+    "CartEventCoalescer",
+]
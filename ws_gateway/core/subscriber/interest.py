@@ -0,0 +1,164 @@
+"""
+Interest-based Redis Subscriptions.
+
+Tracks which concrete Redis channels this gateway needs, based on the
+branches, sessions and sectors that have local connections, and applies
+the difference to a pub/sub connection.
+
+PERF-SUBS-01: Replaces wildcard psubscribe on every branch/session so
+idle branches on this instance cost no Redis egress or JSON decoding.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Channel templates per index kind: (template, is_pattern)
+# Must match shared.infrastructure.events.channels
+CHANNEL_TEMPLATES: dict[str, tuple[str, bool]] = {
+    "branch": ("branch:{key}:*", True),  # waiters, kitchen, admin
+    "session": ("session:{key}", False),
+    "sector": ("sector:{key}:waiters", False),
+}
+
+
+class ChannelInterest:
+    """
+    Desired vs applied Redis subscriptions for this gateway instance.
+
+    Implements the ConnectionIndex InterestListener protocol: the index
+    calls interest_added/interest_removed when a key gains its first or
+    loses its last local connection. Those callbacks only update sets and
+    flag a change; the subscriber task applies it with apply().
+
+    Usage:
+        interest = ChannelInterest()
+        index.set_interest_listener(interest)
+        ...
+        if interest.dirty:
+            await interest.apply(pubsub)
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no interest."""
+        self._channels: set[str] = set()
+        self._patterns: set[str] = set()
+        self._applied_channels: set[str] = set()
+        self._applied_patterns: set[str] = set()
+        self._changed = asyncio.Event()
+
+    @staticmethod
+    def channel_for(kind: str, key: int) -> tuple[str, bool]:
+        """
+        Map an index key to its Redis channel.
+
+        Returns:
+            Tuple of (channel_or_pattern, is_pattern).
+        """
+        template, is_pattern = CHANNEL_TEMPLATES[kind]
+        return template.format(key=key), is_pattern
+
+    # =========================================================================
+    # InterestListener protocol (called synchronously from ConnectionIndex)
+    # =========================================================================
+
+    def interest_added(self, kind: str, key: int) -> None:
+        """First local connection for a branch/session/sector."""
+        channel, is_pattern = self.channel_for(kind, key)
+        (self._patterns if is_pattern else self._channels).add(channel)
+        self._changed.set()
+
+    def interest_removed(self, kind: str, key: int) -> None:
+        """Last local connection for a branch/session/sector left."""
+        channel, is_pattern = self.channel_for(kind, key)
+        (self._patterns if is_pattern else self._channels).discard(channel)
+        self._changed.set()
+
+    # =========================================================================
+    # Applying to pub/sub (called from the subscriber task)
+    # =========================================================================
+
+    @property
+    def dirty(self) -> bool:
+        """Whether desired subscriptions differ from applied ones."""
+        return self._changed.is_set()
+
+    async def wait_for_change(self, timeout: float) -> None:
+        """Wait until interest changes or timeout elapses."""
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def apply(self, pubsub: Any) -> None:
+        """
+        Subscribe/unsubscribe so the pubsub matches current interest.
+
+        Applied state is updated per successful command, so a failure
+        (e.g. connection error) leaves the remainder to be retried.
+
+        Args:
+            pubsub: redis.asyncio PubSub instance.
+        """
+        self._changed.clear()
+        # Snapshot: listeners may fire while we await Redis
+        channels = set(self._channels)
+        patterns = set(self._patterns)
+
+        try:
+            to_unsubscribe = self._applied_channels - channels
+            if to_unsubscribe:
+                await pubsub.unsubscribe(*to_unsubscribe)
+                self._applied_channels -= to_unsubscribe
+
+            to_punsubscribe = self._applied_patterns - patterns
+            if to_punsubscribe:
+                await pubsub.punsubscribe(*to_punsubscribe)
+                self._applied_patterns -= to_punsubscribe
+
+            to_subscribe = channels - self._applied_channels
+            if to_subscribe:
+                await pubsub.subscribe(*to_subscribe)
+                self._applied_channels |= to_subscribe
+
+            to_psubscribe = patterns - self._applied_patterns
+            if to_psubscribe:
+                await pubsub.psubscribe(*to_psubscribe)
+                self._applied_patterns |= to_psubscribe
+        except Exception:
+            self._changed.set()  # Retry on next apply
+            raise
+
+        if to_unsubscribe or to_punsubscribe or to_subscribe or to_psubscribe:
+            logger.debug(
+                "Redis subscriptions updated",
+                subscribed=len(to_subscribe) + len(to_psubscribe),
+                unsubscribed=len(to_unsubscribe) + len(to_punsubscribe),
+                channels=len(self._applied_channels),
+                patterns=len(self._applied_patterns),
+            )
+
+    def reset_applied(self) -> None:
+        """Forget applied state (new pubsub connection after reconnect)."""
+        self._applied_channels.clear()
+        self._applied_patterns.clear()
+        self._changed.set()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get subscription statistics for monitoring."""
+        return {
+            "desired_channels": len(self._channels),
+            "desired_patterns": len(self._patterns),
+            "subscribed_channels": len(self._applied_channels),
+            "subscribed_patterns": len(self._applied_patterns),
+        }
+
+
+__all__ = [
+    "CHANNEL_TEMPLATES",
+    "ChannelInterest",
+]
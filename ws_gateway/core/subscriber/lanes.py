@@ -0,0 +1,338 @@
+"""
+Priority Lanes between the Redis Reader and the Dispatcher.
+
+Billing, kitchen and service call events used to share one FIFO queue
+with cart chatter and admin CRUD events; when it filled up, the oldest
+event was dropped whatever its importance.
+
+PERF-LANES-01: Events are split into lanes (critical, normal, bulk), each
+with its own share of the queue capacity. The dispatcher takes events by
+smooth weighted round-robin across non-empty lanes, and overflow evicts
+from the lowest-priority lane first.
+
+Lanes only choose between different ordering keys (table session, else
+branch): events of one key wait in a single FIFO, and the lane of its
+oldest event decides when the key is served next. A ROUND_SUBMITTED can
+therefore jump ahead of another table's cart chatter, but never ahead of
+an earlier CART_ITEM_ADDED or TABLE_SESSION_STARTED of its own session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Hashable
+
+from ws_gateway.components.core.constants import WSConstants
+from ws_gateway.components.metrics.histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class EventLane(IntEnum):
+    """Dispatch lanes, most important first."""
+
+    CRITICAL = 0
+    NORMAL = 1
+    BULK = 2
+
+
+# Payments, checks, kitchen and service calls: a waiter or cashier is waiting
+CRITICAL_EVENT_PREFIXES = ("PAYMENT_", "CHECK_", "ROUND_", "TICKET_", "SERVICE_CALL_")
+# Cart chatter and admin CRUD: frequent, and superseded by later events
+BULK_EVENT_PREFIXES = ("CART_", "ENTITY_", "CASCADE_")
+
+
+def lane_for(event_type: str | None) -> EventLane:
+    """
+    Lane of an event type. Unknown types go to the normal lane.
+
+    Args:
+        event_type: Value of the event's "type" field.
+
+    Returns:
+        The event's lane.
+    """
+    if not event_type:
+        return EventLane.NORMAL
+    if event_type.startswith(CRITICAL_EVENT_PREFIXES):
+        return EventLane.CRITICAL
+    if event_type.startswith(BULK_EVENT_PREFIXES):
+        return EventLane.BULK
+    return EventLane.NORMAL
+
+
+def ordering_key(event: dict) -> Hashable:
+    """
+    Ordering key of an event.
+
+    All round, cart, check and service call events carry session_id, so
+    e.g. ROUND_IN_KITCHEN can never overtake ROUND_SUBMITTED of the same
+    session. Events without a session are ordered per branch.
+
+    Args:
+        event: Parsed event dict.
+
+    Returns:
+        Hashable key; events with equal keys are delivered in order.
+    """
+    session_id = event.get("session_id")
+    if session_id is not None:
+        return ("session", session_id)
+    branch_id = event.get("branch_id")
+    if branch_id is not None:
+        return ("branch", branch_id)
+    return ("tenant", event.get("tenant_id"))
+
+
+class EventLanes:
+    """
+    Bounded multi-lane event queue with weighted fair dequeue.
+
+    Drop-in replacement for the subscriber's asyncio.Queue: get(),
+    get_nowait(), qsize(), full() and maxsize behave the same. put_nowait()
+    never raises; it returns the event it had to drop, if any:
+    - a lane at its own capacity drops its oldest event;
+    - when the whole queue is full, the oldest event of the least
+      important non-empty lane is evicted, unless every queued event is
+      more important than the new one, which is then dropped instead.
+
+    Events are kept in one FIFO per ordering key; each key with queued
+    events waits in the lane of its oldest event, so order within a key is
+    always arrival order.
+
+    Usage:
+        lanes = EventLanes(maxsize=500)
+        dropped = lanes.put_nowait(event)
+        event = await lanes.get()
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        weights: tuple[int, ...] = WSConstants.EVENT_LANE_WEIGHTS,
+        capacity_shares: tuple[float, ...] = WSConstants.EVENT_LANE_CAPACITY_SHARES,
+        latency_buckets: tuple[float, ...] = WSConstants.EVENT_LANE_LATENCY_BUCKETS,
+        key_func: Callable[[dict], Hashable] = ordering_key,
+    ) -> None:
+        """
+        Initialize lanes.
+
+        Args:
+            maxsize: Max events queued across all lanes.
+            weights: Dequeue weight per lane (critical, normal, bulk).
+            capacity_shares: Fraction of maxsize each lane may hold.
+            latency_buckets: Upper bounds (seconds) of the latency histograms.
+            key_func: Maps an event to its ordering key.
+        """
+        self._maxsize = max(1, maxsize)
+        self._key_func = key_func
+        # Events per ordering key, in arrival order
+        self._keys: dict[Hashable, deque[dict]] = {}
+        # Keys waiting in each lane (each key of _keys in exactly one lane)
+        self._queues: list[deque[Hashable]] = [deque() for _ in EventLane]
+        # Events per lane in arrival order, for eviction; entries whose
+        # event is no longer queued are skipped and compacted lazily
+        self._arrivals: list[deque[dict]] = [deque() for _ in EventLane]
+        self._queued: set[int] = set()
+        self._depth = [0] * len(EventLane)
+        self._weights = [max(1, weight) for weight in weights]
+        self._capacity = [max(1, int(self._maxsize * share)) for share in capacity_shares]
+        # Smooth weighted round-robin credit per lane
+        self._credit = [0] * len(EventLane)
+        self._size = 0
+        self._not_empty = asyncio.Event()
+
+        self._dropped = [0] * len(EventLane)
+        self._latency = [LatencyHistogram(latency_buckets) for _ in EventLane]
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def full(self) -> bool:
+        return self._size >= self._maxsize
+
+    def put_nowait(self, event: dict) -> dict | None:
+        """
+        Queue an event in its key's FIFO, evicting per the overflow policy.
+
+        Args:
+            event: Parsed event dict.
+
+        Returns:
+            The event dropped to make room (possibly `event` itself), or None.
+        """
+        lane = lane_for(event.get("type"))
+        victim: int | None = None
+        if self._depth[lane] >= self._capacity[lane]:
+            victim = lane
+        elif self._size >= self._maxsize:
+            victim = max(i for i, depth in enumerate(self._depth) if depth)
+            if victim < lane:
+                self._dropped[lane] += 1
+                return event
+
+        dropped = self._evict_oldest(victim) if victim is not None else None
+
+        key = self._key_func(event)
+        events = self._keys.get(key)
+        if events is None:
+            self._keys[key] = deque((event,))
+            self._queues[lane].append(key)
+        else:
+            # A key emptied by eviction is still waiting in its old lane
+            events.append(event)
+        self._arrivals[lane].append(event)
+        self._queued.add(id(event))
+        self._depth[lane] += 1
+        self._size += 1
+        self._not_empty.set()
+        return dropped
+
+    def _evict_oldest(self, lane: int) -> dict:
+        """Remove and return the oldest queued event of a lane."""
+        arrivals = self._arrivals[lane]
+        while True:
+            event = arrivals.popleft()
+            if id(event) in self._queued:
+                break
+        events = self._keys[self._key_func(event)]
+        for i, queued in enumerate(events):
+            if queued is event:
+                del events[i]
+                break
+        self._queued.discard(id(event))
+        self._depth[lane] -= 1
+        self._dropped[lane] += 1
+        self._size -= 1
+        return event
+
+    def get_nowait(self) -> dict:
+        """
+        Take the next event by weighted round-robin across non-empty lanes.
+
+        The head event of the chosen lane's next key is returned; the key
+        then waits again, in the lane of its new oldest event.
+
+        Raises:
+            asyncio.QueueEmpty: If no event is queued.
+        """
+        if self._size == 0:
+            raise asyncio.QueueEmpty
+
+        while True:
+            best = -1
+            total = 0
+            for lane, queue in enumerate(self._queues):
+                if queue:
+                    self._credit[lane] += self._weights[lane]
+                    total += self._weights[lane]
+                    if best < 0 or self._credit[lane] > self._credit[best]:
+                        best = lane
+            self._credit[best] -= total
+
+            queue = self._queues[best]
+            key = queue.popleft()
+            if not queue:
+                self._credit[best] = 0
+            events = self._keys[key]
+            if events:
+                break
+            # Every event of the key was evicted
+            del self._keys[key]
+
+        event = events.popleft()
+        if events:
+            self._queues[lane_for(events[0].get("type"))].append(key)
+        else:
+            del self._keys[key]
+
+        lane = lane_for(event.get("type"))
+        self._queued.discard(id(event))
+        self._depth[lane] -= 1
+        self._size -= 1
+        self._compact_arrivals(lane)
+        if self._size == 0:
+            self._not_empty.clear()
+        return event
+
+    def _compact_arrivals(self, lane: int) -> None:
+        """Drop arrival entries of events no longer queued."""
+        arrivals = self._arrivals[lane]
+        while arrivals and id(arrivals[0]) not in self._queued:
+            arrivals.popleft()
+        if len(arrivals) > 2 * self._depth[lane] + 64:
+            self._arrivals[lane] = deque(e for e in arrivals if id(e) in self._queued)
+
+    async def get(self) -> dict:
+        """Wait for and take the next event."""
+        while self._size == 0:
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def record_delivered(self, event: dict, now: float | None = None) -> None:
+        """
+        Record the enqueue-to-delivered latency of an event in its lane.
+
+        Args:
+            event: Event stamped with `_enqueued_at` by parse_incoming_message.
+            now: Current time.time() (defaults to now).
+        """
+        enqueued_at = event.get("_enqueued_at")
+        if not enqueued_at:
+            return
+        latency = (time.time() if now is None else now) - enqueued_at
+        self._latency[lane_for(event.get("type"))].observe(latency)
+
+    def track_delivery(
+        self, on_message: Callable[[dict], Awaitable[None]]
+    ) -> Callable[[dict], Awaitable[None]]:
+        """
+        Wrap a delivery callback to record per-lane latency on success.
+
+        Args:
+            on_message: Callback the dispatcher calls for each event.
+
+        Returns:
+            Callback with the same signature.
+        """
+        async def deliver(event: dict) -> None:
+            await on_message(event)
+            self.record_delivered(event)
+
+        return deliver
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get depth, capacity, drops and latency per lane."""
+        return {
+            "depth": self._size,
+            "capacity": self._maxsize,
+            "lanes": {
+                lane.name.lower(): {
+                    "depth": self._depth[lane],
+                    "capacity": self._capacity[lane],
+                    "weight": self._weights[lane],
+                    "dropped": self._dropped[lane],
+                    "latency_seconds": self._latency[lane].snapshot(),
+                }
+                for lane in EventLane
+            },
+        }
+
+
+__all__ = [
+    "EventLane",
+    "EventLanes",
+    "lane_for",
+    "ordering_key",
+]
@@ -20,6 +20,7 @@ from shared.config.settings import settings
 from ws_gateway.components.core.constants import WSConstants
 from ws_gateway.core.subscriber.validator import validate_event_schema
 from ws_gateway.core.subscriber.drop_tracker import EventDropRateTracker
+from ws_gateway.core.subscriber.lanes import EventLanes
 
 logger = logging.getLogger(__name__)
 
@@ -63,45 +64,79 @@ async def process_event_batch(
 
     while event_queue and batch_count < batch_size:
         event = event_queue.popleft()
-        retry_count = event.get("_retry_count", 0)
+        await process_event(
+            event,
+            event_queue,
+            on_message,
+            drop_tracker,
+            callback_timeout=callback_timeout,
+            staleness_threshold=staleness_threshold,
+            strict_ordering=strict_ordering,
+        )
+        batch_count += 1
 
-        # Check for stale events that waited too long in queue
-        enqueued_at = event.get("_enqueued_at", 0)
-        if enqueued_at > 0:
-            wait_time = time.time() - enqueued_at
-            if wait_time > staleness_threshold:
-                logger.warning(
-                    "Stale event detected - waited too long in queue",
-                    event_type=event.get("type", "UNKNOWN"),
-                    wait_time_seconds=round(wait_time, 2),
-                    threshold_seconds=staleness_threshold,
-                    retry_count=retry_count,
-                    queue_size=len(event_queue),
-                )
 
-        try:
-            await asyncio.wait_for(
-                on_message(event),
-                timeout=callback_timeout,
-            )
-        except asyncio.TimeoutError:
-            _handle_callback_timeout(
-                event,
-                event_queue,
-                drop_tracker,
-                retry_count,
-                callback_timeout,
-                strict_ordering,
-            )
-        except Exception as e:
-            logger.error(
-                "Error processing queued event",
-                error=str(e),
-                event_type=event.get("type"),
-                exc_info=True,
+async def process_event(
+    event: dict,
+    event_queue: deque[dict],
+    on_message: Callable[[dict], Awaitable[None]],
+    drop_tracker: EventDropRateTracker,
+    callback_timeout: float = EVENT_CALLBACK_TIMEOUT,
+    staleness_threshold: float = EVENT_STALENESS_THRESHOLD,
+    strict_ordering: bool = EVENT_STRICT_ORDERING,
+) -> None:
+    """
+    Process a single event already taken from `event_queue`.
+
+    Shared by process_event_batch and the keyed dispatcher. On callback
+    timeout the event is re-queued into `event_queue` for retry.
+
+    Args:
+        event: Event to deliver.
+        event_queue: Queue the event came from (for retries).
+        on_message: Callback for the event.
+        drop_tracker: Tracker for drop rate metrics.
+        callback_timeout: Timeout for the callback.
+        staleness_threshold: Warn if event waited longer than this.
+        strict_ordering: If True, a retried event goes to front of queue.
+    """
+    retry_count = event.get("_retry_count", 0)
+
+    # Check for stale events that waited too long in queue
+    enqueued_at = event.get("_enqueued_at", 0)
+    if enqueued_at > 0:
+        wait_time = time.time() - enqueued_at
+        if wait_time > staleness_threshold:
+            logger.warning(
+                "Stale event detected - waited too long in queue",
+                event_type=event.get("type", "UNKNOWN"),
+                wait_time_seconds=round(wait_time, 2),
+                threshold_seconds=staleness_threshold,
+                retry_count=retry_count,
+                queue_size=len(event_queue),
             )
 
-        batch_count += 1
+    try:
+        await asyncio.wait_for(
+            on_message(event),
+            timeout=callback_timeout,
+        )
+    except asyncio.TimeoutError:
+        _handle_callback_timeout(
+            event,
+            event_queue,
+            drop_tracker,
+            retry_count,
+            callback_timeout,
+            strict_ordering,
+        )
+    except Exception as e:
+        logger.error(
+            "Error processing queued event",
+            error=str(e),
+            event_type=event.get("type"),
+            exc_info=True,
+        )
 
 
 def _handle_callback_timeout(
@@ -159,27 +194,19 @@ def _handle_callback_timeout(
         drop_tracker.record_dropped()
 
 
-def handle_incoming_message(
+def parse_incoming_message(
     msg: dict[str, Any],
-    event_queue: deque[dict],
-    events_dropped: dict[str, int],
-    drop_tracker: EventDropRateTracker,
     max_message_size: int = MAX_MESSAGE_SIZE,
-    max_queue_size: int = MAX_EVENT_QUEUE_SIZE,
-) -> None:
+) -> dict | None:
     """
-    Handle an incoming Redis message.
-
-    Validates message size and schema, then queues for processing.
-    The deque with maxlen handles overflow automatically.
+    Validate size and schema of a raw Redis message and parse it.
 
     Args:
         msg: Raw Redis message.
-        event_queue: Queue to add validated events.
-        events_dropped: Mutable dict with "count" key for tracking.
-        drop_tracker: For drop rate metrics.
         max_message_size: Maximum allowed message size.
-        max_queue_size: Maximum queue size for drop detection.
+
+    Returns:
+        Parsed event stamped with `_enqueued_at`, or None if rejected.
     """
     try:
         raw_data = msg["data"]
@@ -196,7 +223,7 @@ def handle_incoming_message(
                     limit=max_message_size,
                     channel=msg.get("channel"),
                 )
-                return
+                return None
 
         # Parse JSON
         data = json.loads(raw_data)
@@ -209,39 +236,165 @@ def handle_incoming_message(
                 error=error,
                 channel=msg.get("channel"),
             )
-            return
+            return None
 
         # Add timestamp for order tracking and staleness detection
         data["_enqueued_at"] = time.time()
-
-        # Track drops by checking queue size before/after append
-        old_size = len(event_queue)
-        event_queue.append(data)
-        new_size = len(event_queue)
-
-        # Only count as dropped if queue was at capacity AND didn't grow
-        if old_size >= max_queue_size and new_size == old_size:
-            events_dropped["count"] += 1
-            drop_tracker.record_dropped()
-
-            # Log FIRST drop immediately, then every 100th
-            is_first_drop = events_dropped["count"] == 1
-            is_interval = events_dropped["count"] % WSConstants.DROP_LOG_INTERVAL == 0
-
-            if is_first_drop or is_interval:
-                log_level = logging.ERROR if is_first_drop else logging.WARNING
-                logger.log(
-                    log_level,
-                    "Event queue at capacity, oldest event was rotated out",
-                    dropped_total=events_dropped["count"],
-                    queue_size=new_size,
-                    max_size=max_queue_size,
-                    first_drop=is_first_drop,
-                )
-        else:
-            drop_tracker.record_processed()
+        return data
 
     except json.JSONDecodeError as e:
         logger.warning("Failed to parse Redis message", error=str(e))
     except Exception as e:
         logger.error("Error handling Redis message", error=str(e), exc_info=True)
+    return None
+
+
+def _record_queue_drop(
+    events_dropped: dict[str, int],
+    drop_tracker: EventDropRateTracker,
+    queue_size: int,
+    max_queue_size: int,
+) -> None:
+    """Count an event rotated out of a full queue and log first/every Nth drop."""
+    events_dropped["count"] += 1
+    drop_tracker.record_dropped()
+
+    # Log FIRST drop immediately, then every 100th
+    is_first_drop = events_dropped["count"] == 1
+    is_interval = events_dropped["count"] % WSConstants.DROP_LOG_INTERVAL == 0
+
+    if is_first_drop or is_interval:
+        log_level = logging.ERROR if is_first_drop else logging.WARNING
+        logger.log(
+            log_level,
+            "Event queue at capacity, oldest event was rotated out",
+            dropped_total=events_dropped["count"],
+            queue_size=queue_size,
+            max_size=max_queue_size,
+            first_drop=is_first_drop,
+        )
+
+
+def handle_incoming_message(
+    msg: dict[str, Any],
+    event_queue: deque[dict],
+    events_dropped: dict[str, int],
+    drop_tracker: EventDropRateTracker,
+    max_message_size: int = MAX_MESSAGE_SIZE,
+    max_queue_size: int = MAX_EVENT_QUEUE_SIZE,
+) -> None:
+    """
+    Handle an incoming Redis message.
+
+    Validates message size and schema, then queues for processing.
+    The deque with maxlen handles overflow automatically.
+
+    Args:
+        msg: Raw Redis message.
+        event_queue: Queue to add validated events.
+        events_dropped: Mutable dict with "count" key for tracking.
+        drop_tracker: For drop rate metrics.
+        max_message_size: Maximum allowed message size.
+        max_queue_size: Maximum queue size for drop detection.
+    """
+    data = parse_incoming_message(msg, max_message_size)
+    if data is None:
+        return
+
+    # Track drops by checking queue size before/after append
+    old_size = len(event_queue)
+    event_queue.append(data)
+    new_size = len(event_queue)
+
+    # Only count as dropped if queue was at capacity AND didn't grow
+    if old_size >= max_queue_size and new_size == old_size:
+        _record_queue_drop(events_dropped, drop_tracker, new_size, max_queue_size)
+    else:
+        drop_tracker.record_processed()
+
+
+# =============================================================================
+# PERF-PUBSUB-01: Push-driven reader/dispatcher pipeline
+# =============================================================================
+
+
+def enqueue_incoming_message(
+    msg: dict[str, Any],
+    event_queue: asyncio.Queue[dict] | EventLanes,
+    events_dropped: dict[str, int],
+    drop_tracker: EventDropRateTracker,
+    max_message_size: int = MAX_MESSAGE_SIZE,
+) -> None:
+    """
+    PERF-PUBSUB-01: Validate a Redis message and hand it to the dispatcher.
+
+    Same overflow policy as handle_incoming_message: when the bounded queue
+    is full, the oldest event is rotated out and counted as dropped.
+    PERF-LANES-01: With EventLanes the lanes choose what to drop (bulk
+    events first).
+
+    Args:
+        msg: Raw Redis message.
+        event_queue: Bounded queue (or EventLanes) consumed by the dispatcher.
+        events_dropped: Mutable dict with "count" key for tracking.
+        drop_tracker: For drop rate metrics.
+        max_message_size: Maximum allowed message size.
+    """
+    data = parse_incoming_message(msg, max_message_size)
+    if data is None:
+        return
+
+    if isinstance(event_queue, EventLanes):
+        dropped = event_queue.put_nowait(data) is not None
+    else:
+        dropped = False
+        if event_queue.full():
+            event_queue.get_nowait()
+            dropped = True
+        event_queue.put_nowait(data)
+
+    if dropped:
+        _record_queue_drop(
+            events_dropped, drop_tracker, event_queue.qsize(), event_queue.maxsize
+        )
+    else:
+        drop_tracker.record_processed()
+
+
+async def dispatch_events(
+    event_queue: asyncio.Queue[dict] | EventLanes,
+    on_message: Callable[[dict], Awaitable[None]],
+    drop_tracker: EventDropRateTracker,
+    batch_size: int = EVENT_PROCESS_BATCH_SIZE,
+) -> None:
+    """
+    PERF-PUBSUB-01: Dispatcher task - process events as soon as they arrive.
+
+    Wakes on the first queued event, then drains whatever else is already
+    waiting (up to batch_size) and processes it with process_event_batch,
+    keeping its timeout/retry/staleness handling. Runs until cancelled.
+
+    Args:
+        event_queue: Queue filled by the reader task.
+        on_message: Callback for each event.
+        drop_tracker: For tracking events lost after retries.
+        batch_size: Max events drained per batch.
+    """
+    batch: deque[dict] = deque()
+    while True:
+        batch.append(await event_queue.get())
+        while len(batch) < batch_size:
+            try:
+                batch.append(event_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        # Retries are re-queued into the local batch, so loop until empty
+        while batch:
+            try:
+                await process_event_batch(
+                    batch, on_message, drop_tracker, batch_size=batch_size
+                )
+            except Exception as e:
+                logger.error("Error in event dispatcher", error=str(e), exc_info=True)
+                batch.clear()
@@ -0,0 +1,156 @@
+"""
+Missed Event Replay for Reconnecting Clients.
+
+Reads the events:critical entries a client missed while disconnected,
+starting after the last stream_id it received.
+
+PERF-REPLAY-01: A reconnecting client used to refetch its whole state over
+REST. With last_event_id the gateway replays the missed critical events
+(rounds, service calls, checks) instead, within a bounded window. When the
+window cannot be covered the client is told to fall back to REST.
+
+events:critical is shared by all tenants and branches, so the stream is
+read in pages and only the events the client would have received count
+towards the cap; the window is bounded by age and read time, not by raw
+stream entries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import redis.asyncio as redis
+
+from shared.infrastructure.events import get_redis_pool
+from shared.infrastructure.redis.constants import STREAM_EVENTS_CRITICAL
+from ws_gateway.components.broadcast.frame import parse_stream_id
+from ws_gateway.components.core.constants import WSConstants
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class StreamReplay:
+    """
+    Events read after a client's last_event_id.
+
+    complete is False when the gap could not be covered (invalid or
+    trimmed id, too old, too many events, Redis error); reason says why.
+    """
+
+    events: list[dict[str, Any]] = field(default_factory=list)
+    complete: bool = True
+    reason: str | None = None
+    # Last stream_id read (matching or not): where to resume next time
+    last_event_id: str | None = None
+    scanned: int = 0
+
+
+def _decode(value: Any) -> Any:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+async def read_missed_events(
+    last_event_id: str,
+    redis_client: redis.Redis | None = None,
+    accept: Callable[[dict[str, Any]], bool] | None = None,
+    max_events: int = WSConstants.REPLAY_MAX_EVENTS,
+    max_age_seconds: float = WSConstants.REPLAY_MAX_AGE_SECONDS,
+    page_size: int = WSConstants.REPLAY_PAGE_SIZE,
+    timeout: float = WSConstants.REPLAY_READ_TIMEOUT,
+) -> StreamReplay:
+    """
+    Read the events:critical entries after last_event_id.
+
+    The range starts at last_event_id itself: if that entry is gone the
+    stream was trimmed past it and events may be missing.
+
+    Args:
+        last_event_id: Last stream_id the client received.
+        redis_client: Redis connection (the shared pool if None).
+        accept: Whether the client would have received an event (all if None).
+        max_events: Most accepted events to replay.
+        max_age_seconds: Oldest last_event_id accepted.
+        page_size: Entries per XRANGE call.
+        timeout: Max seconds for reading the whole gap.
+
+    Returns:
+        StreamReplay with the accepted events (stamped with stream_id), oldest first.
+    """
+    position = parse_stream_id(last_event_id)
+    if position is None:
+        return StreamReplay(complete=False, reason="invalid_id")
+    if time.time() * 1000 - position[0] > max_age_seconds * 1000:
+        return StreamReplay(complete=False, reason="too_old")
+
+    try:
+        if redis_client is None:
+            redis_client = await get_redis_pool()
+        return await asyncio.wait_for(
+            _read_after(redis_client, last_event_id, position, accept, max_events, page_size),
+            timeout=timeout,
+        )
+    except Exception as e:
+        logger.warning("Replay read failed", last_event_id=last_event_id, error=str(e))
+        return StreamReplay(complete=False, reason="error")
+
+
+async def _read_after(
+    redis_client: redis.Redis,
+    last_event_id: str,
+    position: tuple[int, int],
+    accept: Callable[[dict[str, Any]], bool] | None,
+    max_events: int,
+    page_size: int,
+) -> StreamReplay:
+    """Page through the stream from last_event_id to its end."""
+    page_size = max(2, page_size)
+    entries = await redis_client.xrange(
+        STREAM_EVENTS_CRITICAL, min=last_event_id, max="+", count=page_size
+    )
+    if not entries or parse_stream_id(entries[0][0]) != position:
+        return StreamReplay(complete=False, reason="trimmed")
+
+    events: list[dict[str, Any]] = []
+    cursor = last_event_id
+    scanned = 0
+    page = entries[1:]
+    while True:
+        for message_id, fields in page:
+            cursor = _decode(message_id)
+            scanned += 1
+            event = _parse_entry(fields)
+            if event is None or (accept is not None and not accept(event)):
+                continue
+            if len(events) >= max_events:
+                return StreamReplay(complete=False, reason="too_many", scanned=scanned)
+            event["stream_id"] = cursor
+            events.append(event)
+        if len(entries) < page_size:
+            return StreamReplay(events=events, last_event_id=cursor, scanned=scanned)
+        # Exclusive range: continue after the last entry read
+        entries = page = await redis_client.xrange(
+            STREAM_EVENTS_CRITICAL, min=f"({cursor}", max="+", count=page_size
+        )
+
+
+def _parse_entry(fields: dict[Any, Any]) -> dict[str, Any] | None:
+    """Decoded event of a stream entry, or None if it has none."""
+    data = fields.get("data") or fields.get(b"data")
+    if not data:
+        return None
+    try:
+        return json.loads(_decode(data))
+    except json.JSONDecodeError:
+        return None
+
+
+__all__ = [
+    "StreamReplay",
+    "read_missed_events",
+]
@@ -6,6 +6,13 @@ Reads from 'events:critical' stream using Consumer Groups.
 
 ARCH-STREAM-01: First implementation of Stream Consumer.
 MED-STREAM-03 FIX: Added PEL recovery for failed messages.
+SCALE-MULTI-01: Multi-instance mode. Consumer groups split a stream between
+their consumers, so with N replicas sharing one group each replica would see
+only 1/N of the events. In multi-instance mode every replica reads through
+its own group (named after a stable instance ID), recovers its own PEL, and
+skips events with no local branch/session connections. Groups of replicas
+that are gone (all consumers idle for ORPHAN_GROUP_IDLE_MS) are destroyed
+at startup, so scaled-down or renamed replicas do not leave PELs behind.
 """
 
 from __future__ import annotations
@@ -14,6 +21,7 @@ import asyncio
 import json
 import logging
 import time
+from dataclasses import dataclass
 from typing import Awaitable, Callable
 
 import redis.asyncio as redis
@@ -28,8 +36,7 @@ from shared.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
-# Consumer name (should be stable for single-instance, or unique for fan-out)
-# For this implementation, we assume a single gateway instance or shared workload.
+# Consumer name for single-instance mode.
 # Using a fixed name allows "rewind" after restart.
 CONSUMER_NAME = "gateway-primary"
 
@@ -42,6 +49,9 @@ PEL_CHECK_INTERVAL_CYCLES = 30  # Check PEL every N main loop cycles (~1 minute)
 PEL_MIN_IDLE_MS = 30000  # Only claim messages idle for 30+ seconds
 PEL_MAX_RETRIES = 3  # Max retry attempts before sending to DLQ
 
+# SCALE-MULTI-01: Groups of other replicas idle this long are destroyed at startup
+ORPHAN_GROUP_IDLE_MS = 60 * 60 * 1000  # 1 hour; their events are long stale
+
 # RES-MED-02 FIX: Error backoff configuration
 ERROR_BASE_DELAY = 1.0  # Base delay in seconds
 ERROR_MAX_DELAY = 30.0  # Maximum delay in seconds
@@ -50,6 +60,48 @@ ERROR_JITTER_FACTOR = 0.3  # Add up to 30% jitter
 # RES-LOW-01 FIX: Dead Letter Queue stream name
 STREAM_DLQ = "events:dlq"
 
+
+@dataclass(frozen=True, slots=True)
+class ConsumerIdentity:
+    """
+    SCALE-MULTI-01: Consumer group + consumer name used by this instance.
+
+    Single-instance: shared group, fixed consumer (legacy behavior).
+    Multi-instance: one group per instance so every replica gets every event.
+    Names must be stable across restarts so the PEL can be recovered.
+    """
+
+    group: str
+    consumer: str
+
+
+def get_consumer_identity() -> ConsumerIdentity:
+    """
+    SCALE-MULTI-01: Resolve this instance's stream consumer identity.
+
+    Instance ID comes from settings.ws_gateway_instance_id. It is required in
+    multi-instance mode: a hostname changes on every restart of a Docker or
+    Kubernetes Deployment pod, which would leave a new group (and an
+    unrecoverable PEL) behind each time.
+
+    Raises:
+        ValueError: Multi-instance mode without WS_GATEWAY_INSTANCE_ID.
+    """
+    if not settings.ws_gateway_multi_instance:
+        return ConsumerIdentity(group=CONSUMER_GROUP_WS_GATEWAY, consumer=CONSUMER_NAME)
+
+    instance_id = settings.ws_gateway_instance_id.strip()
+    if not instance_id:
+        raise ValueError(
+            "WS_GATEWAY_INSTANCE_ID must be set to a stable replica name "
+            "when WS_GATEWAY_MULTI_INSTANCE is true"
+        )
+    return ConsumerIdentity(
+        group=f"{CONSUMER_GROUP_WS_GATEWAY}:{instance_id}",
+        consumer=f"gateway-{instance_id}",
+    )
+
+
 def _calculate_error_backoff(error_count: int) -> float:
     """
     RES-MED-02 FIX: Calculate exponential backoff delay with jitter.
@@ -75,6 +127,7 @@ def _calculate_error_backoff(error_count: int) -> float:
 
 async def run_stream_consumer(
     on_event: Callable[[dict], Awaitable[None]],
+    has_local_interest: Callable[[dict], bool] | None = None,
 ) -> None:
     """
     Run the Redis Stream Consumer loop.
@@ -85,8 +138,17 @@ async def run_stream_consumer(
     4. Acknowledges (XACK) upon success.
     5. Handles errors gracefully.
     6. MED-STREAM-03 FIX: Periodically recovers pending messages (PEL).
+
+    Args:
+        on_event: Callback that routes an event to local connections.
+        has_local_interest: SCALE-MULTI-01: Optional predicate; events it
+            rejects are acknowledged without routing (multi-instance only).
     """
     redis_pool = await get_redis_pool()
+    identity = get_consumer_identity()
+    if not settings.ws_gateway_multi_instance:
+        # Shared group: every event must be routed by the single consumer
+        has_local_interest = None
     
     # 1. Ensure Consumer Group Exists
     try:
@@ -94,21 +156,21 @@ async def run_stream_consumer(
         # If the stream is new, $ is effectively 0.
         await redis_pool.xgroup_create(
             name=STREAM_EVENTS_CRITICAL,
-            groupname=CONSUMER_GROUP_WS_GATEWAY,
+            groupname=identity.group,
             id="$",
             mkstream=True
         )
         logger.info(
             "Created consumer group",
             stream=STREAM_EVENTS_CRITICAL,
-            group=CONSUMER_GROUP_WS_GATEWAY
+            group=identity.group
         )
     except ResponseError as e:
         if "BUSYGROUP" in str(e):
             logger.debug(
                 "Consumer group already exists",
                 stream=STREAM_EVENTS_CRITICAL,
-                group=CONSUMER_GROUP_WS_GATEWAY
+                group=identity.group
             )
         else:
             logger.error("Error creating consumer group", error=str(e))
@@ -117,12 +179,16 @@ async def run_stream_consumer(
     logger.info(
         "Starting Stream Consumer",
         stream=STREAM_EVENTS_CRITICAL,
-        group=CONSUMER_GROUP_WS_GATEWAY,
-        consumer=CONSUMER_NAME
+        group=identity.group,
+        consumer=identity.consumer,
+        multi_instance=settings.ws_gateway_multi_instance,
     )
 
+    if settings.ws_gateway_multi_instance:
+        await _destroy_orphan_groups(redis_pool, identity)
+
     # MED-STREAM-03 FIX: On startup, recover any pending messages from previous session
-    await _recover_pending_messages(redis_pool, on_event)
+    await _recover_pending_messages(redis_pool, identity, on_event, has_local_interest)
 
     # 2. Main Loop
     cycle_count = 0
@@ -132,12 +198,14 @@ async def run_stream_consumer(
 
             # MED-STREAM-03 FIX: Periodically check for stuck pending messages
             if cycle_count % PEL_CHECK_INTERVAL_CYCLES == 0:
-                await _recover_pending_messages(redis_pool, on_event)
+                await _recover_pending_messages(
+                    redis_pool, identity, on_event, has_local_interest
+                )
 
             # XREADGROUP GROUP group consumer BLOCK ms STREAMS key >
             entries = await redis_pool.xreadgroup(
-                groupname=CONSUMER_GROUP_WS_GATEWAY,
-                consumername=CONSUMER_NAME,
+                groupname=identity.group,
+                consumername=identity.consumer,
                 streams={STREAM_EVENTS_CRITICAL: ">"},
                 count=BATCH_COUNT,
                 block=BLOCK_MS,
@@ -151,10 +219,12 @@ async def run_stream_consumer(
                 for message_id, fields in messages:
                     await _process_stream_message(
                         redis_pool, 
+                        identity,
                         stream_name, 
                         message_id, 
                         fields, 
-                        on_event
+                        on_event,
+                        has_local_interest=has_local_interest,
                     )
 
         except asyncio.CancelledError:
@@ -166,12 +236,12 @@ async def run_stream_consumer(
                 logger.warning(
                     "Consumer group was deleted externally, recreating",
                     stream=STREAM_EVENTS_CRITICAL,
-                    group=CONSUMER_GROUP_WS_GATEWAY
+                    group=identity.group
                 )
                 try:
                     await redis_pool.xgroup_create(
                         name=STREAM_EVENTS_CRITICAL,
-                        groupname=CONSUMER_GROUP_WS_GATEWAY,
+                        groupname=identity.group,
                         id="$",
                         mkstream=True
                     )
@@ -199,14 +269,63 @@ async def run_stream_consumer(
             await asyncio.sleep(delay)
 
 
+async def _destroy_orphan_groups(
+    redis_pool: redis.Redis,
+    identity: ConsumerIdentity,
+) -> int:
+    """
+    SCALE-MULTI-01: Destroy per-instance groups of replicas that are gone.
+
+    A group is an orphan when it has consumers and all of them have been
+    idle for ORPHAN_GROUP_IDLE_MS. Groups without consumers are kept (a
+    replica creates its group just before its first read). Errors are
+    logged and never prevent the consumer from starting.
+
+    Returns the number of groups destroyed.
+    """
+    prefix = f"{CONSUMER_GROUP_WS_GATEWAY}:"
+    destroyed = 0
+    try:
+        groups = await redis_pool.xinfo_groups(STREAM_EVENTS_CRITICAL)
+        for group in groups:
+            name = group.get("name")
+            if isinstance(name, bytes):
+                name = name.decode()
+            if not name or not name.startswith(prefix) or name == identity.group:
+                continue
+
+            consumers = await redis_pool.xinfo_consumers(STREAM_EVENTS_CRITICAL, name)
+            if not consumers or any(
+                consumer.get("idle", 0) < ORPHAN_GROUP_IDLE_MS for consumer in consumers
+            ):
+                continue
+
+            await redis_pool.xgroup_destroy(STREAM_EVENTS_CRITICAL, name)
+            destroyed += 1
+            logger.info(
+                "Destroyed orphan consumer group",
+                stream=STREAM_EVENTS_CRITICAL,
+                group=name,
+                pending=group.get("pending", 0),
+            )
+    except Exception as e:
+        logger.warning("Error cleaning up orphan consumer groups", error=str(e))
+
+    return destroyed
+
+
 async def _recover_pending_messages(
     redis_pool: redis.Redis,
+    identity: ConsumerIdentity,
     on_event: Callable[[dict], Awaitable[None]],
+    has_local_interest: Callable[[dict], bool] | None = None,
 ) -> int:
     """
     MED-STREAM-03 FIX: Recover pending messages that failed processing.
     
     Uses XAUTOCLAIM to atomically claim and retrieve stale pending messages.
+    SCALE-MULTI-01: Scoped to this instance's group, so each replica only
+    recovers its own PEL.
     Returns the number of messages recovered.
     """
     recovered = 0
@@ -215,8 +334,8 @@ async def _recover_pending_messages(
         # Returns: [next_start_id, [[id, fields], ...], [deleted_ids]]
         result = await redis_pool.xautoclaim(
             name=STREAM_EVENTS_CRITICAL,
-            groupname=CONSUMER_GROUP_WS_GATEWAY,
-            consumername=CONSUMER_NAME,
+            groupname=identity.group,
+            consumername=identity.consumer,
             min_idle_time=PEL_MIN_IDLE_MS,
             start_id="0-0",
             count=BATCH_COUNT,
@@ -239,7 +358,7 @@ async def _recover_pending_messages(
         for message_id, fields in claimed_messages:
             # Check retry count from message metadata
             retry_count = await _get_message_retry_count(
-                redis_pool, message_id
+                redis_pool, identity, message_id
             )
 
             if retry_count >= PEL_MAX_RETRIES:
@@ -265,7 +384,7 @@ async def _recover_pending_messages(
                             "data": data_str,
                             "retry_count": str(retry_count),
                             "failed_at": str(time.time()),
-                            "consumer": CONSUMER_NAME,
+                            "consumer": identity.consumer,
                         },
                         maxlen=1000,  # Keep last 1000 DLQ entries
                     )
@@ -276,7 +395,7 @@ async def _recover_pending_messages(
                 # ACK the original message to remove from PEL
                 await redis_pool.xack(
                     STREAM_EVENTS_CRITICAL, 
-                    CONSUMER_GROUP_WS_GATEWAY, 
+                    identity.group, 
                     message_id
                 )
                 continue
@@ -284,11 +403,13 @@ async def _recover_pending_messages(
             # Attempt reprocessing
             success = await _process_stream_message(
                 redis_pool,
+                identity,
                 STREAM_EVENTS_CRITICAL,
                 message_id,
                 fields,
                 on_event,
-                is_retry=True
+                is_retry=True,
+                has_local_interest=has_local_interest,
             )
             if success:
                 recovered += 1
@@ -304,6 +425,7 @@ async def _recover_pending_messages(
 
 async def _get_message_retry_count(
     redis_pool: redis.Redis,
+    identity: ConsumerIdentity,
     message_id: str,
 ) -> int:
     """
@@ -315,7 +437,7 @@ async def _get_message_retry_count(
         # XPENDING key group [[IDLE min-idle-time] start end count [consumer]]
         pending_info = await redis_pool.xpending_range(
             name=STREAM_EVENTS_CRITICAL,
-            groupname=CONSUMER_GROUP_WS_GATEWAY,
+            groupname=identity.group,
             min=message_id,
             max=message_id,
             count=1,
@@ -333,14 +455,19 @@ async def _get_message_retry_count(
 
 async def _process_stream_message(
     redis_pool: redis.Redis,
+    identity: ConsumerIdentity,
     stream: str,
     message_id: str,
     fields: dict,
     on_event: Callable[[dict], Awaitable[None]],
     is_retry: bool = False,
+    has_local_interest: Callable[[dict], bool] | None = None,
 ) -> bool:
     """
     Process a single stream message and ACK it.
+
+    SCALE-MULTI-01: Events with no local interest are acknowledged without
+    routing; other replicas deliver them through their own groups.
     
     Returns True if successfully processed, False otherwise.
     """
@@ -350,7 +477,7 @@ async def _process_stream_message(
         if not data_str:
             logger.warning("Empty data in stream message", msg_id=message_id)
             # Ack anyway to skip bad message
-            await redis_pool.xack(stream, CONSUMER_GROUP_WS_GATEWAY, message_id)
+            await redis_pool.xack(stream, identity.group, message_id)
             return True  # "Success" in terms of handling
 
         # Handle bytes if returned
@@ -358,12 +485,24 @@ async def _process_stream_message(
             data_str = data_str.decode("utf-8")
 
         event_data = json.loads(data_str)
+
+        # PERF-REPLAY-01: Clients echo the id back as last_event_id on reconnect
+        event_data["stream_id"] = (
+            message_id.decode("ascii") if isinstance(message_id, bytes) else message_id
+        )
+        # PERF-LATENCY-01: Gateway receive time, as parse_incoming_message does for pub/sub
+        event_data["_enqueued_at"] = time.time()
+
+        # SCALE-MULTI-01: Skip events for branches/sessions on other replicas
+        if has_local_interest is not None and not has_local_interest(event_data):
+            await redis_pool.xack(stream, identity.group, message_id)
+            return True
         
         # Dispatch to WebSocket clients
         await on_event(event_data)
 
         # Acknowledge success
-        await redis_pool.xack(stream, CONSUMER_GROUP_WS_GATEWAY, message_id)
+        await redis_pool.xack(stream, identity.group, message_id)
 
         if is_retry:
             logger.info("Successfully reprocessed pending message", msg_id=message_id)
@@ -373,7 +512,7 @@ async def _process_stream_message(
     except json.JSONDecodeError:
         logger.error("Invalid JSON in stream event", msg_id=message_id)
         # Ack to remove from pending (unrecoverable)
-        await redis_pool.xack(stream, CONSUMER_GROUP_WS_GATEWAY, message_id)
+        await redis_pool.xack(stream, identity.group, message_id)
         return True  # Handled (cannot retry invalid JSON)
         
     except Exception as e:
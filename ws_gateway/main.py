@@ -28,8 +28,12 @@ from ws_gateway.components.endpoints.handlers import (
     AdminEndpoint,
     DinerEndpoint,
 )
-from ws_gateway.components.data.sector_repository import cleanup_sector_repository
-from ws_gateway.components.events.router import EventRouter
+from ws_gateway.components.data.sector_repository import (
+    cleanup_sector_repository,
+    get_sector_repository,
+)
+from ws_gateway.components.events.router import EventRouter, safe_int
+from ws_gateway.components.events.types import EventType
 
 
 # Global connection manager
@@ -47,7 +51,7 @@ async def lifespan(app: FastAPI):
     Application lifespan handler.
 
     Starts:
-    - Broadcast worker pool for high-throughput scenarios
+    - Per-connection outbound writers (PERF-OUTBOX-01)
     - Redis subscriber task for event dispatching
     - Heartbeat cleanup task for stale connections
     """
@@ -58,14 +62,24 @@ async def lifespan(app: FastAPI):
         env=settings.environment,
     )
 
-    # SCALE-HIGH-01 FIX: Start broadcast worker pool first
+    # SCALE-MULTI-01: Fail startup (not the background task) on a missing instance ID
+    from ws_gateway.core.subscriber.stream_consumer import (
+        get_consumer_identity,
+        run_stream_consumer,
+    )
+    get_consumer_identity()
+
+    # PERF-OUTBOX-01: Start per-connection outbound queues first
     await manager.start_broadcast_workers()
 
     # MED-NEW-02 FIX: Added task names for easier debugging
     subscriber_task = asyncio.create_task(start_redis_subscriber(), name="redis_subscriber")
     # CRIT-ARCH-01: Start Stream Consumer for reliable delivery
-    from ws_gateway.core.subscriber.stream_consumer import run_stream_consumer
-    stream_task = asyncio.create_task(run_stream_consumer(handle_routed_event), name="stream_consumer")
+    # SCALE-MULTI-01: In multi-instance mode, skip events for other replicas' clients
+    stream_task = asyncio.create_task(
+        run_stream_consumer(handle_routed_event, has_local_interest=manager.has_local_interest),
+        name="stream_consumer",
+    )
     cleanup_task = asyncio.create_task(start_heartbeat_cleanup(), name="heartbeat_cleanup")
 
     yield
@@ -88,10 +102,10 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
 
-    # SCALE-HIGH-01 FIX: Stop broadcast worker pool gracefully
+    # PERF-OUTBOX-01: Stop outbound writers gracefully (drain pending frames)
     try:
         await manager.stop_broadcast_workers(timeout=5.0)
-        logger.debug("Broadcast worker pool stopped")
+        logger.debug("Outbound writers stopped")
     except Exception as e:
         logger.warning("Error stopping broadcast workers", error=str(e))
 
@@ -172,11 +186,54 @@ def _get_event_router() -> EventRouter:
     return _event_router
 
 
+async def handle_sector_assignment_change(event: dict) -> None:
+    """
+    Refresh sectors of local waiters after their assignments changed.
+
+    PERF-SECTORS-01: Drops the cached sectors of the listed waiters, reloads
+    them with one batched query and re-indexes their local connections, so
+    sector events reach the new assignees immediately instead of after the
+    cache TTL. Waiters without local connections are only invalidated.
+    """
+    tenant_id = safe_int(event.get("tenant_id"), "tenant_id")
+    entity = event.get("entity") or {}
+    waiter_ids = [
+        user_id
+        for user_id in (safe_int(raw, "waiter_id") for raw in entity.get("waiter_ids", []))
+        if user_id is not None
+    ]
+    if tenant_id is None or not waiter_ids:
+        return
+
+    repository = get_sector_repository()
+    for user_id in waiter_ids:
+        repository.invalidate_cache(user_id, tenant_id)
+
+    by_user = manager.by_user
+    local_waiters = [uid for uid in waiter_ids if uid in by_user]
+    if not local_waiters:
+        return
+
+    sectors_by_user = await repository.get_waiters_sectors(local_waiters, tenant_id)
+    updated = await manager.refresh_user_sectors(sectors_by_user, tenant_id)
+    logger.info(
+        "Waiter sectors refreshed from assignment change",
+        branch_id=event.get("branch_id"),
+        waiters=len(local_waiters),
+        connections_updated=updated,
+    )
+
+
 async def handle_routed_event(event: dict):
     """
     Handle incoming Redis events (from Pub/Sub or Stream).
     Delegates exact routing to EventRouter.
     """
+    # PERF-SECTORS-01: Gateway-internal event, not routed to clients
+    if event.get("type") == EventType.SECTOR_ASSIGNMENTS_CHANGED.value:
+        await handle_sector_assignment_change(event)
+        return
+
     router = _get_event_router()
     result = await router.route_event(event)
 
@@ -203,10 +260,12 @@ async def start_redis_subscriber():
     """
     # DOC-IMP-01: Use centralized channel constants
     channels = list(WSConstants.REDIS_SUBSCRIPTION_CHANNELS)
+    # PERF-SUBS-01: Subscribe only to channels with local connections
+    interest = manager.channel_interest if settings.redis_interest_subscriptions else None
 
     try:
         # Pass the separated handler function
-        await run_subscriber(channels, handle_routed_event)
+        await run_subscriber(channels, handle_routed_event, interest=interest)
     except asyncio.CancelledError:
         pass
     except Exception as e:
@@ -253,8 +312,13 @@ app.add_middleware(
 
 
 @app.get("/ws/health")
-def health_check():
-    """Basic health check endpoint."""
+async def health_check():
+    """
+    Basic health check endpoint.
+
+    PERF-METRICS-01: Runs on the event loop (not the threadpool), which
+    owns the lock-free MetricsCollector it reads.
+    """
     # LOW-NEW-03 FIX: Include version in health response
     # CRIT-WS-06 FIX: Wrap sync method call with error handling
     try:
@@ -328,11 +392,18 @@ async def prometheus_metrics():
             static_configs:
               - targets: ['localhost:8001']
             metrics_path: '/ws/metrics'
+
+    PERF-PROM-01: Served from cached bytes rebuilt at most once every
+    ws_metrics_cache_seconds, so frequent scrapers share one rebuild.
     """
     from fastapi.responses import PlainTextResponse
-    from ws_gateway.components.metrics.prometheus import generate_prometheus_metrics
+    from ws_gateway.components.metrics.prometheus import (
+        generate_prometheus_metrics,
+        get_exposition_cache,
+    )
 
-    metrics_output = await generate_prometheus_metrics(manager)
+    cache = get_exposition_cache(settings.ws_metrics_cache_seconds)
+    metrics_output = await cache.get(lambda: generate_prometheus_metrics(manager))
     return PlainTextResponse(
         content=metrics_output,
         media_type="text/plain; version=0.0.4; charset=utf-8",
@@ -348,13 +419,14 @@ async def prometheus_metrics():
 async def waiter_websocket(
     websocket: WebSocket,
     token: str = Query(..., description="JWT token"),
+    last_event_id: str | None = Query(None, description="Last stream_id received"),
 ):
     """
     WebSocket endpoint for waiters.
 
     HIGH-03 FIX: Migrated to WaiterEndpoint class.
     """
-    endpoint = WaiterEndpoint(websocket, manager, token)
+    endpoint = WaiterEndpoint(websocket, manager, token, last_event_id)
     await endpoint.run()
 
 
@@ -362,13 +434,14 @@ async def waiter_websocket(
 async def kitchen_websocket(
     websocket: WebSocket,
     token: str = Query(..., description="JWT token"),
+    last_event_id: str | None = Query(None, description="Last stream_id received"),
 ):
     """
     WebSocket endpoint for kitchen staff.
 
     HIGH-03 FIX: Migrated to KitchenEndpoint class.
     """
-    endpoint = KitchenEndpoint(websocket, manager, token)
+    endpoint = KitchenEndpoint(websocket, manager, token, last_event_id)
     await endpoint.run()
 
 
@@ -376,13 +449,14 @@ async def kitchen_websocket(
 async def admin_websocket(
     websocket: WebSocket,
     token: str = Query(..., description="JWT token"),
+    last_event_id: str | None = Query(None, description="Last stream_id received"),
 ):
     """
     WebSocket endpoint for Dashboard/admin monitoring.
 
     HIGH-03 FIX: Migrated to AdminEndpoint class.
     """
-    endpoint = AdminEndpoint(websocket, manager, token)
+    endpoint = AdminEndpoint(websocket, manager, token, last_event_id)
     await endpoint.run()
 
 
@@ -390,13 +464,14 @@ async def admin_websocket(
 async def diner_websocket(
     websocket: WebSocket,
     table_token: str = Query(..., description="Table session token"),
+    last_event_id: str | None = Query(None, description="Last stream_id received"),
 ):
     """
     WebSocket endpoint for diners at a table.
 
     HIGH-03 FIX: Migrated to DinerEndpoint class.
     """
-    endpoint = DinerEndpoint(websocket, manager, table_token)
+    endpoint = DinerEndpoint(websocket, manager, table_token, last_event_id)
     await endpoint.run()
 
 
@@ -9,6 +9,10 @@ Original monolithic file split into:
 - validate_event_schema: Event schema validation
 - process_event_batch: Batch event processing
 - handle_incoming_message: Message handling
+- enqueue_incoming_message/dispatch_events: PERF-PUBSUB-01 reader/dispatcher
+- KeyedDispatcher: PERF-DISPATCH-01 concurrent dispatch with per-key ordering
+- CartEventCoalescer: PERF-CART-01 per-session merging of cart events
+- EventLanes: PERF-LANES-01 priority lanes between reader and dispatcher
 
 This file maintains backward compatibility while delegating to modules.
 """
@@ -17,8 +21,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections import deque
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, TYPE_CHECKING
 
 import redis.exceptions
 
@@ -53,8 +56,16 @@ from ws_gateway.core.subscriber import (
     get_unknown_event_metrics,
     process_event_batch,
     handle_incoming_message,
+    enqueue_incoming_message,
+    dispatch_events,
+    KeyedDispatcher,
+    CartEventCoalescer,
+    EventLanes,
 )
 
+if TYPE_CHECKING:
+    from ws_gateway.core.subscriber.interest import ChannelInterest
+
 logger = logging.getLogger(__name__)
 
 # Configuration from settings
@@ -64,6 +75,8 @@ MAX_EVENT_QUEUE_SIZE = settings.redis_event_queue_size
 EVENT_PROCESS_BATCH_SIZE = settings.redis_event_batch_size
 EVENT_CALLBACK_TIMEOUT = settings.ws_event_callback_timeout
 MAX_RECONNECT_DELAY = getattr(settings, "redis_max_reconnect_delay", 30)
+DISPATCH_CONCURRENCY = getattr(settings, "redis_dispatch_concurrency", 8)
+CART_COALESCE_WINDOW = getattr(settings, "ws_cart_coalesce_window_ms", 0) / 1000
 
 # Timeout configurations
 PUBSUB_CLEANUP_TIMEOUT = getattr(settings, "redis_pubsub_cleanup_timeout", 5.0)
@@ -91,10 +104,23 @@ _drop_rate_tracker = get_drop_tracker(
     alert_cooldown_seconds=300.0,
 )
 
+# PERF-SUBS-01: Interest tracker of the running subscriber (for metrics)
+_active_interest: ChannelInterest | None = None
+
+# PERF-PUBSUB-01/PERF-LANES-01: Reader -> dispatcher lanes of the running subscriber (for metrics)
+_active_event_queue: EventLanes | None = None
+
+# PERF-DISPATCH-01: Keyed dispatcher of the running subscriber (for metrics)
+_active_dispatcher: KeyedDispatcher | None = None
+
+# PERF-CART-01: Cart event coalescer of the running subscriber (for metrics)
+_active_coalescer: CartEventCoalescer | None = None
+
 
 async def run_subscriber(
     channels: list[str],
     on_message: Callable[[dict], Awaitable[None]],
+    interest: ChannelInterest | None = None,
 ) -> None:
     """
     Subscribe to Redis channels and dispatch messages.
@@ -102,28 +128,71 @@ async def run_subscriber(
     This function runs indefinitely, listening for messages
     and calling the callback for each one.
 
+    PERF-PUBSUB-01: This coroutine is the reader; it only parses messages
+    and pushes them into a bounded asyncio.Queue. A dispatcher task wakes
+    as soon as an event is queued and processes it in batches, instead of
+    draining only when a poll comes back empty (which under steady traffic
+    delayed delivery until the first idle second).
+
     Features:
     - Circuit breaker for resilient reconnection
-    - Backpressure queue for event processing
+    - Backpressure queue (drop-oldest) between reader and dispatcher
+    - PERF-LANES-01: The queue is split into priority lanes; billing,
+      kitchen and service call events of other tables are dispatched
+      first (never ahead of their own session's earlier events) and bulk
+      (cart, admin CRUD) events are dropped first
+    - PERF-DISPATCH-01: Concurrent dispatch across sessions/branches,
+      strictly ordered within each (REDIS_DISPATCH_CONCURRENCY > 1)
     - Message size and schema validation
     - Configurable timeouts and batch processing
+    - PERF-SUBS-01: Optional interest-based subscriptions
 
     Args:
-        channels: List of channel patterns to subscribe to.
+        channels: List of channel patterns to subscribe to (ignored when
+            `interest` is given).
         on_message: Async callback function that receives parsed message data.
+        interest: If given, subscribe only to concrete channels of branches,
+            sessions and sectors with local connections, following changes.
 
     Raises:
         RuntimeError: If max reconnection attempts exceeded.
     """
+    global _active_interest, _active_event_queue, _active_dispatcher, _active_coalescer
+    _active_interest = interest
+
+    # PERF-CART-01: Merge bursts of cart events per session before routing
+    if CART_COALESCE_WINDOW > 0:
+        _active_coalescer = CartEventCoalescer(on_message, CART_COALESCE_WINDOW)
+        on_message = _active_coalescer.submit
+
     redis_pool = await get_redis_pool()
     pubsub = redis_pool.pubsub()
 
-    await pubsub.psubscribe(*channels)
-    logger.info("Redis subscriber started", channels=channels)
+    if interest is None:
+        await pubsub.psubscribe(*channels)
+        logger.info("Redis subscriber started", channels=channels)
+    else:
+        interest.reset_applied()
+        await interest.apply(pubsub)
+        logger.info("Redis subscriber started", mode="interest", **interest.get_stats())
 
     reconnect_attempts = 0
-    event_queue: deque[dict] = deque(maxlen=MAX_EVENT_QUEUE_SIZE)
+    event_queue = EventLanes(maxsize=MAX_EVENT_QUEUE_SIZE)
+    _active_event_queue = event_queue
     events_dropped = {"count": 0}
+    deliver = event_queue.track_delivery(on_message)
+    if DISPATCH_CONCURRENCY > 1:
+        # PERF-LANES-01: Keep the backlog in the lanes, where it is prioritized
+        _active_dispatcher = KeyedDispatcher(
+            deliver,
+            _drop_rate_tracker,
+            max_concurrency=DISPATCH_CONCURRENCY,
+            max_pending=DISPATCH_CONCURRENCY * WSConstants.EVENT_LANE_DISPATCH_DEPTH,
+        )
+        dispatch = _active_dispatcher.run(event_queue)
+    else:
+        dispatch = dispatch_events(event_queue, deliver, _drop_rate_tracker)
+    dispatcher = asyncio.create_task(dispatch, name="redis_event_dispatcher")
 
     try:
         while True:
@@ -137,21 +206,21 @@ async def run_subscriber(
                     await asyncio.sleep(WSConstants.CIRCUIT_RECOVERY_TIMEOUT / 2)
                     continue
 
+                # PERF-SUBS-01: Follow local connection interest
+                if interest is not None:
+                    if interest.dirty:
+                        await interest.apply(pubsub)
+                    if not pubsub.subscribed:
+                        # No local connections: wait for one
+                        await interest.wait_for_change(timeout=1.0)
+                        continue
+
                 # Get message with timeout
                 msg = await pubsub.get_message(
                     ignore_subscribe_messages=True, timeout=1.0
                 )
 
                 if msg is None:
-                    # Process queued events during idle time
-                    if event_queue:
-                        await process_event_batch(
-                            event_queue,
-                            on_message,
-                            _drop_rate_tracker,
-                        )
-                    else:
-                        await asyncio.sleep(0.01)
                     continue
 
                 # Skip non-data messages
@@ -162,8 +231,8 @@ async def run_subscriber(
                 reconnect_attempts = 0
                 _redis_circuit_breaker.record_success()
 
-                # Handle incoming message (delegated to module)
-                handle_incoming_message(
+                # Hand off to the dispatcher (delegated to module)
+                enqueue_incoming_message(
                     msg,
                     event_queue,
                     events_dropped,
@@ -203,7 +272,7 @@ async def run_subscriber(
                 await asyncio.sleep(delay)
 
                 # Reconnect
-                pubsub = await _reconnect_pubsub(pubsub, channels)
+                pubsub = await _reconnect_pubsub(pubsub, channels, interest)
 
             except CircuitOpenError:
                 # Circuit is open - wait before retrying
@@ -212,24 +281,47 @@ async def run_subscriber(
     except asyncio.CancelledError:
         logger.info(
             "Redis subscriber cancelled",
-            queued_events=len(event_queue),
+            queued_events=event_queue.qsize(),
             dropped_events=events_dropped["count"],
         )
         raise
     finally:
+        dispatcher.cancel()
+        await asyncio.gather(dispatcher, return_exceptions=True)
+        if _active_coalescer is not None:
+            await _active_coalescer.close()
+        _active_interest = None
+        _active_event_queue = None
+        _active_dispatcher = None
+        _active_coalescer = None
         try:
-            await pubsub.punsubscribe(*channels)
+            await _unsubscribe_all(pubsub, channels, interest)
         except Exception as e:
             logger.warning("Error during pubsub cleanup", error=str(e))
 
 
-async def _reconnect_pubsub(pubsub: Any, channels: list[str]) -> Any:
+async def _unsubscribe_all(
+    pubsub: Any, channels: list[str], interest: ChannelInterest | None
+) -> None:
+    """Drop all subscriptions held by a pubsub (wildcard or interest mode)."""
+    if interest is None:
+        await pubsub.punsubscribe(*channels)
+        return
+    # No arguments = unsubscribe from everything of that kind
+    await pubsub.punsubscribe()
+    await pubsub.unsubscribe()
+
+
+async def _reconnect_pubsub(
+    pubsub: Any, channels: list[str], interest: ChannelInterest | None = None
+) -> Any:
     """
     Reconnect pubsub after connection error.
 
     Args:
         pubsub: Current pubsub object.
         channels: Channels to resubscribe to.
+        interest: PERF-SUBS-01: Interest tracker to re-apply, if any.
 
     Returns:
         New pubsub object.
@@ -238,18 +330,21 @@ async def _reconnect_pubsub(pubsub: Any, channels: list[str]) -> Any:
         asyncio.TimeoutError: If total reconnection takes too long.
     """
     return await asyncio.wait_for(
-        _reconnect_pubsub_internal(pubsub, channels),
+        _reconnect_pubsub_internal(pubsub, channels, interest),
         timeout=PUBSUB_RECONNECT_TOTAL_TIMEOUT,
     )
 
 
-async def _reconnect_pubsub_internal(pubsub: Any, channels: list[str]) -> Any:
+async def _reconnect_pubsub_internal(
+    pubsub: Any, channels: list[str], interest: ChannelInterest | None = None
+) -> Any:
     """
     Internal reconnection logic with per-operation timeouts.
 
     Args:
         pubsub: Current pubsub object.
         channels: Channels to resubscribe to.
+        interest: PERF-SUBS-01: Interest tracker to re-apply, if any.
 
     Returns:
         New pubsub object.
@@ -259,7 +354,7 @@ async def _reconnect_pubsub_internal(pubsub: Any, channels: list[str]) -> Any:
     # Cleanup old pubsub with timeout
     try:
         await asyncio.wait_for(
-            old_pubsub.punsubscribe(*channels),
+            _unsubscribe_all(old_pubsub, channels, interest),
             timeout=PUBSUB_CLEANUP_TIMEOUT,
         )
     except asyncio.TimeoutError:
@@ -289,8 +384,13 @@ async def _reconnect_pubsub_internal(pubsub: Any, channels: list[str]) -> Any:
     # Create new pubsub
     redis_pool = await get_redis_pool()
     new_pubsub = redis_pool.pubsub()
-    await new_pubsub.psubscribe(*channels)
-    logger.info("Redis subscriber reconnected", channels=channels)
+    if interest is None:
+        await new_pubsub.psubscribe(*channels)
+        logger.info("Redis subscriber reconnected", channels=channels)
+    else:
+        interest.reset_applied()
+        await interest.apply(new_pubsub)
+        logger.info("Redis subscriber reconnected", mode="interest", **interest.get_stats())
 
     return new_pubsub
 
@@ -302,11 +402,20 @@ def get_subscriber_metrics() -> dict[str, Any]:
     Returns:
         Dictionary with subscriber metrics for monitoring.
     """
-    return {
+    metrics = {
         **get_unknown_event_metrics(),
         "circuit_breaker": _redis_circuit_breaker.get_stats(),
         "drop_rate": _drop_rate_tracker.get_stats(),
     }
+    if _active_interest is not None:
+        metrics["subscriptions"] = _active_interest.get_stats()
+    if _active_event_queue is not None:
+        metrics["event_queue"] = _active_event_queue.get_stats()
+    if _active_dispatcher is not None:
+        metrics["dispatch"] = _active_dispatcher.get_stats()
+    if _active_coalescer is not None:
+        metrics["cart_coalescing"] = _active_coalescer.get_stats()
+    return metrics
 
 
 def get_circuit_breaker() -> CircuitBreaker: